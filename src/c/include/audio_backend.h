@@ -0,0 +1,55 @@
+#ifndef AUDIO_BACKEND_H
+#define AUDIO_BACKEND_H
+
+#include <stdint.h>
+#include <stdio.h>
+#include "coreaudio.h" /* audio_callback_t */
+
+/*
+ * Pluggable audio output.
+ *
+ * Every backend pulls audio through the same audio_callback_t as
+ * coreaudio.c.  "coreaudio" (macOS only) is the AudioQueue player.  "null"
+ * runs anywhere: a timer thread calls the callback once per device period,
+ * optionally appends the stream to a 16-bit PCM WAV, and records deadline
+ * statistics so real-time rendering can be load-tested without sound
+ * hardware.
+ */
+
+typedef struct {
+    uint64_t callbacks;      /* periods rendered */
+    uint64_t misses;         /* callbacks that finished after their deadline */
+    double   period_us;      /* device period (buffer_size / sr) */
+    double   jitter_mean_us; /* timer wake-up lateness */
+    double   jitter_max_us;
+    double   render_mean_us; /* time spent inside the callback */
+    double   render_max_us;
+} audio_stats_t;
+
+typedef struct {
+    const char *name;
+    int  (*init)(uint32_t sr, uint32_t buffer_size, audio_callback_t callback, void *user_data);
+    void (*start)(void);
+    void (*stop)(void);
+    int  (*get_stats)(audio_stats_t *out); /* NULL when the backend keeps none */
+} audio_backend_t;
+
+/* Look a backend up by name; NULL or "" returns the platform default
+ * (coreaudio on macOS, null elsewhere).  Returns NULL for unknown names. */
+const audio_backend_t *audio_backend_find(const char *name);
+
+void audio_stats_print(FILE *f, const audio_stats_t *s);
+
+/* ---- null sink ---- */
+
+typedef struct {
+    const char *wav_path; /* stream everything rendered to this 16-bit WAV; NULL = discard */
+    float speed;          /* 1 = real time, 2 = twice the device rate, 0 = as fast as possible */
+} audio_null_opts_t;
+
+extern const audio_backend_t audio_backend_null;
+
+/* Apply before init(); defaults are { NULL, 1.0f }. */
+void audio_null_configure(const audio_null_opts_t *opts);
+
+#endif /* AUDIO_BACKEND_H */
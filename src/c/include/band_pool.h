@@ -0,0 +1,53 @@
+#ifndef BAND_POOL_H
+#define BAND_POOL_H
+
+#include <stdbool.h>
+#include <stdatomic.h>
+#include <pthread.h>
+
+/* Persistent worker pool that splits a frame into horizontal bands.
+ *
+ * band_pool_run hands out bands of `band_h` rows to the workers and the
+ * calling thread alike (next free band first) and returns when every band
+ * is done.  The workers sleep on a condition variable between frames, so
+ * an idle pool costs nothing.  Which thread renders which band varies from
+ * run to run; the job must make each band's output depend only on its rows.
+ */
+
+#define BAND_POOL_MAX_THREADS 64
+
+/* fn(ctx, y0, y1, worker): render rows y0 <= y < y1; worker is 0 for the
+ * calling thread, 1..threads-1 for pool threads (index per-thread scratch). */
+typedef void (*band_fn)(void *ctx, int y0, int y1, int worker);
+
+typedef struct band_pool band_pool_t;
+
+typedef struct {
+    band_pool_t *pool;
+    int worker;
+} band_worker_t;
+
+struct band_pool {
+    int threads;                  /* including the calling thread */
+    pthread_t tid[BAND_POOL_MAX_THREADS];
+    band_worker_t workers[BAND_POOL_MAX_THREADS];
+
+    pthread_mutex_t lock;
+    pthread_cond_t start, done;
+    unsigned generation;          /* bumped per run, under lock */
+    int busy;                     /* workers still in this run */
+    bool quit;
+
+    band_fn fn;                   /* current job */
+    void *ctx;
+    int h, band_h;
+    atomic_int next;              /* next band index to hand out */
+};
+
+/* Starts threads - 1 workers (threads <= 1: everything runs on the caller).
+ * Returns 0 on success. */
+int  band_pool_init(band_pool_t *p, int threads);
+void band_pool_run(band_pool_t *p, band_fn fn, void *ctx, int h, int band_h);
+void band_pool_free(band_pool_t *p);
+
+#endif /* BAND_POOL_H */
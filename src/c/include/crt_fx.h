@@ -2,7 +2,11 @@
 #define CRT_FX_H
 
 #include <stdint.h>
+#include <stdbool.h>
 #include "rand.h"
+#include "raster.h"
+
+typedef struct { int x, y; uint32_t px; } crt_noise_t;
 
 typedef struct {
     /* persistence (ghost trails) */
@@ -29,10 +33,42 @@ typedef struct {
     
     /* RNG for effects */
     rng_t rng;
+
+    /* damage-tracked path */
+    uint32_t *row_tmp;      /* one row, chroma scratch */
+    uint32_t *tile_stamp;   /* per raster tile: fx_frame it was last drawn */
+    uint32_t fx_frame;
+    uint32_t ghost_frames;  /* frames a ghost takes to fade to background */
+    int tw, th;
+
+    /* fixed-point effect constants */
+    uint32_t persist_w;     /* weight of the new frame, 0-256 */
+    uint32_t bleed_w;       /* weight of the neighbour average, 0-256 */
+    uint8_t scan_lut[256];  /* darkened value of each channel level */
+
+    /* this frame's noise pixels, drawn by crt_fx_begin */
+    crt_noise_t *noise;
 } crt_fx_t;
 
 void crt_fx_init(crt_fx_t *fx, uint64_t seed, int w, int h);
 void crt_fx_apply(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame);
+/* Same effects on a frame that is background outside `drawn` (the damage
+ * recorded since the previous call's `out` was cleared).  Only the drawn
+ * tiles and still-fading ghosts are processed; `out` receives every tile
+ * that may now differ from background, rectangles built. */
+void crt_fx_apply_damage(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame,
+                         const raster_damage_t *drawn, raster_damage_t *out);
+
+/* The same work split for band-parallel rendering:
+ *   crt_fx_begin       once per frame, draws the noise pixels
+ *   crt_fx_apply_rows  per band of rows [y0, y1), any thread; `row_tmp`
+ *                      is one row of scratch per thread (NULL = the
+ *                      built-in one).  With `drawn` (damage path) bands
+ *                      must start on a RASTER_TILE row and `out` gets the
+ *                      band's tile rows; raster_damage_build(out) after. */
+void crt_fx_begin(crt_fx_t *fx, int w, int h, bool track_damage);
+void crt_fx_apply_rows(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame, int y0, int y1,
+                       const raster_damage_t *drawn, raster_damage_t *out, uint32_t *row_tmp);
 void crt_fx_cleanup(crt_fx_t *fx);
 
 #endif /* CRT_FX_H */ 
\ No newline at end of file
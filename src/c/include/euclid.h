@@ -9,4 +9,26 @@
  */
 void euclid_pattern(int pulses, int steps, uint8_t *out);
 
+#define EUCLID_MAX_STEPS 64
+
+/* Rotate a `steps`-long mask so that new step i is old step (i + rot) % steps. */
+static inline uint64_t euclid_rotate(uint64_t mask, int steps, int rot)
+{
+    rot %= steps;
+    if(rot == 0) return mask;
+    uint64_t full = steps == 64 ? ~0ull : ((1ull << steps) - 1u);
+    return ((mask >> rot) | (mask << (steps - rot))) & full;
+}
+
+/* The same rhythm as euclid_pattern, rotated by `rot`, as a bitmask with
+ * bit i = step i.  O(1): a lookup in the precomputed table of every
+ * pattern up to EUCLID_MAX_STEPS steps plus a bit rotation.  Returns 0 for
+ * pulses/steps outside 0 <= pulses <= steps <= EUCLID_MAX_STEPS. */
+uint64_t euclid_mask(int pulses, int steps, int rot);
+
+static inline int euclid_hit(uint64_t mask, uint32_t step)
+{
+    return (int)((mask >> step) & 1u);
+}
+
 #endif /* EUCLID_H */ 
\ No newline at end of file
@@ -0,0 +1,638 @@
+/* Generated by tools/euclid_table.py – do not edit. */
+#ifndef EUCLID_TABLE_H
+#define EUCLID_TABLE_H
+
+#include <stdint.h>
+
+#define EUCLID_TABLE_SIZE 2144u
+
+/* Bucket pattern of (pulses, steps), bit i = step i, at
+ * [(steps - 1) * (steps + 2) / 2 + pulses] for 1 <= steps <= 64. */
+static const uint64_t euclid_table[EUCLID_TABLE_SIZE] = {
+    /* 1 */
+    0x0000000000000000ull, 0x0000000000000001ull,
+    /* 2 */
+    0x0000000000000000ull, 0x0000000000000002ull, 0x0000000000000003ull,
+    /* 3 */
+    0x0000000000000000ull, 0x0000000000000004ull, 0x0000000000000006ull, 0x0000000000000007ull,
+    /* 4 */
+    0x0000000000000000ull, 0x0000000000000008ull, 0x000000000000000aull, 0x000000000000000eull,
+    0x000000000000000full,
+    /* 5 */
+    0x0000000000000000ull, 0x0000000000000010ull, 0x0000000000000014ull, 0x000000000000001aull,
+    0x000000000000001eull, 0x000000000000001full,
+    /* 6 */
+    0x0000000000000000ull, 0x0000000000000020ull, 0x0000000000000024ull, 0x000000000000002aull,
+    0x0000000000000036ull, 0x000000000000003eull, 0x000000000000003full,
+    /* 7 */
+    0x0000000000000000ull, 0x0000000000000040ull, 0x0000000000000048ull, 0x0000000000000054ull,
+    0x000000000000006aull, 0x0000000000000076ull, 0x000000000000007eull, 0x000000000000007full,
+    /* 8 */
+    0x0000000000000000ull, 0x0000000000000080ull, 0x0000000000000088ull, 0x00000000000000a4ull,
+    0x00000000000000aaull, 0x00000000000000daull, 0x00000000000000eeull, 0x00000000000000feull,
+    0x00000000000000ffull,
+    /* 9 */
+    0x0000000000000000ull, 0x0000000000000100ull, 0x0000000000000110ull, 0x0000000000000124ull,
+    0x0000000000000154ull, 0x00000000000001aaull, 0x00000000000001b6ull, 0x00000000000001eeull,
+    0x00000000000001feull, 0x00000000000001ffull,
+    /* 10 */
+    0x0000000000000000ull, 0x0000000000000200ull, 0x0000000000000210ull, 0x0000000000000248ull,
+    0x0000000000000294ull, 0x00000000000002aaull, 0x000000000000035aull, 0x00000000000003b6ull,
+    0x00000000000003deull, 0x00000000000003feull, 0x00000000000003ffull,
+    /* 11 */
+    0x0000000000000000ull, 0x0000000000000400ull, 0x0000000000000420ull, 0x0000000000000488ull,
+    0x0000000000000524ull, 0x0000000000000554ull, 0x00000000000006aaull, 0x00000000000006daull,
+    0x0000000000000776ull, 0x00000000000007deull, 0x00000000000007feull, 0x00000000000007ffull,
+    /* 12 */
+    0x0000000000000000ull, 0x0000000000000800ull, 0x0000000000000820ull, 0x0000000000000888ull,
+    0x0000000000000924ull, 0x0000000000000a94ull, 0x0000000000000aaaull, 0x0000000000000d6aull,
+    0x0000000000000db6ull, 0x0000000000000eeeull, 0x0000000000000fbeull, 0x0000000000000ffeull,
+    0x0000000000000fffull,
+    /* 13 */
+    0x0000000000000000ull, 0x0000000000001000ull, 0x0000000000001040ull, 0x0000000000001110ull,
+    0x0000000000001248ull, 0x00000000000014a4ull, 0x0000000000001554ull, 0x0000000000001aaaull,
+    0x0000000000001b5aull, 0x0000000000001db6ull, 0x0000000000001eeeull, 0x0000000000001fbeull,
+    0x0000000000001ffeull, 0x0000000000001fffull,
+    /* 14 */
+    0x0000000000000000ull, 0x0000000000002000ull, 0x0000000000002040ull, 0x0000000000002210ull,
+    0x0000000000002448ull, 0x0000000000002924ull, 0x0000000000002a54ull, 0x0000000000002aaaull,
+    0x000000000000356aull, 0x00000000000036daull, 0x0000000000003b76ull, 0x0000000000003deeull,
+    0x0000000000003f7eull, 0x0000000000003ffeull, 0x0000000000003fffull,
+    /* 15 */
+    0x0000000000000000ull, 0x0000000000004000ull, 0x0000000000004080ull, 0x0000000000004210ull,
+    0x0000000000004888ull, 0x0000000000004924ull, 0x0000000000005294ull, 0x0000000000005554ull,
+    0x0000000000006aaaull, 0x0000000000006b5aull, 0x0000000000006db6ull, 0x0000000000007776ull,
+    0x0000000000007bdeull, 0x0000000000007f7eull, 0x0000000000007ffeull, 0x0000000000007fffull,
+    /* 16 */
+    0x0000000000000000ull, 0x0000000000008000ull, 0x0000000000008080ull, 0x0000000000008420ull,
+    0x0000000000008888ull, 0x0000000000009248ull, 0x000000000000a4a4ull, 0x000000000000aa54ull,
+    0x000000000000aaaaull, 0x000000000000d5aaull, 0x000000000000dadaull, 0x000000000000edb6ull,
+    0x000000000000eeeeull, 0x000000000000fbdeull, 0x000000000000fefeull, 0x000000000000fffeull,
+    0x000000000000ffffull,
+    /* 17 */
+    0x0000000000000000ull, 0x0000000000010000ull, 0x0000000000010100ull, 0x0000000000010820ull,
+    0x0000000000011110ull, 0x0000000000012448ull, 0x0000000000014924ull, 0x0000000000015294ull,
+    0x0000000000015554ull, 0x000000000001aaaaull, 0x000000000001ad6aull, 0x000000000001b6daull,
+    0x000000000001dbb6ull, 0x000000000001eeeeull, 0x000000000001f7deull, 0x000000000001fefeull,
+    0x000000000001fffeull, 0x000000000001ffffull,
+    /* 18 */
+    0x0000000000000000ull, 0x0000000000020000ull, 0x0000000000020100ull, 0x0000000000020820ull,
+    0x0000000000022110ull, 0x0000000000024488ull, 0x0000000000024924ull, 0x00000000000294a4ull,
+    0x000000000002a954ull, 0x000000000002aaaaull, 0x00000000000355aaull, 0x0000000000036b5aull,
+    0x0000000000036db6ull, 0x000000000003bb76ull, 0x000000000003ddeeull, 0x000000000003efbeull,
+    0x000000000003fdfeull, 0x000000000003fffeull, 0x000000000003ffffull,
+    /* 19 */
+    0x0000000000000000ull, 0x0000000000040000ull, 0x0000000000040200ull, 0x0000000000041040ull,
+    0x0000000000044210ull, 0x0000000000048888ull, 0x0000000000049248ull, 0x0000000000052524ull,
+    0x0000000000054a94ull, 0x0000000000055554ull, 0x000000000006aaaaull, 0x000000000006b56aull,
+    0x000000000006dadaull, 0x0000000000076db6ull, 0x0000000000077776ull, 0x000000000007bdeeull,
+    0x000000000007efbeull, 0x000000000007fdfeull, 0x000000000007fffeull, 0x000000000007ffffull,
+    /* 20 */
+    0x0000000000000000ull, 0x0000000000080000ull, 0x0000000000080200ull, 0x0000000000082040ull,
+    0x0000000000084210ull, 0x0000000000088888ull, 0x0000000000092248ull, 0x00000000000a4924ull,
+    0x00000000000a5294ull, 0x00000000000aa954ull, 0x00000000000aaaaaull, 0x00000000000d56aaull,
+    0x00000000000d6b5aull, 0x00000000000db6daull, 0x00000000000edbb6ull, 0x00000000000eeeeeull,
+    0x00000000000f7bdeull, 0x00000000000fdfbeull, 0x00000000000ffbfeull, 0x00000000000ffffeull,
+    0x00000000000fffffull,
+    /* 21 */
+    0x0000000000000000ull, 0x0000000000100000ull, 0x0000000000100400ull, 0x0000000000102040ull,
+    0x0000000000108420ull, 0x0000000000111110ull, 0x0000000000122448ull, 0x0000000000124924ull,
+    0x000000000014a4a4ull, 0x0000000000152a54ull, 0x0000000000155554ull, 0x00000000001aaaaaull,
+    0x00000000001ab56aull, 0x00000000001b5b5aull, 0x00000000001b6db6ull, 0x00000000001dbb76ull,
+    0x00000000001eeeeeull, 0x00000000001f7bdeull, 0x00000000001fbf7eull, 0x00000000001ffbfeull,
+    0x00000000001ffffeull, 0x00000000001fffffull,
+    /* 22 */
+    0x0000000000000000ull, 0x0000000000200000ull, 0x0000000000200400ull, 0x0000000000204080ull,
+    0x0000000000210420ull, 0x0000000000222110ull, 0x0000000000244488ull, 0x0000000000249248ull,
+    0x0000000000292524ull, 0x00000000002a5294ull, 0x00000000002aa554ull, 0x00000000002aaaaaull,
+    0x00000000003556aaull, 0x000000000035ad6aull, 0x000000000036d6daull, 0x00000000003b6db6ull,
+    0x00000000003bb776ull, 0x00000000003ddeeeull, 0x00000000003ef7deull, 0x00000000003fbf7eull,
+    0x00000000003ff7feull, 0x00000000003ffffeull, 0x00000000003fffffull,
+    /* 23 */
+    0x0000000000000000ull, 0x0000000000400000ull, 0x0000000000400800ull, 0x0000000000408080ull,
+    0x0000000000420820ull, 0x0000000000442210ull, 0x0000000000488888ull, 0x0000000000492248ull,
+    0x0000000000524924ull, 0x00000000005294a4ull, 0x0000000000552a54ull, 0x0000000000555554ull,
+    0x00000000006aaaaaull, 0x00000000006ad5aaull, 0x00000000006d6b5aull, 0x00000000006db6daull,
+    0x000000000076ddb6ull, 0x0000000000777776ull, 0x00000000007bddeeull, 0x00000000007df7deull,
+    0x00000000007f7f7eull, 0x00000000007ff7feull, 0x00000000007ffffeull, 0x00000000007fffffull,
+    /* 24 */
+    0x0000000000000000ull, 0x0000000000800000ull, 0x0000000000800800ull, 0x0000000000808080ull,
+    0x0000000000820820ull, 0x0000000000884210ull, 0x0000000000888888ull, 0x0000000000922448ull,
+    0x0000000000924924ull, 0x0000000000a4a4a4ull, 0x0000000000a94a94ull, 0x0000000000aaa554ull,
+    0x0000000000aaaaaaull, 0x0000000000d55aaaull, 0x0000000000d6ad6aull, 0x0000000000dadadaull,
+    0x0000000000db6db6ull, 0x0000000000eddbb6ull, 0x0000000000eeeeeeull, 0x0000000000f7bdeeull,
+    0x0000000000fbefbeull, 0x0000000000fefefeull, 0x0000000000ffeffeull, 0x0000000000fffffeull,
+    0x0000000000ffffffull,
+    /* 25 */
+    0x0000000000000000ull, 0x0000000001000000ull, 0x0000000001001000ull, 0x0000000001010100ull,
+    0x0000000001041040ull, 0x0000000001084210ull, 0x0000000001111110ull, 0x0000000001224488ull,
+    0x0000000001249248ull, 0x0000000001492924ull, 0x00000000014a5294ull, 0x000000000154aa54ull,
+    0x0000000001555554ull, 0x0000000001aaaaaaull, 0x0000000001ab55aaull, 0x0000000001ad6b5aull,
+    0x0000000001b6d6daull, 0x0000000001db6db6ull, 0x0000000001ddbb76ull, 0x0000000001eeeeeeull,
+    0x0000000001ef7bdeull, 0x0000000001fbefbeull, 0x0000000001fefefeull, 0x0000000001ffeffeull,
+    0x0000000001fffffeull, 0x0000000001ffffffull,
+    /* 26 */
+    0x0000000000000000ull, 0x0000000002000000ull, 0x0000000002001000ull, 0x0000000002020100ull,
+    0x0000000002081040ull, 0x0000000002108420ull, 0x0000000002221110ull, 0x0000000002444888ull,
+    0x0000000002491248ull, 0x0000000002924924ull, 0x00000000029494a4ull, 0x0000000002a54a94ull,
+    0x0000000002aa9554ull, 0x0000000002aaaaaaull, 0x0000000003555aaaull, 0x00000000035ab56aull,
+    0x00000000036b5b5aull, 0x00000000036db6daull, 0x0000000003b6ddb6ull, 0x0000000003bbb776ull,
+    0x0000000003dddeeeull, 0x0000000003ef7bdeull, 0x0000000003f7dfbeull, 0x0000000003fdfefeull,
+    0x0000000003ffdffeull, 0x0000000003fffffeull, 0x0000000003ffffffull,
+    /* 27 */
+    0x0000000000000000ull, 0x0000000004000000ull, 0x0000000004002000ull, 0x0000000004020100ull,
+    0x0000000004102040ull, 0x0000000004210420ull, 0x0000000004422110ull, 0x0000000004888888ull,
+    0x0000000004912448ull, 0x0000000004924924ull, 0x0000000005252524ull, 0x00000000054a5294ull,
+    0x000000000552a954ull, 0x0000000005555554ull, 0x0000000006aaaaaaull, 0x0000000006ab55aaull,
+    0x0000000006b5ad6aull, 0x0000000006dadadaull, 0x0000000006db6db6ull, 0x00000000076edbb6ull,
+    0x0000000007777776ull, 0x0000000007bbddeeull, 0x0000000007defbdeull, 0x0000000007efdfbeull,
+    0x0000000007fbfdfeull, 0x0000000007ffdffeull, 0x0000000007fffffeull, 0x0000000007ffffffull,
+    /* 28 */
+    0x0000000000000000ull, 0x0000000008000000ull, 0x0000000008002000ull, 0x0000000008040200ull,
+    0x0000000008102040ull, 0x0000000008410820ull, 0x0000000008842210ull, 0x0000000008888888ull,
+    0x0000000009122448ull, 0x0000000009249248ull, 0x000000000a492924ull, 0x000000000a5294a4ull,
+    0x000000000a952a54ull, 0x000000000aaa9554ull, 0x000000000aaaaaaaull, 0x000000000d556aaaull,
+    0x000000000d5ab56aull, 0x000000000dad6b5aull, 0x000000000db6b6daull, 0x000000000edb6db6ull,
+    0x000000000eddbb76ull, 0x000000000eeeeeeeull, 0x000000000f7bbdeeull, 0x000000000fbef7deull,
+    0x000000000fdfbf7eull, 0x000000000ffbfdfeull, 0x000000000fffbffeull, 0x000000000ffffffeull,
+    0x000000000fffffffull,
+    /* 29 */
+    0x0000000000000000ull, 0x0000000010000000ull, 0x0000000010004000ull, 0x0000000010080200ull,
+    0x0000000010204080ull, 0x0000000010820820ull, 0x0000000011084210ull, 0x0000000011111110ull,
+    0x0000000012244488ull, 0x0000000012491248ull, 0x0000000014924924ull, 0x0000000014a4a4a4ull,
+    0x0000000015295294ull, 0x000000001552a954ull, 0x0000000015555554ull, 0x000000001aaaaaaaull,
+    0x000000001aad56aaull, 0x000000001ad6ad6aull, 0x000000001b5b5b5aull, 0x000000001b6db6daull,
+    0x000000001db6edb6ull, 0x000000001ddbbb76ull, 0x000000001eeeeeeeull, 0x000000001ef7bdeeull,
+    0x000000001f7df7deull, 0x000000001fdfbf7eull, 0x000000001ff7fdfeull, 0x000000001fffbffeull,
+    0x000000001ffffffeull, 0x000000001fffffffull,
+    /* 30 */
+    0x0000000000000000ull, 0x0000000020000000ull, 0x0000000020004000ull, 0x0000000020080200ull,
+    0x0000000020404080ull, 0x0000000020820820ull, 0x0000000021084210ull, 0x0000000022221110ull,
+    0x0000000024444888ull, 0x0000000024892248ull, 0x0000000024924924ull, 0x0000000029292524ull,
+    0x00000000294a5294ull, 0x000000002a952a54ull, 0x000000002aaa5554ull, 0x000000002aaaaaaaull,
+    0x0000000035556aaaull, 0x00000000356ad5aaull, 0x0000000035ad6b5aull, 0x0000000036d6dadaull,
+    0x0000000036db6db6ull, 0x000000003b6edbb6ull, 0x000000003bbb7776ull, 0x000000003dddeeeeull,
+    0x000000003def7bdeull, 0x000000003efbefbeull, 0x000000003fbf7f7eull, 0x000000003feffbfeull,
+    0x000000003fff7ffeull, 0x000000003ffffffeull, 0x000000003fffffffull,
+    /* 31 */
+    0x0000000000000000ull, 0x0000000040000000ull, 0x0000000040008000ull, 0x0000000040100400ull,
+    0x0000000040808080ull, 0x0000000041041040ull, 0x0000000042108420ull, 0x0000000044422110ull,
+    0x0000000048888888ull, 0x0000000049122448ull, 0x0000000049249248ull, 0x0000000052494924ull,
+    0x00000000529494a4ull, 0x0000000054a94a94ull, 0x00000000554aa954ull, 0x0000000055555554ull,
+    0x000000006aaaaaaaull, 0x000000006ab556aaull, 0x000000006b56b56aull, 0x000000006d6b6b5aull,
+    0x000000006db6b6daull, 0x0000000076db6db6ull, 0x0000000076eddbb6ull, 0x0000000077777776ull,
+    0x000000007bbddeeeull, 0x000000007def7bdeull, 0x000000007efbefbeull, 0x000000007f7f7f7eull,
+    0x000000007feffbfeull, 0x000000007fff7ffeull, 0x000000007ffffffeull, 0x000000007fffffffull,
+    /* 32 */
+    0x0000000000000000ull, 0x0000000080000000ull, 0x0000000080008000ull, 0x0000000080200400ull,
+    0x0000000080808080ull, 0x0000000082081040ull, 0x0000000084208420ull, 0x0000000088442210ull,
+    0x0000000088888888ull, 0x0000000091224488ull, 0x0000000092489248ull, 0x00000000a4924924ull,
+    0x00000000a4a4a4a4ull, 0x00000000a94a5294ull, 0x00000000aa54aa54ull, 0x00000000aaaa5554ull,
+    0x00000000aaaaaaaaull, 0x00000000d555aaaaull, 0x00000000d5aad5aaull, 0x00000000d6b5ad6aull,
+    0x00000000dadadadaull, 0x00000000db6db6daull, 0x00000000edb6edb6ull, 0x00000000eeddbb76ull,
+    0x00000000eeeeeeeeull, 0x00000000f7bbddeeull, 0x00000000fbdefbdeull, 0x00000000fdf7efbeull,
+    0x00000000fefefefeull, 0x00000000ffdffbfeull, 0x00000000fffefffeull, 0x00000000fffffffeull,
+    0x00000000ffffffffull,
+    /* 33 */
+    0x0000000000000000ull, 0x0000000100000000ull, 0x0000000100010000ull, 0x0000000100200400ull,
+    0x0000000101010100ull, 0x0000000104082040ull, 0x0000000108210420ull, 0x0000000110844210ull,
+    0x0000000111111110ull, 0x0000000122244488ull, 0x0000000124892248ull, 0x0000000124924924ull,
+    0x0000000149292524ull, 0x000000014a5294a4ull, 0x0000000152a54a94ull, 0x00000001552aa554ull,
+    0x0000000155555554ull, 0x00000001aaaaaaaaull, 0x00000001aab556aaull, 0x00000001ad5ab56aull,
+    0x00000001b5ad6b5aull, 0x00000001b6b6d6daull, 0x00000001b6db6db6ull, 0x00000001db76ddb6ull,
+    0x00000001ddbbb776ull, 0x00000001eeeeeeeeull, 0x00000001ef7bbdeeull, 0x00000001f7bef7deull,
+    0x00000001fbf7dfbeull, 0x00000001fefefefeull, 0x00000001ffbff7feull, 0x00000001fffefffeull,
+    0x00000001fffffffeull, 0x00000001ffffffffull,
+    /* 34 */
+    0x0000000000000000ull, 0x0000000200000000ull, 0x0000000200010000ull, 0x0000000200400800ull,
+    0x0000000202010100ull, 0x0000000208102040ull, 0x0000000210410820ull, 0x0000000221084210ull,
+    0x0000000222211110ull, 0x0000000244448888ull, 0x0000000248912448ull, 0x0000000249249248ull,
+    0x0000000292494924ull, 0x000000029494a4a4ull, 0x00000002a5295294ull, 0x00000002a954aa54ull,
+    0x00000002aaa95554ull, 0x00000002aaaaaaaaull, 0x000000035555aaaaull, 0x0000000356ab55aaull,
+    0x000000035ad5ad6aull, 0x000000036b6b5b5aull, 0x000000036db5b6daull, 0x00000003b6db6db6ull,
+    0x00000003b76ddbb6ull, 0x00000003bbbb7776ull, 0x00000003ddddeeeeull, 0x00000003def7bdeeull,
+    0x00000003efbdf7deull, 0x00000003f7efdfbeull, 0x00000003fdfdfefeull, 0x00000003ffbff7feull,
+    0x00000003fffdfffeull, 0x00000003fffffffeull, 0x00000003ffffffffull,
+    /* 35 */
+    0x0000000000000000ull, 0x0000000400000000ull, 0x0000000400020000ull, 0x0000000400800800ull,
+    0x0000000404020100ull, 0x0000000408102040ull, 0x0000000420820820ull, 0x0000000421084210ull,
+    0x0000000444222110ull, 0x0000000488888888ull, 0x0000000489122448ull, 0x0000000492489248ull,
+    0x0000000524924924ull, 0x0000000525252524ull, 0x00000005294a5294ull, 0x000000054a952a54ull,
+    0x00000005552aa554ull, 0x0000000555555554ull, 0x00000006aaaaaaaaull, 0x00000006aad55aaaull,
+    0x00000006ad5ab56aull, 0x00000006b5ad6b5aull, 0x00000006dadadadaull, 0x00000006db6db6daull,
+    0x000000076db76db6ull, 0x000000076eddbb76ull, 0x0000000777777776ull, 0x00000007bbdddeeeull,
+    0x00000007bdef7bdeull, 0x00000007df7df7deull, 0x00000007efdfbf7eull, 0x00000007fbfdfefeull,
+    0x00000007ff7ff7feull, 0x00000007fffdfffeull, 0x00000007fffffffeull, 0x00000007ffffffffull,
+    /* 36 */
+    0x0000000000000000ull, 0x0000000800000000ull, 0x0000000800020000ull, 0x0000000800800800ull,
+    0x0000000804020100ull, 0x0000000810204080ull, 0x0000000820820820ull, 0x0000000842108420ull,
+    0x0000000884422110ull, 0x0000000888888888ull, 0x0000000912224488ull, 0x0000000924492248ull,
+    0x0000000924924924ull, 0x0000000a49492924ull, 0x0000000a529294a4ull, 0x0000000a94a94a94ull,
+    0x0000000aa552a954ull, 0x0000000aaaa95554ull, 0x0000000aaaaaaaaaull, 0x0000000d5556aaaaull,
+    0x0000000d56ab55aaull, 0x0000000d6ad6ad6aull, 0x0000000dad6b6b5aull, 0x0000000db6b6d6daull,
+    0x0000000db6db6db6ull, 0x0000000edbb6ddb6ull, 0x0000000eeddbbb76ull, 0x0000000eeeeeeeeeull,
+    0x0000000f77bbddeeull, 0x0000000fbdef7bdeull, 0x0000000fbefbefbeull, 0x0000000fefdfbf7eull,
+    0x0000000ff7fbfdfeull, 0x0000000ffeffeffeull, 0x0000000ffffbfffeull, 0x0000000ffffffffeull,
+    0x0000000fffffffffull,
+    /* 37 */
+    0x0000000000000000ull, 0x0000001000000000ull, 0x0000001000040000ull, 0x0000001001001000ull,
+    0x0000001008040200ull, 0x0000001020404080ull, 0x0000001041041040ull, 0x0000001084208420ull,
+    0x0000001108842210ull, 0x0000001111111110ull, 0x0000001222444888ull, 0x0000001244912448ull,
+    0x0000001249249248ull, 0x00000014924a4924ull, 0x00000014a4a4a4a4ull, 0x00000015294a5294ull,
+    0x000000154a952a54ull, 0x0000001554aaa554ull, 0x0000001555555554ull, 0x0000001aaaaaaaaaull,
+    0x0000001aab555aaaull, 0x0000001ab56ad5aaull, 0x0000001ad6b5ad6aull, 0x0000001b5b5b5b5aull,
+    0x0000001b6db5b6daull, 0x0000001db6db6db6ull, 0x0000001dbb6edbb6ull, 0x0000001dddbbb776ull,
+    0x0000001eeeeeeeeeull, 0x0000001ef77bddeeull, 0x0000001f7bdf7bdeull, 0x0000001fbefbefbeull,
+    0x0000001fdfbfbf7eull, 0x0000001ff7fbfdfeull, 0x0000001ffeffeffeull, 0x0000001ffffbfffeull,
+    0x0000001ffffffffeull, 0x0000001fffffffffull,
+    /* 38 */
+    0x0000000000000000ull, 0x0000002000000000ull, 0x0000002000040000ull, 0x0000002002001000ull,
+    0x0000002010040200ull, 0x0000002040408080ull, 0x0000002082041040ull, 0x0000002108210420ull,
+    0x0000002210844210ull, 0x0000002222211110ull, 0x0000002444448888ull, 0x0000002489122448ull,
+    0x0000002492449248ull, 0x0000002924924924ull, 0x0000002929252524ull, 0x000000294a5294a4ull,
+    0x0000002a54a54a94ull, 0x0000002aa552a954ull, 0x0000002aaaa55554ull, 0x0000002aaaaaaaaaull,
+    0x000000355556aaaaull, 0x000000355aad56aaull, 0x00000035ab56b56aull, 0x00000036b5ad6b5aull,
+    0x00000036d6d6dadaull, 0x00000036db6db6daull, 0x0000003b6db76db6ull, 0x0000003b76eddbb6ull,
+    0x0000003bbbb77776ull, 0x0000003ddddeeeeeull, 0x0000003def77bdeeull, 0x0000003ef7defbdeull,
+    0x0000003f7df7efbeull, 0x0000003fbfbf7f7eull, 0x0000003feff7fdfeull, 0x0000003ffdffeffeull,
+    0x0000003ffff7fffeull, 0x0000003ffffffffeull, 0x0000003fffffffffull,
+    /* 39 */
+    0x0000000000000000ull, 0x0000004000000000ull, 0x0000004000080000ull, 0x0000004002001000ull,
+    0x0000004020080200ull, 0x0000004080808080ull, 0x0000004102081040ull, 0x0000004208410820ull,
+    0x0000004421084210ull, 0x0000004442221110ull, 0x0000004888888888ull, 0x0000004891224488ull,
+    0x0000004922491248ull, 0x0000004924924924ull, 0x000000524a492924ull, 0x00000052929494a4ull,
+    0x00000054a52a5294ull, 0x000000552a552a54ull, 0x0000005552aa9554ull, 0x0000005555555554ull,
+    0x0000006aaaaaaaaaull, 0x0000006aab555aaaull, 0x0000006ad5aad5aaull, 0x0000006b5ad5ad6aull,
+    0x0000006d6b6b5b5aull, 0x0000006db5b6d6daull, 0x0000006db6db6db6ull, 0x00000076dbb6ddb6ull,
+    0x000000776eddbb76ull, 0x0000007777777776ull, 0x0000007bbbdddeeeull, 0x0000007bdef7bdeeull,
+    0x0000007df7bef7deull, 0x0000007efbf7dfbeull, 0x0000007f7f7f7f7eull, 0x0000007fdff7fdfeull,
+    0x0000007ffbffdffeull, 0x0000007ffff7fffeull, 0x0000007ffffffffeull, 0x0000007fffffffffull,
+    /* 40 */
+    0x0000000000000000ull, 0x0000008000000000ull, 0x0000008000080000ull, 0x0000008004002000ull,
+    0x0000008020080200ull, 0x0000008080808080ull, 0x0000008204082040ull, 0x0000008410420820ull,
+    0x0000008421084210ull, 0x0000008884422110ull, 0x0000008888888888ull, 0x0000009122244488ull,
+    0x0000009224892248ull, 0x0000009249249248ull, 0x000000a4924a4924ull, 0x000000a4a4a4a4a4ull,
+    0x000000a5294a5294ull, 0x000000a952a54a94ull, 0x000000aa954aa954ull, 0x000000aaaaa55554ull,
+    0x000000aaaaaaaaaaull, 0x000000d5555aaaaaull, 0x000000d56aad56aaull, 0x000000d6ad5ab56aull,
+    0x000000d6b5ad6b5aull, 0x000000dadadadadaull, 0x000000db6dadb6daull, 0x000000edb6db6db6ull,
+    0x000000edbb6edbb6ull, 0x000000eedddbbb76ull, 0x000000eeeeeeeeeeull, 0x000000f77bbddeeeull,
+    0x000000f7bdef7bdeull, 0x000000fbefbdf7deull, 0x000000fdfbefdfbeull, 0x000000fefefefefeull,
+    0x000000ffbfeffbfeull, 0x000000fffbffdffeull, 0x000000ffffeffffeull, 0x000000fffffffffeull,
+    0x000000ffffffffffull,
+    /* 41 */
+    0x0000000000000000ull, 0x0000010000000000ull, 0x0000010000100000ull, 0x0000010008002000ull,
+    0x0000010040100400ull, 0x0000010101010100ull, 0x0000010408102040ull, 0x0000010820820820ull,
+    0x0000010842108420ull, 0x0000011088442210ull, 0x0000011111111110ull, 0x0000012224444888ull,
+    0x0000012448922448ull, 0x0000012492449248ull, 0x0000014924924924ull, 0x0000014949292524ull,
+    0x0000014a529294a4ull, 0x0000015295295294ull, 0x00000154aa54aa54ull, 0x0000015552aa9554ull,
+    0x0000015555555554ull, 0x000001aaaaaaaaaaull, 0x000001aaad556aaaull, 0x000001ab55ab55aaull,
+    0x000001ad6ad6ad6aull, 0x000001b5ad6d6b5aull, 0x000001b6b6d6dadaull, 0x000001b6db6db6daull,
+    0x000001db6dbb6db6ull, 0x000001dbb76ddbb6ull, 0x000001dddbbbb776ull, 0x000001eeeeeeeeeeull,
+    0x000001ef77bbddeeull, 0x000001f7bdef7bdeull, 0x000001f7df7df7deull, 0x000001fbf7efdfbeull,
+    0x000001fefefefefeull, 0x000001ffbfeffbfeull, 0x000001fff7ffdffeull, 0x000001ffffeffffeull,
+    0x000001fffffffffeull, 0x000001ffffffffffull,
+    /* 42 */
+    0x0000000000000000ull, 0x0000020000000000ull, 0x0000020000100000ull, 0x0000020008002000ull,
+    0x0000020080100400ull, 0x0000020202010100ull, 0x0000020408102040ull, 0x0000020820820820ull,
+    0x0000021084108420ull, 0x0000022108842210ull, 0x0000022222111110ull, 0x0000024444488888ull,
+    0x0000024489122448ull, 0x0000024922491248ull, 0x0000024924924924ull, 0x000002924a492924ull,
+    0x000002949494a4a4ull, 0x000002a5294a5294ull, 0x000002a54a952a54ull, 0x000002aa554aa954ull,
+    0x000002aaaa955554ull, 0x000002aaaaaaaaaaull, 0x00000355555aaaaaull, 0x00000355aab556aaull,
+    0x00000356ad5ab56aull, 0x0000035ad6b5ad6aull, 0x0000036b6b5b5b5aull, 0x0000036dadb6b6daull,
+    0x0000036db6db6db6ull, 0x000003b6ddb6edb6ull, 0x000003b76eddbb76ull, 0x000003bbbbb77776ull,
+    0x000003dddddeeeeeull, 0x000003deef7bbdeeull, 0x000003ef7bdf7bdeull, 0x000003efbefbefbeull,
+    0x000003f7efdfbf7eull, 0x000003fdfdfefefeull, 0x000003ff7fdffbfeull, 0x000003ffefffbffeull,
+    0x000003ffffdffffeull, 0x000003fffffffffeull, 0x000003ffffffffffull,
+    /* 43 */
+    0x0000000000000000ull, 0x0000040000000000ull, 0x0000040000200000ull, 0x0000040010004000ull,
+    0x0000040100200400ull, 0x0000040402020100ull, 0x0000040810204080ull, 0x0000041041041040ull,
+    0x0000042104210420ull, 0x0000044210884210ull, 0x0000044442221110ull, 0x0000048888888888ull,
+    0x0000048912224488ull, 0x0000049224892248ull, 0x0000049249249248ull, 0x0000052492524924ull,
+    0x0000052525252524ull, 0x000005294a5294a4ull, 0x0000054a94a94a94ull, 0x00000552a954aa54ull,
+    0x000005554aaa9554ull, 0x0000055555555554ull, 0x000006aaaaaaaaaaull, 0x000006aab5556aaaull,
+    0x000006ad56ab55aaull, 0x000006b56b56b56aull, 0x000006d6b5ad6b5aull, 0x000006dadadadadaull,
+    0x000006db6dadb6daull, 0x0000076db6db6db6ull, 0x0000076ddb76ddb6ull, 0x00000776edddbb76ull,
+    0x0000077777777776ull, 0x000007bbbdddeeeeull, 0x000007bdef77bdeeull, 0x000007defbdefbdeull,
+    0x000007efbefbefbeull, 0x000007f7efdfbf7eull, 0x000007fbfdfdfefeull, 0x000007feffdffbfeull,
+    0x000007ffefffbffeull, 0x000007ffffdffffeull, 0x000007fffffffffeull, 0x000007ffffffffffull,
+    /* 44 */
+    0x0000000000000000ull, 0x0000080000000000ull, 0x0000080000200000ull, 0x0000080020004000ull,
+    0x0000080100200400ull, 0x0000080804020100ull, 0x0000081020204080ull, 0x0000082082041040ull,
+    0x0000084108210420ull, 0x0000088421084210ull, 0x0000088844222110ull, 0x0000088888888888ull,
+    0x0000091122244488ull, 0x0000092248912448ull, 0x0000092492249248ull, 0x00000a4924924924ull,
+    0x00000a4949292524ull, 0x00000a52929494a4ull, 0x00000a94a52a5294ull, 0x00000aa54a952a54ull,
+    0x00000aa9552aa554ull, 0x00000aaaaa955554ull, 0x00000aaaaaaaaaaaull, 0x00000d55556aaaaaull,
+    0x00000d55aab556aaull, 0x00000d5ab56ad5aaull, 0x00000d6b5ab5ad6aull, 0x00000dad6d6b6b5aull,
+    0x00000db5b6b6d6daull, 0x00000db6db6db6daull, 0x00000edb6dbb6db6ull, 0x00000eddb76edbb6ull,
+    0x00000eedddbbb776ull, 0x00000eeeeeeeeeeeull, 0x00000f77bbbddeeeull, 0x00000f7bdef7bdeeull,
+    0x00000fbdf7bef7deull, 0x00000fdf7dfbefbeull, 0x00000fefdfbfbf7eull, 0x00000ff7fbfdfefeull,
+    0x00000ffdffbff7feull, 0x00000fffdfffbffeull, 0x00000fffffbffffeull, 0x00000ffffffffffeull,
+    0x00000fffffffffffull,
+    /* 45 */
+    0x0000000000000000ull, 0x0000100000000000ull, 0x0000100000400000ull, 0x0000100020004000ull,
+    0x0000100200400800ull, 0x0000100804020100ull, 0x0000102020404080ull, 0x0000104102081040ull,
+    0x0000108210410820ull, 0x0000108421084210ull, 0x0000110884422110ull, 0x0000111111111110ull,
+    0x0000122224444888ull, 0x0000124489122448ull, 0x0000124912491248ull, 0x0000124924924924ull,
+    0x0000149252494924ull, 0x000014a4a4a4a4a4ull, 0x000014a5294a5294ull, 0x0000152a54a54a94ull,
+    0x0000154aa552a954ull, 0x000015552aaa5554ull, 0x0000155555555554ull, 0x00001aaaaaaaaaaaull,
+    0x00001aaab5556aaaull, 0x00001aad56ab55aaull, 0x00001ad5ab5ab56aull, 0x00001ad6b5ad6b5aull,
+    0x00001b5b5b5b5b5aull, 0x00001b6dadb6b6daull, 0x00001b6db6db6db6ull, 0x00001db6edb6edb6ull,
+    0x00001dbb76eddbb6ull, 0x00001dddbbbb7776ull, 0x00001eeeeeeeeeeeull, 0x00001eef77bbddeeull,
+    0x00001ef7bdef7bdeull, 0x00001f7defbef7deull, 0x00001fbefdf7efbeull, 0x00001fdfbfbf7f7eull,
+    0x00001feff7fbfdfeull, 0x00001ffdffbff7feull, 0x00001fffbfff7ffeull, 0x00001fffffbffffeull,
+    0x00001ffffffffffeull, 0x00001fffffffffffull,
+    /* 46 */
+    0x0000000000000000ull, 0x0000200000000000ull, 0x0000200000400000ull, 0x0000200040008000ull,
+    0x0000200400400800ull, 0x0000201008040200ull, 0x0000204040408080ull, 0x0000208104082040ull,
+    0x0000210410420820ull, 0x0000210842108420ull, 0x0000221108442210ull, 0x0000222222111110ull,
+    0x0000244444488888ull, 0x0000244891224488ull, 0x0000249124492248ull, 0x0000249249249248ull,
+    0x0000292492524924ull, 0x0000292929252524ull, 0x0000294a525294a4ull, 0x00002a52a5295294ull,
+    0x00002a952a552a54ull, 0x00002aa9552aa554ull, 0x00002aaaaa555554ull, 0x00002aaaaaaaaaaaull,
+    0x00003555556aaaaaull, 0x00003556aad55aaaull, 0x0000356ad56ad5aaull, 0x000035ad5ad6ad6aull,
+    0x000036b5ad6d6b5aull, 0x000036d6d6dadadaull, 0x000036db6d6db6daull, 0x00003b6db6db6db6ull,
+    0x00003b6edb76ddb6ull, 0x00003bb76eddbb76ull, 0x00003bbbbb777776ull, 0x00003dddddeeeeeeull,
+    0x00003deef77bddeeull, 0x00003ef7bdef7bdeull, 0x00003efbef7df7deull, 0x00003f7efbf7dfbeull,
+    0x00003fbfbf7f7f7eull, 0x00003feff7fbfdfeull, 0x00003ffbff7ff7feull, 0x00003fffbfff7ffeull,
+    0x00003fffff7ffffeull, 0x00003ffffffffffeull, 0x00003fffffffffffull,
+    /* 47 */
+    0x0000000000000000ull, 0x0000400000000000ull, 0x0000400000800000ull, 0x0000400080008000ull,
+    0x0000400800800800ull, 0x0000402010040200ull, 0x0000408080808080ull, 0x0000410204102040ull,
+    0x0000420820820820ull, 0x0000421084108420ull, 0x0000442110844210ull, 0x0000444422221110ull,
+    0x0000488888888888ull, 0x0000489112244488ull, 0x0000491244912448ull, 0x0000492492249248ull,
+    0x0000524924924924ull, 0x0000524a49492924ull, 0x000052929494a4a4ull, 0x000054a5294a5294ull,
+    0x000054a952a54a94ull, 0x0000554aa552a954ull, 0x000055552aaa5554ull, 0x0000555555555554ull,
+    0x00006aaaaaaaaaaaull, 0x00006aaad555aaaaull, 0x00006ab55aad56aaull, 0x00006b56ad5ab56aull,
+    0x00006b5ad6b5ad6aull, 0x00006d6d6b6b5b5aull, 0x00006db5b6b6d6daull, 0x00006db6db6db6daull,
+    0x000076db6ddb6db6ull, 0x000076edbb6edbb6ull, 0x0000776eeddbbb76ull, 0x0000777777777776ull,
+    0x00007bbbddddeeeeull, 0x00007bdeef7bbdeeull, 0x00007def7bef7bdeull, 0x00007df7df7df7deull,
+    0x00007efdfbefdfbeull, 0x00007f7f7f7f7f7eull, 0x00007fdfeffbfdfeull, 0x00007ff7ff7ff7feull,
+    0x00007fff7fff7ffeull, 0x00007fffff7ffffeull, 0x00007ffffffffffeull, 0x00007fffffffffffull,
+    /* 48 */
+    0x0000000000000000ull, 0x0000800000000000ull, 0x0000800000800000ull, 0x0000800080008000ull,
+    0x0000800800800800ull, 0x0000804010080200ull, 0x0000808080808080ull, 0x0000820408102040ull,
+    0x0000820820820820ull, 0x0000842084208420ull, 0x0000884210884210ull, 0x0000888444222110ull,
+    0x0000888888888888ull, 0x0000911222444888ull, 0x0000922448922448ull, 0x0000924892489248ull,
+    0x0000924924924924ull, 0x0000a49292494924ull, 0x0000a4a4a4a4a4a4ull, 0x0000a5294a5294a4ull,
+    0x0000a94a94a94a94ull, 0x0000aa54aa54aa54ull, 0x0000aaa554aaa554ull, 0x0000aaaaaa555554ull,
+    0x0000aaaaaaaaaaaaull, 0x0000d55555aaaaaaull, 0x0000d55aaad55aaaull, 0x0000d5aad5aad5aaull,
+    0x0000d6ad6ad6ad6aull, 0x0000dad6b5ad6b5aull, 0x0000dadadadadadaull, 0x0000db6d6db6b6daull,
+    0x0000db6db6db6db6ull, 0x0000edb6edb6edb6ull, 0x0000eddbb6eddbb6ull, 0x0000eeedddbbb776ull,
+    0x0000eeeeeeeeeeeeull, 0x0000f77bbbdddeeeull, 0x0000f7bdeef7bdeeull, 0x0000fbdefbdefbdeull,
+    0x0000fbefbefbefbeull, 0x0000fdfbf7efdfbeull, 0x0000fefefefefefeull, 0x0000ffbfeff7fdfeull,
+    0x0000ffeffeffeffeull, 0x0000fffefffefffeull, 0x0000fffffefffffeull, 0x0000fffffffffffeull,
+    0x0000ffffffffffffull,
+    /* 49 */
+    0x0000000000000000ull, 0x0001000000000000ull, 0x0001000001000000ull, 0x0001000100010000ull,
+    0x0001001001001000ull, 0x0001008020080200ull, 0x0001010101010100ull, 0x0001020408102040ull,
+    0x0001041041041040ull, 0x0001084108210420ull, 0x0001108421084210ull, 0x0001110884422110ull,
+    0x0001111111111110ull, 0x0001222244448888ull, 0x0001224489122448ull, 0x0001248924492248ull,
+    0x0001249249249248ull, 0x0001492492924924ull, 0x0001494929292524ull, 0x00014a52529494a4ull,
+    0x00015294a54a5294ull, 0x000152a54a952a54ull, 0x0001552a9552a954ull, 0x00015554aaaa5554ull,
+    0x0001555555555554ull, 0x0001aaaaaaaaaaaaull, 0x0001aaab5555aaaaull, 0x0001aad56aad56aaull,
+    0x0001ab56ad5ab56aull, 0x0001ad6b5ab5ad6aull, 0x0001b5adad6b6b5aull, 0x0001b6b6d6d6dadaull,
+    0x0001b6db6d6db6daull, 0x0001db6db6db6db6ull, 0x0001db76dbb6ddb6ull, 0x0001dbb76eddbb76ull,
+    0x0001ddddbbbb7776ull, 0x0001eeeeeeeeeeeeull, 0x0001eef77bbddeeeull, 0x0001ef7bdef7bdeeull,
+    0x0001f7bef7defbdeull, 0x0001fbefbefbefbeull, 0x0001fbf7efdfbf7eull, 0x0001fefefefefefeull,
+    0x0001ff7fdff7fdfeull, 0x0001ffeffeffeffeull, 0x0001fffefffefffeull, 0x0001fffffefffffeull,
+    0x0001fffffffffffeull, 0x0001ffffffffffffull,
+    /* 50 */
+    0x0000000000000000ull, 0x0002000000000000ull, 0x0002000001000000ull, 0x0002000200010000ull,
+    0x0002002001001000ull, 0x0002008020080200ull, 0x0002020201010100ull, 0x0002040810204080ull,
+    0x0002082081041040ull, 0x0002104208410820ull, 0x0002108421084210ull, 0x0002211088442210ull,
+    0x0002222221111110ull, 0x0002444444888888ull, 0x0002448911224488ull, 0x0002489224892248ull,
+    0x0002492491249248ull, 0x0002924924924924ull, 0x0002925249492924ull, 0x0002949494a4a4a4ull,
+    0x000294a5294a5294ull, 0x0002a54a54a94a94ull, 0x0002a954a954aa54ull, 0x0002aa9554aaa554ull,
+    0x0002aaaaa9555554ull, 0x0002aaaaaaaaaaaaull, 0x0003555555aaaaaaull, 0x0003556aab555aaaull,
+    0x000356ab55ab55aaull, 0x00035ab5ab56b56aull, 0x00035ad6b5ad6b5aull, 0x00036b6b6b5b5b5aull,
+    0x00036dadb5b6d6daull, 0x00036db6db6db6daull, 0x0003b6db6ddb6db6ull, 0x0003b6edbb6edbb6ull,
+    0x0003bb76edddbb76ull, 0x0003bbbbbb777776ull, 0x0003ddddddeeeeeeull, 0x0003deef77bbddeeull,
+    0x0003def7bdef7bdeull, 0x0003efbdf7bef7deull, 0x0003f7df7dfbefbeull, 0x0003fbf7efdfbf7eull,
+    0x0003fdfdfdfefefeull, 0x0003feffbfeffbfeull, 0x0003ffdffdffeffeull, 0x0003fffdfffefffeull,
+    0x0003fffffdfffffeull, 0x0003fffffffffffeull, 0x0003ffffffffffffull,
+    /* 51 */
+    0x0000000000000000ull, 0x0004000000000000ull, 0x0004000002000000ull, 0x0004000200010000ull,
+    0x0004004002001000ull, 0x0004010040100400ull, 0x0004040202010100ull, 0x0004081020204080ull,
+    0x0004104082081040ull, 0x0004208210410820ull, 0x0004210842108420ull, 0x0004422108842210ull,
+    0x0004444222211110ull, 0x0004888888888888ull, 0x0004891122244488ull, 0x0004912248912448ull,
+    0x0004924892489248ull, 0x0004924924924924ull, 0x0005249292494924ull, 0x0005252525252524ull,
+    0x0005294a525294a4ull, 0x00054a52a5295294ull, 0x000552a54a952a54ull, 0x000554aa954aa954ull,
+    0x00055552aaa95554ull, 0x0005555555555554ull, 0x0006aaaaaaaaaaaaull, 0x0006aaab5555aaaaull,
+    0x0006ab556ab556aaull, 0x0006ad5ab56ad5aaull, 0x0006b5ab5ad5ad6aull, 0x0006d6b5adad6b5aull,
+    0x0006dadadadadadaull, 0x0006db6b6db5b6daull, 0x0006db6db6db6db6ull, 0x00076db76db76db6ull,
+    0x00076edbb76ddbb6ull, 0x000776eedddbbb76ull, 0x0007777777777776ull, 0x0007bbbbddddeeeeull,
+    0x0007bddef77bddeeull, 0x0007def7bdef7bdeull, 0x0007df7befbdf7deull, 0x0007efbf7df7efbeull,
+    0x0007f7efdfdfbf7eull, 0x0007fbfbfdfdfefeull, 0x0007feffbfeffbfeull, 0x0007ffbffdffeffeull,
+    0x0007fffbfffdfffeull, 0x0007fffffdfffffeull, 0x0007fffffffffffeull, 0x0007ffffffffffffull,
+    /* 52 */
+    0x0000000000000000ull, 0x0008000000000000ull, 0x0008000002000000ull, 0x0008000400020000ull,
+    0x0008004002001000ull, 0x0008020080100400ull, 0x0008080402020100ull, 0x0008102020404080ull,
+    0x0008204102081040ull, 0x0008410410820820ull, 0x0008421082108420ull, 0x0008842210844210ull,
+    0x0008884442221110ull, 0x0008888888888888ull, 0x0009112222444888ull, 0x0009224489122448ull,
+    0x0009244922491248ull, 0x0009249249249248ull, 0x000a492492924924ull, 0x000a4a4949292524ull,
+    0x000a5252929494a4ull, 0x000a94a5294a5294ull, 0x000a952a52a54a94ull, 0x000aa552a954aa54ull,
+    0x000aaa5552aa9554ull, 0x000aaaaaa9555554ull, 0x000aaaaaaaaaaaaaull, 0x000d555556aaaaaaull,
+    0x000d556aab555aaaull, 0x000d5aad56ab55aaull, 0x000d6ad5ab5ab56aull, 0x000d6b5ad6b5ad6aull,
+    0x000dad6d6b6b5b5aull, 0x000db5b6b6d6dadaull, 0x000db6db6b6db6daull, 0x000edb6db6db6db6ull,
+    0x000edb76dbb6ddb6ull, 0x000eddbb76eddbb6ull, 0x000eeedddbbbb776ull, 0x000eeeeeeeeeeeeeull,
+    0x000f777bbbdddeeeull, 0x000f7bddef7bbdeeull, 0x000fbdef7bef7bdeull, 0x000fbefbef7df7deull,
+    0x000fdf7efbf7dfbeull, 0x000fefdfdfbfbf7eull, 0x000ff7fbfbfdfefeull, 0x000ffdff7feffbfeull,
+    0x000fff7ffbffdffeull, 0x000ffffbfffdfffeull, 0x000ffffffbfffffeull, 0x000ffffffffffffeull,
+    0x000fffffffffffffull,
+    /* 53 */
+    0x0000000000000000ull, 0x0010000000000000ull, 0x0010000004000000ull, 0x0010000800020000ull,
+    0x0010008004002000ull, 0x0010040080200400ull, 0x0010100804020100ull, 0x0010202040408080ull,
+    0x0010408204082040ull, 0x0010820820820820ull, 0x0010842084208420ull, 0x0011084211084210ull,
+    0x0011108844422110ull, 0x0011111111111110ull, 0x0012222444448888ull, 0x0012244891224488ull,
+    0x0012489224892248ull, 0x0012492491249248ull, 0x0014924924924924ull, 0x001492924a492924ull,
+    0x0014a4a4a4a4a4a4ull, 0x0014a5294a5294a4ull, 0x0015295295295294ull, 0x00154a952a952a54ull,
+    0x001552aa554aa954ull, 0x00155552aaa95554ull, 0x0015555555555554ull, 0x001aaaaaaaaaaaaaull,
+    0x001aaaad5556aaaaull, 0x001aad55aab556aaull, 0x001ab56ad56ad5aaull, 0x001ad6ad6ad6ad6aull,
+    0x001b5ad6b5ad6b5aull, 0x001b5b5b5b5b5b5aull, 0x001b6d6db5b6d6daull, 0x001b6db6db6db6daull,
+    0x001db6db6edb6db6ull, 0x001db76ddb76ddb6ull, 0x001ddbb76eddbb76ull, 0x001ddddbbbbb7776ull,
+    0x001eeeeeeeeeeeeeull, 0x001eef77bbbddeeeull, 0x001ef7bdeef7bdeeull, 0x001f7bdf7bdf7bdeull,
+    0x001f7df7df7df7deull, 0x001fbf7dfbf7dfbeull, 0x001fdfdfbfbf7f7eull, 0x001feff7fbfdfefeull,
+    0x001ffbff7fdffbfeull, 0x001fff7ffbffdffeull, 0x001ffff7fffdfffeull, 0x001ffffffbfffffeull,
+    0x001ffffffffffffeull, 0x001fffffffffffffull,
+    /* 54 */
+    0x0000000000000000ull, 0x0020000000000000ull, 0x0020000004000000ull, 0x0020000800020000ull,
+    0x0020010004002000ull, 0x0020080100200400ull, 0x0020100804020100ull, 0x0020404040808080ull,
+    0x0020810204102040ull, 0x0020820820820820ull, 0x0021082104210420ull, 0x0022108421084210ull,
+    0x0022110884422110ull, 0x0022222221111110ull, 0x0024444444888888ull, 0x0024488912224488ull,
+    0x0024892244912448ull, 0x0024924492489248ull, 0x0024924924924924ull, 0x00292494924a4924ull,
+    0x0029292925252524ull, 0x00294a4a529294a4ull, 0x002a5294a54a5294ull, 0x002a54a952a54a94ull,
+    0x002a954aa552a954ull, 0x002aaa5552aa9554ull, 0x002aaaaaa5555554ull, 0x002aaaaaaaaaaaaaull,
+    0x0035555556aaaaaaull, 0x003555aaad556aaaull, 0x00355aad56ab55aaull, 0x0035ab56ad5ab56aull,
+    0x0035ad6b56b5ad6aull, 0x0036b5adad6b6b5aull, 0x0036d6d6d6dadadaull, 0x0036db6b6db5b6daull,
+    0x0036db6db6db6db6ull, 0x003b6dbb6db76db6ull, 0x003b76ddb76edbb6ull, 0x003bb76eeddbbb76ull,
+    0x003bbbbbb7777776ull, 0x003ddddddeeeeeeeull, 0x003ddeef77bbddeeull, 0x003def7bdef7bdeeull,
+    0x003ef7def7defbdeull, 0x003efbefbefbefbeull, 0x003f7efdf7efdfbeull, 0x003fbfbfbf7f7f7eull,
+    0x003fdfeff7fbfdfeull, 0x003ff7feffdffbfeull, 0x003ffefff7ffdffeull, 0x003fffeffffbfffeull,
+    0x003ffffff7fffffeull, 0x003ffffffffffffeull, 0x003fffffffffffffull,
+    /* 55 */
+    0x0000000000000000ull, 0x0040000000000000ull, 0x0040000008000000ull, 0x0040001000040000ull,
+    0x0040020008002000ull, 0x0040080100200400ull, 0x0040201008040200ull, 0x0040808080808080ull,
+    0x0041020408102040ull, 0x0041041041041040ull, 0x0042084108210420ull, 0x0042108421084210ull,
+    0x0044221108442210ull, 0x0044444222211110ull, 0x0048888888888888ull, 0x0048891122244488ull,
+    0x0049122449122448ull, 0x0049244922491248ull, 0x0049249249249248ull, 0x0052492494924924ull,
+    0x00524a4949292524ull, 0x005292949494a4a4ull, 0x005294a5294a5294ull, 0x0054a94a94a94a94ull,
+    0x00552a552a552a54ull, 0x00554aa9552aa554ull, 0x0055554aaaa95554ull, 0x0055555555555554ull,
+    0x006aaaaaaaaaaaaaull, 0x006aaab55556aaaaull, 0x006aad55aab556aaull, 0x006ad5aad5aad5aaull,
+    0x006b56b56b56b56aull, 0x006b5ad6b5ad6b5aull, 0x006d6d6b6b6b5b5aull, 0x006dadb5b6b6d6daull,
+    0x006db6db6b6db6daull, 0x0076db6db6db6db6ull, 0x0076dbb6ddb6edb6ull, 0x0076eddbb6eddbb6ull,
+    0x00776eedddbbb776ull, 0x0077777777777776ull, 0x007bbbbddddeeeeeull, 0x007bddeef7bbddeeull,
+    0x007bdef7bdef7bdeull, 0x007defbdf7bef7deull, 0x007efbefbefbefbeull, 0x007efdfbf7efdfbeull,
+    0x007f7f7f7f7f7f7eull, 0x007fdfeff7fbfdfeull, 0x007feffdffbff7feull, 0x007ffdfff7ffdffeull,
+    0x007fffeffffbfffeull, 0x007ffffff7fffffeull, 0x007ffffffffffffeull, 0x007fffffffffffffull,
+    /* 56 */
+    0x0000000000000000ull, 0x0080000000000000ull, 0x0080000008000000ull, 0x0080002000040000ull,
+    0x0080020008002000ull, 0x0080100200400800ull, 0x0080402008040200ull, 0x0080808080808080ull,
+    0x0081020408102040ull, 0x0082082081041040ull, 0x0084108208410820ull, 0x0084210842108420ull,
+    0x0088422108842210ull, 0x0088884442221110ull, 0x0088888888888888ull, 0x0091122224444888ull,
+    0x0091224489122448ull, 0x0092449124892248ull, 0x0092492489249248ull, 0x00a4924924924924ull,
+    0x00a492924a492924ull, 0x00a4a4a4a4a4a4a4ull, 0x00a5294a4a5294a4ull, 0x00a94a54a52a5294ull,
+    0x00a952a54a952a54ull, 0x00aa954aa552a954ull, 0x00aaa9554aaa9554ull, 0x00aaaaaaa5555554ull,
+    0x00aaaaaaaaaaaaaaull, 0x00d555555aaaaaaaull, 0x00d556aaad556aaaull, 0x00d56ab55aad56aaull,
+    0x00d5ab56ad5ab56aull, 0x00d6b5ab5ad5ad6aull, 0x00dad6b5adad6b5aull, 0x00dadadadadadadaull,
+    0x00db6b6dadb6b6daull, 0x00db6db6db6db6daull, 0x00edb6db6edb6db6ull, 0x00edbb6edb76ddb6ull,
+    0x00eddbb76eddbb76ull, 0x00eeeddddbbbb776ull, 0x00eeeeeeeeeeeeeeull, 0x00f777bbbdddeeeeull,
+    0x00f7bbdeef7bbdeeull, 0x00fbdef7bdef7bdeull, 0x00fbef7defbef7deull, 0x00fdf7df7efbefbeull,
+    0x00fdfbf7efdfbf7eull, 0x00fefefefefefefeull, 0x00ffbfdfeffbfdfeull, 0x00ffeffdffbff7feull,
+    0x00fffbffefffbffeull, 0x00ffffdffffbfffeull, 0x00ffffffeffffffeull, 0x00fffffffffffffeull,
+    0x00ffffffffffffffull,
+    /* 57 */
+    0x0000000000000000ull, 0x0100000000000000ull, 0x0100000010000000ull, 0x0100002000040000ull,
+    0x0100040010004000ull, 0x0100200400400800ull, 0x0100802010040200ull, 0x0101010101010100ull,
+    0x0102040810204080ull, 0x0104102082041040ull, 0x0108208410420820ull, 0x0108421082108420ull,
+    0x0110842210844210ull, 0x0111088844222110ull, 0x0111111111111110ull, 0x0122222444448888ull,
+    0x0122448911224488ull, 0x0124491244912448ull, 0x0124922492449248ull, 0x0124924924924924ull,
+    0x014924a4924a4924ull, 0x0149492929252524ull, 0x014a5252929494a4ull, 0x015294a5294a5294ull,
+    0x0152a52a54a54a94ull, 0x0154aa54aa54aa54ull, 0x01554aa9552aa554ull, 0x0155552aaaa55554ull,
+    0x0155555555555554ull, 0x01aaaaaaaaaaaaaaull, 0x01aaaab55556aaaaull, 0x01aab556aad55aaaull,
+    0x01ab55ab55ab55aaull, 0x01ad5ab5ab56b56aull, 0x01ad6b5ad6b5ad6aull, 0x01b5adad6d6b6b5aull,
+    0x01b6b6b6d6d6dadaull, 0x01b6db5b6db5b6daull, 0x01b6db6db6db6db6ull, 0x01db6dbb6db76db6ull,
+    0x01dbb6edbb6edbb6ull, 0x01ddbb76eeddbb76ull, 0x01ddddbbbbb77776ull, 0x01eeeeeeeeeeeeeeull,
+    0x01eef777bbdddeeeull, 0x01ef7bbdef77bdeeull, 0x01f7bdef7def7bdeull, 0x01f7df7befbdf7deull,
+    0x01fbefbf7df7efbeull, 0x01fdfbf7efdfbf7eull, 0x01fefefefefefefeull, 0x01ff7fbfeff7fdfeull,
+    0x01ffdffbffbff7feull, 0x01fffbffefffbffeull, 0x01ffffbffff7fffeull, 0x01ffffffeffffffeull,
+    0x01fffffffffffffeull, 0x01ffffffffffffffull,
+    /* 58 */
+    0x0000000000000000ull, 0x0200000000000000ull, 0x0200000010000000ull, 0x0200004000080000ull,
+    0x0200080010004000ull, 0x0200400400800800ull, 0x0201004010080200ull, 0x0202020201010100ull,
+    0x0204081010204080ull, 0x0208204102081040ull, 0x0210410410820820ull, 0x0210841084208420ull,
+    0x0221084211084210ull, 0x0222110884422110ull, 0x0222222211111110ull, 0x0244444448888888ull,
+    0x0244889112244488ull, 0x0248912448922448ull, 0x0249224912491248ull, 0x0249249249249248ull,
+    0x0292492494924924ull, 0x0292524a49492924ull, 0x0294949494a4a4a4ull, 0x0294a5294a5294a4ull,
+    0x02a52a5295295294ull, 0x02a952a54a952a54ull, 0x02aa552a9552a954ull, 0x02aaa5554aaa9554ull,
+    0x02aaaaaa95555554ull, 0x02aaaaaaaaaaaaaaull, 0x035555555aaaaaaaull, 0x03555aaab5556aaaull,
+    0x0355aad55aad56aaull, 0x0356ad5ab56ad5aaull, 0x035ad5ad5ad6ad6aull, 0x036b5ad6b5ad6b5aull,
+    0x036b6b6b5b5b5b5aull, 0x036dadb5b6b6d6daull, 0x036db6db5b6db6daull, 0x03b6db6db6db6db6ull,
+    0x03b6ddb6ddb6edb6ull, 0x03b76edbb76ddbb6ull, 0x03bb776edddbbb76ull, 0x03bbbbbbb7777776ull,
+    0x03dddddddeeeeeeeull, 0x03ddeef77bbddeeeull, 0x03def7bddef7bdeeull, 0x03ef7bef7bdf7bdeull,
+    0x03efbefbdf7df7deull, 0x03f7dfbefdf7efbeull, 0x03fbf7efdfdfbf7eull, 0x03fdfdfdfefefefeull,
+    0x03feffbfdff7fdfeull, 0x03ffbffbff7ff7feull, 0x03fff7ffdfffbffeull, 0x03ffffbffff7fffeull,
+    0x03ffffffdffffffeull, 0x03fffffffffffffeull, 0x03ffffffffffffffull,
+    /* 59 */
+    0x0000000000000000ull, 0x0400000000000000ull, 0x0400000020000000ull, 0x0400008000080000ull,
+    0x0400100020004000ull, 0x0400800800800800ull, 0x0402008020080200ull, 0x0404040202010100ull,
+    0x0408101020404080ull, 0x0410208104082040ull, 0x0420820820820820ull, 0x0421042104210420ull,
+    0x0442108421084210ull, 0x0442211088442210ull, 0x0444442222211110ull, 0x0488888888888888ull,
+    0x0488911222444888ull, 0x0491224489122448ull, 0x0492249124492248ull, 0x0492492489249248ull,
+    0x0524924924924924ull, 0x0524949252494924ull, 0x0525252525252524ull, 0x05294a4a529294a4ull,
+    0x054a5294a94a5294ull, 0x054a952a52a54a94ull, 0x0552a954a954aa54ull, 0x05552aa5552aa554ull,
+    0x0555552aaaa55554ull, 0x0555555555555554ull, 0x06aaaaaaaaaaaaaaull, 0x06aaaad5555aaaaaull,
+    0x06aad55aaad55aaaull, 0x06ad56ab56ab55aaull, 0x06b56ad5ad5ab56aull, 0x06b5ad6b56b5ad6aull,
+    0x06d6b5b5ad6d6b5aull, 0x06dadadadadadadaull, 0x06db6b6dadb6b6daull, 0x06db6db6db6db6daull,
+    0x076db6db76db6db6ull, 0x076ddb6edbb6ddb6ull, 0x076eddbb76eddbb6ull, 0x07776eedddbbb776ull,
+    0x0777777777777776ull, 0x07bbbbdddddeeeeeull, 0x07bddeef77bbddeeull, 0x07bdef7bdef7bdeeull,
+    0x07defbdefbdefbdeull, 0x07df7df7df7df7deull, 0x07efdf7efbf7dfbeull, 0x07f7efefdfbfbf7eull,
+    0x07fbfbfdfdfefefeull, 0x07fdff7fdff7fdfeull, 0x07ff7ff7ff7ff7feull, 0x07ffefffdfffbffeull,
+    0x07ffff7ffff7fffeull, 0x07ffffffdffffffeull, 0x07fffffffffffffeull, 0x07ffffffffffffffull,
+    /* 60 */
+    0x0000000000000000ull, 0x0800000000000000ull, 0x0800000020000000ull, 0x0800008000080000ull,
+    0x0800100020004000ull, 0x0800800800800800ull, 0x0802008020080200ull, 0x0808040402020100ull,
+    0x0810102020404080ull, 0x0820408204082040ull, 0x0820820820820820ull, 0x0842084108210420ull,
+    0x0842108421084210ull, 0x0884421108842210ull, 0x0888844422221110ull, 0x0888888888888888ull,
+    0x0911122224444888ull, 0x0912244891224488ull, 0x0922489224892248ull, 0x0924922492449248ull,
+    0x0924924924924924ull, 0x0a4924a4924a4924ull, 0x0a4a494929292524ull, 0x0a5252929494a4a4ull,
+    0x0a5294a5294a5294ull, 0x0a94a94a94a94a94ull, 0x0aa54a952a952a54ull, 0x0aa954aa954aa954ull,
+    0x0aaa95552aaa5554ull, 0x0aaaaaaa95555554ull, 0x0aaaaaaaaaaaaaaaull, 0x0d5555556aaaaaaaull,
+    0x0d555aaab5556aaaull, 0x0d56aad56aad56aaull, 0x0d5ab56ab56ad5aaull, 0x0d6ad6ad6ad6ad6aull,
+    0x0d6b5ad6b5ad6b5aull, 0x0dadad6d6b6b5b5aull, 0x0db5b6b6b6d6dadaull, 0x0db6dadb6dadb6daull,
+    0x0db6db6db6db6db6ull, 0x0edb6ddb6dbb6db6ull, 0x0edbb6edbb6edbb6ull, 0x0eeddbb76eddbb76ull,
+    0x0eeeddddbbbb7776ull, 0x0eeeeeeeeeeeeeeeull, 0x0f777bbbbdddeeeeull, 0x0f7bbdeef77bddeeull,
+    0x0f7bdef7bdef7bdeull, 0x0fbdf7bef7defbdeull, 0x0fbefbefbefbefbeull, 0x0fdfbefdfbefdfbeull,
+    0x0fefdfdfbfbf7f7eull, 0x0ff7fbfbfdfdfefeull, 0x0ffbfeffbfeffbfeull, 0x0ffeffeffeffeffeull,
+    0x0fffdfffbfff7ffeull, 0x0ffffeffffeffffeull, 0x0fffffffbffffffeull, 0x0ffffffffffffffeull,
+    0x0fffffffffffffffull,
+    /* 61 */
+    0x0000000000000000ull, 0x1000000000000000ull, 0x1000000040000000ull, 0x1000010000100000ull,
+    0x1000200040008000ull, 0x1001001001001000ull, 0x1004010040100400ull, 0x1010080404020100ull,
+    0x1020204040408080ull, 0x1040810208102040ull, 0x1041041041041040ull, 0x1082104208410820ull,
+    0x1084210842108420ull, 0x1108442110844210ull, 0x1110888444222110ull, 0x1111111111111110ull,
+    0x1222224444488888ull, 0x1224488912224488ull, 0x1244912248912448ull, 0x1249124912491248ull,
+    0x1249249249249248ull, 0x14924924a4924924ull, 0x1492925249492924ull, 0x14a4a4a4a4a4a4a4ull,
+    0x14a5294a4a5294a4ull, 0x15294a94a52a5294ull, 0x152a54a952a54a94ull, 0x154aa552a954aa54ull,
+    0x1554aaa554aaa554ull, 0x155554aaaaa55554ull, 0x1555555555555554ull, 0x1aaaaaaaaaaaaaaaull,
+    0x1aaaab55555aaaaaull, 0x1aab555aab555aaaull, 0x1ab55aad56ab55aaull, 0x1ad5ab56ad5ab56aull,
+    0x1ad6b56b5ad5ad6aull, 0x1b5ad6b5b5ad6b5aull, 0x1b5b5b5b5b5b5b5aull, 0x1b6d6dadb6b6d6daull,
+    0x1b6db6db5b6db6daull, 0x1db6db6db6db6db6ull, 0x1db6edb6edb6edb6ull, 0x1dbb6eddb76edbb6ull,
+    0x1ddbb776edddbb76ull, 0x1dddddbbbbb77776ull, 0x1eeeeeeeeeeeeeeeull, 0x1eef777bbbdddeeeull,
+    0x1ef7bbdeef7bbdeeull, 0x1f7bdef7bdef7bdeull, 0x1f7defbdf7bef7deull, 0x1fbefbefbefbefbeull,
+    0x1fbf7efdf7efdfbeull, 0x1fdfdfbfbfbf7f7eull, 0x1feff7fbfbfdfefeull, 0x1ffbfeffbfeffbfeull,
+    0x1ffeffeffeffeffeull, 0x1fffdfffbfff7ffeull, 0x1ffffeffffeffffeull, 0x1fffffffbffffffeull,
+    0x1ffffffffffffffeull, 0x1fffffffffffffffull,
+    /* 62 */
+    0x0000000000000000ull, 0x2000000000000000ull, 0x2000000040000000ull, 0x2000020000100000ull,
+    0x2000400040008000ull, 0x2002002001001000ull, 0x2008020040100400ull, 0x2020100804020100ull,
+    0x2040404040808080ull, 0x2081020408102040ull, 0x2082082041041040ull, 0x2104208210410820ull,
+    0x2108421042108420ull, 0x2210844210884210ull, 0x2221108844422110ull, 0x2222222211111110ull,
+    0x2444444448888888ull, 0x2448891122244488ull, 0x2489122449122448ull, 0x2491248924492248ull,
+    0x2492492449249248ull, 0x2924924924924924ull, 0x2924a49252494924ull, 0x2929292925252524ull,
+    0x294a4a52529494a4ull, 0x2a5294a5294a5294ull, 0x2a54a54a54a94a94ull, 0x2a952a952a552a54ull,
+    0x2aa554aa554aa954ull, 0x2aaa95552aaa5554ull, 0x2aaaaaaa55555554ull, 0x2aaaaaaaaaaaaaaaull,
+    0x355555556aaaaaaaull, 0x35556aaad555aaaaull, 0x355aab556ab556aaull, 0x356ad56ad5aad5aaull,
+    0x35ab5ab56b56b56aull, 0x35ad6b5ad6b5ad6aull, 0x36b5b5ad6d6b6b5aull, 0x36d6d6d6dadadadaull,
+    0x36db5b6d6db6b6daull, 0x36db6db6db6db6daull, 0x3b6db6db76db6db6ull, 0x3b6edb76dbb6ddb6ull,
+    0x3b76eddb76eddbb6ull, 0x3bb776eedddbbb76ull, 0x3bbbbbbb77777776ull, 0x3dddddddeeeeeeeeull,
+    0x3ddeef777bbddeeeull, 0x3def7bbdef77bdeeull, 0x3ef7bdef7def7bdeull, 0x3efbdf7defbef7deull,
+    0x3f7df7df7efbefbeull, 0x3f7efdfbf7efdfbeull, 0x3fbfbfbf7f7f7f7eull, 0x3fdfeff7fbfdfefeull,
+    0x3ff7fdff7feffbfeull, 0x3ffdffdffeffeffeull, 0x3fffbfff7fff7ffeull, 0x3ffffdffffeffffeull,
+    0x3fffffff7ffffffeull, 0x3ffffffffffffffeull, 0x3fffffffffffffffull,
+    /* 63 */
+    0x0000000000000000ull, 0x4000000000000000ull, 0x4000000080000000ull, 0x4000020000100000ull,
+    0x4000800080008000ull, 0x4004002002001000ull, 0x4010020080100400ull, 0x4020100804020100ull,
+    0x4080808080808080ull, 0x4081020408102040ull, 0x4104102082041040ull, 0x4208210410420820ull,
+    0x4210821084108420ull, 0x4421084221084210ull, 0x4422110884422110ull, 0x4444422222111110ull,
+    0x4888888888888888ull, 0x4889112222444888ull, 0x4891224489122448ull, 0x4922489224892248ull,
+    0x4924912492449248ull, 0x4924924924924924ull, 0x5249252492524924ull, 0x52524a4949292524ull,
+    0x529292949494a4a4ull, 0x5294a5294a5294a4ull, 0x54a54a52a5295294ull, 0x54a952a54a952a54ull,
+    0x552a954aa552a954ull, 0x5552aa9554aaa554ull, 0x555552aaaa955554ull, 0x5555555555555554ull,
+    0x6aaaaaaaaaaaaaaaull, 0x6aaaab55555aaaaaull, 0x6aad556aab555aaaull, 0x6ab55aad56ab55aaull,
+    0x6ad5ab56ad5ab56aull, 0x6b5ab5ad5ad6ad6aull, 0x6d6b5ad6b5ad6b5aull, 0x6d6d6b6b6b5b5b5aull,
+    0x6dadb5b6b6d6dadaull, 0x6db6dadb6dadb6daull, 0x6db6db6db6db6db6ull, 0x76db6edb6dbb6db6ull,
+    0x76ddb76ddb76ddb6ull, 0x76eddbb76eddbb76ull, 0x7776eeddddbbb776ull, 0x7777777777777776ull,
+    0x7bbbbbdddddeeeeeull, 0x7bbddeef77bbddeeull, 0x7bdef7bddef7bdeeull, 0x7def7bef7bdf7bdeull,
+    0x7df7defbefbdf7deull, 0x7efbefdf7dfbefbeull, 0x7efdfbf7efdfbf7eull, 0x7f7f7f7f7f7f7f7eull,
+    0x7fbfdfeff7fbfdfeull, 0x7feffbff7fdffbfeull, 0x7ffbffdffdffeffeull, 0x7fff7fff7fff7ffeull,
+    0x7ffffbffffdffffeull, 0x7fffffff7ffffffeull, 0x7ffffffffffffffeull, 0x7fffffffffffffffull,
+    /* 64 */
+    0x0000000000000000ull, 0x8000000000000000ull, 0x8000000080000000ull, 0x8000040000200000ull,
+    0x8000800080008000ull, 0x8008004002001000ull, 0x8020040080200400ull, 0x8040201008040200ull,
+    0x8080808080808080ull, 0x8102040810204080ull, 0x8208104082081040ull, 0x8410410420820820ull,
+    0x8420842084208420ull, 0x8842108421084210ull, 0x8844221088442210ull, 0x8888444422221110ull,
+    0x8888888888888888ull, 0x9111222244448888ull, 0x9122448891224488ull, 0x9224892244912448ull,
+    0x9248924892489248ull, 0x9249249249249248ull, 0xa4924924a4924924ull, 0xa49492524a492924ull,
+    0xa4a4a4a4a4a4a4a4ull, 0xa529494a529294a4ull, 0xa94a5294a94a5294ull, 0xa952a52a54a54a94ull,
+    0xaa54aa54aa54aa54ull, 0xaa9552aa554aa954ull, 0xaaaa5554aaaa5554ull, 0xaaaaaaaa55555554ull,
+    0xaaaaaaaaaaaaaaaaull, 0xd5555555aaaaaaaaull, 0xd555aaaad555aaaaull, 0xd56aad55aab556aaull,
+    0xd5aad5aad5aad5aaull, 0xd6ad5ad5ab5ab56aull, 0xd6b5ad6ad6b5ad6aull, 0xdad6b6b5ad6d6b5aull,
+    0xdadadadadadadadaull, 0xdb6b6dadb5b6d6daull, 0xdb6db6dadb6db6daull, 0xedb6db6db6db6db6ull,
+    0xedb6edb6edb6edb6ull, 0xeddb76ddbb6edbb6ull, 0xeeddbb76eeddbb76ull, 0xeeeeddddbbbb7776ull,
+    0xeeeeeeeeeeeeeeeeull, 0xf777bbbbddddeeeeull, 0xf7bbddeef7bbddeeull, 0xf7bdef7bdef7bdeeull,
+    0xfbdefbdefbdefbdeull, 0xfbefbefbdf7df7deull, 0xfdf7efbefdf7efbeull, 0xfefdfbf7efdfbf7eull,
+    0xfefefefefefefefeull, 0xffbfdfeff7fbfdfeull, 0xffdffbfeffdffbfeull, 0xfff7ffbffdffeffeull,
+    0xfffefffefffefffeull, 0xfffffbffffdffffeull, 0xfffffffefffffffeull, 0xfffffffffffffffeull,
+    0xffffffffffffffffull,
+};
+
+#endif /* EUCLID_TABLE_H */
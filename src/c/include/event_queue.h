@@ -15,7 +15,7 @@ typedef enum {
 } event_type_t;
 
 typedef struct {
-    uint32_t time;   /* sample index at which to trigger */
+    uint32_t time;   /* sample index at which to trigger (any sample, not just step starts) */
     uint8_t  type;   /* event_type_t */
     uint8_t  aux;    /* optional small parameter (e.g. preset/freq index) */
 } event_t;
@@ -28,10 +28,17 @@ typedef struct {
 } event_queue_t;
 
 static inline void eq_init(event_queue_t *q){ q->count = 0; }
-static inline void eq_push(event_queue_t *q, uint32_t time, uint8_t type, uint8_t aux){
+/* Returns 1 when queued, 0 when the queue is full and the event was dropped. */
+static inline int eq_push(event_queue_t *q, uint32_t time, uint8_t type, uint8_t aux){
     if(q->count < MAX_EVENTS){
         q->events[q->count++] = (event_t){time, type, aux};
+        return 1;
     }
+    return 0;
 }
 
+/* Stable sort by time.  generator_process expects a sorted queue; events
+ * sharing a timestamp keep their push order (which fixes their RNG draws). */
+void eq_sort(event_queue_t *q);
+
 #endif /* EVENT_QUEUE_H */ 
\ No newline at end of file
@@ -0,0 +1,68 @@
+// fast_math.h – portable scalar approximations (no NEON / asm required)
+//
+// fast_sinf(): Cody–Waite reduction to [-pi/4, pi/4] followed by the
+// Cephes minimax sin/cos polynomials.  Written branch-free (quadrant picked
+// with bit masks) so compilers can auto-vectorise loops that call it.
+// Absolute error vs. sinf() is <= 2.5e-7 for |x| < 8192, which covers every
+// phase the FM voices produce (carrier phase + index * sin(mod phase)).
+#pragma once
+
+#include <stdint.h>
+
+static inline float fast_sinf(float x)
+{
+    const float two_over_pi = 0.636619772367581343f;
+    /* pi/2 split into three parts so q * PIO2_* stays exact for |q| < 2^12 */
+    const float pio2_1 = 1.5703125f;
+    const float pio2_2 = 4.837512969970703125e-4f;
+    const float pio2_3 = 7.54978995489188216e-8f;
+
+    /* round-to-nearest via the 1.5*2^23 shifter: q lands in the low mantissa
+     * bits, and only adds/subs are needed (no rintf, vectorises on SSE2) */
+    const float shifter = 12582912.0f;
+    union { float f; int32_t i; } u = { x * two_over_pi + shifter };
+    float qf = u.f - shifter;
+    int32_t q = u.i;
+    float r = ((x - qf * pio2_1) - qf * pio2_2) - qf * pio2_3;
+    float r2 = r * r;
+
+    float s = r + r * r2 * (-1.6666654611e-1f + r2 * (8.3321608736e-3f + r2 * -1.9515295891e-4f));
+    float c = 1.0f - 0.5f * r2 + r2 * r2 * (4.166664568298827e-2f + r2 * (-1.388731625493765e-3f + r2 * 2.443315711809948e-5f));
+
+    /* odd quadrants take cos, quadrants 2/3 flip the sign – done with bit
+     * masks rather than ?: so the caller's loop stays free of control flow */
+    union { float f; uint32_t u; } sv = { s }, cv = { c }, out;
+    uint32_t pick_cos = 0u - (uint32_t)(q & 1);
+    out.u = ((sv.u & ~pick_cos) | (cv.u & pick_cos)) ^ ((uint32_t)(q & 2) << 30);
+    return out.f;
+}
+
+// fast_log2f(): exponent from the float bits plus the atanh series of the
+// mantissa, log2(m) = 2/ln2 * (t + t^3/3 + ...), t = (m-1)/(m+1).  x must be
+// a positive normal float; absolute error <= 2e-5.  Branch-free.
+static inline float fast_log2f(float x)
+{
+    union { float f; uint32_t u; } v = { x };
+    float e = (float)((int32_t)(v.u >> 23) - 127);
+    v.u = (v.u & 0x007FFFFFu) | 0x3F800000u;            /* mantissa in [1, 2) */
+    float t = (v.f - 1.0f) / (v.f + 1.0f);
+    float t2 = t * t;
+    float s = t * (2.885390082f + t2 * (0.961796694f + t2 * (0.577078016f + t2 * 0.412198583f)));
+    return e + s;
+}
+
+// fast_exp2f(): nearest-integer split via the shifter trick, 2^f on
+// [-0.5, 0.5] from a degree-5 Taylor polynomial, exponent built in the
+// bits.  Input clamped to [-126, 126]; relative error <= 4e-6.  Branch-free.
+static inline float fast_exp2f(float x)
+{
+    const float shifter = 12582912.0f;
+    x = x < -126.0f ? -126.0f : (x > 126.0f ? 126.0f : x);
+    union { float f; int32_t i; } u = { x + shifter };
+    float n = u.f - shifter;
+    int32_t ni = u.i - 0x4B400000;
+    float f = (x - n) * 0.693147181f;
+    float p = 1.0f + f * (1.0f + f * (0.5f + f * (0.166666667f + f * (0.0416666667f + f * 0.00833333333f))));
+    union { float f; int32_t i; } s = { .i = (ni + 127) << 23 };
+    return p * s.f;
+}
@@ -0,0 +1,54 @@
+#ifndef FM_POOL_H
+#define FM_POOL_H
+
+#include <stdint.h>
+#include "osc.h"
+
+/* Fixed-capacity polyphonic FM voice pool.
+ *
+ * Same 2-operator patch as fm_voice_t, but with FM_POOL_MAX preallocated
+ * slots stored as a struct-of-arrays so a new note no longer cuts off the
+ * previous one.  When every slot is busy the oldest note is stolen.  No
+ * allocation happens after fm_pool_init().
+ */
+
+#ifndef FM_POOL_MAX
+#define FM_POOL_MAX 4u
+#endif
+
+typedef struct {
+    float32_t sr;
+    uint32_t  active;   /* bitmask of sounding slots */
+    uint32_t  serial;   /* trigger counter, used to find the oldest slot */
+
+    /* per-slot state (struct-of-arrays) */
+    float32_t c_inc[FM_POOL_MAX];          /* carrier phase increment (rad/sample) */
+    float32_t m_inc[FM_POOL_MAX];          /* modulator phase increment (rad/sample) */
+    float32_t index0[FM_POOL_MAX];
+    float32_t amp[FM_POOL_MAX];
+    float32_t decay[FM_POOL_MAX];
+    float32_t carrier_phase[FM_POOL_MAX];
+    float32_t mod_phase[FM_POOL_MAX];
+    uint32_t  pos[FM_POOL_MAX];
+    uint32_t  len[FM_POOL_MAX];
+    uint32_t  born[FM_POOL_MAX];           /* serial at trigger time */
+    uint8_t   preset[FM_POOL_MAX];         /* caller-defined preset id */
+} fm_pool_t;
+
+void fm_pool_init(fm_pool_t *p, float32_t sr);
+
+/* Start a note in a free slot, stealing the oldest one if the pool is full.
+ * Returns the slot index used. */
+uint32_t fm_pool_trigger(fm_pool_t *p, float32_t carrier_freq, float32_t duration_sec,
+                         float32_t ratio, float32_t index, float32_t amp, float32_t decay,
+                         uint8_t preset);
+
+/* Render every sounding slot, adding into L/R. */
+void fm_pool_process(fm_pool_t *p, float32_t *L, float32_t *R, uint32_t n);
+
+static inline uint32_t fm_pool_active_count(const fm_pool_t *p)
+{
+    return (uint32_t)__builtin_popcount(p->active);
+}
+
+#endif /* FM_POOL_H */
@@ -24,4 +24,30 @@ void fm_voice_init(fm_voice_t *v, float32_t sr);
 void fm_voice_trigger(fm_voice_t *v, float32_t carrier_freq, float32_t duration_sec, float32_t ratio, float32_t index, float32_t amp, float32_t decay);
 void fm_voice_process(fm_voice_t *v, float32_t *L, float32_t *R, uint32_t n);
 
+/* Inner loops shared by fm_voice and fm_pool.  Render `n` frames of a note
+ * that sounds for all of them, starting `pos` samples after its trigger, and
+ * add into L/R.  *cp / *mp carry the carrier / modulator phase in and out.
+ *
+ * fm_kernel_ref  – reference: expf envelope and two sinf per sample.
+ * fm_kernel_fast – multiplicative envelope recurrence (re-seeded with expf on
+ *                  every call) and fast_sinf(); 4 samples per iteration
+ *                  unless built with FM_KERNEL_SCALAR.
+ *
+ * fm_voice_process uses the fast kernel when built with FM_FAST=1
+ * (-DFM_VOICE_FAST).  The default stays on the reference kernel because the
+ * coarse hash baselines were recorded with it.
+ */
+void fm_kernel_ref(float32_t *L, float32_t *R, uint32_t n, uint32_t pos, float32_t sr,
+                   float32_t c_inc, float32_t m_inc, float32_t index0, float32_t amp,
+                   float32_t decay, float32_t *cp, float32_t *mp);
+void fm_kernel_fast(float32_t *L, float32_t *R, uint32_t n, uint32_t pos, float32_t sr,
+                    float32_t c_inc, float32_t m_inc, float32_t index0, float32_t amp,
+                    float32_t decay, float32_t *cp, float32_t *mp);
+
+#ifdef FM_VOICE_FAST
+#define FM_KERNEL fm_kernel_fast
+#else
+#define FM_KERNEL fm_kernel_ref
+#endif
+
 #endif /* FM_VOICE_H */ 
\ No newline at end of file
@@ -0,0 +1,105 @@
+#ifndef GEN_EVENT_H
+#define GEN_EVENT_H
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdatomic.h>
+
+/* Timestamped note events published by the generator.
+ *
+ * generator_process appends one record per trigger it fires – stream time
+ * in frames, what fired and at which pitch and level – to a ring attached
+ * with generator_set_event_ring.  The ring is single-writer, any-number of
+ * readers: each reader keeps its own cursor and reads at its own pace.
+ * The writer never waits; a reader that falls more than the capacity
+ * behind skips the overwritten events and is told how many it lost.
+ * Each slot carries a sequence number (a per-slot seqlock), so a reader on
+ * another thread never returns a record the writer is overwriting.
+ *
+ * Unlike the per-block saw_hit / bass_hit flags, two notes in one block
+ * are two records with their exact sample times.
+ */
+
+#define GEN_EVENT_RING_CAPACITY 4096u  /* power of two */
+
+typedef struct {
+    uint64_t time;   /* stream frame the note starts on (0 = first generator_process frame) */
+    uint8_t  type;   /* event_type_t */
+    uint8_t  voice;  /* gen_event_voice_t: which voice rendered it */
+    uint8_t  aux;    /* event_t.aux: melody slot, mid preset index */
+    uint8_t  preset; /* FM preset (mid: bells/calm/quantum/pluck, bass: default/quantum/plucky), else 0 */
+    float    freq;   /* Hz, 0 for drums */
+    float    amp;    /* trigger level: envelope peak (drums, melody) or the voice's amp */
+} gen_event_t;
+
+/* Bit positions of the GEN_VOICE_* flags in generator.h */
+typedef enum {
+    GEN_EV_KICK = 0,
+    GEN_EV_SNARE,
+    GEN_EV_HAT,
+    GEN_EV_MELODY,
+    GEN_EV_MID_FM,
+    GEN_EV_BASS_FM,
+    GEN_EV_MID_SIMPLE,
+    GEN_EV_VOICE_COUNT
+} gen_event_voice_t;
+
+typedef struct {
+    _Atomic uint64_t seq;    /* 2*i+1 while event i is written, 2*i+2 once it is complete */
+    gen_event_t ev;
+} gen_event_slot_t;
+
+typedef struct {
+    gen_event_slot_t slot[GEN_EVENT_RING_CAPACITY];
+    _Atomic uint64_t head;   /* events ever published */
+} gen_event_ring_t;
+
+typedef struct {
+    uint64_t next;   /* index of the next event to read */
+    uint64_t lost;   /* events overwritten before this reader got to them */
+} gen_event_reader_t;
+
+static inline void gen_event_ring_init(gen_event_ring_t *r)
+{
+    for(uint32_t i = 0; i < GEN_EVENT_RING_CAPACITY; i++) atomic_init(&r->slot[i].seq, 0u);
+    atomic_init(&r->head, 0u);
+}
+
+/* Writer side (the thread running generator_process). */
+static inline void gen_event_publish(gen_event_ring_t *r, const gen_event_t *e)
+{
+    uint64_t head = atomic_load_explicit(&r->head, memory_order_relaxed);
+    gen_event_slot_t *s = &r->slot[head & (GEN_EVENT_RING_CAPACITY - 1u)];
+    atomic_store_explicit(&s->seq, 2u * head + 1u, memory_order_relaxed);
+    atomic_thread_fence(memory_order_release);
+    s->ev = *e;
+    atomic_store_explicit(&s->seq, 2u * head + 2u, memory_order_release);
+    atomic_store_explicit(&r->head, head + 1u, memory_order_release);
+}
+
+/* A reader that sees only events published from now on. */
+static inline void gen_event_reader_init(gen_event_reader_t *rd, const gen_event_ring_t *r)
+{
+    rd->next = atomic_load_explicit(&((gen_event_ring_t *)r)->head, memory_order_acquire);
+    rd->lost = 0;
+}
+
+/* Copy up to `max` unread events, oldest first, into `out`; returns how
+ * many.  Events overwritten before (or while) they were copied are skipped
+ * and added to rd->lost.  Safe from any thread, concurrently with the
+ * writer and with other readers. */
+uint32_t gen_event_read(gen_event_ring_t *r, gen_event_reader_t *rd, gen_event_t *out, uint32_t max);
+
+const char *gen_event_type_name(uint8_t type);
+const char *gen_event_voice_name(uint8_t voice);
+
+/* Bulk export for offline renderers: a JSON document
+ *   {"sample_rate": SR, "seed": "0x..", "events": [{"time": .., "type": "melody", ...}, ...]}
+ * or a NumPy structured .npy array with the gen_event_t fields as columns.
+ * Return 0 on success. */
+int gen_event_write_json(FILE *f, const gen_event_t *ev, uint64_t n, uint64_t seed);
+int gen_event_write_npy(FILE *f, const gen_event_t *ev, uint64_t n);
+/* Either of the above, .npy when `path` ends in ".npy", else JSON. */
+int gen_event_save(const char *path, const gen_event_t *ev, uint64_t n, uint64_t seed);
+
+#endif /* GEN_EVENT_H */
@@ -0,0 +1,75 @@
+#ifndef GEN_PROFILE_H
+#define GEN_PROFILE_H
+
+#include <stdint.h>
+#include "event_queue.h"
+
+/* Per-voice / per-stage cost accounting for generator_process.
+ *
+ * Compiled out by default.  Build with `make PROFILE_VOICES=1` (adds
+ * -DGEN_PROFILE_ENABLED) to wrap every voice call and post-processing stage
+ * with a monotonic-clock timer.  segment then writes a JSON summary next to
+ * the WAV; tools/profile_seeds.py aggregates those across seeds.
+ */
+
+/* Keep in sync with STAGE_NAMES in src/gen_profile.c */
+typedef enum {
+    PROF_KICK = 0,
+    PROF_SNARE,
+    PROF_HAT,
+    PROF_MELODY,
+    PROF_MID_FM,
+    PROF_BASS_FM,
+    PROF_MID_SIMPLE,
+    PROF_EVENTS,     /* event dispatch at step starts */
+    PROF_DELAY,
+    PROF_POSTMIX,    /* fused mix + limiter + RMS (generator_postmix) */
+    PROF_STAGE_COUNT
+} gen_prof_stage_t;
+
+typedef struct {
+    uint64_t ns;      /* accumulated wall-clock nanoseconds */
+    uint64_t frames;  /* frames rendered while the voice was sounding */
+    uint64_t calls;   /* number of invocations */
+} gen_prof_counter_t;
+
+typedef struct {
+    gen_prof_counter_t stage[PROF_STAGE_COUNT];
+    uint64_t triggers[EVT_COUNT]; /* fired events by event_type_t */
+    uint64_t blocks;              /* generator_process calls */
+    uint64_t block_frames;        /* total frames requested */
+} gen_profile_t;
+
+void gen_profile_reset(void);
+const gen_profile_t *gen_profile_get(void);
+const char *gen_profile_stage_name(gen_prof_stage_t s);
+
+/* Write the counters as a JSON object.  Returns 0 on success. */
+int gen_profile_dump_json(const char *path);
+
+/* Hooks used by generator.c (only referenced when GEN_PROFILE_ENABLED). */
+uint64_t gen_profile_now_ns(void);
+void gen_profile_add(gen_prof_stage_t s, uint64_t ns, uint32_t frames);
+void gen_profile_trigger(uint8_t evt_type);
+void gen_profile_block(uint32_t frames);
+
+#ifdef GEN_PROFILE_ENABLED
+#define PROF_BEGIN(var)              uint64_t var = gen_profile_now_ns()
+#define PROF_END(stage, var, frames) gen_profile_add((stage), gen_profile_now_ns() - (var), (frames))
+#define PROF_VOICE(stage, active, n, call) do {                        \
+        uint32_t prof_n_ = (active) ? (n) : 0u;                        \
+        uint64_t prof_t0_ = gen_profile_now_ns();                      \
+        call;                                                          \
+        gen_profile_add((stage), gen_profile_now_ns() - prof_t0_, prof_n_); \
+    } while(0)
+#define PROF_TRIGGER(evt)            gen_profile_trigger(evt)
+#define PROF_BLOCK(frames)           gen_profile_block(frames)
+#else
+#define PROF_BEGIN(var)              ((void)0)
+#define PROF_END(stage, var, frames) ((void)0)
+#define PROF_VOICE(stage, active, n, call) call
+#define PROF_TRIGGER(evt)            ((void)0)
+#define PROF_BLOCK(frames)           ((void)0)
+#endif
+
+#endif /* GEN_PROFILE_H */
@@ -11,13 +11,44 @@
 #include "hat.h"
 #include "melody.h"
 #include "fm_voice.h"
+#include "fm_pool.h"
 #include "simple_voice.h"
 #include "delay.h"
 #include "limiter.h"
 #include "event_queue.h"
+#include "gen_event.h"
 
 #define MAX_DELAY_SAMPLES 106000
 
+/* Frames rendered per internal pass; longer generator_process calls are
+ * split into chunks of this size so the bus scratch can live in generator_t. */
+#define GEN_MAX_BLOCK 1024u
+
+/* Look-ahead limiter latency at init, 0 = classic limiter_process
+ * (set with `make LOOKAHEAD_MS=...`, or per generator via
+ * generator_set_lookahead) */
+#ifndef GEN_LIMITER_LOOKAHEAD_MS
+#define GEN_LIMITER_LOOKAHEAD_MS 0.0f
+#endif
+
+/* Delay output level below which the echo tail counts as silent (≈ -120 dBFS) */
+#define DELAY_TAIL_THRESHOLD 1e-6f
+
+/* Bits in generator_t.active_mask – one per voice that is currently sounding */
+enum {
+    GEN_VOICE_KICK       = 1u << 0,
+    GEN_VOICE_SNARE      = 1u << 1,
+    GEN_VOICE_HAT        = 1u << 2,
+    GEN_VOICE_MELODY     = 1u << 3,
+    GEN_VOICE_MID_FM     = 1u << 4,
+    GEN_VOICE_BASS_FM    = 1u << 5,
+    GEN_VOICE_MID_SIMPLE = 1u << 6,
+};
+#define GEN_DRUM_VOICES  (GEN_VOICE_KICK | GEN_VOICE_SNARE | GEN_VOICE_HAT)
+#define GEN_SYNTH_VOICES (GEN_VOICE_MELODY | GEN_VOICE_MID_FM | GEN_VOICE_BASS_FM | GEN_VOICE_MID_SIMPLE)
+_Static_assert(GEN_VOICE_MID_SIMPLE == 1u << GEN_EV_MID_SIMPLE && GEN_VOICE_BASS_FM == 1u << GEN_EV_BASS_FM,
+               "gen_event_voice_t must follow the GEN_VOICE_* bit order");
+
 typedef struct {
     music_time_t mt;
     music_globals_t music;
@@ -27,7 +58,7 @@ typedef struct {
     snare_t snare;
     hat_t hat;
     melody_t mel;
-    fm_voice_t mid_fm;
+    fm_voice_t mid_fm;  /* unused: notes go through mid_pool/bass_pool, kept for generator.s offsets */
     fm_voice_t bass_fm;
     simple_voice_t mid_simple;
 
@@ -45,10 +76,87 @@ typedef struct {
     bool saw_hit;      /* set when saw melody triggers */
     bool bass_hit;     /* set when bass triggers */
 
+    /* silent-voice skipping (appended – generator.s relies on the offsets above) */
+    uint32_t active_mask;        /* GEN_VOICE_* bits set on trigger, cleared on release */
+    uint32_t delay_quiet_frames; /* consecutive silent-input frames with tail below threshold */
+    bool delay_idle;             /* delay line flushed to zero; bypassed while input is silent */
+
+    /* polyphonic FM voices – overlapping notes instead of re-triggering one voice */
+    fm_pool_t mid_pool;
+    fm_pool_t bass_pool;
+
+    uint32_t events_dropped; /* eq_push overflows while building the queue (0 = none) */
+
+    /* drum / synth bus scratch for generator_process, GEN_MAX_BLOCK frames each */
+    _Alignas(16) float32_t bus_Ld[GEN_MAX_BLOCK];
+    _Alignas(16) float32_t bus_Rd[GEN_MAX_BLOCK];
+    _Alignas(16) float32_t bus_Ls[GEN_MAX_BLOCK];
+    _Alignas(16) float32_t bus_Rs[GEN_MAX_BLOCK];
+
+    /* look-ahead limiter, used instead of `limiter` when la_enabled */
+    limiter_lookahead_t la_limiter;
+    bool la_enabled;
+
+    /* note event stream (NULL = off), see gen_event.h */
+    gen_event_ring_t *events;
+    uint64_t frames_done;        /* stream frames rendered so far */
+
 } generator_t;
 
+/* Drop the bits of voices in `mask` that have finished sounding. */
+static inline uint32_t generator_release_voices(const generator_t *g, uint32_t mask)
+{
+    if((mask & GEN_VOICE_KICK)       && g->kick.pos >= g->kick.len)             mask &= ~GEN_VOICE_KICK;
+    if((mask & GEN_VOICE_SNARE)      && g->snare.pos >= g->snare.len)           mask &= ~GEN_VOICE_SNARE;
+    if((mask & GEN_VOICE_HAT)        && g->hat.pos >= g->hat.len)               mask &= ~GEN_VOICE_HAT;
+    if((mask & GEN_VOICE_MELODY)     && g->mel.pos >= g->mel.len)               mask &= ~GEN_VOICE_MELODY;
+    if((mask & GEN_VOICE_MID_FM)     && g->mid_pool.active == 0)                mask &= ~GEN_VOICE_MID_FM;
+    if((mask & GEN_VOICE_BASS_FM)    && g->bass_pool.active == 0)               mask &= ~GEN_VOICE_BASS_FM;
+    if((mask & GEN_VOICE_MID_SIMPLE) && g->mid_simple.pos >= g->mid_simple.len) mask &= ~GEN_VOICE_MID_SIMPLE;
+    return mask;
+}
+
+/* What a seed decides, without rendering: the musical parameters and the
+ * per-voice event counts of one segment (see describe_seed). */
+typedef struct {
+    uint64_t seed;
+    float bpm;
+    uint32_t step_samples;
+    uint32_t seg_frames;
+    float root_freq;
+    float delay_factor;
+    uint32_t delay_samples;
+    uint8_t scale;              /* scale_type_t */
+    uint8_t kick_hits, snare_hits, hat_hits;
+    uint8_t preset_offset;
+    uint8_t rotation;           /* drum pattern rotation in steps */
+    uint16_t kick_mask, snare_mask, hat_mask;   /* bar patterns, bit i = step i */
+    uint16_t events;            /* total queued */
+    uint16_t events_dropped;
+    uint16_t n_kick, n_snare, n_hat, n_melody;
+    uint16_t n_mid_simple, n_mid_fm, n_bass;
+} seed_desc_t;
+_Static_assert(STEPS_PER_BAR <= 16, "seed_desc_t pattern masks hold one bar");
+
 void generator_init(generator_t *g, uint64_t seed);
+/* Derive what generator_init(g, seed) would – same RNG draws – but only the
+ * parameters and the event queue: no voices, no audio, no output.  About a
+ * microsecond per seed, for scanning the seed space. */
+void describe_seed(uint64_t seed, seed_desc_t *d);
 void generator_process(generator_t *g, float32_t *L, float32_t *R, uint32_t num_frames);
+/* Switch to the look-ahead limiter with `ms` of latency (0 = back to the
+ * classic limiter).  Resets the limiter state; call between blocks. */
+void generator_set_lookahead(generator_t *g, float32_t ms);
+/* Publish every trigger generator_process fires to `ring` (NULL = stop).
+ * Timestamps count from the first frame this generator rendered.  Only
+ * the C generator_process publishes; generator.s builds leave it empty. */
+void generator_set_event_ring(generator_t *g, gen_event_ring_t *ring);
+/* Mix the drum (Ld/Rd) and synth (Ls/Rs) buses into L/R, run the limiter
+ * (`la` when non-NULL, else `lim`) and return the block RMS, in one tiled
+ * pass.  Either bus may be NULL when it is silent, but not both. */
+float generator_postmix(limiter_t *lim, limiter_lookahead_t *la, float32_t *L, float32_t *R,
+                        const float32_t *Ld, const float32_t *Rd,
+                        const float32_t *Ls, const float32_t *Rs, uint32_t num_frames);
 void generator_process_voices(generator_t *g, float32_t *Ld, float32_t *Rd,
                               float32_t *Ls, float32_t *Rs, uint32_t num_frames);
 
@@ -25,4 +25,46 @@ static inline void limiter_init(limiter_t *l, float32_t sr, float32_t attack_ms,
 
 void limiter_process(limiter_t *l, float32_t *L, float32_t *R, uint32_t n);
 
+/* Look-ahead limiter.
+ *
+ * The output is delayed by `lookahead` samples.  A sliding-max deque
+ * tracks the stereo peak over that window, so the gain has already
+ * dropped when a transient reaches the output and no sample exceeds the
+ * threshold.  No hard clamp is needed.  The gain curve has a soft knee
+ * (in dB), attack is instant within the window, and release is a one-pole
+ * curve.
+ *
+ * Each tile runs in passes.  The deque and the release recurrence are
+ * serial but branch-light.  The knee / dB math and the gain multiply are
+ * straight-line loops the compiler vectorizes.
+ *
+ * A separate type because limiter.s hardcodes limiter_t's layout.
+ */
+#define LIMITER_MAX_LOOKAHEAD 512u   /* samples, ~11.6 ms at 44.1 kHz */
+#define LIMITER_DEQUE_SIZE    1024u  /* power of two > LIMITER_MAX_LOOKAHEAD */
+#define LIMITER_LA_TILE       256u
+
+typedef struct {
+    uint32_t  lookahead;      /* latency in samples, 1..LIMITER_MAX_LOOKAHEAD */
+    float32_t threshold_db;
+    float32_t knee_db;
+    float32_t release_coeff;
+    float32_t gain;           /* smoothed gain applied to the last sample */
+
+    uint32_t  t;              /* input samples seen (wraps) */
+    uint32_t  pos;            /* delay line read/write index */
+    uint32_t  dq_head, dq_tail;
+    uint32_t  dq_idx[LIMITER_DEQUE_SIZE];   /* window maxima, peaks decreasing */
+    float32_t dq_peak[LIMITER_DEQUE_SIZE];
+
+    float32_t delay_L[LIMITER_MAX_LOOKAHEAD];
+    float32_t delay_R[LIMITER_MAX_LOOKAHEAD];
+    float32_t gain_buf[LIMITER_LA_TILE];    /* per-tile scratch */
+} limiter_lookahead_t;
+
+/* lookahead_ms is rounded to samples and clamped to 1..LIMITER_MAX_LOOKAHEAD. */
+void limiter_lookahead_init(limiter_lookahead_t *l, float32_t sr, float32_t lookahead_ms,
+                            float32_t release_ms, float32_t threshold_db, float32_t knee_db);
+void limiter_lookahead_process(limiter_lookahead_t *l, float32_t *L, float32_t *R, uint32_t n);
+
 #endif /* LIMITER_H */ 
\ No newline at end of file
@@ -15,5 +15,8 @@ typedef struct {
 void melody_init(melody_t *m, float32_t sr);
 void melody_trigger(melody_t *m, float32_t freq, float32_t dur_sec);
 void melody_process(melody_t *m, float32_t *L, float32_t *R, uint32_t n);
+/* Band-limited kernel (osc_bl.h); melody_process uses it when built with
+ * OSC_BANDLIMITED.  Phase lives in osc.acc, so do not mix the two on one voice. */
+void melody_process_bl(melody_t *m, float32_t *L, float32_t *R, uint32_t n);
 
 #endif /* MELODY_H */ 
\ No newline at end of file
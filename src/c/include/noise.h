@@ -4,7 +4,44 @@
 #include <stdint.h>
 #include "rand.h"
 
-/* Fill `out[n]` with white noise in range [-1,1). Uses provided RNG. */
+/* Samples the voices generate per noise_block call */
+#define NOISE_CHUNK 256u
+
+/* Fill `out[n]` with white noise in range [-1,1) and advance `rng` by n.
+ * The values are exactly those n calls of rng_float_mono() would return
+ * (the SplitMix64 sample i is rng_mix64(state + (i+1) * gamma)), so a
+ * voice drawing block noise stays bit-identical per seed.  The 64-bit
+ * multiplies keep it scalar-speed; see noise_block_fast. */
 void noise_block(rng_t *rng, float *out, uint32_t n);
 
+/* Same contract with a 32-bit counter hash instead: sample i is
+ * lowbias32(hi ^ (lo + (i+1) * (uint32_t)gamma)), hi/lo being the halves of
+ * the state, and the stream advances by n exactly like noise_block.  Every
+ * lane is independent and only needs 32-bit multiplies, which SSE4/AVX2 and
+ * NEON vectorize (SplitMix64's 64-bit multiplies do not), so this is
+ * several times faster.  The values are a different (still deterministic)
+ * stream.  Inline so it also exists where noise.s replaces noise.c. */
+static inline void noise_block_fast(rng_t *rng, float *out, uint32_t n)
+{
+    const uint32_t lo = (uint32_t)rng->state;
+    const uint32_t hi = (uint32_t)(rng->state >> 32);
+    const uint32_t step = (uint32_t)RNG_GAMMA;
+    for (uint32_t i = 0; i < n; ++i) {
+        uint32_t x = hi ^ (lo + (i + 1u) * step);
+        x ^= x >> 16; x *= 0x7feb352du;
+        x ^= x >> 15; x *= 0x846ca68bu;
+        x ^= x >> 16;
+        out[i] = (x >> 8) * (1.0f / 16777216.0f) * 2.0f - 1.0f;
+    }
+    rng_skip(rng, n);
+}
+
+/* Generator the snare / hat C paths draw their noise blocks from
+ * (`make NOISE_FAST=1` selects the counter hash) */
+#ifdef NOISE_FAST
+#define NOISE_FILL noise_block_fast
+#else
+#define NOISE_FILL noise_block
+#endif
+
 #endif /* NOISE_H */ 
\ No newline at end of file
@@ -10,7 +10,10 @@ extern "C" {
 /* Basic phase-accumulator oscillator helpers. */
 
 typedef struct {
-    float32_t phase; /* in radians */
+    union {
+        float32_t phase; /* in radians */
+        uint32_t acc;    /* band-limited kernels (osc_bl.h): 2^32 = one cycle */
+    };
 } osc_t;
 
 static inline void osc_reset(osc_t *o) { o->phase = 0.0f; }
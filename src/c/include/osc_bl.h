@@ -0,0 +1,140 @@
+#ifndef OSC_BL_H
+#define OSC_BL_H
+
+#include <math.h>
+#include <stdint.h>
+#include "osc.h"
+
+/* Band-limited saw / square (PolyBLEP).
+ *
+ * Phase is a 32-bit fixed-point accumulator (2^32 = one cycle) kept in
+ * osc_t.acc, so the wrap is the integer overflow and the normalized phase
+ * is a shift and a multiply – no divide, no branch.  Each discontinuity is
+ * smoothed by the two-sample polynomial residual
+ *     blep(t) = b^2 - a^2,  a = max(0, 1 - t/dt),  b = max(0, 1 - (1-t)/dt)
+ * which removes most of the energy a naive ramp folds back below Nyquist
+ * (see `make bench_osc` for the error against an additive reference).
+ * Header-only so melody.c and osc.c can inline it without extra objects.
+ */
+
+#define OSC_BL_PHASE_SCALE (1.0f / 16777216.0f)   /* top 24 bits -> [0, 1) */
+
+static inline uint32_t osc_bl_inc(float32_t freq, float32_t sr)
+{
+    return (uint32_t)((double)freq / (double)sr * 4294967296.0 + 0.5);
+}
+
+static inline float32_t osc_bl_phase(uint32_t acc)
+{
+    /* < 2^24, so the signed conversion is exact and has a packed form */
+    return (float32_t)(int32_t)(acc >> 8) * OSC_BL_PHASE_SCALE;
+}
+
+static inline float32_t osc_bl_blep(float32_t t, float32_t inv_dt)
+{
+    float32_t a = 1.0f - t * inv_dt;
+    float32_t b = 1.0f - (1.0f - t) * inv_dt;
+    /* max(x, 0) as (x + |x|) / 2: exact, and no compare for the vectorizer */
+    a = 0.5f * (a + fabsf(a));
+    b = 0.5f * (b + fabsf(b));
+    return b * b - a * a;
+}
+
+static inline float32_t osc_bl_saw_at(uint32_t p, float32_t inv_dt)
+{
+    float32_t t = osc_bl_phase(p);
+    return 2.0f * t - 1.0f - osc_bl_blep(t, inv_dt);
+}
+
+static inline float32_t osc_bl_square_at(uint32_t p, float32_t inv_dt)
+{
+    float32_t naive = 1.0f - 2.0f * (float32_t)(int32_t)(p >> 31);
+    return naive + osc_bl_blep(osc_bl_phase(p), inv_dt) - osc_bl_blep(osc_bl_phase(p + 0x80000000u), inv_dt);
+}
+
+/* The block loops compute every sample's phase from the block start
+ * (acc + i * inc) instead of carrying it, and evaluate the residual for
+ * every sample (it is 0 away from the edges), so there is neither a
+ * dependency between samples nor a branch.  With GCC / Clang they run on
+ * four lanes through the generic vector extensions (SSE, NEON) – the -O2
+ * auto-vectorizer does not take these loops on its own; the tail and
+ * other compilers use the scalar forms above, which compute the same. */
+#if defined(__GNUC__)
+#define OSC_BL_VECTOR 1
+typedef float32_t osc_bl_v4f __attribute__((vector_size(16)));
+typedef uint32_t  osc_bl_v4u __attribute__((vector_size(16)));
+typedef int32_t   osc_bl_v4i __attribute__((vector_size(16)));
+
+static inline osc_bl_v4f osc_bl_phase4(osc_bl_v4u p)
+{
+    return __builtin_convertvector((osc_bl_v4i)(p >> 8), osc_bl_v4f) * OSC_BL_PHASE_SCALE;
+}
+
+static inline osc_bl_v4f osc_bl_relu4(osc_bl_v4f x)
+{
+    osc_bl_v4f ax = (osc_bl_v4f)((osc_bl_v4u)x & 0x7FFFFFFFu);
+    return 0.5f * (x + ax);
+}
+
+static inline osc_bl_v4f osc_bl_blep4(osc_bl_v4f t, float32_t inv_dt)
+{
+    osc_bl_v4f a = osc_bl_relu4(1.0f - t * inv_dt);
+    osc_bl_v4f b = osc_bl_relu4(1.0f - (1.0f - t) * inv_dt);
+    return b * b - a * a;
+}
+
+static inline osc_bl_v4u osc_bl_lanes(uint32_t ph, uint32_t inc)
+{
+    return (osc_bl_v4u){ ph, ph + inc, ph + 2u * inc, ph + 3u * inc };
+}
+#endif
+
+/* Render `n` samples of a band-limited saw (-1..1) advancing `*acc` by `inc`. */
+static inline void osc_bl_saw(uint32_t *acc, float32_t *restrict out, uint32_t n, uint32_t inc)
+{
+    const float32_t inv_dt = inc ? 4294967296.0f / (float32_t)inc : 0.0f;
+    const uint32_t ph = *acc;
+    uint32_t i = 0;
+#ifdef OSC_BL_VECTOR
+    osc_bl_v4u p = osc_bl_lanes(ph, inc);
+    for(; i + 4u <= n; i += 4u, p += 4u * inc){
+        osc_bl_v4f t = osc_bl_phase4(p);
+        osc_bl_v4f y = 2.0f * t - 1.0f - osc_bl_blep4(t, inv_dt);
+        __builtin_memcpy(out + i, &y, sizeof(y));
+    }
+#endif
+    for(; i < n; i++) out[i] = osc_bl_saw_at(ph + i * inc, inv_dt);
+    *acc = ph + n * inc;
+}
+
+/* Render `n` samples of a band-limited square (-1..1). */
+static inline void osc_bl_square(uint32_t *acc, float32_t *restrict out, uint32_t n, uint32_t inc)
+{
+    const float32_t inv_dt = inc ? 4294967296.0f / (float32_t)inc : 0.0f;
+    const uint32_t ph = *acc;
+    uint32_t i = 0;
+#ifdef OSC_BL_VECTOR
+    osc_bl_v4u p = osc_bl_lanes(ph, inc);
+    for(; i + 4u <= n; i += 4u, p += 4u * inc){
+        osc_bl_v4f naive = 1.0f - 2.0f * __builtin_convertvector((osc_bl_v4i)(p >> 31), osc_bl_v4f);
+        osc_bl_v4f y = naive + osc_bl_blep4(osc_bl_phase4(p), inv_dt)
+                             - osc_bl_blep4(osc_bl_phase4(p + 0x80000000u), inv_dt);
+        __builtin_memcpy(out + i, &y, sizeof(y));
+    }
+#endif
+    for(; i < n; i++) out[i] = osc_bl_square_at(ph + i * inc, inv_dt);
+    *acc = ph + n * inc;
+}
+
+/* Drop-in counterparts of osc_saw_block / osc_square_block. */
+static inline void osc_bl_saw_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float32_t sr)
+{
+    osc_bl_saw(&o->acc, out, n, osc_bl_inc(freq, sr));
+}
+
+static inline void osc_bl_square_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float32_t sr)
+{
+    osc_bl_square(&o->acc, out, n, osc_bl_inc(freq, sr));
+}
+
+#endif /* OSC_BL_H */
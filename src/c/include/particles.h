@@ -4,7 +4,10 @@
 #include <stdint.h>
 #include <stdbool.h>
 
-#define MAX_PARTICLES 256
+/* Pool size until particles_set_capacity; also what the visualiser's
+ * reference renders use, so changing it changes the pictures. */
+#define PARTICLES_DEFAULT_CAPACITY 256
+#define MAX_PARTICLES PARTICLES_DEFAULT_CAPACITY
 
 typedef struct {
     float x,y;
@@ -13,10 +16,22 @@ typedef struct {
     int max_life;
     uint32_t color;
     uint8_t glyph; /* index into glyph set */
+    /* set by particles_update for particles_draw */
+    uint32_t shade;  /* color faded by remaining life */
+    int sx, sy;      /* top-left of the 5x7 glyph cell */
 } particle_t;
 
 void particles_init(void);
+/* Resize the particle pool (live particles beyond it are dropped).
+ * Returns 0 on success. */
+int  particles_set_capacity(int capacity);
+int  particles_capacity(void);
+int  particles_count(void);
+void particles_free(void);
 void particles_spawn_burst(float x,float y,int count,uint32_t color);
 void particles_update_and_draw(uint32_t *fb,int w,int h);
+/* The two halves of particles_update_and_draw, for band-parallel drawing */
+void particles_update(int w,int h);
+void particles_draw(uint32_t *fb,int w,int h);
 
 #endif /* PARTICLES_H */ 
\ No newline at end of file
@@ -13,15 +13,30 @@ static inline rng_t rng_seed(uint64_t seed)
     rng_t r; r.state = seed + 0x9E3779B97F4A7C15ULL; return r;
 }
 
-/* Produce next 64-bit pseudo-random value. */
-static inline uint64_t rng_next_u64(rng_t *r)
+#define RNG_GAMMA 0x9E3779B97F4A7C15ULL
+
+/* SplitMix64 output function.  The k-th value after state s is
+ * rng_mix64(s + k * RNG_GAMMA), so a stream can be evaluated at any
+ * counter independently (see noise_block). */
+static inline uint64_t rng_mix64(uint64_t z)
 {
-    uint64_t z = (r->state += 0x9E3779B97F4A7C15ULL);
     z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
     z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
     return z ^ (z >> 31);
 }
 
+/* Produce next 64-bit pseudo-random value. */
+static inline uint64_t rng_next_u64(rng_t *r)
+{
+    return rng_mix64(r->state += RNG_GAMMA);
+}
+
+/* Advance the stream by n values without generating them. */
+static inline void rng_skip(rng_t *r, uint64_t n)
+{
+    r->state += n * RNG_GAMMA;
+}
+
 static inline uint32_t rng_next_u32(rng_t *r)
 {
     return (uint32_t)rng_next_u64(r);
@@ -3,7 +3,57 @@
 #include <stdint.h>
 #include <stdbool.h>
 
+/* ---- Damage tracking ----
+ * The framebuffer is split into RASTER_TILE x RASTER_TILE tiles; a damage set
+ * marks the tiles that may differ from the background.  While a set is
+ * installed with raster_set_damage, every primitive below marks what it
+ * touches (raster_clear excepted: it resets to background).  Before drawing,
+ * raster_damage_build turns the tiles into a short list of rectangles: runs
+ * of dirty tiles per tile row, merged with the row above when they line up. */
+#define RASTER_TILE_SHIFT 4
+#define RASTER_TILE       (1 << RASTER_TILE_SHIFT)
+
+typedef struct { int x, y, w, h; } raster_rect_t;
+
+typedef struct {
+    int w, h;               /* framebuffer size */
+    int tw, th;             /* tile grid size */
+    uint8_t *tiles;         /* tw * th, non-zero = dirty */
+    raster_rect_t *rects;   /* filled by raster_damage_build */
+    int nrects;
+    int *open;              /* tw, build scratch */
+} raster_damage_t;
+
+int  raster_damage_init(raster_damage_t *d, int w, int h);
+void raster_damage_free(raster_damage_t *d);
+void raster_damage_reset(raster_damage_t *d);
+void raster_damage_all(raster_damage_t *d);
+/* Mark the tiles covering [x0, x1] x [y0, y1] (inclusive, clipped). */
+void raster_damage_rect(raster_damage_t *d, int x0, int y0, int x1, int y1);
+void raster_damage_union(raster_damage_t *d, const raster_damage_t *src);
+/* Grow every dirty run by `tiles` tiles left and right. */
+void raster_damage_expand_x(raster_damage_t *d, int tiles);
+/* The same for tile rows ty0 <= ty < ty1 only. */
+void raster_damage_expand_rows(raster_damage_t *d, int tiles, int ty0, int ty1);
+int  raster_damage_build(raster_damage_t *d);
+/* Fraction of the frame in d's rectangles (after raster_damage_build). */
+float raster_damage_coverage(const raster_damage_t *d);
+
+/* Install the set primitives report to (NULL = off) and report a box by hand,
+ * for code that writes pixels itself. */
+void raster_set_damage(raster_damage_t *d);
+void raster_damage(int x0, int y0, int x1, int y1);
+
+/* Row window for the calling thread (rows y0 <= y < y1): every primitive,
+ * raster_clear included, leaves rows outside it untouched and unreported,
+ * so threads can draw the same scene into disjoint bands.  Reset with
+ * raster_set_rows(0, INT_MAX).  raster_clip_rows intersects it with [0, h). */
+void raster_set_rows(int y0, int y1);
+void raster_clip_rows(int h, int *y0, int *y1);
+
 void raster_clear(uint32_t *fb, int w, int h, uint32_t color_rgba);
+/* Clear only d's rectangles (after raster_damage_build). */
+void raster_clear_damage(uint32_t *fb, int w, int h, uint32_t color_rgba, const raster_damage_t *d);
 void raster_circle(uint32_t *fb, int w, int h, int cx, int cy, int r, uint32_t color_rgba, int thickness);
 void raster_fill_circle(uint32_t *fb, int w, int h, int cx, int cy, int r, uint32_t color_rgba);
 void raster_line(uint32_t *fb, int w, int h, int x0, int y0, int x1, int y1, uint32_t color_rgba);
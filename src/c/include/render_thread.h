@@ -0,0 +1,55 @@
+#ifndef RENDER_THREAD_H
+#define RENDER_THREAD_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stdatomic.h>
+#include <pthread.h>
+#include "generator.h"
+#include "spsc_ring.h"
+#include "vis_event.h"
+
+/* Render-ahead thread for the real-time player.
+ *
+ * A dedicated thread runs generator_process in `block`-frame chunks and
+ * keeps the SPSC ring topped up to `blocks_ahead` blocks, posting the
+ * block's visual events to `vis`: every saw / bass hit at its own sample
+ * (read from the generator's event stream) and the block RMS.  The audio
+ * callback then only copies out of the ring via render_thread_pull().
+ */
+
+typedef struct {
+    generator_t *g;
+    vis_queue_t *vis;
+    uint32_t block;               /* frames per generator_process call */
+
+    spsc_ring_t ring;             /* interleaved stereo */
+    float *ring_buf;
+    float *scratch;               /* L | R | interleaved, render thread only */
+    uint64_t frames_rendered;     /* render thread only */
+    gen_event_ring_t *events;     /* generator note events, when vis is set */
+    gen_event_reader_t reader;
+
+    _Atomic uint64_t frames_played;  /* advanced by the audio callback */
+    _Atomic uint64_t underruns;      /* callbacks that found the ring short */
+
+    atomic_bool running;
+    pthread_t thread;
+} render_thread_t;
+
+/* Allocates the ring (blocks_ahead * block frames, rounded up to a power of
+ * two), pre-fills it and starts the thread.  Returns 0 on success. */
+int  render_thread_start(render_thread_t *rt, generator_t *g, vis_queue_t *vis,
+                         uint32_t block, uint32_t blocks_ahead);
+void render_thread_stop(render_thread_t *rt);
+
+/* Audio-callback side: copy `num_frames` interleaved frames out of the ring,
+ * padding with silence (and counting an underrun) if it runs short. */
+void render_thread_pull(render_thread_t *rt, float *buffer, uint32_t num_frames);
+
+static inline uint64_t render_thread_played(render_thread_t *rt)
+{
+    return atomic_load_explicit(&rt->frames_played, memory_order_acquire);
+}
+
+#endif /* RENDER_THREAD_H */
@@ -26,5 +26,8 @@ typedef struct {
 void shapes_init(void);
 void shapes_spawn(shape_type_t type, uint32_t color);
 void shapes_update_and_draw(uint32_t *fb, int w, int h);
+/* The two halves of shapes_update_and_draw, for band-parallel drawing */
+void shapes_update(void);
+void shapes_draw(uint32_t *fb, int w, int h);
 
 #endif /* SHAPES_H */ 
\ No newline at end of file
@@ -0,0 +1,75 @@
+#ifndef SPSC_RING_H
+#define SPSC_RING_H
+
+#include <stdint.h>
+#include <stdatomic.h>
+#include <string.h>
+
+/* Lock-free single-producer / single-consumer float ring.
+ *
+ * One thread writes, one thread reads; no locks, no allocation.  Capacity
+ * must be a power of two.  head/tail are free-running counters: the writer
+ * publishes `head` with release order after copying the data in, the reader
+ * publishes `tail` with release order after copying it out, and each side
+ * reads the other's counter with acquire.
+ */
+
+typedef struct {
+    float *buf;
+    uint32_t mask;                 /* capacity - 1 */
+    _Atomic uint32_t head;         /* total floats written */
+    char pad_[64 - sizeof(uint32_t)]; /* keep head and tail on separate cache lines */
+    _Atomic uint32_t tail;         /* total floats read */
+} spsc_ring_t;
+
+static inline void spsc_ring_init(spsc_ring_t *r, float *storage, uint32_t capacity_pow2)
+{
+    r->buf = storage;
+    r->mask = capacity_pow2 - 1u;
+    atomic_init(&r->head, 0u);
+    atomic_init(&r->tail, 0u);
+}
+
+static inline uint32_t spsc_ring_readable(spsc_ring_t *r)
+{
+    return atomic_load_explicit(&r->head, memory_order_acquire)
+         - atomic_load_explicit(&r->tail, memory_order_relaxed);
+}
+
+static inline uint32_t spsc_ring_writable(spsc_ring_t *r)
+{
+    return (r->mask + 1u) - (atomic_load_explicit(&r->head, memory_order_relaxed)
+                           - atomic_load_explicit(&r->tail, memory_order_acquire));
+}
+
+/* Producer side.  Writes up to n floats, returns how many were written. */
+static inline uint32_t spsc_ring_write(spsc_ring_t *r, const float *src, uint32_t n)
+{
+    uint32_t head = atomic_load_explicit(&r->head, memory_order_relaxed);
+    uint32_t space = spsc_ring_writable(r);
+    if(n > space) n = space;
+    uint32_t at = head & r->mask;
+    uint32_t first = (r->mask + 1u) - at;
+    if(first > n) first = n;
+    memcpy(r->buf + at, src, first * sizeof(float));
+    memcpy(r->buf, src + first, (n - first) * sizeof(float));
+    atomic_store_explicit(&r->head, head + n, memory_order_release);
+    return n;
+}
+
+/* Consumer side.  Reads up to n floats, returns how many were read. */
+static inline uint32_t spsc_ring_read(spsc_ring_t *r, float *dst, uint32_t n)
+{
+    uint32_t tail = atomic_load_explicit(&r->tail, memory_order_relaxed);
+    uint32_t avail = spsc_ring_readable(r);
+    if(n > avail) n = avail;
+    uint32_t at = tail & r->mask;
+    uint32_t first = (r->mask + 1u) - at;
+    if(first > n) first = n;
+    memcpy(dst, r->buf + at, first * sizeof(float));
+    memcpy(dst + first, r->buf, (n - first) * sizeof(float));
+    atomic_store_explicit(&r->tail, tail + n, memory_order_release);
+    return n;
+}
+
+#endif /* SPSC_RING_H */
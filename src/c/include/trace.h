@@ -0,0 +1,83 @@
+#ifndef TRACE_H
+#define TRACE_H
+
+#include <stdint.h>
+
+/* Compile-time trace facility for the audio path.
+ *
+ * Replaces printf debugging inside the render loop: instead of formatting
+ * text on the audio thread, TRACE() stores a fixed-size binary record in a
+ * ring buffer.  The ring is dumped to disk after rendering and decoded with
+ * tools/trace_decode.py.
+ *
+ * Compiled out by default.  Build with `make TRACE=1` (adds -DTRACE_ENABLED)
+ * to turn every TRACE() call site into a record write.
+ */
+
+/* Ring capacity in records – must be a power of two. */
+#ifndef TRACE_CAPACITY
+#define TRACE_CAPACITY 4096u
+#endif
+
+/* Keep in sync with EVENT_NAMES in tools/trace_decode.py */
+typedef enum {
+    TRACE_FM_TRIGGER = 0,   /* p = {carrier_freq, ratio, index, amp}, aux = len            */
+    TRACE_FM_PROCESS_FIRST, /* p = {len}, aux = n ; first fm_voice_process call            */
+    TRACE_EVENT,            /* p = {type, aux, step, pos_in_step}, aux = event_idx         */
+    TRACE_MID_TRIGGER,      /* p = {step, aux, pos_in_step}, aux = mid trigger count       */
+    TRACE_STEP_END,         /* p = {step, pos_in_step}, aux = event_idx                    */
+    TRACE_DELAY_BLOCK,      /* p = {size, idx}, aux = num_frames ; before delay_process    */
+    TRACE_EVENT_COUNT
+} trace_event_t;
+
+/* Keep in sync with VOICE_NAMES in tools/trace_decode.py */
+typedef enum {
+    TRACE_VOICE_NONE = 0,
+    TRACE_VOICE_KICK,
+    TRACE_VOICE_SNARE,
+    TRACE_VOICE_HAT,
+    TRACE_VOICE_MELODY,
+    TRACE_VOICE_FM,
+    TRACE_VOICE_MID_FM,
+    TRACE_VOICE_BASS_FM,
+    TRACE_VOICE_MID_SIMPLE,
+    TRACE_VOICE_DELAY,
+    TRACE_VOICE_COUNT
+} trace_voice_t;
+
+/* 32-byte on-disk / in-ring record (little-endian, naturally aligned). */
+typedef struct {
+    uint64_t t_ns;   /* monotonic timestamp in nanoseconds */
+    uint16_t event;  /* trace_event_t */
+    uint16_t voice;  /* trace_voice_t */
+    uint32_t aux;    /* event-specific integer payload */
+    float    p[4];   /* event-specific float payload */
+} trace_record_t;
+
+#define TRACE_FILE_MAGIC   0x5442444Eu /* "NDBT" little-endian */
+#define TRACE_FILE_VERSION 1u
+
+/* Append a record.  Real-time safe: no allocation, no locks, no stdio.
+ * Single producer; the oldest records are overwritten when the ring wraps. */
+void trace_emit(uint16_t event, uint16_t voice, uint32_t aux,
+                float p0, float p1, float p2, float p3);
+
+/* Forget all recorded entries. */
+void trace_reset(void);
+
+/* Total number of records emitted since the last reset (may exceed capacity). */
+uint64_t trace_count(void);
+
+/* Write the ring (oldest first) to `path`.  Call from a non-audio thread once
+ * rendering has stopped.  Returns 0 on success. */
+int trace_dump(const char *path);
+
+#ifdef TRACE_ENABLED
+#define TRACE(ev, voice, aux, p0, p1, p2, p3) \
+    trace_emit((uint16_t)(ev), (uint16_t)(voice), (uint32_t)(aux), \
+               (float)(p0), (float)(p1), (float)(p2), (float)(p3))
+#else
+#define TRACE(ev, voice, aux, p0, p1, p2, p3) ((void)0)
+#endif
+
+#endif /* TRACE_H */
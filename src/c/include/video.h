@@ -3,6 +3,7 @@
 
 #include <stdint.h>
 #include <stdbool.h>
+#include "raster.h"
 
 /* Simple SDL2 + OpenGL video facade used by the visualiser.
  * This is intentionally minimal for Stage-1 scaffolding.
@@ -24,6 +25,10 @@ bool video_frame_begin(void);
 /* End the frame: present back-buffer. */
 void video_frame_end(void);
 
+/* Present uploading only d's rectangles (after raster_damage_build; NULL =
+ * the whole framebuffer), drawn offset by (dx, dy) for screen shake. */
+void video_frame_end_damage(const raster_damage_t *d, int dx, int dy);
+
 /* Accessors for software framebuffer */
 uint32_t* video_get_framebuffer(void);
 int video_get_width(void);
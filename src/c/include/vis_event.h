@@ -0,0 +1,78 @@
+#ifndef VIS_EVENT_H
+#define VIS_EVENT_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stdatomic.h>
+
+/* Timestamped visual events, render thread -> video thread.
+ *
+ * Same single-producer / single-consumer scheme as spsc_ring_t but for
+ * whole records, so a hit is either fully visible or not there yet.  The
+ * timestamp is the stream frame of the note (hits) or of the start of the
+ * block it was measured over (RMS), pushed in non-decreasing order; the
+ * consumer only takes events whose frame has already been played, which
+ * keeps visuals in step with what is audible even though audio is
+ * rendered a few blocks ahead.
+ */
+
+#define VIS_QUEUE_CAPACITY 1024u  /* power of two */
+
+typedef enum {
+    VIS_SAW_HIT = 0,   /* melody (saw) trigger   – value = note Hz */
+    VIS_BASS_HIT,      /* FM bass trigger        – value = note Hz */
+    VIS_RMS,           /* block RMS              – value = level 0..1 */
+} vis_event_type_t;
+
+typedef struct {
+    uint64_t frame;    /* stream position in frames */
+    uint32_t type;     /* vis_event_type_t */
+    float    value;
+} vis_event_t;
+
+typedef struct {
+    vis_event_t ev[VIS_QUEUE_CAPACITY];
+    _Atomic uint32_t head;
+    char pad_[64 - sizeof(uint32_t)];
+    _Atomic uint32_t tail;
+    _Atomic uint32_t dropped;  /* pushes rejected because the queue was full */
+} vis_queue_t;
+
+static inline void vis_queue_init(vis_queue_t *q)
+{
+    atomic_init(&q->head, 0u);
+    atomic_init(&q->tail, 0u);
+    atomic_init(&q->dropped, 0u);
+}
+
+/* Producer side.  Returns false (and counts a drop) when full. */
+static inline bool vis_queue_push(vis_queue_t *q, uint64_t frame, vis_event_type_t type, float value)
+{
+    uint32_t head = atomic_load_explicit(&q->head, memory_order_relaxed);
+    uint32_t tail = atomic_load_explicit(&q->tail, memory_order_acquire);
+    if(head - tail >= VIS_QUEUE_CAPACITY){
+        atomic_fetch_add_explicit(&q->dropped, 1u, memory_order_relaxed);
+        return false;
+    }
+    vis_event_t *e = &q->ev[head & (VIS_QUEUE_CAPACITY - 1u)];
+    e->frame = frame;
+    e->type = (uint32_t)type;
+    e->value = value;
+    atomic_store_explicit(&q->head, head + 1u, memory_order_release);
+    return true;
+}
+
+/* Consumer side.  Pops the oldest event if its frame is <= `until_frame`. */
+static inline bool vis_queue_pop(vis_queue_t *q, uint64_t until_frame, vis_event_t *out)
+{
+    uint32_t tail = atomic_load_explicit(&q->tail, memory_order_relaxed);
+    uint32_t head = atomic_load_explicit(&q->head, memory_order_acquire);
+    if(tail == head) return false;
+    const vis_event_t *e = &q->ev[tail & (VIS_QUEUE_CAPACITY - 1u)];
+    if(e->frame > until_frame) return false;
+    *out = *e;
+    atomic_store_explicit(&q->tail, tail + 1u, memory_order_release);
+    return true;
+}
+
+#endif /* VIS_EVENT_H */
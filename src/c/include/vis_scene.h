@@ -0,0 +1,59 @@
+#ifndef VIS_SCENE_H
+#define VIS_SCENE_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include "band_pool.h"
+#include "crt_fx.h"
+#include "raster.h"
+
+/* The visualiser scene (orbiting circle, terrain, bass shapes, glyph
+ * particles, CRT effects) rendered into a caller-owned framebuffer, so the
+ * SDL front end and headless tools draw the same frames.
+ *
+ * With track_damage the scene only clears and post-processes the tiles that
+ * changed (see raster_damage_t); the framebuffer must then be left as the
+ * previous call wrote it.  With vis_scene_set_threads the frame is cut into
+ * VIS_BAND_ROWS-row bands that a worker pool draws and post-processes in
+ * parallel; all state updates and every rand() call stay on the calling
+ * thread, in the original order.  Whatever the combination, the pixels are
+ * the same.
+ */
+
+#define VIS_BAND_ROWS 32   /* multiple of RASTER_TILE */
+typedef struct {
+    crt_fx_t fx;
+    int w, h;
+    int frame;
+    float angle;
+
+    bool track_damage;
+    raster_damage_t drawn;     /* tiles drawn this frame */
+    raster_damage_t out;       /* tiles that may differ from background */
+    raster_damage_t present;   /* tiles changed since the last present */
+
+    /* screen shake for this frame, applied when presenting */
+    int jitter_x, jitter_y;
+
+    /* band-parallel rendering (threads > 1) */
+    int threads;
+    band_pool_t pool;
+    uint32_t *row_tmp;         /* one row per thread, CRT scratch */
+
+    /* current frame, for the band jobs */
+    uint32_t *fb;
+    int cx, cy, radius;
+} vis_scene_t;
+
+int  vis_scene_init(vis_scene_t *s, uint64_t seed, int w, int h, bool track_damage);
+/* Draw one frame; level is the block RMS 0..1, hits count events since the
+ * last frame.  Calls rand() in the same order as the original main loop. */
+void vis_scene_render(vis_scene_t *s, uint32_t *fb, float level, int saw_hits, int bass_hits);
+/* Render with `threads` threads (the caller included) from now on; <= 1
+ * goes back to rendering on the caller alone.  Returns 0 on success. */
+int  vis_scene_set_threads(vis_scene_t *s, int threads);
+/* Call after presenting: `present` starts collecting changes anew. */
+void vis_scene_presented(vis_scene_t *s);
+void vis_scene_free(vis_scene_t *s);
+
+#endif /* VIS_SCENE_H */
@@ -2,6 +2,7 @@
 #define WAV_WRITER_H
 
 #include <stdint.h>
+#include <stdio.h>
 
 /*
  * Write a little-endian 16-bit PCM WAV file.
@@ -17,4 +18,46 @@ void write_wav(const char *path,
                uint16_t num_channels,
                uint32_t sample_rate);
 
-#endif /* WAV_WRITER_H */ 
\ No newline at end of file
+/*
+ * Streaming WAV writer for renders that never sit in memory as a whole:
+ * open writes a header with zero sizes, the append calls convert and
+ * buffer each block as it is produced, close flushes and patches the
+ * RIFF / data (and fact) sizes.  Float input is clamped to [-1, 1] and
+ * written as 16-bit PCM, 24-bit PCM or IEEE float32.
+ */
+typedef enum {
+    WAV_PCM16 = 0,
+    WAV_PCM24,
+    WAV_FLOAT32,
+} wav_format_t;
+
+#define WAV_STREAM_BUF_BYTES 65536u  /* output buffer; multiple of 2, 3 and 4 */
+
+typedef struct {
+    FILE    *f;
+    uint64_t frames;       /* frames appended so far */
+    uint16_t num_channels;
+    uint32_t sample_rate;
+    wav_format_t format;
+    uint32_t data_size_pos; /* file offset of the data chunk size */
+    uint32_t buf_used;
+    _Alignas(16) uint8_t buf[WAV_STREAM_BUF_BYTES];
+} wav_stream_t;
+
+/* Returns 0 on success. */
+int  wav_stream_open(wav_stream_t *w, const char *path, uint16_t num_channels,
+                     uint32_t sample_rate, wav_format_t format);
+/* Interleaved int16 frames, written as-is (WAV_PCM16 streams only). */
+void wav_stream_append(wav_stream_t *w, const int16_t *samples, uint32_t frames);
+/* Interleaved float frames, converted to the stream format. */
+void wav_stream_append_float(wav_stream_t *w, const float *samples, uint32_t frames);
+/* Planar stereo (R may be NULL for a mono stream), converted to the stream format. */
+void wav_stream_append_stereo(wav_stream_t *w, const float *L, const float *R, uint32_t frames);
+/* Flush, patch the header and close.  Returns 0 on success. */
+int  wav_stream_close(wav_stream_t *w);
+
+/* The float -> 16-bit PCM conversion the streams use (clamp to [-1, 1],
+ * scale by 32767, truncate).  bin/golden digests through it too. */
+void wav_convert_s16(const float *in, int16_t *out, uint32_t n);
+
+#endif /* WAV_WRITER_H */
@@ -0,0 +1,118 @@
+/* arrange – stream a multi-segment arrangement straight to a WAV file.
+ *
+ * Each segment is a fresh generator whose seed evolves from the previous
+ * one (SplitMix64 step), so an arrangement is fully determined by its first
+ * seed.  Audio is rendered in fixed-size blocks and appended to the WAV as
+ * it is produced: memory use does not depend on the length, and hour-long
+ * renders need no recompiled constants.  A segment longer than the
+ * generator's BARS_PER_SEG pattern simply loops it.
+ *
+ * Usage: bin/arrange [seed] [--segments N | --seconds S] [--bars B]
+ *                    [--block FRAMES] [--format s16|s24|f32] [--lookahead MS]
+ *                    [--out arrangement.wav]
+ *
+ * --lookahead switches every segment to the look-ahead limiter with that
+ * latency; the output is delayed by it.
+ */
+#include "wav_writer.h"
+#include "generator.h"
+#include "rand.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define ARRANGE_MAX_BLOCK 8192u
+
+static generator_t g;
+
+/* Seed of the segment following `seed`. */
+static uint64_t next_seed(uint64_t seed)
+{
+    rng_t r = rng_seed(seed);
+    return rng_next_u64(&r);
+}
+
+static void usage(const char *argv0)
+{
+    fprintf(stderr, "usage: %s [seed] [--segments N | --seconds S] [--bars B] "
+                    "[--block FRAMES] [--format s16|s24|f32] [--lookahead MS] [--out file.wav]\n", argv0);
+}
+
+int main(int argc, char **argv)
+{
+    uint64_t seed = 0xCAFEBABEULL;
+    uint32_t segments = 4;
+    double seconds = 0.0;   /* > 0: total length, overrides --segments */
+    uint32_t bars = BARS_PER_SEG;
+    uint32_t block = 512;
+    const char *out = "arrangement.wav";
+    wav_format_t format = WAV_PCM16;
+    float lookahead_ms = -1.0f;   /* < 0: keep the build default */
+
+    for(int i = 1; i < argc; i++){
+        const char *a = argv[i];
+        const char *v = (i + 1 < argc) ? argv[i + 1] : NULL;
+        if(a[0] != '-'){ seed = strtoull(a, NULL, 0); continue; }
+        if(!v){ usage(argv[0]); return 2; }
+        if     (strcmp(a, "--segments") == 0) segments = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--seconds") == 0)  seconds = strtod(v, NULL);
+        else if(strcmp(a, "--bars") == 0)     bars = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--block") == 0)    block = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--out") == 0)      out = v;
+        else if(strcmp(a, "--lookahead") == 0) lookahead_ms = strtof(v, NULL);
+        else if(strcmp(a, "--format") == 0){
+            if     (strcmp(v, "s16") == 0) format = WAV_PCM16;
+            else if(strcmp(v, "s24") == 0) format = WAV_PCM24;
+            else if(strcmp(v, "f32") == 0) format = WAV_FLOAT32;
+            else { usage(argv[0]); return 2; }
+        }
+        else { usage(argv[0]); return 2; }
+        i++;
+    }
+    if(bars == 0 || block == 0 || block > ARRANGE_MAX_BLOCK || (segments == 0 && seconds <= 0.0)){
+        usage(argv[0]);
+        return 2;
+    }
+    uint64_t total_target = seconds > 0.0 ? (uint64_t)(seconds * SR + 0.5) : UINT64_MAX;
+    if(seconds > 0.0) segments = UINT32_MAX;
+
+    static wav_stream_t wav;
+    if(wav_stream_open(&wav, out, 2, SR, format) != 0) return 1;
+
+    static float L[ARRANGE_MAX_BLOCK], R[ARRANGE_MAX_BLOCK];
+    uint64_t total_dropped = 0;
+    uint32_t seg;
+
+    for(seg = 0; seg < segments && wav.frames < total_target; seg++){
+        generator_init(&g, seed);
+        if(lookahead_ms >= 0.0f) generator_set_lookahead(&g, lookahead_ms);
+        total_dropped += g.events_dropped;
+
+        /* The default length matches bin/segment exactly; longer segments
+         * loop the pattern. */
+        uint64_t seg_frames = (uint64_t)g.mt.seg_frames * bars / BARS_PER_SEG;
+        if(seg_frames > total_target - wav.frames) seg_frames = total_target - wav.frames;
+
+        printf("segment %u: seed 0x%llx, %.2f bpm, root %.2f Hz, %llu frames%s\n", seg,
+               (unsigned long long)seed, g.mt.bpm, g.music.root_freq, (unsigned long long)seg_frames,
+               g.events_dropped ? " (events dropped)" : "");
+
+        for(uint64_t done = 0; done < seg_frames; ){
+            uint32_t n = (seg_frames - done < block) ? (uint32_t)(seg_frames - done) : block;
+            generator_process(&g, L, R, n);
+            wav_stream_append_stereo(&wav, L, R, n);
+            done += n;
+        }
+        seed = next_seed(seed);
+    }
+
+    uint64_t frames = wav.frames;
+    if(wav_stream_close(&wav) != 0) return 1;
+    printf("Wrote %s (%u segments, %llu frames, %.1f s)\n", out, seg,
+           (unsigned long long)frames, (double)frames / SR);
+    if(total_dropped){
+        fprintf(stderr, "WARNING: %llu events dropped across the arrangement (MAX_EVENTS %u)\n",
+                (unsigned long long)total_dropped, (unsigned)MAX_EVENTS);
+    }
+    return 0;
+}
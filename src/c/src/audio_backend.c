@@ -0,0 +1,34 @@
+#include "audio_backend.h"
+#include <string.h>
+
+#ifdef __APPLE__
+static const audio_backend_t audio_backend_coreaudio = {
+    "coreaudio", audio_init, audio_start, audio_stop, NULL
+};
+#endif
+
+/* First entry is the platform default */
+static const audio_backend_t *BACKENDS[] = {
+#ifdef __APPLE__
+    &audio_backend_coreaudio,
+#endif
+    &audio_backend_null,
+};
+
+const audio_backend_t *audio_backend_find(const char *name)
+{
+    if(!name || !name[0]) return BACKENDS[0];
+    for(size_t i = 0; i < sizeof(BACKENDS) / sizeof(BACKENDS[0]); i++){
+        if(strcmp(BACKENDS[i]->name, name) == 0) return BACKENDS[i];
+    }
+    return NULL;
+}
+
+void audio_stats_print(FILE *f, const audio_stats_t *s)
+{
+    fprintf(f, "audio: %llu callbacks, %llu missed deadlines, period %.1f us\n",
+            (unsigned long long)s->callbacks, (unsigned long long)s->misses, s->period_us);
+    fprintf(f, "       jitter mean %.1f us / max %.1f us, render mean %.1f us / max %.1f us (%.1f%% of period)\n",
+            s->jitter_mean_us, s->jitter_max_us, s->render_mean_us, s->render_max_us,
+            s->period_us > 0.0 ? 100.0 * s->render_max_us / s->period_us : 0.0);
+}
@@ -0,0 +1,172 @@
+#define _POSIX_C_SOURCE 200809L
+#include "audio_backend.h"
+#include "wav_writer.h"
+#include <pthread.h>
+#include <stdatomic.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <errno.h>
+
+/* Null / file sink: a timer thread stands in for the sound card.
+ *
+ * Period k is due at t0 + k * period.  The thread sleeps until that
+ * instant (absolute CLOCK_MONOTONIC deadline, so there is no drift), calls
+ * the render callback, and counts a miss if the callback has not returned
+ * by the time period k+1 is due – the point where a real device would have
+ * underrun.  After a miss the schedule restarts from "now", like an xrun
+ * recovery, instead of bursting to catch up.
+ */
+
+typedef struct {
+    audio_callback_t callback;
+    void *user_data;
+    uint32_t sr;
+    uint32_t frames;
+    float *buf;          /* interleaved stereo, frames * 2 */
+
+    audio_null_opts_t opts;
+    wav_stream_t wav;    /* open when opts.wav_path is set */
+
+    pthread_t thread;
+    bool thread_started;
+    atomic_bool running;
+
+    pthread_mutex_t lock;  /* guards the accumulators below */
+    uint64_t callbacks, misses;
+    uint64_t jitter_sum_ns, jitter_max_ns;
+    uint64_t render_sum_ns, render_max_ns;
+} null_state_t;
+
+static null_state_t g_null = {
+    .opts = { NULL, 1.0f },
+    .lock = PTHREAD_MUTEX_INITIALIZER,
+};
+
+static uint64_t now_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ull + (uint64_t)ts.tv_nsec;
+}
+
+static void sleep_until_ns(uint64_t t)
+{
+    struct timespec ts = { (time_t)(t / 1000000000ull), (long)(t % 1000000000ull) };
+    while(clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, &ts, NULL) == EINTR) { }
+}
+
+/* ---- timer thread ---- */
+
+static void *null_thread(void *arg)
+{
+    null_state_t *s = (null_state_t *)arg;
+    uint64_t period_ns = 0;
+    if(s->opts.speed > 0.0f)
+        period_ns = (uint64_t)(1e9 * (double)s->frames / (double)s->sr / (double)s->opts.speed);
+
+    uint64_t due = now_ns();
+    while(atomic_load_explicit(&s->running, memory_order_relaxed)){
+        if(period_ns) sleep_until_ns(due);
+        uint64_t wake = now_ns();
+
+        s->callback(s->buf, s->frames, s->user_data);
+        uint64_t done = now_ns();
+
+        if(s->wav.f) wav_stream_append_float(&s->wav, s->buf, s->frames);
+
+        uint64_t jitter = (period_ns && wake > due) ? wake - due : 0;
+        uint64_t render = done - wake;
+        bool missed = false;
+        if(period_ns){
+            due += period_ns;
+            if(done > due){
+                missed = true;
+                due = done;
+            }
+        }
+
+        pthread_mutex_lock(&s->lock);
+        s->callbacks++;
+        s->misses += missed;
+        s->jitter_sum_ns += jitter;
+        if(jitter > s->jitter_max_ns) s->jitter_max_ns = jitter;
+        s->render_sum_ns += render;
+        if(render > s->render_max_ns) s->render_max_ns = render;
+        pthread_mutex_unlock(&s->lock);
+    }
+    return NULL;
+}
+
+/* ---- backend interface ---- */
+
+void audio_null_configure(const audio_null_opts_t *opts)
+{
+    g_null.opts = *opts;
+}
+
+static int null_init(uint32_t sr, uint32_t buffer_size, audio_callback_t callback, void *user_data)
+{
+    null_state_t *s = &g_null;
+    s->callback = callback;
+    s->user_data = user_data;
+    s->sr = sr;
+    s->frames = buffer_size;
+    s->callbacks = s->misses = 0;
+    s->jitter_sum_ns = s->jitter_max_ns = 0;
+    s->render_sum_ns = s->render_max_ns = 0;
+
+    s->buf = calloc((size_t)buffer_size * 2, sizeof(float));
+    if(!s->buf){
+        fprintf(stderr, "audio_null: out of memory\n");
+        return 1;
+    }
+    if(s->opts.wav_path && wav_stream_open(&s->wav, s->opts.wav_path, 2, sr, WAV_PCM16) != 0)
+        return 1;
+    return 0;
+}
+
+static void null_start(void)
+{
+    atomic_store(&g_null.running, true);
+    if(pthread_create(&g_null.thread, NULL, null_thread, &g_null) != 0){
+        fprintf(stderr, "audio_null: pthread_create failed\n");
+        atomic_store(&g_null.running, false);
+        return;
+    }
+    g_null.thread_started = true;
+}
+
+static void null_stop(void)
+{
+    null_state_t *s = &g_null;
+    atomic_store(&s->running, false);
+    if(s->thread_started){
+        pthread_join(s->thread, NULL);
+        s->thread_started = false;
+    }
+    if(s->wav.f) wav_stream_close(&s->wav);
+    free(s->buf);
+    s->buf = NULL;
+}
+
+static int null_get_stats(audio_stats_t *out)
+{
+    null_state_t *s = &g_null;
+    pthread_mutex_lock(&s->lock);
+    out->callbacks = s->callbacks;
+    out->misses = s->misses;
+    out->period_us = (s->opts.speed > 0.0f && s->sr)
+                   ? 1e6 * (double)s->frames / (double)s->sr / (double)s->opts.speed : 0.0;
+    out->jitter_mean_us = s->callbacks ? (double)s->jitter_sum_ns / (double)s->callbacks * 1e-3 : 0.0;
+    out->jitter_max_us  = (double)s->jitter_max_ns * 1e-3;
+    out->render_mean_us = s->callbacks ? (double)s->render_sum_ns / (double)s->callbacks * 1e-3 : 0.0;
+    out->render_max_us  = (double)s->render_max_ns * 1e-3;
+    pthread_mutex_unlock(&s->lock);
+    return 0;
+}
+
+const audio_backend_t audio_backend_null = {
+    "null", null_init, null_start, null_stop, null_get_stats
+};
@@ -0,0 +1,93 @@
+#include "band_pool.h"
+#include <stdio.h>
+#include <string.h>
+
+static void work(band_pool_t *p, int worker)
+{
+    for(;;){
+        int b = atomic_fetch_add_explicit(&p->next, 1, memory_order_relaxed);
+        int y0 = b * p->band_h;
+        if(y0 >= p->h) break;
+        int y1 = y0 + p->band_h < p->h ? y0 + p->band_h : p->h;
+        p->fn(p->ctx, y0, y1, worker);
+    }
+}
+
+static void *worker_main(void *arg)
+{
+    band_worker_t *a = (band_worker_t *)arg;
+    band_pool_t *p = a->pool;
+    unsigned seen = 0;
+    for(;;){
+        pthread_mutex_lock(&p->lock);
+        while(p->generation == seen && !p->quit) pthread_cond_wait(&p->start, &p->lock);
+        if(p->quit){ pthread_mutex_unlock(&p->lock); break; }
+        seen = p->generation;
+        pthread_mutex_unlock(&p->lock);
+
+        work(p, a->worker);
+
+        pthread_mutex_lock(&p->lock);
+        if(--p->busy == 0) pthread_cond_signal(&p->done);
+        pthread_mutex_unlock(&p->lock);
+    }
+    return NULL;
+}
+
+int band_pool_init(band_pool_t *p, int threads)
+{
+    memset(p, 0, sizeof(*p));
+    if(threads < 1) threads = 1;
+    if(threads > BAND_POOL_MAX_THREADS) threads = BAND_POOL_MAX_THREADS;
+    pthread_mutex_init(&p->lock, NULL);
+    pthread_cond_init(&p->start, NULL);
+    pthread_cond_init(&p->done, NULL);
+    atomic_init(&p->next, 0);
+
+    p->threads = 1;
+    for(int i = 1; i < threads; i++){
+        p->workers[i] = (band_worker_t){ p, i };
+        if(pthread_create(&p->tid[i], NULL, worker_main, &p->workers[i]) != 0){
+            fprintf(stderr, "band_pool: started %d of %d threads\n", p->threads, threads);
+            break;
+        }
+        p->threads++;
+    }
+    return 0;
+}
+
+void band_pool_run(band_pool_t *p, band_fn fn, void *ctx, int h, int band_h)
+{
+    p->fn = fn;
+    p->ctx = ctx;
+    p->h = h;
+    p->band_h = band_h > 0 ? band_h : h;
+    atomic_store_explicit(&p->next, 0, memory_order_relaxed);
+    if(p->threads > 1){
+        pthread_mutex_lock(&p->lock);
+        p->busy = p->threads - 1;
+        p->generation++;
+        pthread_cond_broadcast(&p->start);
+        pthread_mutex_unlock(&p->lock);
+    }
+
+    work(p, 0);
+
+    if(p->threads > 1){
+        pthread_mutex_lock(&p->lock);
+        while(p->busy) pthread_cond_wait(&p->done, &p->lock);
+        pthread_mutex_unlock(&p->lock);
+    }
+}
+
+void band_pool_free(band_pool_t *p)
+{
+    pthread_mutex_lock(&p->lock);
+    p->quit = true;
+    pthread_cond_broadcast(&p->start);
+    pthread_mutex_unlock(&p->lock);
+    for(int i = 1; i < p->threads; i++) pthread_join(p->tid[i], NULL);
+    pthread_cond_destroy(&p->start);
+    pthread_cond_destroy(&p->done);
+    pthread_mutex_destroy(&p->lock);
+}
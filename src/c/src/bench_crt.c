@@ -0,0 +1,142 @@
+/* bench_crt – fused fixed-point CRT pass vs the float multi-pass original.
+ *
+ * The reference below is the previous crt_fx_apply: float blend_alpha for
+ * persistence and bleed, one full-frame pass per effect and a malloc'd
+ * frame copy for chroma.  Both run on the same frames (moving rings and
+ * discs over black) with the same effect levels; the report gives ms/frame
+ * and how far the fixed-point blends drift from the float ones.
+ *
+ * Usage: bin/bench_crt [frames] [width height [seed]]
+ */
+#define _POSIX_C_SOURCE 199309L
+#include "crt_fx.h"
+#include "raster.h"
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static inline uint32_t ref_blend(uint32_t dst, uint32_t src, float alpha)
+{
+    uint8_t r = (uint8_t)(((dst >> 24) & 0xFF) * (1.0f - alpha) + ((src >> 24) & 0xFF) * alpha);
+    uint8_t g = (uint8_t)(((dst >> 16) & 0xFF) * (1.0f - alpha) + ((src >> 16) & 0xFF) * alpha);
+    uint8_t b = (uint8_t)(((dst >> 8) & 0xFF) * (1.0f - alpha) + ((src >> 8) & 0xFF) * alpha);
+    return (r << 24) | (g << 16) | (b << 8) | 0xFF;
+}
+
+static void ref_apply(crt_fx_t *fx, uint32_t *prev, uint32_t *fb, int w, int h, int frame)
+{
+    if(fx->persistence > 0.01f)
+        for(int i = 0; i < w*h; i++) fb[i] = ref_blend(prev[i], fb[i], 1.0f - fx->persistence);
+    memcpy(prev, fb, w * h * sizeof(uint32_t));
+
+    if(fx->scanline_alpha > 0){
+        float alpha = fx->scanline_alpha / 255.0f;
+        for(int y = 0; y < h; y += 2)
+            for(int x = 0; x < w; x++){
+                uint32_t p = fb[y * w + x];
+                uint8_t r = ((p >> 24) & 0xFF) * (1.0f - alpha);
+                uint8_t g = ((p >> 16) & 0xFF) * (1.0f - alpha);
+                uint8_t b = ((p >> 8) & 0xFF) * (1.0f - alpha);
+                fb[y * w + x] = (r << 24) | (g << 16) | (b << 8) | 0xFF;
+            }
+    }
+
+    if(fx->chroma_shift > 0){
+        uint32_t *temp = (uint32_t*)malloc(w * h * sizeof(uint32_t));
+        memcpy(temp, fb, w * h * sizeof(uint32_t));
+        int shift = (frame % 30 < 15) ? fx->chroma_shift : -fx->chroma_shift;
+        for(int y = 0; y < h; y++)
+            for(int x = 0; x < w; x++){
+                int src_x = x - shift;
+                if(src_x >= 0 && src_x < w)
+                    fb[y * w + x] = (fb[y * w + x] & 0x00FFFFFF) | (temp[y * w + src_x] & 0xFF000000);
+            }
+        for(int y = 0; y < h; y++)
+            for(int x = 0; x < w; x++){
+                int src_x = x + shift;
+                if(src_x >= 0 && src_x < w)
+                    fb[y * w + x] = (fb[y * w + x] & 0xFFFF00FF) | (temp[y * w + src_x] & 0x0000FF00);
+            }
+        free(temp);
+    }
+
+    if(fx->color_bleed > 0.01f)
+        for(int y = 0; y < h; y++)
+            for(int x = 1; x < w-1; x++){
+                int i = y * w + x;
+                fb[i] = ref_blend(fb[i], ref_blend(fb[i - 1], fb[i + 1], 0.5f), fx->color_bleed);
+            }
+
+    for(int i = 0; i < fx->noise_pixels; i++){
+        int x = rng_next_u32(&fx->rng) % w;
+        int y = rng_next_u32(&fx->rng) % h;
+        uint8_t val = rng_next_u32(&fx->rng) & 0xFF;
+        fb[y * w + x] = (val << 24) | (val << 16) | (val << 8) | 0xFF;
+    }
+}
+
+static void draw_scene(uint32_t *fb, int w, int h, int f)
+{
+    raster_clear(fb, w, h, 0x000000FF);
+    for(int i = 0; i < 6; i++){
+        float a = f * 0.03f + i * 1.047f;
+        int cx = w/2 + (int)(cosf(a) * w * 0.3f), cy = h/2 + (int)(sinf(a * 1.3f) * h * 0.3f);
+        uint32_t col = ((uint32_t)(60 + 30 * i) << 24) | ((uint32_t)(250 - 35 * i) << 16) | ((uint32_t)(40 * i) << 8) | 0xFF;
+        raster_fill_circle(fb, w, h, cx, cy, h / 12, col);
+        raster_circle(fb, w, h, cx, cy, h / 8, 0xFFFFFFFFu, 4);
+    }
+}
+
+int main(int argc, char **argv)
+{
+    int frames = argc > 1 ? atoi(argv[1]) : 300;
+    int w = argc > 3 ? atoi(argv[2]) : 800;
+    int h = argc > 3 ? atoi(argv[3]) : 600;
+    uint64_t seed = argc > 4 ? strtoull(argv[4], NULL, 0) : 0xCAFEBABEULL;
+    if(frames <= 0 || w <= 0 || h <= 0){
+        fprintf(stderr, "usage: %s [frames] [width height [seed]]\n", argv[0]);
+        return 2;
+    }
+    size_t n = (size_t)w * h;
+    uint32_t *a = malloc(n * 4), *b = malloc(n * 4), *prev = calloc(n, 4);
+    crt_fx_t fx, ref;
+    crt_fx_init(&fx, seed, w, h);
+    ref = fx;
+    if(!a || !b || !prev || !fx.prev_frame){ fprintf(stderr, "bench_crt: out of memory\n"); return 1; }
+
+    double t_ref = 0.0, t_fix = 0.0, sum = 0.0;
+    int max_err = 0;
+    for(int f = 0; f < frames; f++){
+        draw_scene(a, w, h, f);
+        memcpy(b, a, n * 4);
+        double t0 = now_sec();
+        ref_apply(&ref, prev, a, w, h, f);
+        double t1 = now_sec();
+        crt_fx_apply(&fx, b, w, h, f);
+        t_fix += now_sec() - t1;
+        t_ref += t1 - t0;
+        for(size_t i = 0; i < n; i++)
+            for(int s = 8; s < 32; s += 8){
+                int d = abs((int)((a[i] >> s) & 0xFF) - (int)((b[i] >> s) & 0xFF));
+                sum += d;
+                if(d > max_err) max_err = d;
+            }
+    }
+    printf("bench_crt: %d frames at %dx%d, persist=%.2f scan=%d chroma=%d bleed=%.2f\n",
+           frames, w, h, fx.persistence, fx.scanline_alpha, fx.chroma_shift, fx.color_bleed);
+    printf("  float, per effect  %7.3f ms/frame\n", t_ref / frames * 1e3);
+    printf("  fixed, fused       %7.3f ms/frame  (%.2fx)\n", t_fix / frames * 1e3, t_ref / t_fix);
+    printf("  channel error: max %d, mean %.4f levels\n", max_err, sum / ((double)n * 3 * frames));
+    crt_fx_cleanup(&fx);
+    free(a); free(b); free(prev);
+    return 0;
+}
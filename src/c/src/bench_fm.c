@@ -0,0 +1,123 @@
+/* bench_fm – throughput and accuracy of the FM kernels.
+ *
+ * Renders every preset with fm_kernel_ref and fm_kernel_fast over the same
+ * span (in generator-sized blocks, notes re-triggered every second so
+ * the envelope never decays into denormals), then reports Msamples/s for each,
+ * the speed-up, the max absolute difference and how many int16 samples
+ * would land in a different coarse-hash bucket (top 12 bits, see
+ * tests/hash_wav.py).
+ *
+ * Usage: bin/bench_fm [seconds] [block]
+ */
+#define _POSIX_C_SOURCE 199309L
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+#include <time.h>
+#include "fm_voice.h"
+#include "fm_presets.h"
+
+#define TAU 6.2831853071795864769f
+#define SR  44100.0f
+#define NOTE_FRAMES 44100u  /* re-trigger every second, like a long bass note */
+
+typedef void (*fm_kernel_fn)(float32_t *, float32_t *, uint32_t, uint32_t, float32_t,
+                             float32_t, float32_t, float32_t, float32_t, float32_t,
+                             float32_t *, float32_t *);
+
+typedef struct {
+    const char *name;
+    fm_params_t p;
+    float32_t freq;
+} bench_case_t;
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static double render(fm_kernel_fn fn, const bench_case_t *c, float32_t *L, float32_t *R,
+                     uint32_t frames, uint32_t block)
+{
+    float32_t cp = 0.0f, mp = 0.0f;
+    const float32_t c_inc = TAU * c->freq / SR;
+    const float32_t m_inc = TAU * c->freq * c->p.ratio / SR;
+    memset(L, 0, frames * sizeof(float32_t));
+    memset(R, 0, frames * sizeof(float32_t));
+
+    double t0 = now_sec();
+    for(uint32_t pos = 0; pos < frames; ){
+        uint32_t note_pos = pos % NOTE_FRAMES;
+        if(note_pos == 0) cp = mp = 0.0f; /* compare per note, not accumulated phase drift */
+        uint32_t n = block;
+        if(n > NOTE_FRAMES - note_pos) n = NOTE_FRAMES - note_pos;
+        if(n > frames - pos) n = frames - pos;
+        fn(L + pos, R + pos, n, note_pos, SR, c_inc, m_inc, c->p.index, c->p.amp, c->p.decay, &cp, &mp);
+        pos += n;
+    }
+    return now_sec() - t0;
+}
+
+static int coarse_bucket(float32_t v)
+{
+    if(v > 1.0f) v = 1.0f;
+    if(v < -1.0f) v = -1.0f;
+    return ((int16_t)(v * 32767.0f)) & 0xFFF0;
+}
+
+int main(int argc, char **argv)
+{
+    float seconds = (argc > 1) ? (float)atof(argv[1]) : 10.0f;
+    uint32_t block = (argc > 2) ? (uint32_t)atoi(argv[2]) : 512u;
+    uint32_t frames = (uint32_t)(seconds * SR);
+    if(frames == 0 || block == 0){
+        fprintf(stderr, "usage: %s [seconds] [block]\n", argv[0]);
+        return 1;
+    }
+
+    const bench_case_t cases[] = {
+        { "bells",        FM_PRESET_BELLS,   880.0f },
+        { "calm",         FM_PRESET_CALM,    880.0f },
+        { "quantum",      FM_PRESET_QUANTUM, 880.0f },
+        { "pluck",        FM_PRESET_PLUCK,   880.0f },
+        { "bass",         FM_BASS_DEFAULT,    55.0f },
+        { "bass_quantum", FM_BASS_QUANTUM,    55.0f },
+        { "bass_plucky",  FM_BASS_PLUCKY,     55.0f },
+    };
+
+    float32_t *Lr = malloc(frames * sizeof(float32_t));
+    float32_t *Rr = malloc(frames * sizeof(float32_t));
+    float32_t *Lf = malloc(frames * sizeof(float32_t));
+    float32_t *Rf = malloc(frames * sizeof(float32_t));
+    if(!Lr || !Rr || !Lf || !Rf){
+        fprintf(stderr, "bench_fm: out of memory\n");
+        return 1;
+    }
+
+    printf("%u frames per case, block %u\n\n", frames, block);
+    printf("%-13s %10s %10s %8s %10s %9s\n", "preset", "ref Ms/s", "fast Ms/s", "speedup", "max |err|", "coarse Δ");
+    double tot_ref = 0.0, tot_fast = 0.0;
+    for(size_t c = 0; c < sizeof(cases) / sizeof(cases[0]); c++){
+        double t_ref  = render(fm_kernel_ref,  &cases[c], Lr, Rr, frames, block);
+        double t_fast = render(fm_kernel_fast, &cases[c], Lf, Rf, frames, block);
+        tot_ref += t_ref;
+        tot_fast += t_fast;
+
+        float32_t max_err = 0.0f;
+        uint32_t buckets = 0;
+        for(uint32_t i = 0; i < frames; i++){
+            float32_t d = fabsf(Lr[i] - Lf[i]);
+            if(d > max_err) max_err = d;
+            if(coarse_bucket(Lr[i]) != coarse_bucket(Lf[i])) buckets++;
+        }
+        printf("%-13s %10.2f %10.2f %7.2fx %10.2e %9u\n", cases[c].name,
+               frames / t_ref * 1e-6, frames / t_fast * 1e-6, t_ref / t_fast, max_err, buckets);
+    }
+    printf("\ntotal: ref %.1f ms, fast %.1f ms (%.2fx)\n", tot_ref * 1e3, tot_fast * 1e3, tot_ref / tot_fast);
+
+    free(Lr); free(Rr); free(Lf); free(Rf);
+    return 0;
+}
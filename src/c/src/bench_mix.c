@@ -0,0 +1,142 @@
+/* bench_mix – throughput of the post-processing stage of generator_process.
+ *
+ * Feeds the same drum / synth buses (loud enough that the limiter works)
+ * through
+ *   separate – mix loop, limiter_process, scalar RMS: three passes
+ *   fused    – generator_postmix: one tiled pass
+ *   asm      – generator_mix_buffers_asm + limiter_process +
+ *              generator_compute_rms_asm (only when generator.s is linked,
+ *              i.e. VOICE_ASM="... GENERATOR_ASM" on arm64)
+ *   lookahead – generator_postmix with the 1.5 ms look-ahead limiter
+ * and reports Mframes/s, plus the max output difference to "separate"
+ * (for the look-ahead limiter, the output peak instead: its output is
+ * delayed, so it is not sample-comparable).
+ *
+ * Usage: bin/bench_mix [seconds] [block]
+ */
+#define _POSIX_C_SOURCE 199309L
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+#include <time.h>
+#include "generator.h"
+
+#define TAU 6.2831853071795864769f
+
+typedef float (*post_fn)(limiter_t *, limiter_lookahead_t *, float32_t *, float32_t *, const float32_t *, const float32_t *,
+                         const float32_t *, const float32_t *, uint32_t);
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+/* The pre-fusion generator_process tail. */
+static float post_separate(limiter_t *lim, limiter_lookahead_t *la, float32_t *L, float32_t *R,
+                           const float32_t *Ld, const float32_t *Rd,
+                           const float32_t *Ls, const float32_t *Rs, uint32_t n)
+{
+    (void)la;
+    for(uint32_t i = 0; i < n; i++){
+        L[i] = Ld[i] + Ls[i];
+        R[i] = Rd[i] + Rs[i];
+    }
+    limiter_process(lim, L, R, n);
+    float sum = 0.0f;
+    for(uint32_t i = 0; i < n; i++) sum += L[i] * L[i] + R[i] * R[i];
+    return sqrtf(sum / (n * 2));
+}
+
+#ifdef GENERATOR_RMS_ASM_PRESENT
+static float post_asm(limiter_t *lim, limiter_lookahead_t *la, float32_t *L, float32_t *R,
+                      const float32_t *Ld, const float32_t *Rd,
+                      const float32_t *Ls, const float32_t *Rs, uint32_t n)
+{
+    (void)la;
+    generator_mix_buffers_asm(L, R, Ld, Rd, Ls, Rs, n);
+    limiter_process(lim, L, R, n);
+    return generator_compute_rms_asm(L, R, n);
+}
+#endif
+
+static double run(post_fn fn, float32_t lookahead_ms, float32_t *L, float32_t *R,
+                  const float32_t *Ld, const float32_t *Rd, const float32_t *Ls, const float32_t *Rs,
+                  uint32_t frames, uint32_t block, double *rms_sum)
+{
+    limiter_t lim;
+    static limiter_lookahead_t la;
+    limiter_init(&lim, SR, 0.5f, 50.0f, -0.1f);
+    limiter_lookahead_init(&la, SR, lookahead_ms, 50.0f, -0.1f, 5.0f);
+    double rs = 0.0;
+    double t0 = now_sec();
+    for(uint32_t pos = 0; pos < frames; pos += block){
+        uint32_t n = frames - pos < block ? frames - pos : block;
+        rs += fn(&lim, lookahead_ms > 0.0f ? &la : NULL, L + pos, R + pos, Ld + pos, Rd + pos, Ls + pos, Rs + pos, n);
+    }
+    double t = now_sec() - t0;
+    *rms_sum = rs;
+    return t;
+}
+
+int main(int argc, char **argv)
+{
+    float seconds = argc > 1 ? strtof(argv[1], NULL) : 30.0f;
+    uint32_t block = argc > 2 ? (uint32_t)strtoul(argv[2], NULL, 0) : 512u;
+    uint32_t frames = (uint32_t)(seconds * (float)SR);
+    if(frames == 0 || block == 0) return 2;
+
+    float32_t *buf = malloc(sizeof(float32_t) * frames * 8);
+    if(!buf){ fprintf(stderr, "bench_mix: out of memory\n"); return 1; }
+    float32_t *Ld = buf, *Rd = Ld + frames, *Ls = Rd + frames, *Rs = Ls + frames;
+    float32_t *L0 = Rs + frames, *R0 = L0 + frames, *L1 = R0 + frames, *R1 = L1 + frames;
+
+    /* Kick-like decaying thumps every half second on the drum bus, a chord on
+     * the synth bus; together they exceed the limiter threshold on every hit. */
+    for(uint32_t i = 0; i < frames; i++){
+        float32_t t = (float32_t)(i % 22050u) / (float32_t)SR;
+        float32_t kick = 0.9f * expf(-t * 12.0f) * sinf(TAU * 55.0f * t);
+        float32_t s = (float32_t)i / (float32_t)SR;
+        float32_t chord = 0.2f * (sinf(TAU * 220.0f * s) + sinf(TAU * 277.2f * s) + sinf(TAU * 329.6f * s));
+        Ld[i] = kick;         Rd[i] = kick;
+        Ls[i] = chord;        Rs[i] = 0.8f * chord;
+    }
+
+    double rms_ref, rms;
+    double t_sep = run(post_separate, 0.0f, L0, R0, Ld, Rd, Ls, Rs, frames, block, &rms_ref);
+    double t_fused = run(generator_postmix, 0.0f, L1, R1, Ld, Rd, Ls, Rs, frames, block, &rms);
+
+    float32_t max_diff = 0.0f;
+    for(uint32_t i = 0; i < frames; i++)
+        max_diff = fmaxf(max_diff, fmaxf(fabsf(L0[i] - L1[i]), fabsf(R0[i] - R1[i])));
+
+    uint32_t blocks = (frames + block - 1) / block;
+    printf("bench_mix: %.1f s, block %u\n", seconds, block);
+    printf("  separate  %8.1f Mframes/s\n", frames / t_sep * 1e-6);
+    printf("  fused     %8.1f Mframes/s  (%.2fx)  max |diff| %.3g  mean rms diff %.3g\n",
+           frames / t_fused * 1e-6, t_sep / t_fused, max_diff, fabs(rms - rms_ref) / blocks);
+#ifdef GENERATOR_RMS_ASM_PRESENT
+    double t_asm = run(post_asm, 0.0f, L1, R1, Ld, Rd, Ls, Rs, frames, block, &rms);
+    max_diff = 0.0f;
+    for(uint32_t i = 0; i < frames; i++)
+        max_diff = fmaxf(max_diff, fmaxf(fabsf(L0[i] - L1[i]), fabsf(R0[i] - R1[i])));
+    printf("  asm       %8.1f Mframes/s  (%.2fx)  max |diff| %.3g  mean rms diff %.3g\n",
+           frames / t_asm * 1e-6, t_sep / t_asm, max_diff, fabs(rms - rms_ref) / blocks);
+#else
+    printf("  asm       (generator.s not linked – build with VOICE_ASM=\"... GENERATOR_ASM\" on arm64)\n");
+#endif
+
+    double t_la = run(generator_postmix, 1.5f, L1, R1, Ld, Rd, Ls, Rs, frames, block, &rms);
+    float32_t peak_ref = 0.0f, peak_la = 0.0f;
+    for(uint32_t i = 0; i < frames; i++){
+        peak_ref = fmaxf(peak_ref, fmaxf(fabsf(L0[i]), fabsf(R0[i])));
+        peak_la  = fmaxf(peak_la,  fmaxf(fabsf(L1[i]), fabsf(R1[i])));
+    }
+    printf("  lookahead %8.1f Mframes/s  (%.2fx)  peak %.5f (separate %.5f, threshold %.5f)\n",
+           frames / t_la * 1e-6, t_sep / t_la, peak_la, peak_ref, powf(10.0f, -0.1f / 20.0f));
+
+    free(buf);
+    return 0;
+}
@@ -0,0 +1,149 @@
+/* bench_raster – span rasterizers vs the per-pixel originals.
+ *
+ * The reference kernels below are the previous raster_circle (dist2 test
+ * over the whole bounding square) and outline raster_poly (one bounds-
+ * checked Bresenham line per x offset).  Each case draws the same random
+ * shapes, partly off-screen, with both and compares the framebuffers
+ * before timing them.
+ *
+ * Usage: bin/bench_raster [iterations]
+ */
+#define _POSIX_C_SOURCE 199309L
+#include "raster.h"
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define W 800
+#define H 600
+#define SHAPES 64
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static inline void ref_plot(uint32_t *fb, int w, int h, int x, int y, uint32_t col)
+{
+    if((unsigned)x < (unsigned)w && (unsigned)y < (unsigned)h) fb[y*w + x] = col;
+}
+
+static void ref_circle(uint32_t *fb, int w, int h, int cx, int cy, int r, uint32_t col, int thickness)
+{
+    if(thickness <= 0) thickness = 1;
+    int r_in = r - thickness;
+    int r_out2 = r*r, r_in2 = r_in*r_in;
+    for(int y = -r; y <= r; y++)
+        for(int x = -r; x <= r; x++){
+            int dist2 = x*x + y*y;
+            if(dist2 <= r_out2 && dist2 >= r_in2) ref_plot(fb, w, h, x + cx, y + cy, col);
+        }
+}
+
+static void ref_line(uint32_t *fb, int w, int h, int x0, int y0, int x1, int y1, uint32_t col)
+{
+    int dx =  abs(x1 - x0), sx = x0 < x1 ? 1 : -1;
+    int dy = -abs(y1 - y0), sy = y0 < y1 ? 1 : -1;
+    int err = dx + dy, e2;
+    for(;;){
+        ref_plot(fb, w, h, x0, y0, col);
+        if(x0 == x1 && y0 == y1) break;
+        e2 = 2*err;
+        if(e2 >= dy){ err += dy; x0 += sx; }
+        if(e2 <= dx){ err += dx; y0 += sy; }
+    }
+}
+
+static void ref_poly(uint32_t *fb, int w, int h, const int *vx, const int *vy, int n, uint32_t col, int thickness)
+{
+    for(int i = 0; i < n; i++){
+        int j = (i+1) % n;
+        ref_line(fb, w, h, vx[i], vy[i], vx[j], vy[j], col);
+        for(int t = 1; t < thickness; t++){
+            ref_line(fb, w, h, vx[i]+t, vy[i], vx[j]+t, vy[j], col);
+            ref_line(fb, w, h, vx[i]-t, vy[i], vx[j]-t, vy[j], col);
+        }
+    }
+}
+
+typedef struct { int cx, cy, r, n; int vx[10], vy[10]; } shape_t;
+
+/* Random centres in a margin around the screen, stars of n = 3..10 points */
+static void make_shapes(shape_t *s, int r)
+{
+    for(int i = 0; i < SHAPES; i++){
+        s[i].cx = rand() % (W + 2*r) - r;
+        s[i].cy = rand() % (H + 2*r) - r;
+        s[i].r = r;
+        s[i].n = 3 + rand() % 8;
+        float rot = (float)(rand() % 628) / 100.0f;
+        for(int k = 0; k < s[i].n; k++){
+            float a = rot + 6.2831853f * k / s[i].n;
+            float rr = (k & 1) ? r * 0.5f : (float)r;
+            s[i].vx[k] = s[i].cx + (int)(cosf(a) * rr);
+            s[i].vy[k] = s[i].cy + (int)(sinf(a) * rr);
+        }
+    }
+}
+
+static void draw(uint32_t *fb, const shape_t *s, int poly, int thick, int ref)
+{
+    for(int i = 0; i < SHAPES; i++){
+        uint32_t col = 0x10203000u + (uint32_t)i;
+        if(poly){
+            if(ref) ref_poly(fb, W, H, s[i].vx, s[i].vy, s[i].n, col, thick);
+            else raster_poly(fb, W, H, s[i].vx, s[i].vy, s[i].n, col, false, thick);
+        } else {
+            if(ref) ref_circle(fb, W, H, s[i].cx, s[i].cy, s[i].r, col, thick);
+            else raster_circle(fb, W, H, s[i].cx, s[i].cy, s[i].r, col, thick);
+        }
+    }
+}
+
+static double time_draw(uint32_t *fb, const shape_t *s, int poly, int thick, int ref, int iters)
+{
+    double t0 = now_sec();
+    for(int it = 0; it < iters; it++) draw(fb, s, poly, thick, ref);
+    return (now_sec() - t0) / (iters * SHAPES) * 1e6;
+}
+
+int main(int argc, char **argv)
+{
+    int iters = argc > 1 ? atoi(argv[1]) : 20;
+    if(iters <= 0) iters = 1;
+    uint32_t *a = malloc(sizeof(uint32_t) * W * H), *b = malloc(sizeof(uint32_t) * W * H);
+    if(!a || !b){ fprintf(stderr, "bench_raster: out of memory\n"); return 1; }
+    static const int radii[] = { 8, 32, 120, 400 };
+    static const int thick[] = { 1, 4, 16 };
+    shape_t shapes[SHAPES];
+    int mismatches = 0;
+
+    srand(7);
+    printf("bench_raster: %dx%d, %d shapes per pass, us per shape\n", W, H, SHAPES);
+    printf("  %-7s %6s %6s   %9s %9s\n", "", "radius", "thick", "per-pixel", "spans");
+    for(int poly = 0; poly < 2; poly++){
+        for(size_t ri = 0; ri < sizeof(radii) / sizeof(radii[0]); ri++){
+            make_shapes(shapes, radii[ri]);
+            for(size_t ti = 0; ti < sizeof(thick) / sizeof(thick[0]); ti++){
+                int t = thick[ti];
+                memset(a, 0, sizeof(uint32_t) * W * H);
+                memset(b, 0, sizeof(uint32_t) * W * H);
+                draw(a, shapes, poly, t, 1);
+                draw(b, shapes, poly, t, 0);
+                int same = memcmp(a, b, sizeof(uint32_t) * W * H) == 0;
+                mismatches += !same;
+                double tr = time_draw(a, shapes, poly, t, 1, iters);
+                double ts = time_draw(b, shapes, poly, t, 0, iters);
+                printf("  %-7s %6d %6d   %9.2f %9.2f  (%.1fx)%s\n", poly ? "poly" : "circle",
+                       radii[ri], t, tr, ts, tr / ts, same ? "" : "  MISMATCH");
+            }
+        }
+    }
+    printf("  %d mismatched cases\n", mismatches);
+    free(a); free(b);
+    return mismatches ? 1 : 0;
+}
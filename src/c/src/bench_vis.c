@@ -0,0 +1,98 @@
+/* bench_vis – visualiser rendering paths, headless.
+ *
+ * Renders the same scene from the same rand() seed with a synthetic hit
+ * pattern (saw hit every 6th frame, bass every 45th, pulsing RMS): whole
+ * frames and dirty tiles only, each on one thread and on a band-parallel
+ * pool.  Every frame's pixels are hashed on the first (full, one thread)
+ * pass and checked on the others, so any difference is a mismatch.
+ *
+ * Usage: bin/bench_vis [frames] [width height [seed [threads]]]
+ *        threads defaults to the online CPU count (at least 2)
+ */
+#define _POSIX_C_SOURCE 199309L
+#include "vis_scene.h"
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+#include <unistd.h>
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static uint64_t fnv1a(const uint32_t *px, size_t n)
+{
+    uint64_t h = 0xcbf29ce484222325ULL;
+    const uint8_t *p = (const uint8_t *)px;
+    for(size_t i = 0; i < n * 4; i++){ h ^= p[i]; h *= 0x100000001b3ULL; }
+    return h;
+}
+
+/* Render `frames` frames; fills hashes (first pass) or checks them. */
+static uint64_t g_seed = 0xCAFEBABEULL;
+
+static double run(bool damage, int threads, int frames, int w, int h, uint64_t *hashes, bool check,
+                  int *mismatches, double *coverage)
+{
+    uint32_t *fb = malloc((size_t)w * h * sizeof(uint32_t));
+    vis_scene_t s;
+    if(!fb || vis_scene_init(&s, g_seed, w, h, damage) != 0 || vis_scene_set_threads(&s, threads) != 0){
+        fprintf(stderr, "bench_vis: out of memory\n");
+        exit(1);
+    }
+    srand(1);
+    double t = 0.0, cov = 0.0;
+    for(int f = 0; f < frames; f++){
+        float level = 0.5f + 0.5f * sinf(f * 0.1f);
+        double t0 = now_sec();
+        vis_scene_render(&s, fb, level, f % 6 == 0, f % 45 == 0);
+        t += now_sec() - t0;
+        if(damage){ cov += raster_damage_coverage(&s.out); vis_scene_presented(&s); }
+        uint64_t hv = fnv1a(fb, (size_t)w * h) ^ (uint64_t)(s.jitter_x * 31 + s.jitter_y);
+        if(!check) hashes[f] = hv;
+        else if(hashes[f] != hv){
+            if(*mismatches < 5) fprintf(stderr, "%s, %d threads: frame %d differs\n",
+                                        damage ? "damage" : "full", threads, f);
+            (*mismatches)++;
+        }
+    }
+    vis_scene_free(&s);
+    free(fb);
+    if(coverage) *coverage = cov / frames;
+    return t / frames * 1e3;
+}
+
+int main(int argc, char **argv)
+{
+    int frames = argc > 1 ? atoi(argv[1]) : 600;
+    int w = argc > 3 ? atoi(argv[2]) : 800;
+    int h = argc > 3 ? atoi(argv[3]) : 600;
+    if(argc > 4) g_seed = strtoull(argv[4], NULL, 0);
+    long ncpu = sysconf(_SC_NPROCESSORS_ONLN);
+    int threads = argc > 5 ? atoi(argv[5]) : (ncpu > 2 ? (int)ncpu : 2);
+    if(frames <= 0 || w <= 0 || h <= 0 || threads <= 0){
+        fprintf(stderr, "usage: %s [frames] [width height [seed [threads]]]\n", argv[0]);
+        return 2;
+    }
+    uint64_t *hashes = malloc(sizeof(uint64_t) * frames);
+    if(!hashes){ fprintf(stderr, "bench_vis: out of memory\n"); return 1; }
+
+    int mismatches = 0;
+    double coverage = 0.0;
+    double full  = run(false, 1, frames, w, h, hashes, false, &mismatches, NULL);
+    double dmg   = run(true, 1, frames, w, h, hashes, true, &mismatches, &coverage);
+    double fullp = run(false, threads, frames, w, h, hashes, true, &mismatches, NULL);
+    double dmgp  = run(true, threads, frames, w, h, hashes, true, &mismatches, NULL);
+
+    printf("bench_vis: %d frames at %dx%d, seed 0x%llx\n", frames, w, h, (unsigned long long)g_seed);
+    printf("  %-12s %7.3f ms   %7.3f ms with %d threads (%.2fx)\n", "full frame", full, fullp, threads, full / fullp);
+    printf("  %-12s %7.3f ms   %7.3f ms with %d threads (%.2fx)\n", "damage", dmg, dmgp, threads, full / dmgp);
+    printf("  %.1f%% of pixels dirty on average\n", coverage * 100.0);
+    printf("  %d mismatched frames\n", mismatches);
+    free(hashes);
+    return mismatches ? 1 : 0;
+}
@@ -7,6 +7,12 @@ void crt_fx_init(crt_fx_t *fx, uint64_t seed, int w, int h)
 {
     /* allocate persistence buffer */
     fx->prev_frame = (uint32_t*)calloc(w * h, sizeof(uint32_t));
+    fx->row_tmp = (uint32_t*)malloc(w * sizeof(uint32_t));
+    fx->tw = (w + RASTER_TILE - 1) >> RASTER_TILE_SHIFT;
+    fx->th = (h + RASTER_TILE - 1) >> RASTER_TILE_SHIFT;
+    fx->tile_stamp = (uint32_t*)calloc(fx->tw * fx->th, sizeof(uint32_t));
+    fx->fx_frame = 0;
+    fx->noise = NULL;
     
     /* seed-based randomization of effect levels */
     fx->rng = rng_seed(seed ^ 0xDE5A7ULL);
@@ -18,111 +24,201 @@ void crt_fx_init(crt_fx_t *fx, uint64_t seed, int w, int h)
     fx->jitter_amount = rng_next_float(&fx->rng) * 3.0f;
     fx->frame_drop_chance = rng_next_float(&fx->rng) * 0.1f;
     fx->color_bleed = rng_next_float(&fx->rng) * 0.3f;
+    fx->noise = (crt_noise_t*)malloc((fx->noise_pixels + 1) * sizeof(crt_noise_t));
+
+    /* 8-bit weights of the incoming pixel for the fixed-point blends */
+    fx->persist_w = (uint32_t)((1.0f - fx->persistence) * 256.0f + 0.5f);
+    fx->bleed_w = (uint32_t)(fx->color_bleed * 256.0f + 0.5f);
+    float dark = 1.0f - fx->scanline_alpha / 255.0f;
+    for(int v = 0; v < 256; v++) fx->scan_lut[v] = (uint8_t)(v * dark);
+
+    /* frames for a full-white ghost to decay to black, same arithmetic as
+     * the persistence blend over a background pixel */
+    fx->ghost_frames = 0;
+    if(fx->persistence > 0.01f){
+        for(uint32_t v = 255; v; fx->ghost_frames++) v = (v * (256 - fx->persist_w)) >> 8;
+    }
 }
 
 void crt_fx_cleanup(crt_fx_t *fx)
 {
     free(fx->prev_frame);
+    free(fx->row_tmp);
+    free(fx->tile_stamp);
+    free(fx->noise);
 }
 
-/* blend two pixels with alpha */
-static inline uint32_t blend_alpha(uint32_t dst, uint32_t src, float alpha)
+/* Packed RGBA helpers.  R and B sit in the 0x00FF00FF lanes of p >> 8, G
+ * (and A) in those of p, so two multiplies blend all three channels; each
+ * lane holds at most 255 * 256 and cannot carry into the next. */
+#define LANES 0x00FF00FFu
+
+/* dst + (src - dst) * a / 256 per channel, a = 0..256; alpha forced to 255 */
+static inline uint32_t lerp_px(uint32_t dst, uint32_t src, uint32_t a)
 {
-    uint8_t dr = (dst >> 24) & 0xFF;
-    uint8_t dg = (dst >> 16) & 0xFF;
-    uint8_t db = (dst >> 8) & 0xFF;
-    
-    uint8_t sr = (src >> 24) & 0xFF;
-    uint8_t sg = (src >> 16) & 0xFF;
-    uint8_t sb = (src >> 8) & 0xFF;
-    
-    uint8_t r = (uint8_t)(dr * (1.0f - alpha) + sr * alpha);
-    uint8_t g = (uint8_t)(dg * (1.0f - alpha) + sg * alpha);
-    uint8_t b = (uint8_t)(db * (1.0f - alpha) + sb * alpha);
-    
-    return (r << 24) | (g << 16) | (b << 8) | 0xFF;
+    uint32_t ia = 256 - a;
+    uint32_t rb = (((dst >> 8) & LANES) * ia + ((src >> 8) & LANES) * a) >> 8;
+    uint32_t g  = ((dst & LANES) * ia + (src & LANES) * a) >> 8;
+    return ((rb & LANES) << 8) | (g & 0x00FF0000u) | 0xFF;
 }
 
-void crt_fx_apply(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame)
+static inline uint32_t scan_px(const uint8_t *lut, uint32_t p)
 {
-    /* 1. Persistence (ghost trails) - blend with previous frame */
-    if(fx->persistence > 0.01f){
-        for(int i = 0; i < w*h; i++){
-            fb[i] = blend_alpha(fx->prev_frame[i], fb[i], 1.0f - fx->persistence);
+    return ((uint32_t)lut[p >> 24] << 24) | ((uint32_t)lut[(p >> 16) & 0xFF] << 16)
+         | ((uint32_t)lut[(p >> 8) & 0xFF] << 8) | 0xFF;
+}
+
+/* red from x - shift, blue from x + shift (t indexed from lo) */
+static inline uint32_t chroma_px(const uint32_t *t, int lo, int w, int x, int shift)
+{
+    uint32_t p = t[x - lo];
+    int src_x = x - shift;
+    if(src_x >= 0 && src_x < w) p = (p & 0x00FFFFFF) | (t[src_x - lo] & 0xFF000000);
+    src_x = x + shift;
+    if(src_x >= 0 && src_x < w) p = (p & 0xFFFF00FF) | (t[src_x - lo] & 0x0000FF00);
+    return p;
+}
+
+/* Effects 1-4 fused, one rectangle, one row at a time:
+ *   a) persistence blend, save to prev_frame, scanline darkening -> row_tmp
+ *   b) chroma shift read back from row_tmp, then colour bleed
+ * Every effect is per pixel or reads only along the row, so a rectangle
+ * whose left/right neighbours are background gives the same pixels as the
+ * whole frame does. */
+static void apply_rect(crt_fx_t *fx, uint32_t *fb, int w, int frame, const raster_rect_t *r,
+                       uint32_t *restrict tmp)
+{
+    const int x0 = r->x, x1 = r->x + r->w;
+    const bool persist = fx->persistence > 0.01f;
+    const bool bleed = fx->color_bleed > 0.01f;
+    int shift = 0;
+    if(fx->chroma_shift > 0) shift = (frame % 30 < 15) ? fx->chroma_shift : -fx->chroma_shift;
+    const int reach = shift < 0 ? -shift : shift;
+    const int lo = x0 - reach < 0 ? 0 : x0 - reach;
+    const int hi = x1 + reach > w ? w : x1 + reach;
+    const uint32_t pw = fx->persist_w, bw = fx->bleed_w;
+    const uint8_t *lut = fx->scan_lut;
+
+    for(int y = r->y; y < r->y + r->h; y++){
+        uint32_t *restrict row = fb + y * w;
+        uint32_t *restrict prev = fx->prev_frame + y * w;
+        const bool scan = fx->scanline_alpha > 0 && !(y & 1);
+
+        /* a) 1. persistence, save, 2. scanlines */
+        for(int x = x0; x < x1; x++){
+            uint32_t p = row[x];
+            if(persist) p = lerp_px(prev[x], p, pw);
+            prev[x] = p;
+            tmp[x - lo] = scan ? scan_px(lut, p) : p;
         }
-    }
-    
-    /* Save current frame for next time */
-    memcpy(fx->prev_frame, fb, w * h * sizeof(uint32_t));
-    
-    /* 2. Scanlines - darken every other row */
-    if(fx->scanline_alpha > 0){
-        float alpha = fx->scanline_alpha / 255.0f;
-        for(int y = 0; y < h; y += 2){
-            for(int x = 0; x < w; x++){
-                int idx = y * w + x;
-                uint32_t p = fb[idx];
-                uint8_t r = ((p >> 24) & 0xFF) * (1.0f - alpha);
-                uint8_t g = ((p >> 16) & 0xFF) * (1.0f - alpha);
-                uint8_t b = ((p >> 8) & 0xFF) * (1.0f - alpha);
-                fb[idx] = (r << 24) | (g << 16) | (b << 8) | 0xFF;
+        for(int x = lo; x < x0; x++) tmp[x - lo] = row[x];
+        for(int x = x1; x < hi; x++) tmp[x - lo] = row[x];
+
+        /* b) 3. chromatic aberration, 4. color bleed (in place, left
+         * neighbour already bled, right one not yet) - the row is in cache */
+        if(shift) for(int x = x0; x < x1; x++) row[x] = chroma_px(tmp, lo, w, x, shift);
+        else memcpy(row + x0, tmp + (x0 - lo), (size_t)(x1 - x0) * sizeof(uint32_t));
+        if(bleed){
+            const int bx0 = x0 < 1 ? 1 : x0;
+            const int bx1 = x1 > w - 1 ? w - 1 : x1;
+            /* lerp_px(row[x], avg_px(left, right), bw) with the bled left
+             * pixel kept in lane form, off the packed round trip */
+            const uint32_t ibw = 256 - bw;
+            uint32_t lrb = (row[bx0 - 1] >> 8) & LANES, lg = row[bx0 - 1] & LANES;
+            for(int x = bx0; x < bx1; x++){
+                uint32_t c = row[x], n = row[x + 1];
+                uint32_t mrb = (lrb + ((n >> 8) & LANES)) >> 1 & LANES;
+                uint32_t mg  = (lg + (n & LANES)) >> 1 & LANES;
+                lrb = (((c >> 8) & LANES) * ibw + mrb * bw) >> 8 & LANES;
+                lg  = ((c & LANES) * ibw + mg * bw) >> 8 & LANES;
+                row[x] = (lrb << 8) | (lg & 0x00FF0000u) | 0xFF;
             }
         }
     }
-    
-    /* 3. Chromatic aberration - shift red/blue channels */
-    if(fx->chroma_shift > 0){
-        /* temporary buffer for shifted channels */
-        uint32_t *temp = (uint32_t*)malloc(w * h * sizeof(uint32_t));
-        memcpy(temp, fb, w * h * sizeof(uint32_t));
-        
-        int shift = (frame % 30 < 15) ? fx->chroma_shift : -fx->chroma_shift;
-        
-        /* shift red channel right */
-        for(int y = 0; y < h; y++){
-            for(int x = 0; x < w; x++){
-                int src_x = x - shift;
-                if(src_x >= 0 && src_x < w){
-                    uint8_t r = (temp[y * w + src_x] >> 24) & 0xFF;
-                    fb[y * w + x] = (fb[y * w + x] & 0x00FFFFFF) | (r << 24);
-                }
-            }
-        }
-        
-        /* shift blue channel left */
-        for(int y = 0; y < h; y++){
-            for(int x = 0; x < w; x++){
-                int src_x = x + shift;
-                if(src_x >= 0 && src_x < w){
-                    uint8_t b = (temp[y * w + src_x] >> 8) & 0xFF;
-                    fb[y * w + x] = (fb[y * w + x] & 0xFFFF00FF) | (b << 8);
-                }
+}
+
+void crt_fx_begin(crt_fx_t *fx, int w, int h, bool track_damage)
+{
+    /* 5. Random pixel noise: drawn here, in one sequence, and stamped by
+     * whichever band owns the row */
+    for(int i = 0; i < fx->noise_pixels; i++){
+        int x = rng_next_u32(&fx->rng) % w;
+        int y = rng_next_u32(&fx->rng) % h;
+        uint8_t val = rng_next_u32(&fx->rng) & 0xFF;
+        fx->noise[i] = (crt_noise_t){ x, y, (val << 24) | (val << 16) | (val << 8) | 0xFF };
+    }
+
+    fx->fx_frame++;
+    /* full frames: every tile of prev_frame may now hold a ghost */
+    if(!track_damage)
+        for(int i = 0; i < fx->tw * fx->th; i++) fx->tile_stamp[i] = fx->fx_frame;
+}
+
+void crt_fx_apply_rows(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame, int y0, int y1,
+                       const raster_damage_t *drawn, raster_damage_t *out, uint32_t *row_tmp)
+{
+    if(!row_tmp) row_tmp = fx->row_tmp;
+    if(y0 < 0) y0 = 0;
+    if(y1 > h) y1 = h;
+    if(y0 >= y1) return;
+
+    if(!drawn){
+        raster_rect_t band = { 0, y0, w, y1 - y0 };
+        apply_rect(fx, fb, w, frame, &band, row_tmp);
+    } else {
+        /* Region, per tile row: what was drawn, plus tiles whose ghost has
+         * not faded yet, widened by a tile for chroma shift and bleed to
+         * spill into. */
+        int ty0 = y0 >> RASTER_TILE_SHIFT, ty1 = ((y1 - 1) >> RASTER_TILE_SHIFT) + 1;
+        for(int ty = ty0; ty < ty1; ty++){
+            uint8_t *reg = out->tiles + ty * out->tw;
+            const uint8_t *drw = drawn->tiles + ty * out->tw;
+            uint32_t *stamp = fx->tile_stamp + ty * fx->tw;
+            for(int tx = 0; tx < out->tw; tx++){
+                reg[tx] = drw[tx];
+                if(drw[tx]) stamp[tx] = fx->fx_frame;
+                else if(stamp[tx] && fx->fx_frame - stamp[tx] <= fx->ghost_frames) reg[tx] = 1;
             }
         }
-        
-        free(temp);
-    }
-    
-    /* 4. Color bleed (horizontal blur) */
-    if(fx->color_bleed > 0.01f){
-        for(int y = 0; y < h; y++){
-            for(int x = 1; x < w-1; x++){
-                int idx = y * w + x;
-                uint32_t left = fb[idx - 1];
-                uint32_t right = fb[idx + 1];
-                fb[idx] = blend_alpha(fb[idx], blend_alpha(left, right, 0.5f), fx->color_bleed);
+        raster_damage_expand_rows(out, 1, ty0, ty1);
+
+        for(int ty = ty0; ty < ty1; ty++){
+            const uint8_t *reg = out->tiles + ty * out->tw;
+            int ry0 = ty << RASTER_TILE_SHIFT, ry1 = ry0 + RASTER_TILE;
+            raster_rect_t run = { 0, ry0 > y0 ? ry0 : y0, 0, 0 };
+            run.h = (ry1 < y1 ? ry1 : y1) - run.y;
+            for(int tx = 0; tx < out->tw; ){
+                if(!reg[tx]){ tx++; continue; }
+                int a = tx;
+                while(tx < out->tw && reg[tx]) tx++;
+                run.x = a << RASTER_TILE_SHIFT;
+                run.w = ((tx << RASTER_TILE_SHIFT) < w ? (tx << RASTER_TILE_SHIFT) : w) - run.x;
+                apply_rect(fx, fb, w, frame, &run, row_tmp);
             }
         }
     }
-    
-    /* 5. Random pixel noise */
+
     for(int i = 0; i < fx->noise_pixels; i++){
-        int x = rng_next_u32(&fx->rng) % w;
-        int y = rng_next_u32(&fx->rng) % h;
-        uint8_t val = rng_next_u32(&fx->rng) & 0xFF;
-        fb[y * w + x] = (val << 24) | (val << 16) | (val << 8) | 0xFF;
+        const crt_noise_t *n = &fx->noise[i];
+        if(n->y < y0 || n->y >= y1) continue;
+        fb[n->y * w + n->x] = n->px;
+        if(drawn) raster_damage_rect(out, n->x, n->y, n->x, n->y);
     }
-    
+}
+
+void crt_fx_apply(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame)
+{
+    crt_fx_begin(fx, w, h, false);
+    crt_fx_apply_rows(fx, fb, w, h, frame, 0, h, NULL, NULL, NULL);
+
     /* 6. Jitter (whole screen offset) - handled in main loop */
     /* 7. Frame drops - handled in main loop */
-} 
\ No newline at end of file
+}
+
+void crt_fx_apply_damage(crt_fx_t *fx, uint32_t *fb, int w, int h, int frame,
+                         const raster_damage_t *drawn, raster_damage_t *out)
+{
+    crt_fx_begin(fx, w, h, true);
+    crt_fx_apply_rows(fx, fb, w, h, frame, 0, h, drawn, out, NULL);
+    raster_damage_build(out);
+}
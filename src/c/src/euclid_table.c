@@ -0,0 +1,11 @@
+#include "euclid.h"
+#include "euclid_table.h"
+
+/* Kept apart from euclid.c, which is dropped when euclid.s is linked. */
+
+uint64_t euclid_mask(int pulses, int steps, int rot)
+{
+    if(steps < 1 || steps > EUCLID_MAX_STEPS || pulses < 0 || pulses > steps) return 0;
+    uint64_t m = euclid_table[(uint32_t)((steps - 1) * (steps + 2) / 2 + pulses)];
+    return euclid_rotate(m, steps, rot < 0 ? steps - (-rot % steps) : rot);
+}
@@ -1,3 +1,16 @@
 #include "event_queue.h"
-/* All functions are inline in the header. This translation unit exists
-   to satisfy the build system linking rules. */ 
\ No newline at end of file
+
+void eq_sort(event_queue_t *q)
+{
+    /* Insertion sort: stable, in place, and close to O(n) for the
+       nearly-sorted queues the pattern builder produces. */
+    for(uint32_t i = 1; i < q->count; i++){
+        event_t e = q->events[i];
+        uint32_t j = i;
+        while(j > 0 && q->events[j - 1].time > e.time){
+            q->events[j] = q->events[j - 1];
+            j--;
+        }
+        q->events[j] = e;
+    }
+}
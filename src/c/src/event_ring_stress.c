@@ -0,0 +1,119 @@
+/* event_ring_stress – gen_event ring with readers on other threads.
+ *
+ * One writer thread publishes --events records as fast as it can while
+ * --readers threads drain the ring through small buffers, pausing now and
+ * then so the writer laps them.  Every record's fields are derived from its
+ * time, so a torn copy (half old event, half new) shows up as a mismatch.
+ * Each reader checks that it received intact records in increasing time
+ * order and that received + lost accounts for every event.  Exits
+ * non-zero on any violation.
+ *
+ * Usage: bin/event_ring_stress [--events N] [--readers R]
+ */
+#define _POSIX_C_SOURCE 200809L
+#include "gen_event.h"
+#include <pthread.h>
+#include <stdatomic.h>
+#include <stdbool.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define MAX_READERS 16u
+
+static gen_event_ring_t g_ring;
+static atomic_bool g_done;
+static uint64_t g_events = 2000000;
+
+typedef struct {
+    uint32_t id;
+    uint64_t got, lost, torn, disorder;
+} reader_t;
+
+static gen_event_t make_event(uint64_t i)
+{
+    uint32_t h = (uint32_t)i * 2654435761u;
+    return (gen_event_t){ i, (uint8_t)(i % 6), (uint8_t)(i % 7), (uint8_t)(h >> 24), (uint8_t)(h >> 16),
+                          (float)(uint32_t)(i & 0xFFFFFu), (float)(h & 0xFFFFFu) };
+}
+
+static int intact(const gen_event_t *e)
+{
+    gen_event_t want = make_event(e->time);
+    return e->type == want.type && e->voice == want.voice && e->aux == want.aux &&
+           e->preset == want.preset && e->freq == want.freq && e->amp == want.amp;
+}
+
+static void *writer(void *arg)
+{
+    (void)arg;
+    for(uint64_t i = 0; i < g_events; i++){
+        gen_event_t e = make_event(i);
+        gen_event_publish(&g_ring, &e);
+    }
+    atomic_store_explicit(&g_done, true, memory_order_release);
+    return NULL;
+}
+
+static void *reader(void *arg)
+{
+    reader_t *r = arg;
+    gen_event_reader_t rd = { 0, 0 };   /* from the first event on */
+    gen_event_t ev[7];
+    uint64_t last = 0, reads = 0;
+    int first = 1;
+    for(;;){
+        int done = atomic_load_explicit(&g_done, memory_order_acquire);
+        uint32_t got = gen_event_read(&g_ring, &rd, ev, 7);
+        for(uint32_t i = 0; i < got; i++){
+            if(!intact(&ev[i])) r->torn++;
+            if(!first && ev[i].time <= last) r->disorder++;
+            last = ev[i].time;
+            first = 0;
+        }
+        r->got += got;
+        if(done && got == 0) break;
+        /* Fall behind now and then so the writer laps this reader */
+        if(++reads % (1000u + 250u * r->id) == 0)
+            for(volatile uint32_t spin = 0; spin < 200000u; spin++) {}
+    }
+    r->lost = rd.lost;
+    return NULL;
+}
+
+int main(int argc, char **argv)
+{
+    uint32_t readers = 3;
+    for(int i = 1; i + 1 < argc; i += 2){
+        if(strcmp(argv[i], "--events") == 0) g_events = strtoull(argv[i + 1], NULL, 0);
+        else if(strcmp(argv[i], "--readers") == 0) readers = (uint32_t)strtoul(argv[i + 1], NULL, 0);
+        else { fprintf(stderr, "usage: %s [--events N] [--readers R]\n", argv[0]); return 2; }
+    }
+    if(readers == 0 || readers > MAX_READERS){
+        fprintf(stderr, "event_ring_stress: 1..%u readers\n", MAX_READERS);
+        return 2;
+    }
+
+    gen_event_ring_init(&g_ring);
+    reader_t r[MAX_READERS];
+    pthread_t tid[MAX_READERS], wtid;
+    for(uint32_t i = 0; i < readers; i++){
+        r[i] = (reader_t){ .id = i };
+        if(pthread_create(&tid[i], NULL, reader, &r[i]) != 0){ perror("pthread_create"); return 1; }
+    }
+    if(pthread_create(&wtid, NULL, writer, NULL) != 0){ perror("pthread_create"); return 1; }
+    pthread_join(wtid, NULL);
+
+    int fail = 0;
+    for(uint32_t i = 0; i < readers; i++){
+        pthread_join(tid[i], NULL);
+        int ok = r[i].torn == 0 && r[i].disorder == 0 && r[i].got + r[i].lost == g_events;
+        printf("reader %u: %llu received, %llu lost, %llu torn, %llu out of order%s\n", i,
+               (unsigned long long)r[i].got, (unsigned long long)r[i].lost,
+               (unsigned long long)r[i].torn, (unsigned long long)r[i].disorder, ok ? "" : "  FAIL");
+        fail |= !ok;
+    }
+    printf("event_ring_stress: %llu events, %u readers: %s\n", (unsigned long long)g_events, readers,
+           fail ? "FAIL" : "ok");
+    return fail;
+}
@@ -0,0 +1,60 @@
+#include "fm_pool.h"
+#include <string.h>
+#include "fm_voice.h"
+#include "trace.h"
+
+#define TAU 6.2831853071795864769f
+
+void fm_pool_init(fm_pool_t *p, float32_t sr)
+{
+    memset(p, 0, sizeof(*p));
+    p->sr = sr;
+}
+
+uint32_t fm_pool_trigger(fm_pool_t *p, float32_t carrier_freq, float32_t duration_sec,
+                         float32_t ratio, float32_t index, float32_t amp, float32_t decay,
+                         uint8_t preset)
+{
+    /* Lowest free slot, otherwise steal the oldest note */
+    uint32_t slot = 0;
+    uint32_t free_mask = ~p->active & ((1u << FM_POOL_MAX) - 1u);
+    if(free_mask){
+        slot = (uint32_t)__builtin_ctz(free_mask);
+    } else {
+        for(uint32_t s = 1; s < FM_POOL_MAX; s++){
+            if(p->serial - p->born[s] > p->serial - p->born[slot]) slot = s;
+        }
+    }
+
+    /* Phases carry over, exactly like fm_voice_trigger re-using its voice */
+    p->c_inc[slot]  = TAU * carrier_freq / p->sr;
+    p->m_inc[slot]  = TAU * carrier_freq * ratio / p->sr;
+    p->index0[slot] = index;
+    p->amp[slot]    = amp;
+    p->decay[slot]  = decay;
+    p->len[slot]    = (uint32_t)(duration_sec * p->sr);
+    p->pos[slot]    = 0;
+    p->born[slot]   = p->serial++;
+    p->preset[slot] = preset;
+    if(p->len[slot] > 0) p->active |= 1u << slot;
+    else                 p->active &= ~(1u << slot);
+    TRACE(TRACE_FM_TRIGGER, TRACE_VOICE_FM, p->len[slot], carrier_freq, ratio, index, amp);
+    return slot;
+}
+
+void fm_pool_process(fm_pool_t *p, float32_t *L, float32_t *R, uint32_t n)
+{
+    uint32_t active = p->active;
+    while(active){
+        uint32_t s = (uint32_t)__builtin_ctz(active);
+        active &= active - 1u;
+
+        /* Clamp to the note's remaining length so the kernel never tests it */
+        uint32_t remaining = p->len[s] - p->pos[s];
+        uint32_t m = (n < remaining) ? n : remaining;
+        FM_KERNEL(L, R, m, p->pos[s], p->sr, p->c_inc[s], p->m_inc[s], p->index0[s],
+                  p->amp[s], p->decay[s], &p->carrier_phase[s], &p->mod_phase[s]);
+        p->pos[s] += m;
+        if(p->pos[s] >= p->len[s]) p->active &= ~(1u << s);
+    }
+}
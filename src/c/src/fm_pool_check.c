@@ -0,0 +1,124 @@
+/* fm_pool_check – fm_pool_t against independent fm_voice_t renders.
+ *
+ * overlap – a second note starts while the first is still sounding; the
+ *           pool must play both, sample for sample the sum of two separate
+ *           monophonic voices.
+ * steal   – FM_POOL_MAX + 2 long notes; once every slot is busy each new
+ *           note must take the slot of the oldest one.  A stolen slot keeps
+ *           its phases, exactly like re-triggering one fm_voice_t, so the
+ *           reference is one voice per slot, re-triggered on every steal.
+ *
+ * Rendering goes through generator-sized blocks (with an odd one now and
+ * then) so notes end mid-block.  Both sides use the same kernel and add in
+ * slot order, so the output must match bit for bit.  Exits non-zero on any
+ * mismatch.
+ *
+ * Usage: bin/fm_pool_check
+ */
+#include <stdio.h>
+#include <string.h>
+#include "fm_pool.h"
+#include "fm_voice.h"
+
+#define SR     44100.0f
+#define FRAMES 30000u
+#define NOTES  (FM_POOL_MAX + 2u)
+
+typedef struct {
+    uint32_t  at;       /* trigger frame */
+    float32_t freq, dur, ratio, index, amp, decay;
+} note_t;
+
+static float32_t pool_L[FRAMES], pool_R[FRAMES], ref_L[FRAMES], ref_R[FRAMES];
+
+/* Next block end: 256-frame blocks, every fifth one 77 frames, and never
+ * past the next trigger so notes start on a block boundary */
+static uint32_t block_end(uint32_t pos, uint32_t blk, const note_t *notes, uint32_t n_notes)
+{
+    uint32_t end = pos + ((blk % 5u == 4u) ? 77u : 256u);
+    for(uint32_t k = 0; k < n_notes; k++)
+        if(notes[k].at > pos && notes[k].at < end) end = notes[k].at;
+    return end < FRAMES ? end : FRAMES;
+}
+
+/* Render `notes` through one pool and through one fm_voice_t per slot
+ * (voice k % FM_POOL_MAX, matching the slot the pool should pick).
+ * Returns the number of failed checks. */
+static int run(const char *name, const note_t *notes, uint32_t n_notes, uint32_t want_overlap)
+{
+    fm_pool_t pool;
+    fm_voice_t voice[FM_POOL_MAX];
+    fm_pool_init(&pool, SR);
+    for(uint32_t s = 0; s < FM_POOL_MAX; s++) fm_voice_init(&voice[s], SR);
+    memset(pool_L, 0, sizeof(pool_L)); memset(pool_R, 0, sizeof(pool_R));
+    memset(ref_L, 0, sizeof(ref_L));   memset(ref_R, 0, sizeof(ref_R));
+
+    int fail = 0;
+    uint32_t max_active = 0;
+    for(uint32_t pos = 0, blk = 0; pos < FRAMES; blk++){
+        for(uint32_t k = 0; k < n_notes; k++){
+            const note_t *nt = &notes[k];
+            if(nt->at != pos) continue;
+            uint32_t slot = fm_pool_trigger(&pool, nt->freq, nt->dur, nt->ratio, nt->index, nt->amp, nt->decay, 0);
+            if(slot != k % FM_POOL_MAX){
+                printf("%s: note %u took slot %u, expected %u\n", name, k, slot, k % FM_POOL_MAX);
+                fail++;
+            }
+            fm_voice_trigger(&voice[k % FM_POOL_MAX], nt->freq, nt->dur, nt->ratio, nt->index, nt->amp, nt->decay);
+        }
+        uint32_t act = fm_pool_active_count(&pool);
+        if(act > max_active) max_active = act;
+
+        uint32_t end = block_end(pos, blk, notes, n_notes);
+        fm_pool_process(&pool, pool_L + pos, pool_R + pos, end - pos);
+        for(uint32_t s = 0; s < FM_POOL_MAX; s++)
+            fm_voice_process(&voice[s], ref_L + pos, ref_R + pos, end - pos);
+        pos = end;
+    }
+
+    uint32_t diff = 0, first = 0;
+    for(uint32_t i = 0; i < FRAMES; i++){
+        if(pool_L[i] != ref_L[i] || pool_R[i] != ref_R[i]){
+            if(diff++ == 0) first = i;
+        }
+    }
+    if(diff){
+        printf("%s: %u frames differ from the per-slot voices, first at %u\n", name, diff, first);
+        fail++;
+    }
+    if(max_active != want_overlap){
+        printf("%s: at most %u notes sounded together, expected %u\n", name, max_active, want_overlap);
+        fail++;
+    }
+    if(fm_pool_active_count(&pool) != 0){
+        printf("%s: %u slot(s) still active after every note ended\n", name, fm_pool_active_count(&pool));
+        fail++;
+    }
+    printf("%s: %u notes, up to %u at once: %s\n", name, n_notes, max_active, fail ? "FAIL" : "ok");
+    return fail;
+}
+
+int main(void)
+{
+    int fail = 0;
+
+    /* 0.25 s note, a fifth above it starts 0.1 s in */
+    const note_t overlap[2] = {
+        {    0, 220.0f, 0.25f, 2.0f, 3.0f, 0.4f, 4.0f },
+        { 4410, 330.0f, 0.25f, 1.5f, 2.0f, 0.4f, 6.0f },
+    };
+    fail += run("overlap", overlap, 2, 2);
+
+    /* Half-second notes 2000 frames apart: the pool fills up, then notes
+     * FM_POOL_MAX and FM_POOL_MAX+1 steal slots 0 and 1 while those are
+     * still sounding.  Everything has ended by FRAMES. */
+    note_t steal[NOTES];
+    for(uint32_t k = 0; k < NOTES; k++){
+        float32_t dur = (k + 2u >= NOTES) ? 0.1f : 0.5f;
+        steal[k] = (note_t){ 1000u + 2000u * k, 110.0f * (float32_t)(k + 1u), dur, 1.0f + 0.5f * (float32_t)k,
+                             2.5f, 0.3f, 3.0f };
+    }
+    fail += run("steal", steal, NOTES, FM_POOL_MAX);
+
+    return fail ? 1 : 0;
+}
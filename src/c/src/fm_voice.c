@@ -1,7 +1,8 @@
 #include "fm_voice.h"
 #include <math.h>
-#include <stdio.h>
 #include "env.h"
+#include "fast_math.h"
+#include "trace.h"
 
 #define TAU 6.2831853071795864769f
 
@@ -23,37 +24,103 @@ void fm_voice_trigger(fm_voice_t *v, float32_t carrier_freq, float32_t duration_
     v->decay = decay;
     v->len = (uint32_t)(duration_sec * v->sr);
     v->pos = 0;
-    printf("FM_TRIGGER cf=%.2f dur=%.2f ratio=%.2f idx=%.2f amp=%.2f len=%u\n", carrier_freq, duration_sec, ratio, index, amp, v->len);
+    TRACE(TRACE_FM_TRIGGER, TRACE_VOICE_FM, v->len, carrier_freq, ratio, index, amp);
 }
 
-#ifndef FM_VOICE_ASM
-void fm_voice_process(fm_voice_t *v, float32_t *L, float32_t *R, uint32_t n)
+void fm_kernel_ref(float32_t *L, float32_t *R, uint32_t n, uint32_t pos, float32_t sr,
+                   float32_t c_inc, float32_t m_inc, float32_t index0, float32_t amp,
+                   float32_t decay, float32_t *cp_io, float32_t *mp_io)
 {
-    static int first_call=1;
-    if (v->pos >= v->len) return;
-    if(first_call){
-        printf("FM_PROCESS first n=%u len=%u\n", n, v->len);
-        first_call=0;
-    }
-    float32_t cp = v->carrier_phase;
-    float32_t mp = v->mod_phase;
-    float32_t c_inc = TAU * v->carrier_freq / v->sr;
-    float32_t m_inc = TAU * v->carrier_freq * v->ratio / v->sr;
+    float32_t cp = *cp_io;
+    float32_t mp = *mp_io;
     for (uint32_t i=0;i<n;++i){
-        if (v->pos >= v->len) break;
-        float32_t t = (float32_t)v->pos / v->sr;
-        float32_t env = env_exp_decay(t, v->decay);
-        float32_t index = v->index0 * env; // optional index decay
-        float32_t sample = sinf(cp + index * sinf(mp)) * env * v->amp;
+        float32_t t = (float32_t)(pos + i) / sr;
+        float32_t env = env_exp_decay(t, decay);
+        float32_t index = index0 * env; // optional index decay
+        float32_t sample = sinf(cp + index * sinf(mp)) * env * amp;
+        L[i]+=sample;
+        R[i]+=sample;
+        cp += c_inc;
+        mp += m_inc;
+        if(cp>=TAU) cp-=TAU;
+        if(mp>=TAU) mp-=TAU;
+    }
+    *cp_io = cp;
+    *mp_io = mp;
+}
+
+void fm_kernel_fast(float32_t *L, float32_t *R, uint32_t n, uint32_t pos, float32_t sr,
+                    float32_t c_inc, float32_t m_inc, float32_t index0, float32_t amp,
+                    float32_t decay, float32_t *cp_io, float32_t *mp_io)
+{
+    float32_t cp = *cp_io;
+    float32_t mp = *mp_io;
+    /* env[pos+1] = env[pos] * k.  Re-seeding from expf at every call keeps the
+     * accumulated rounding drift to n * 2^-24 relative. */
+    const float32_t k = expf(-decay / sr);
+    float32_t env = env_exp_decay((float32_t)pos / sr, decay);
+    uint32_t i = 0;
+
+#ifndef FM_KERNEL_SCALAR
+    /* 4 lanes in lockstep, lane j running j samples ahead.  The loop body
+     * has no control flow, so it maps onto one SSE/NEON register.  Lane
+     * phases may exceed TAU (fast_sinf reduces its own argument); the base
+     * phase takes one rounding step per 4 samples instead of 4, so it drifts
+     * slightly away from the reference accumulator (see bench_fm). */
+    const float32_t k2 = k * k, k4 = k2 * k2;
+    float32_t env4[4] = { env, env * k, env * k2, env * k2 * k };
+    for (; i + 4 <= n; i += 4){
+        float32_t out[4];
+        for (int j = 0; j < 4; ++j){
+            float32_t e = env4[j];
+            float32_t m = fast_sinf(mp + (float32_t)j * m_inc);
+            out[j] = fast_sinf(cp + (float32_t)j * c_inc + index0 * e * m) * e * amp;
+            env4[j] = e * k4;
+        }
+        for (int j = 0; j < 4; ++j){
+            L[i + j] += out[j];
+            R[i + j] += out[j];
+        }
+        cp += 4.0f * c_inc;
+        mp += 4.0f * m_inc;
+        while(cp>=TAU) cp-=TAU;
+        while(mp>=TAU) mp-=TAU;
+    }
+    env = env4[0];
+#endif
+
+    for (; i < n; ++i){
+        float32_t sample = fast_sinf(cp + index0 * env * fast_sinf(mp)) * env * amp;
         L[i]+=sample;
         R[i]+=sample;
+        env *= k;
         cp += c_inc;
         mp += m_inc;
         if(cp>=TAU) cp-=TAU;
         if(mp>=TAU) mp-=TAU;
-        v->pos++;
     }
-    v->carrier_phase = cp;
-    v->mod_phase = mp;
+    *cp_io = cp;
+    *mp_io = mp;
+}
+
+#ifndef FM_VOICE_ASM
+void fm_voice_process(fm_voice_t *v, float32_t *L, float32_t *R, uint32_t n)
+{
+#ifdef TRACE_ENABLED
+    static int first_call=1;
+#endif
+    if (v->pos >= v->len) return;
+#ifdef TRACE_ENABLED
+    if(first_call){
+        TRACE(TRACE_FM_PROCESS_FIRST, TRACE_VOICE_FM, n, v->len, 0, 0, 0);
+        first_call=0;
+    }
+#endif
+    uint32_t remaining = v->len - v->pos;
+    if (n > remaining) n = remaining;
+    FM_KERNEL(L, R, n, v->pos, v->sr,
+              TAU * v->carrier_freq / v->sr, TAU * v->carrier_freq * v->ratio / v->sr,
+              v->index0, v->amp, v->decay, &v->carrier_phase, &v->mod_phase);
+    v->pos += n;
 }
-#endif 
\ No newline at end of file
+#endif
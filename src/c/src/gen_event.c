@@ -0,0 +1,123 @@
+#include "gen_event.h"
+#include "event_queue.h"
+#include "music_time.h"
+#include <stddef.h>
+#include <string.h>
+
+uint32_t gen_event_read(gen_event_ring_t *r, gen_event_reader_t *rd, gen_event_t *out, uint32_t max)
+{
+    uint64_t head = atomic_load_explicit(&r->head, memory_order_acquire);
+    if(head - rd->next > GEN_EVENT_RING_CAPACITY){
+        rd->lost += head - rd->next - GEN_EVENT_RING_CAPACITY;
+        rd->next = head - GEN_EVENT_RING_CAPACITY;
+    }
+    uint32_t got = 0;
+    while(got < max && rd->next < head){
+        const gen_event_slot_t *s = &r->slot[rd->next & (GEN_EVENT_RING_CAPACITY - 1u)];
+        const uint64_t want = 2u * rd->next + 2u;
+        uint64_t seq = atomic_load_explicit(&s->seq, memory_order_acquire);
+        if(seq == want){
+            out[got] = s->ev;
+            /* Keep the copy before the re-check, then make sure the writer
+             * did not start on the slot meanwhile */
+            atomic_thread_fence(memory_order_acquire);
+            seq = atomic_load_explicit(&s->seq, memory_order_relaxed);
+        }
+        if(seq == want) got++;
+        else rd->lost++;   /* the writer has lapped this event */
+        rd->next++;
+    }
+    return got;
+}
+
+static const char *const TYPE_NAMES[EVT_COUNT] = {
+    "kick", "snare", "hat", "melody", "mid", "fm_bass"
+};
+
+static const char *const VOICE_NAMES[GEN_EV_VOICE_COUNT] = {
+    "kick", "snare", "hat", "melody", "mid_fm", "bass_fm", "mid_simple"
+};
+
+const char *gen_event_type_name(uint8_t type)
+{
+    return type < EVT_COUNT ? TYPE_NAMES[type] : "?";
+}
+
+const char *gen_event_voice_name(uint8_t voice)
+{
+    return voice < GEN_EV_VOICE_COUNT ? VOICE_NAMES[voice] : "?";
+}
+
+int gen_event_write_json(FILE *f, const gen_event_t *ev, uint64_t n, uint64_t seed)
+{
+    fprintf(f, "{\"sample_rate\": %u, \"seed\": \"0x%llx\", \"events\": [", (unsigned)SR,
+            (unsigned long long)seed);
+    for(uint64_t i = 0; i < n; i++){
+        const gen_event_t *e = &ev[i];
+        fprintf(f, "%s\n  {\"time\": %llu, \"type\": \"%s\", \"voice\": \"%s\", \"aux\": %u, "
+                   "\"preset\": %u, \"freq\": %.9g, \"amp\": %.9g}",
+                i ? "," : "", (unsigned long long)e->time, gen_event_type_name(e->type),
+                gen_event_voice_name(e->voice), (unsigned)e->aux, (unsigned)e->preset,
+                (double)e->freq, (double)e->amp);
+    }
+    fprintf(f, "%s]}\n", n ? "\n" : "");
+    return ferror(f) ? -1 : 0;
+}
+
+/* Column order of the .npy records (packed, little-endian) */
+typedef struct {
+    const char *name;
+    const char *dtype;
+    size_t offset;
+    size_t size;
+} column_t;
+
+#define COL(f, t) { #f, t, offsetof(gen_event_t, f), sizeof(((gen_event_t *)0)->f) }
+static const column_t columns[] = {
+    COL(time, "<u8"),
+    COL(type, "|u1"),
+    COL(voice, "|u1"),
+    COL(aux, "|u1"),
+    COL(preset, "|u1"),
+    COL(freq, "<f4"),
+    COL(amp, "<f4"),
+};
+#define NUM_COLUMNS (sizeof(columns) / sizeof(columns[0]))
+
+int gen_event_write_npy(FILE *f, const gen_event_t *ev, uint64_t n)
+{
+    char dict[512];
+    int len = snprintf(dict, sizeof(dict), "{'descr': [");
+    for(size_t c = 0; c < NUM_COLUMNS; c++)
+        len += snprintf(dict + len, sizeof(dict) - (size_t)len, "%s('%s', '%s')",
+                        c ? ", " : "", columns[c].name, columns[c].dtype);
+    len += snprintf(dict + len, sizeof(dict) - (size_t)len,
+                    "], 'fortran_order': False, 'shape': (%llu,), }", (unsigned long long)n);
+
+    /* magic(6) + version(2) + header_len(2) + dict + padding + '\n' is a multiple of 64 */
+    size_t total = 10 + (size_t)len + 1;
+    size_t pad = (64 - total % 64) % 64;
+    uint16_t hlen = (uint16_t)(len + pad + 1);
+    uint8_t pre[10] = { 0x93, 'N', 'U', 'M', 'P', 'Y', 1, 0, (uint8_t)(hlen & 0xFF), (uint8_t)(hlen >> 8) };
+    if(fwrite(pre, 1, sizeof(pre), f) != sizeof(pre)) return -1;
+    if(fwrite(dict, 1, (size_t)len, f) != (size_t)len) return -1;
+    for(size_t i = 0; i < pad; i++) fputc(' ', f);
+    fputc('\n', f);
+
+    for(uint64_t i = 0; i < n; i++)
+        for(size_t c = 0; c < NUM_COLUMNS; c++)
+            fwrite((const uint8_t *)&ev[i] + columns[c].offset, 1, columns[c].size, f);
+    return ferror(f) ? -1 : 0;
+}
+
+int gen_event_save(const char *path, const gen_event_t *ev, uint64_t n, uint64_t seed)
+{
+    FILE *f = fopen(path, "wb");
+    if(!f){ perror(path); return -1; }
+    size_t len = strlen(path);
+    int npy = len >= 4 && strcmp(path + len - 4, ".npy") == 0;
+    int rc = npy ? gen_event_write_npy(f, ev, n) : gen_event_write_json(f, ev, n, seed);
+    if(fclose(f) != 0) rc = -1;
+    if(rc != 0) perror(path);
+    return rc;
+}
@@ -0,0 +1,79 @@
+#define _POSIX_C_SOURCE 199309L
+#include "gen_profile.h"
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+
+static gen_profile_t g_prof;
+
+/* Keep in sync with gen_prof_stage_t */
+static const char *STAGE_NAMES[PROF_STAGE_COUNT] = {
+    "kick", "snare", "hat", "melody", "mid_fm", "bass_fm", "mid_simple",
+    "events", "delay", "postmix"
+};
+
+static const char *EVT_NAMES[EVT_COUNT] = {
+    "kick", "snare", "hat", "melody", "mid", "fm_bass"
+};
+
+uint64_t gen_profile_now_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ull + (uint64_t)ts.tv_nsec;
+}
+
+void gen_profile_reset(void) { memset(&g_prof, 0, sizeof(g_prof)); }
+
+const gen_profile_t *gen_profile_get(void) { return &g_prof; }
+
+const char *gen_profile_stage_name(gen_prof_stage_t s)
+{
+    return (s < PROF_STAGE_COUNT) ? STAGE_NAMES[s] : "?";
+}
+
+void gen_profile_add(gen_prof_stage_t s, uint64_t ns, uint32_t frames)
+{
+    gen_prof_counter_t *c = &g_prof.stage[s];
+    c->ns += ns;
+    c->frames += frames;
+    c->calls++;
+}
+
+void gen_profile_trigger(uint8_t evt_type)
+{
+    if(evt_type < EVT_COUNT) g_prof.triggers[evt_type]++;
+}
+
+void gen_profile_block(uint32_t frames)
+{
+    g_prof.blocks++;
+    g_prof.block_frames += frames;
+}
+
+int gen_profile_dump_json(const char *path)
+{
+    FILE *f = fopen(path, "w");
+    if(!f){
+        perror("gen_profile_dump_json: fopen");
+        return 1;
+    }
+
+    fprintf(f, "{\n  \"blocks\": %llu,\n  \"block_frames\": %llu,\n  \"stages\": {\n",
+            (unsigned long long)g_prof.blocks, (unsigned long long)g_prof.block_frames);
+    for(int s = 0; s < PROF_STAGE_COUNT; s++){
+        const gen_prof_counter_t *c = &g_prof.stage[s];
+        fprintf(f, "    \"%s\": {\"ns\": %llu, \"frames\": %llu, \"calls\": %llu}%s\n",
+                STAGE_NAMES[s], (unsigned long long)c->ns, (unsigned long long)c->frames,
+                (unsigned long long)c->calls, (s + 1 < PROF_STAGE_COUNT) ? "," : "");
+    }
+    fprintf(f, "  },\n  \"triggers\": {\n");
+    for(int e = 0; e < EVT_COUNT; e++){
+        fprintf(f, "    \"%s\": %llu%s\n", EVT_NAMES[e],
+                (unsigned long long)g_prof.triggers[e], (e + 1 < EVT_COUNT) ? "," : "");
+    }
+    fprintf(f, "  }\n}\n");
+
+    fclose(f);
+    return 0;
+}
@@ -4,6 +4,8 @@
 #include <stdio.h>
 #include "fm_presets.h"
 #include "euclid.h"
+#include "trace.h"
+#include "gen_profile.h"
 
 /* Helper for RNG float */
 #define RNG_FLOAT(rng) ( (rng_next_u32(rng) >> 8) * (1.0f/16777216.0f) )
@@ -11,10 +13,13 @@
 volatile float g_block_rms = 0.0f;
 
 // C fallback for generator_build_events_asm - for debugging
-static void generator_build_events_c(event_queue_t *q, rng_t *rng, 
-                                     const uint8_t *kick_pat, const uint8_t *snare_pat, const uint8_t *hat_pat,
+/* Drum patterns are bitmasks over one bar (bit i = bar step i).
+ * Returns the number of events that did not fit in the queue. */
+static uint32_t generator_build_events_c(event_queue_t *q, rng_t *rng, 
+                                     uint64_t kick_mask, uint64_t snare_mask, uint64_t hat_mask,
                                      uint32_t step_samples)
 {
+    uint32_t dropped = 0;
     eq_init(q);
     
     for(uint32_t step = 0; step < TOTAL_STEPS; step++) {
@@ -22,39 +27,74 @@ static void generator_build_events_c(event_queue_t *q, rng_t *rng,
         uint32_t bar_step = step % STEPS_PER_BAR;
         
         // Drums
-        if(kick_pat[bar_step])  eq_push(q, t, EVT_KICK, 0);
-        if(snare_pat[bar_step]) eq_push(q, t, EVT_SNARE, 0);
-        if(hat_pat[bar_step])   eq_push(q, t, EVT_HAT, 0);
+        if(euclid_hit(kick_mask, bar_step))  dropped += !eq_push(q, t, EVT_KICK, 0);
+        if(euclid_hit(snare_mask, bar_step)) dropped += !eq_push(q, t, EVT_SNARE, 0);
+        if(euclid_hit(hat_mask, bar_step))   dropped += !eq_push(q, t, EVT_HAT, 0);
         
         // Melody at specific positions
         if(bar_step == 0 || bar_step == 8 || bar_step == 16 || bar_step == 24) {
-            eq_push(q, t, EVT_MELODY, bar_step/8);
+            dropped += !eq_push(q, t, EVT_MELODY, bar_step/8);
         }
         
         // Mid triggers
         if((bar_step % 4) == 2 || (((bar_step % 4) == 1 || (bar_step % 4) == 3) && RNG_FLOAT(rng) < 0.1f)) {
-            eq_push(q, t, EVT_MID, rng_next_u32(rng) % 7);
+            dropped += !eq_push(q, t, EVT_MID, rng_next_u32(rng) % 7);
         }
         
         // Bass at bar start
         if(bar_step == 0) {
-            eq_push(q, t, EVT_FM_BASS, 0);
+            dropped += !eq_push(q, t, EVT_FM_BASS, 0);
         }
     }
+    return dropped;
 }
 
-// C fallback for generator_rotate_pattern_asm - for debugging
-static void generator_rotate_pattern_c(uint8_t *pattern, uint8_t *tmp, uint32_t size, uint32_t rot)
+/* Everything generator_init derives from the seed, in the order it draws
+ * from `rng`.  Shared with describe_seed so the two cannot drift apart. */
+typedef struct {
+    music_time_t mt;
+    music_globals_t music;
+    event_queue_t q;
+    uint32_t events_dropped;
+    uint8_t kick_hits, snare_hits, hat_hits, preset_offset, rot;
+    uint16_t kick_mask, snare_mask, hat_mask;
+    float delay_factor;
+    uint32_t delay_samples;
+} seed_params_t;
+
+static void generator_derive(rng_t *rng, seed_params_t *p)
 {
-    if(rot == 0) return;
-    
-    // Copy original pattern to tmp
-    memcpy(tmp, pattern, size);
-    
-    // Rotate: pattern[i] = tmp[(i + rot) % size]
-    for(uint32_t i = 0; i < size; i++) {
-        pattern[i] = tmp[(i + rot) % size];
-    }
+    /* ---- Derive per-run musical variation from seed ---- */
+    p->kick_hits  = 2 + (rng_next_u32(rng) % 3);
+    p->snare_hits = 1 + (rng_next_u32(rng) % 3);
+    p->hat_hits   = 4 + (rng_next_u32(rng) % 5);
+    p->preset_offset = rng_next_u32(rng) % 4;
+
+    float bpm = 50.0f + (RNG_FLOAT(rng) * 70.0f);
+    music_time_init(&p->mt, bpm);
+    music_globals_init(&p->music, rng);
+
+    /* ---- Build drum patterns (table lookup + bit rotation) ---- */
+    p->rot = rng_next_u32(rng) % STEPS_PER_BAR;
+    p->kick_mask  = (uint16_t)euclid_mask(p->kick_hits, STEPS_PER_BAR, p->rot);
+    p->snare_mask = (uint16_t)euclid_mask(p->snare_hits, STEPS_PER_BAR, p->rot);
+    p->hat_mask   = (uint16_t)euclid_mask(p->hat_hits, STEPS_PER_BAR, p->rot);
+
+    /* ---- Pre-compute event queue ---- */
+    /* Phase 5.5: Use C implementation (assembly has infinite loop bug) */
+    p->events_dropped = generator_build_events_c(&p->q, rng, p->kick_mask, p->snare_mask, p->hat_mask,
+                                                 p->mt.step_samples);
+    eq_sort(&p->q);
+
+    /* ---- Effects ---- */
+#ifdef DELAY_FACTOR_OVERRIDE
+    p->delay_factor = DELAY_FACTOR_OVERRIDE;
+#else
+    float delay_factors[] = {2.0f,1.0f,0.5f,0.25f};
+    p->delay_factor = delay_factors[rng_next_u32(rng)%4];
+#endif
+    p->delay_samples = (uint32_t)(p->mt.beat_sec * p->delay_factor * SR);
+    if(p->delay_samples > MAX_DELAY_SAMPLES) p->delay_samples = MAX_DELAY_SAMPLES;
 }
 
 void generator_init(generator_t *g, uint64_t seed)
@@ -62,15 +102,18 @@ void generator_init(generator_t *g, uint64_t seed)
     memset(g, 0, sizeof(generator_t));
     g->rng = rng_seed(seed);
 
-    /* ---- Derive per-run musical variation from seed ---- */
-    uint8_t kick_hits  = 2 + (rng_next_u32(&g->rng) % 3);
-    uint8_t snare_hits = 1 + (rng_next_u32(&g->rng) % 3);
-    uint8_t hat_hits   = 4 + (rng_next_u32(&g->rng) % 5);
-    uint8_t preset_offset = rng_next_u32(&g->rng) % 4;
-    
-    float bpm = 50.0f + (RNG_FLOAT(&g->rng) * 70.0f);
-    music_time_init(&g->mt, bpm);
-    music_globals_init(&g->music, &g->rng);
+    seed_params_t p;
+    generator_derive(&g->rng, &p);
+    g->mt = p.mt;
+    g->music = p.music;
+    g->q = p.q;
+    g->events_dropped = p.events_dropped;
+    if(g->events_dropped)
+        fprintf(stderr, "WARNING: event queue full – dropped %u event(s) (MAX_EVENTS %u)\n",
+                g->events_dropped, (unsigned)MAX_EVENTS);
+    g->event_idx = 0;
+    g->step = 0;
+    g->pos_in_step = 0;
 
     /* ---- Init voices ---- */
     kick_init(&g->kick, SR);
@@ -79,84 +122,112 @@ void generator_init(generator_t *g, uint64_t seed)
     melody_init(&g->mel, SR);
     fm_voice_init(&g->mid_fm, SR);
     fm_voice_init(&g->bass_fm, SR);
+    fm_pool_init(&g->mid_pool, SR);
+    fm_pool_init(&g->bass_pool, SR);
     simple_voice_init(&g->mid_simple, SR);
 
-    /* ---- Build drum patterns ---- */
-    uint8_t kick_pat[STEPS_PER_BAR], snare_pat[STEPS_PER_BAR], hat_pat[STEPS_PER_BAR];
-    euclid_pattern(kick_hits, STEPS_PER_BAR, kick_pat);
-    euclid_pattern(snare_hits, STEPS_PER_BAR, snare_pat);
-    euclid_pattern(hat_hits, STEPS_PER_BAR, hat_pat);
-
-    uint8_t rot = rng_next_u32(&g->rng) % STEPS_PER_BAR;
-    if(rot > 0){
-        uint8_t tmp[STEPS_PER_BAR];
-        /* Phase 5.4: Use C implementation for debugging segfault */
-        generator_rotate_pattern_c(kick_pat, tmp, STEPS_PER_BAR, rot);
-        generator_rotate_pattern_c(snare_pat, tmp, STEPS_PER_BAR, rot);
-        generator_rotate_pattern_c(hat_pat, tmp, STEPS_PER_BAR, rot);
-    }
-    
-    /* ---- Pre-compute event queue ---- */
-    /* Phase 5.5: Use C implementation (assembly has infinite loop bug) */
-    generator_build_events_c(&g->q, &g->rng, kick_pat, snare_pat, hat_pat, g->mt.step_samples);
-    g->event_idx = 0;
-    g->step = 0;
-    g->pos_in_step = 0;
-
-    /* Debug: count how many EVT_MID events were scheduled */
-    uint32_t mid_evt_count = 0;
-    for(uint32_t i = 0; i < g->q.count; i++){
-        if(g->q.events[i].type == EVT_MID) mid_evt_count++;
-    }
-    printf("DEBUG: EVT_MID events scheduled = %u\n", mid_evt_count);
-    
     /* ---- Init Effects ---- */
-#ifdef DELAY_FACTOR_OVERRIDE
-    float delay_factor = DELAY_FACTOR_OVERRIDE;
-#else
-    float delay_factors[] = {2.0f,1.0f,0.5f,0.25f};
-    float delay_factor = delay_factors[rng_next_u32(&g->rng)%4];
-#endif
-    uint32_t delay_samples = (uint32_t)(g->mt.beat_sec * delay_factor * SR);
-    if(delay_samples > MAX_DELAY_SAMPLES) delay_samples = MAX_DELAY_SAMPLES;
-    delay_init(&g->delay, g->delay_buf, delay_samples);
-    printf("DEBUG: After delay_init - buf=%p size=%u idx=%u\n", g->delay.buf, g->delay.size, g->delay.idx);
-    printf("DEBUG: LLDB WATCHPOINT ADDRESSES - delay struct at %p, delay.size at %p, delay.idx at %p\n", 
-           &g->delay, &g->delay.size, &g->delay.idx);
+    delay_init(&g->delay, g->delay_buf, p.delay_samples);
     /* Limiter tweak: faster attack/release and softer threshold (−0.1 dB) */
     limiter_init(&g->limiter, SR, 0.5f, 50.0f, -0.1f);
+    generator_set_lookahead(g, GEN_LIMITER_LOOKAHEAD_MS);
+}
+
+void describe_seed(uint64_t seed, seed_desc_t *d)
+{
+    rng_t rng = rng_seed(seed);
+    seed_params_t p;
+    generator_derive(&rng, &p);
+
+    memset(d, 0, sizeof(*d));
+    d->seed = seed;
+    d->bpm = p.mt.bpm;
+    d->step_samples = p.mt.step_samples;
+    d->seg_frames = p.mt.seg_frames;
+    d->root_freq = p.music.root_freq;
+    d->delay_factor = p.delay_factor;
+    d->delay_samples = p.delay_samples;
+    d->scale = (uint8_t)p.music.scale_type;
+    d->kick_hits = p.kick_hits;
+    d->snare_hits = p.snare_hits;
+    d->hat_hits = p.hat_hits;
+    d->preset_offset = p.preset_offset;
+    d->rotation = p.rot;
+    d->kick_mask = p.kick_mask;
+    d->snare_mask = p.snare_mask;
+    d->hat_mask = p.hat_mask;
+    d->events = (uint16_t)p.q.count;
+    d->events_dropped = (uint16_t)p.events_dropped;
+    for(uint32_t i = 0; i < p.q.count; i++){
+        const event_t *e = &p.q.events[i];
+        switch(e->type){
+            case EVT_KICK:    d->n_kick++; break;
+            case EVT_SNARE:   d->n_snare++; break;
+            case EVT_HAT:     d->n_hat++; break;
+            case EVT_MELODY:  d->n_melody++; break;
+            case EVT_MID:     if(e->aux < 3) d->n_mid_simple++; else d->n_mid_fm++; break;
+            case EVT_FM_BASS: d->n_bass++; break;
+        }
+    }
+}
+
+void generator_set_lookahead(generator_t *g, float32_t ms)
+{
+    g->la_enabled = ms > 0.0f;
+    if(g->la_enabled) limiter_lookahead_init(&g->la_limiter, SR, ms, 50.0f, -0.1f, 5.0f);
+}
+
+void generator_set_event_ring(generator_t *g, gen_event_ring_t *ring)
+{
+    g->events = ring;
 }
 
 #ifndef GENERATOR_ASM
-void generator_process(generator_t *g, float32_t *L, float32_t *R, uint32_t num_frames)
+static inline void publish(generator_t *g, uint32_t frame, uint8_t type, gen_event_voice_t voice,
+                           uint8_t aux, uint8_t preset, float32_t freq, float32_t amp)
 {
-    /* clear visual event flags */
-    g->saw_hit = false;
-    g->bass_hit = false;
+    gen_event_t e = { g->frames_done + frame, type, (uint8_t)voice, aux, preset, freq, amp };
+    gen_event_publish(g->events, &e);
+}
+
+/* One chunk of at most GEN_MAX_BLOCK frames; returns its RMS.  Visual hit
+ * flags are only ever set here – generator_process clears them. */
+static float generator_process_block(generator_t *g, float32_t *L, float32_t *R, uint32_t num_frames)
+{
+    PROF_BLOCK(num_frames);
 
     /* buffers for sub-mixes */
-    float32_t Ld[num_frames], Rd[num_frames];
-    float32_t Ls[num_frames], Rs[num_frames];
-    
-    /* Phase 5.3: Use C implementation for debugging */
-    memset(Ld, 0, num_frames * sizeof(float32_t));
-    memset(Rd, 0, num_frames * sizeof(float32_t));
-    memset(Ls, 0, num_frames * sizeof(float32_t));
-    memset(Rs, 0, num_frames * sizeof(float32_t));
+    float32_t *Ld = g->bus_Ld, *Rd = g->bus_Rd;
+    float32_t *Ls = g->bus_Ls, *Rs = g->bus_Rs;
+
+    /* Sub-mixes are cleared lazily: a bus is only zeroed (and later mixed)
+       once a voice on it is sounding during this block. */
+    bool drums_on = false, synth_on = false;
 
     uint32_t frames_rem = num_frames;
     uint32_t current_frame = 0;
 
+    const uint32_t loop_frames = TOTAL_STEPS * g->mt.step_samples;
+
     while(frames_rem > 0){
-        /* Trigger events at the *beginning* of each step */
-        if(g->pos_in_step == 0){
-            uint32_t t_step_start = g->step * g->mt.step_samples;
-            while(g->event_idx < g->q.count && g->q.events[g->event_idx].time == t_step_start){
+        /* Fire every event due at the current sample (the queue is sorted by time) */
+        uint32_t pos = g->step * g->mt.step_samples + g->pos_in_step;
+        if(g->event_idx < g->q.count && g->q.events[g->event_idx].time <= pos){
+            PROF_BEGIN(t_events);
+            while(g->event_idx < g->q.count && g->q.events[g->event_idx].time <= pos){
                 event_t *e = &g->q.events[g->event_idx];
+                TRACE(TRACE_EVENT, TRACE_VOICE_NONE, g->event_idx, e->type, e->aux, g->step, g->pos_in_step);
+                PROF_TRIGGER(e->type);
                 switch(e->type){
-                    case EVT_KICK:  kick_trigger(&g->kick); break;
-                    case EVT_SNARE: snare_trigger(&g->snare); break;
-                    case EVT_HAT:   hat_trigger(&g->hat); break;
+                    case EVT_KICK:  kick_trigger(&g->kick);   g->active_mask |= GEN_VOICE_KICK;
+                        if(g->events) publish(g, current_frame, e->type, GEN_EV_KICK, e->aux, 0, 0.0f, 1.0f);
+                        break;
+                    case EVT_SNARE: snare_trigger(&g->snare); g->active_mask |= GEN_VOICE_SNARE;
+                        if(g->events) publish(g, current_frame, e->type, GEN_EV_SNARE, e->aux, 0, 0.0f, 1.0f);
+                        break;
+                    case EVT_HAT:   hat_trigger(&g->hat);     g->active_mask |= GEN_VOICE_HAT;
+                        if(g->events) publish(g, current_frame, e->type, GEN_EV_HAT, e->aux, 0, 0.0f, 1.0f);
+                        break;
                     case EVT_MELODY: {
                         float32_t freq=g->music.root_freq;
                         int deg;
@@ -167,7 +238,9 @@ void generator_process(generator_t *g, float32_t *L, float32_t *R, uint32_t num_
                             case 3: deg=g->music.scale_degrees[rng_next_u32(&g->rng)%(g->music.scale_len-1)+1]; freq *= powf(2.0f, deg/12.0f); break;
                         }
                         melody_trigger(&g->mel, freq, g->mt.beat_sec);
+                        g->active_mask |= GEN_VOICE_MELODY;
                         g->saw_hit = true;
+                        if(g->events) publish(g, current_frame, e->type, GEN_EV_MELODY, e->aux, 0, freq, 1.0f);
                         break; }
                     case EVT_MID: {
                         uint8_t idx = e->aux;
@@ -176,10 +249,14 @@ void generator_process(generator_t *g, float32_t *L, float32_t *R, uint32_t num_
                         if(idx < 3){
                             simple_wave_t w = (idx==0)?SIMPLE_TRI:(idx==1)?SIMPLE_SINE:SIMPLE_SQUARE;
                             simple_voice_trigger(&g->mid_simple, freq, g->mt.step_sec, w, 0.2f, 6.0f);
+                            g->active_mask |= GEN_VOICE_MID_SIMPLE;
+                            if(g->events) publish(g, current_frame, e->type, GEN_EV_MID_SIMPLE, idx, 0, freq, 0.2f);
                         } else {
                             fm_params_t mid_presets[4] = {FM_PRESET_BELLS, FM_PRESET_CALM, FM_PRESET_QUANTUM, FM_PRESET_PLUCK};
                             fm_params_t p = mid_presets[(idx-3)%4];
-                            fm_voice_trigger(&g->mid_fm, freq, g->mt.step_sec + (1.0f/(float32_t)SR), p.ratio, p.index, p.amp, p.decay);
+                            fm_pool_trigger(&g->mid_pool, freq, g->mt.step_sec + (1.0f/(float32_t)SR), p.ratio, p.index, p.amp, p.decay, (idx-3)%4);
+                            g->active_mask |= GEN_VOICE_MID_FM;
+                            if(g->events) publish(g, current_frame, e->type, GEN_EV_MID_FM, idx, (uint8_t)((idx-3)%4), freq, p.amp);
                         }
                         break; }
                     case EVT_FM_BASS: {
@@ -192,69 +269,154 @@ void generator_process(generator_t *g, float32_t *L, float32_t *R, uint32_t num_
                             case 1: p = FM_BASS_QUANTUM; break;
                             case 2: p = FM_BASS_PLUCKY;  break;
                         }
-                        fm_voice_trigger(&g->bass_fm, freq, g->mt.beat_sec*2, p.ratio, p.index, p.amp, p.decay);
+                        fm_pool_trigger(&g->bass_pool, freq, g->mt.beat_sec*2, p.ratio, p.index, p.amp, p.decay, bass_choice);
+                        g->active_mask |= GEN_VOICE_BASS_FM;
                         g->bass_hit = true;
+                        if(g->events) publish(g, current_frame, e->type, GEN_EV_BASS_FM, e->aux, bass_choice, freq, p.amp);
                         break; }
                 }
                 g->event_idx++;
             }
+            PROF_END(PROF_EVENTS, t_events, 0);
         }
 
-        /* How many frames until the next step boundary? */
-        uint32_t frames_to_step_boundary = g->mt.step_samples - g->pos_in_step;
-        /*
-         * FM sustain fix: ensure the first slice of every step processes at most
-         * step_samples-1 frames so notes longer than one slice are not fully
-         * consumed in a single call (they would then be silent on subsequent
-         * slices). Only apply when we are at the very start of a step and have
-         * more than one frame left to render.
-         */
-        if (g->pos_in_step == 0 && frames_to_step_boundary > 1) {
-            frames_to_step_boundary -= 1;
-        }
-        uint32_t frames_to_process = (frames_rem < frames_to_step_boundary) ? frames_rem : frames_to_step_boundary;
+        /* Render straight through to the next event (or the loop end): voices
+           get the longest contiguous span the schedule allows. */
+        uint32_t next_event = (g->event_idx < g->q.count) ? g->q.events[g->event_idx].time : loop_frames;
+        if(next_event > loop_frames) next_event = loop_frames;
+        uint32_t frames_to_process = next_event - pos;
+        if(frames_to_process > frames_rem) frames_to_process = frames_rem;
 
-        /* Render voices */
-        kick_process(&g->kick,   &Ld[current_frame], &Rd[current_frame], frames_to_process);
-        snare_process(&g->snare, &Ld[current_frame], &Rd[current_frame], frames_to_process);
-        hat_process(&g->hat,     &Ld[current_frame], &Rd[current_frame], frames_to_process);
-        melody_process(&g->mel,      &Ls[current_frame], &Rs[current_frame], frames_to_process);
-        fm_voice_process(&g->mid_fm, &Ls[current_frame], &Rs[current_frame], frames_to_process);
-        fm_voice_process(&g->bass_fm,&Ls[current_frame], &Rs[current_frame], frames_to_process);
-        simple_voice_process(&g->mid_simple, &Ls[current_frame], &Rs[current_frame], frames_to_process);
+        /* Render voices – only those whose bit is set in active_mask */
+        uint32_t mask = g->active_mask;
+        if((mask & GEN_DRUM_VOICES) && !drums_on){
+            memset(Ld, 0, num_frames * sizeof(float32_t));
+            memset(Rd, 0, num_frames * sizeof(float32_t));
+            drums_on = true;
+        }
+        if((mask & GEN_SYNTH_VOICES) && !synth_on){
+            memset(Ls, 0, num_frames * sizeof(float32_t));
+            memset(Rs, 0, num_frames * sizeof(float32_t));
+            synth_on = true;
+        }
+        if(mask & GEN_VOICE_KICK)
+            PROF_VOICE(PROF_KICK, 1, frames_to_process,
+                       kick_process(&g->kick,   &Ld[current_frame], &Rd[current_frame], frames_to_process));
+        if(mask & GEN_VOICE_SNARE)
+            PROF_VOICE(PROF_SNARE, 1, frames_to_process,
+                       snare_process(&g->snare, &Ld[current_frame], &Rd[current_frame], frames_to_process));
+        if(mask & GEN_VOICE_HAT)
+            PROF_VOICE(PROF_HAT, 1, frames_to_process,
+                       hat_process(&g->hat,     &Ld[current_frame], &Rd[current_frame], frames_to_process));
+        if(mask & GEN_VOICE_MELODY)
+            PROF_VOICE(PROF_MELODY, 1, frames_to_process,
+                       melody_process(&g->mel,      &Ls[current_frame], &Rs[current_frame], frames_to_process));
+        if(mask & GEN_VOICE_MID_FM)
+            PROF_VOICE(PROF_MID_FM, 1, frames_to_process,
+                       fm_pool_process(&g->mid_pool, &Ls[current_frame], &Rs[current_frame], frames_to_process));
+        if(mask & GEN_VOICE_BASS_FM)
+            PROF_VOICE(PROF_BASS_FM, 1, frames_to_process,
+                       fm_pool_process(&g->bass_pool,&Ls[current_frame], &Rs[current_frame], frames_to_process));
+        if(mask & GEN_VOICE_MID_SIMPLE)
+            PROF_VOICE(PROF_MID_SIMPLE, 1, frames_to_process,
+                       simple_voice_process(&g->mid_simple, &Ls[current_frame], &Rs[current_frame], frames_to_process));
+        g->active_mask = generator_release_voices(g, mask);
 
         /* Advance pointers / counters */
         current_frame += frames_to_process;
         frames_rem    -= frames_to_process;
-        g->pos_in_step += frames_to_process;
-
-        /* Step boundary reached? */
-        if(g->pos_in_step >= g->mt.step_samples){
-            g->pos_in_step = 0;
-            g->step++;
-            if(g->step >= TOTAL_STEPS){
-                g->step = 0;
-                g->event_idx = 0; /* loop event queue */
-            }
+        pos           += frames_to_process;
+        if(pos >= loop_frames){
+            pos = 0;
+            g->event_idx = 0; /* loop event queue */
         }
+        g->step        = pos / g->mt.step_samples;
+        g->pos_in_step = pos % g->mt.step_samples;
+    }
+
+    /* The synth bus feeds the delay, so it needs real zeros even when no synth
+       voice sounded – unless the echo tail has died out and the line is idle. */
+    if(synth_on) g->delay_idle = false;
+    bool synth_valid = synth_on || !g->delay_idle;
+    if(synth_valid && !synth_on){
+        memset(Ls, 0, num_frames * sizeof(float32_t));
+        memset(Rs, 0, num_frames * sizeof(float32_t));
     }
 
-    printf("DEBUG: Before delay_process_block - buf=%p size=%u idx=%u n=%u\n", g->delay.buf, g->delay.size, g->delay.idx, num_frames);
-    delay_process_block(&g->delay, Ls, Rs, num_frames, 0.45f);
+    if(synth_valid){
+        TRACE(TRACE_DELAY_BLOCK, TRACE_VOICE_DELAY, num_frames, g->delay.size, g->delay.idx, 0, 0);
+        PROF_BEGIN(t_delay);
+        delay_process_block(&g->delay, Ls, Rs, num_frames, 0.45f);
+        PROF_END(PROF_DELAY, t_delay, num_frames);
 
-    /* Phase 5.1: Use C implementation for debugging */
-    for(uint32_t i = 0; i < num_frames; i++) {
-        L[i] = Ld[i] + Ls[i];
-        R[i] = Rd[i] + Rs[i];
+        if(!synth_on){
+            /* Silent input: the output is pure echo tail.  Once a full delay
+               period has been read below threshold every slot in the line is
+               below threshold too, so flush it and bypass the delay. */
+            float32_t peak = 0.0f;
+            for(uint32_t i = 0; i < num_frames; i++){
+                peak = fmaxf(peak, fmaxf(fabsf(Ls[i]), fabsf(Rs[i])));
+            }
+            g->delay_quiet_frames = (peak < DELAY_TAIL_THRESHOLD) ? g->delay_quiet_frames + num_frames : 0;
+            if(g->delay_quiet_frames >= g->delay.size){
+                memset(g->delay.buf, 0, sizeof(float32_t) * g->delay.size * 2);
+                g->delay_idle = true;
+            }
+        } else {
+            g->delay_quiet_frames = 0;
+        }
     }
 
-    limiter_process(&g->limiter, L, R, num_frames);
+    if(!drums_on && !synth_valid){
+        /* Nothing sounding and no echo tail: the whole block is silence. */
+        PROF_BEGIN(t_mix);
+        memset(L, 0, num_frames * sizeof(float32_t));
+        memset(R, 0, num_frames * sizeof(float32_t));
+        /* Zero input cannot trigger gain reduction; only the envelope's
+           release needs to keep running until it has fully decayed.  The
+           look-ahead limiter still has its delay line to play out. */
+        float rms = 0.0f;
+        if(g->la_enabled){
+            limiter_lookahead_process(&g->la_limiter, L, R, num_frames);
+            float sum = 0.0f;
+            for(uint32_t i = 0; i < num_frames; i++) sum += L[i] * L[i] + R[i] * R[i];
+            rms = sqrtf(sum / (num_frames * 2));
+        } else if(g->limiter.envelope != 0.0f){
+            limiter_process(&g->limiter, L, R, num_frames);
+        }
+        PROF_END(PROF_POSTMIX, t_mix, num_frames);
+        return rms;
+    }
 
-    /* Phase 5.2: Use C implementation for debugging */
-    float sum = 0.0f;
-    for(uint32_t i = 0; i < num_frames; i++) {
-        sum += L[i] * L[i] + R[i] * R[i];
+    /* Mix, limiter and RMS fused into one tiled pass, profiled as one
+       "postmix" stage: the three no longer run separately to be timed. */
+    PROF_BEGIN(t_mix);
+    float rms = generator_postmix(&g->limiter, g->la_enabled ? &g->la_limiter : NULL, L, R,
+                                  drums_on ? Ld : NULL, drums_on ? Rd : NULL,
+                                  synth_valid ? Ls : NULL, synth_valid ? Rs : NULL, num_frames);
+    PROF_END(PROF_POSTMIX, t_mix, num_frames);
+    return rms;
+}
+
+void generator_process(generator_t *g, float32_t *L, float32_t *R, uint32_t num_frames)
+{
+    /* clear visual event flags */
+    g->saw_hit = false;
+    g->bass_hit = false;
+
+    if(num_frames <= GEN_MAX_BLOCK){
+        g_block_rms = generator_process_block(g, L, R, num_frames);
+        g->frames_done += num_frames;
+        return;
+    }
+    double sum_sq = 0.0;
+    for(uint32_t done = 0; done < num_frames; ){
+        uint32_t n = num_frames - done < GEN_MAX_BLOCK ? num_frames - done : GEN_MAX_BLOCK;
+        float rms = generator_process_block(g, L + done, R + done, n);
+        g->frames_done += n;
+        sum_sq += (double)rms * rms * n;
+        done += n;
     }
-    g_block_rms = sqrtf(sum / (num_frames * 2));
+    g_block_rms = num_frames ? (float)sqrt(sum_sq / num_frames) : 0.0f;
 }
 #endif // GENERATOR_ASM 
\ No newline at end of file
@@ -0,0 +1,63 @@
+#include "generator.h"
+#include <string.h>
+#include <math.h>
+
+/* Fused post-processing: bus mix, limiter and RMS in one pass.
+ *
+ * The block is walked in GEN_MIX_TILE-frame tiles.  Each tile is mixed
+ * (vectorizable), limited while it is still in L1 (the envelope follower
+ * is inherently serial, so it stays a scalar pass over the hot tile) and
+ * then squared into GEN_MIX_LANES independent partial sums, which lets the
+ * compiler vectorize the RMS without -ffast-math.  The audio is
+ * bit-identical to the separate mix / limiter_process / RMS passes; only
+ * the RMS summation order differs.
+ */
+
+#define GEN_MIX_TILE  256u
+#define GEN_MIX_LANES 8u
+
+static void mix_tile(float32_t *restrict L, float32_t *restrict R,
+                     const float32_t *restrict Ld, const float32_t *restrict Rd,
+                     const float32_t *restrict Ls, const float32_t *restrict Rs, uint32_t n)
+{
+    if(Ld && Ls){
+        for(uint32_t i = 0; i < n; i++){
+            L[i] = Ld[i] + Ls[i];
+            R[i] = Rd[i] + Rs[i];
+        }
+    } else if(Ld){
+        memcpy(L, Ld, n * sizeof(float32_t));
+        memcpy(R, Rd, n * sizeof(float32_t));
+    } else {
+        memcpy(L, Ls, n * sizeof(float32_t));
+        memcpy(R, Rs, n * sizeof(float32_t));
+    }
+}
+
+float generator_postmix(limiter_t *lim, limiter_lookahead_t *la, float32_t *L, float32_t *R,
+                        const float32_t *Ld, const float32_t *Rd,
+                        const float32_t *Ls, const float32_t *Rs, uint32_t num_frames)
+{
+    float32_t acc[GEN_MIX_LANES] = { 0 };
+
+    for(uint32_t off = 0; off < num_frames; off += GEN_MIX_TILE){
+        uint32_t n = num_frames - off < GEN_MIX_TILE ? num_frames - off : GEN_MIX_TILE;
+        float32_t *tl = L + off, *tr = R + off;
+
+        mix_tile(tl, tr, Ld ? Ld + off : NULL, Rd ? Rd + off : NULL,
+                         Ls ? Ls + off : NULL, Rs ? Rs + off : NULL, n);
+        if(la) limiter_lookahead_process(la, tl, tr, n);
+        else   limiter_process(lim, tl, tr, n);
+
+        uint32_t i = 0;
+        for(; i + GEN_MIX_LANES <= n; i += GEN_MIX_LANES){
+            for(uint32_t k = 0; k < GEN_MIX_LANES; k++)
+                acc[k] += tl[i+k] * tl[i+k] + tr[i+k] * tr[i+k];
+        }
+        for(; i < n; i++) acc[0] += tl[i] * tl[i] + tr[i] * tr[i];
+    }
+
+    float32_t sum = 0.0f;
+    for(uint32_t k = 0; k < GEN_MIX_LANES; k++) sum += acc[k];
+    return sqrtf(sum / (float32_t)(num_frames * 2));
+}
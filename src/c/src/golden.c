@@ -0,0 +1,274 @@
+/* golden – render-regression digests for a range of seeds.
+ *
+ * Renders one segment per seed (what bin/segment writes) and writes one
+ * tab-separated line per seed:
+ *
+ *   seed  paths  frames  coarse  s0 s1 s2 ...
+ *
+ * `coarse` digests the whole render and s0, s1, ... each second of it, so
+ * a mismatch against a stored line says which second drifted first.  The
+ * samples are digested the way tests/hash_wav.py's coarse mode sees a WAV:
+ * converted to int16 by wav_writer's own wav_convert_s16, with the 4 LSBs
+ * dropped – then
+ * FNV-1a 64 over the 16-bit words (tools/golden.py computes the same from
+ * a WAV file).  `paths` is a bit set of the code paths the seed exercised,
+ * collected from its note events (gen_event.h): bits 0-6 the voices
+ * (GEN_VOICE_*), 8-11 the mid FM presets, 12-14 the bass FM presets, so a
+ * verifier can re-render only the seeds a change can affect.
+ *
+ * Seeds are split across threads in fixed chunks; lines come out in seed
+ * order whatever the thread count.  The first line is a comment with the
+ * build options that change the audio.
+ *
+ * Usage: bin/golden [--start S] [--count N] [--stride K] [--seeds FILE|-]
+ *                   [--threads T] [--out golden.tsv]
+ */
+#define _POSIX_C_SOURCE 199309L
+#include "generator.h"
+#include "wav_writer.h"
+#include <pthread.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define GOLDEN_BLOCK       1024u
+#define GOLDEN_CHUNK       256u
+#define GOLDEN_MAX_THREADS 64u
+#define GOLDEN_MAX_SECONDS 64u
+
+#define FNV_OFFSET 0xcbf29ce484222325ull
+#define FNV_PRIME  0x100000001b3ull
+
+typedef struct {
+    uint64_t seed;
+    uint32_t paths;
+    uint32_t frames;
+    uint64_t coarse;
+    uint32_t nsec;
+    uint64_t sec[GOLDEN_MAX_SECONDS];
+} golden_rec_t;
+
+typedef struct {
+    const uint64_t *seeds;
+    golden_rec_t *out;
+    uint32_t count;
+} golden_job_t;
+
+static inline uint64_t fnv_word(uint64_t h, int16_t s)
+{
+    uint16_t w = (uint16_t)s & 0xFFF0u;
+    return (h ^ w) * FNV_PRIME;
+}
+
+static uint32_t event_paths(const gen_event_t *e)
+{
+    uint32_t bits = 1u << e->voice;
+    if(e->voice == GEN_EV_MID_FM)  bits |= 1u << (8 + (e->preset & 3));
+    if(e->voice == GEN_EV_BASS_FM) bits |= 1u << (12 + (e->preset % 3));
+    return bits;
+}
+
+static void render_seed(generator_t *g, gen_event_ring_t *ring, uint64_t seed, golden_rec_t *r)
+{
+    static _Thread_local float L[GOLDEN_BLOCK], R[GOLDEN_BLOCK];
+    static _Thread_local int16_t sL[GOLDEN_BLOCK], sR[GOLDEN_BLOCK];
+    generator_init(g, seed);
+    gen_event_ring_init(ring);
+    gen_event_reader_t rd;
+    gen_event_reader_init(&rd, ring);
+    generator_set_event_ring(g, ring);
+
+    memset(r, 0, sizeof(*r));
+    r->seed = seed;
+    r->frames = g->mt.seg_frames;
+    r->coarse = FNV_OFFSET;
+    uint64_t sec = FNV_OFFSET;
+    uint32_t in_sec = 0;
+    for(uint32_t done = 0; done < r->frames; ){
+        uint32_t n = r->frames - done < GOLDEN_BLOCK ? r->frames - done : GOLDEN_BLOCK;
+        generator_process(g, L, R, n);
+        wav_convert_s16(L, sL, n);
+        wav_convert_s16(R, sR, n);
+        for(uint32_t i = 0; i < n; i++){
+            uint64_t c = r->coarse;
+            c = fnv_word(c, sL[i]); sec = fnv_word(sec, sL[i]);
+            c = fnv_word(c, sR[i]); sec = fnv_word(sec, sR[i]);
+            r->coarse = c;
+            if(++in_sec == SR){
+                if(r->nsec < GOLDEN_MAX_SECONDS) r->sec[r->nsec++] = sec;
+                sec = FNV_OFFSET;
+                in_sec = 0;
+            }
+        }
+        gen_event_t ev[64];
+        uint32_t got;
+        while((got = gen_event_read(ring, &rd, ev, 64)) > 0)
+            for(uint32_t i = 0; i < got; i++) r->paths |= event_paths(&ev[i]);
+        done += n;
+    }
+    if(in_sec && r->nsec < GOLDEN_MAX_SECONDS) r->sec[r->nsec++] = sec;  /* partial last second */
+}
+
+static void *golden_worker(void *arg)
+{
+    const golden_job_t *job = arg;
+    generator_t *g = malloc(sizeof(generator_t));
+    gen_event_ring_t *ring = malloc(sizeof(gen_event_ring_t));
+    if(!g || !ring){
+        fprintf(stderr, "golden: out of memory\n");
+        exit(1);
+    }
+    for(uint32_t i = 0; i < job->count; i++) render_seed(g, ring, job->seeds[i], &job->out[i]);
+    free(g);
+    free(ring);
+    return NULL;
+}
+
+static void print_config(FILE *f)
+{
+    fprintf(f, "# config");
+#ifdef FM_VOICE_FAST
+    fprintf(f, " FM_FAST=1");
+#endif
+#ifdef NOISE_FAST
+    fprintf(f, " NOISE_FAST=1");
+#endif
+#ifdef OSC_BANDLIMITED
+    fprintf(f, " OSC_BL=1");
+#endif
+    fprintf(f, " LOOKAHEAD_MS=%g", (double)GEN_LIMITER_LOOKAHEAD_MS);
+#ifdef GENERATOR_ASM
+    fprintf(f, " GENERATOR_ASM");
+#endif
+#ifdef KICK_ASM
+    fprintf(f, " KICK_ASM");
+#endif
+#ifdef SNARE_ASM
+    fprintf(f, " SNARE_ASM");
+#endif
+#ifdef HAT_ASM
+    fprintf(f, " HAT_ASM");
+#endif
+#ifdef MELODY_ASM
+    fprintf(f, " MELODY_ASM");
+#endif
+#ifdef DELAY_ASM
+    fprintf(f, " DELAY_ASM");
+#endif
+    fprintf(f, "\n");
+}
+
+static void print_rec(FILE *f, const golden_rec_t *r)
+{
+    fprintf(f, "0x%016llx\t0x%04x\t%u\t%016llx", (unsigned long long)r->seed, r->paths, r->frames,
+            (unsigned long long)r->coarse);
+    for(uint32_t s = 0; s < r->nsec; s++) fprintf(f, "\t%016llx", (unsigned long long)r->sec[s]);
+    fputc('\n', f);
+}
+
+/* Seeds from a file, one per line (decimal or 0x hex, '#' comments). */
+static uint64_t *read_seeds(const char *path, uint64_t *count)
+{
+    FILE *f = strcmp(path, "-") == 0 ? stdin : fopen(path, "r");
+    if(!f){ perror(path); return NULL; }
+    uint64_t n = 0, cap = 1024;
+    uint64_t *seeds = malloc(cap * sizeof(uint64_t));
+    char line[256];
+    while(seeds && fgets(line, sizeof(line), f)){
+        char *p = line;
+        while(*p == ' ' || *p == '\t') p++;
+        if(*p == '#' || *p == '\n' || *p == '\0') continue;
+        if(n == cap){
+            uint64_t *grown = realloc(seeds, (cap *= 2) * sizeof(uint64_t));
+            if(!grown){ free(seeds); seeds = NULL; break; }
+            seeds = grown;
+        }
+        seeds[n++] = strtoull(p, NULL, 0);
+    }
+    if(f != stdin) fclose(f);
+    if(!seeds) fprintf(stderr, "golden: out of memory\n");
+    *count = n;
+    return seeds;
+}
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static void usage(const char *argv0)
+{
+    fprintf(stderr, "usage: %s [--start S] [--count N] [--stride K] [--seeds FILE|-] [--threads T] [--out golden.tsv]\n", argv0);
+}
+
+int main(int argc, char **argv)
+{
+    uint64_t start = 0, stride = 1, count = 1000;
+    uint32_t threads = 4;
+    const char *out = "golden.tsv", *seeds_path = NULL;
+
+    for(int i = 1; i < argc; i++){
+        const char *a = argv[i];
+        const char *v = (i + 1 < argc) ? argv[i + 1] : NULL;
+        if(!v){ usage(argv[0]); return 2; }
+        if     (strcmp(a, "--start") == 0)   start = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--count") == 0)   count = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--stride") == 0)  stride = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--seeds") == 0)   seeds_path = v;
+        else if(strcmp(a, "--threads") == 0) threads = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--out") == 0)     out = v;
+        else { usage(argv[0]); return 2; }
+        i++;
+    }
+    if(threads == 0 || threads > GOLDEN_MAX_THREADS){
+        usage(argv[0]);
+        return 2;
+    }
+
+    uint64_t *seeds;
+    if(seeds_path){
+        seeds = read_seeds(seeds_path, &count);
+        if(!seeds) return 1;
+    } else {
+        seeds = malloc((count ? count : 1) * sizeof(uint64_t));
+        if(!seeds){ fprintf(stderr, "golden: out of memory\n"); return 1; }
+        for(uint64_t i = 0; i < count; i++) seeds[i] = start + i * stride;
+    }
+
+    FILE *f = fopen(out, "w");
+    if(!f){ perror(out); free(seeds); return 1; }
+    golden_rec_t *recs = malloc(sizeof(golden_rec_t) * GOLDEN_CHUNK);
+    if(!recs){ fprintf(stderr, "golden: out of memory\n"); free(seeds); return 1; }
+
+    print_config(f);
+    fprintf(f, "# seed\tpaths\tframes\tcoarse\tper-second...\n");
+    double t0 = now_sec();
+    pthread_t tid[GOLDEN_MAX_THREADS];
+    golden_job_t job[GOLDEN_MAX_THREADS];
+    int spawned[GOLDEN_MAX_THREADS];
+    for(uint64_t done = 0; done < count; ){
+        uint32_t n = count - done < GOLDEN_CHUNK ? (uint32_t)(count - done) : GOLDEN_CHUNK;
+        uint32_t per = (n + threads - 1) / threads, used = 0;
+        for(uint32_t t = 0; t < threads && t * per < n; t++, used++){
+            uint32_t lo = t * per;
+            job[t] = (golden_job_t){ seeds + done + lo, recs + lo, n - lo < per ? n - lo : per };
+            spawned[t] = pthread_create(&tid[t], NULL, golden_worker, &job[t]) == 0;
+            if(!spawned[t]) golden_worker(&job[t]);
+        }
+        for(uint32_t t = 0; t < used; t++)
+            if(spawned[t]) pthread_join(tid[t], NULL);
+        for(uint32_t i = 0; i < n; i++) print_rec(f, &recs[i]);
+        done += n;
+    }
+    double dt = now_sec() - t0;
+    free(recs);
+    free(seeds);
+    if(fclose(f) != 0){ perror(out); return 1; }
+
+    fprintf(stderr, "golden: %llu seeds in %.1f s (%.1f seeds/s, %u threads)\n",
+            (unsigned long long)count, dt, dt > 0.0 ? (double)count / dt : 0.0, threads);
+    return 0;
+}
@@ -1,4 +1,5 @@
 #include "hat.h"
+#include "noise.h"
 #include <math.h>
 
 #define HAT_DECAY_RATE 120.0f
@@ -22,18 +23,34 @@ void hat_trigger(hat_t *h)
 }
 
 #ifndef HAT_ASM
+/* Noise comes from a precomputed NOISE_FILL block; the stream is rewound to
+ * the samples actually used when the envelope cuts the hit short.  With
+ * the default noise_block the output matches the per-sample
+ * rng_float_mono() loop exactly. */
 void hat_process(hat_t *h, float32_t *L, float32_t *R, uint32_t n)
 {
-    if (h->pos >= h->len) return;
-    for(uint32_t i=0;i<n;++i){
-        if(h->pos >= h->len) break;
-        h->env *= h->env_coef;
-        float32_t noise = rng_float_mono(&h->rng);
-        float32_t sample = noise * h->env * HAT_AMP;
-        L[i] += sample;
-        R[i] += sample;
-        if (h->env < 1e-5f) { h->pos = h->len; break; }
-        h->pos++;
+    float32_t noise[NOISE_CHUNK];
+    uint32_t i = 0;
+    while (i < n && h->pos < h->len) {
+        uint32_t m = n - i;
+        if (m > h->len - h->pos) m = h->len - h->pos;
+        if (m > NOISE_CHUNK) m = NOISE_CHUNK;
+        rng_t start = h->rng;
+        NOISE_FILL(&h->rng, noise, m);
+
+        float32_t env = h->env, coef = h->env_coef;
+        uint32_t k = 0;
+        for (; k < m; ++k) {
+            env *= coef;
+            float32_t sample = env * noise[k] * HAT_AMP;
+            L[i + k] += sample;
+            R[i + k] += sample;
+            if (env < 1e-5f) { ++k; h->pos = h->len; break; }
+        }
+        h->env = env;
+        if (h->pos < h->len) h->pos += k;
+        if (k < m) { h->rng = start; rng_skip(&h->rng, k); }
+        i += k;
     }
 }
 #endif // HAT_ASM 
\ No newline at end of file
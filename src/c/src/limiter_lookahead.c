@@ -0,0 +1,99 @@
+#include "limiter.h"
+#include "fast_math.h"
+#include <string.h>
+
+/* Kept apart from limiter.c, which is dropped when limiter.s is linked. */
+
+#define DB_PER_LOG2 6.02059991f   /* 20 * log10(2) */
+
+/* ?: rather than fminf/fmaxf: without -ffinite-math-only the libm calls
+ * keep their NaN semantics and block vectorization, these map to min/max. */
+static inline float32_t minf(float32_t a, float32_t b) { return a < b ? a : b; }
+static inline float32_t maxf(float32_t a, float32_t b) { return a > b ? a : b; }
+
+void limiter_lookahead_init(limiter_lookahead_t *l, float32_t sr, float32_t lookahead_ms,
+                            float32_t release_ms, float32_t threshold_db, float32_t knee_db)
+{
+    memset(l, 0, sizeof(*l));
+    float32_t la = lookahead_ms * sr / 1000.0f + 0.5f;
+    l->lookahead = la < 1.0f ? 1u : la > (float32_t)LIMITER_MAX_LOOKAHEAD ? LIMITER_MAX_LOOKAHEAD : (uint32_t)la;
+    l->threshold_db = threshold_db;
+    l->knee_db = knee_db > 1e-3f ? knee_db : 1e-3f;
+    l->release_coeff = expf(-1.0f / (release_ms * sr / 1000.0f));
+    l->gain = 1.0f;
+}
+
+/* Pass 1: push the tile through the delay line and record, per output
+ * sample, the peak over the window that ends at the newest input. */
+static void window_peaks(limiter_lookahead_t *l, float32_t *L, float32_t *R, float32_t *peak, uint32_t n)
+{
+    const uint32_t mask = LIMITER_DEQUE_SIZE - 1u;
+    const uint32_t D = l->lookahead;
+    uint32_t head = l->dq_head, tail = l->dq_tail, t = l->t, pos = l->pos;
+
+    for(uint32_t i = 0; i < n; i++, t++){
+        float32_t p = fmaxf(fabsf(L[i]), fabsf(R[i]));
+        while(tail != head && l->dq_peak[(tail - 1u) & mask] <= p) tail--;
+        l->dq_idx[tail & mask] = t;
+        l->dq_peak[tail & mask] = p;
+        tail++;
+        if(t - l->dq_idx[head & mask] > D) head++;   /* front fell out of [t-D, t] */
+        peak[i] = l->dq_peak[head & mask];
+
+        float32_t oL = l->delay_L[pos], oR = l->delay_R[pos];
+        l->delay_L[pos] = L[i];
+        l->delay_R[pos] = R[i];
+        L[i] = oL;
+        R[i] = oR;
+        pos = (pos + 1u == D) ? 0u : pos + 1u;
+    }
+    l->dq_head = head;
+    l->dq_tail = tail;
+    l->t = t;
+    l->pos = pos;
+}
+
+/* Pass 2: soft-knee target gain from the window peak, in place. */
+static void knee_gain(const limiter_lookahead_t *l, float32_t *restrict g, uint32_t n)
+{
+    const float32_t thr = l->threshold_db;
+    const float32_t W = l->knee_db;
+    const float32_t inv_2w = 0.5f / W;
+    for(uint32_t i = 0; i < n; i++){
+        float32_t over = DB_PER_LOG2 * fast_log2f(maxf(g[i], 1e-20f)) - thr;
+        float32_t x = minf(maxf(over + 0.5f * W, 0.0f), W);
+        float32_t red = x * x * inv_2w + maxf(over - 0.5f * W, 0.0f);
+        g[i] = fast_exp2f(-red * (1.0f / DB_PER_LOG2));
+    }
+}
+
+static void apply_gain(float32_t *restrict L, float32_t *restrict R, const float32_t *restrict g, uint32_t n)
+{
+    for(uint32_t i = 0; i < n; i++){
+        L[i] *= g[i];
+        R[i] *= g[i];
+    }
+}
+
+void limiter_lookahead_process(limiter_lookahead_t *l, float32_t *L, float32_t *R, uint32_t n)
+{
+    float32_t *g = l->gain_buf;
+    for(uint32_t off = 0; off < n; off += LIMITER_LA_TILE){
+        uint32_t c = n - off < LIMITER_LA_TILE ? n - off : LIMITER_LA_TILE;
+        float32_t *tl = L + off, *tr = R + off;
+
+        window_peaks(l, tl, tr, g, c);
+        knee_gain(l, g, c);
+
+        /* Pass 3: instant attack (the window already anticipates the peak),
+         * one-pole release – min() instead of a branch. */
+        float32_t gs = l->gain, rel = l->release_coeff;
+        for(uint32_t i = 0; i < c; i++){
+            gs = minf(g[i], g[i] + rel * (gs - g[i]));
+            g[i] = gs;
+        }
+        l->gain = gs;
+
+        apply_gain(tl, tr, g, c);   /* Pass 4 */
+    }
+}
@@ -1,156 +1,148 @@
-#include "coreaudio.h"
+#include "audio_backend.h"
 #include "generator.h"
+#include "render_thread.h"
 #include "video.h"
-#include "raster.h"
-#include "terrain.h"
+#include "vis_scene.h"
 #include "particles.h"
-#include "shapes.h"
-#include "crt_fx.h"
+#include "trace.h"
 #include <stdio.h>
 #include <unistd.h> // for sleep
 #include <stdlib.h> // for strtoull
 #include <stdbool.h>
+#include <string.h>
 #include <math.h>
 
+#define AUDIO_BLOCK   512
+#define BLOCKS_AHEAD  4   /* render-ahead depth of the audio ring */
+
 static generator_t g_generator;
+static render_thread_t g_render;
+static vis_queue_t g_vis;
 
+/* The generator runs on the render thread; the callback only copies. */
 void audio_render_callback(float* buffer, uint32_t num_frames, void* user_data)
 {
-    float L[num_frames], R[num_frames];
-    generator_process(&g_generator, L, R, num_frames);
-    for(uint32_t i=0; i<num_frames; ++i){
-        buffer[i*2]   = L[i];
-        buffer[i*2+1] = R[i];
-    }
+    (void)user_data;
+    render_thread_pull(&g_render, buffer, num_frames);
 }
 
 int main(int argc, char **argv)
 {
     uint64_t seed = 0xCAFEBABEULL;
-    if(argc > 1) {
-        seed = strtoull(argv[1], NULL, 0);
+    const char *audio_name = NULL;  /* --audio coreaudio|null (default: platform) */
+    audio_null_opts_t null_opts = { NULL, 1.0f };
+    bool full_redraw = false;       /* --full-redraw: no dirty-tile tracking */
+    long ncpu = sysconf(_SC_NPROCESSORS_ONLN);
+    int threads = ncpu > 0 ? (int)ncpu : 1;  /* --threads N: band-parallel frames */
+    int width = 800, height = 600, fps = 30; /* --size WxH, --fps N */
+    int max_particles = PARTICLES_DEFAULT_CAPACITY; /* --particles N: glyph pool size */
+    for(int i = 1; i < argc; i++){
+        if(strcmp(argv[i], "--audio") == 0 && i + 1 < argc)      audio_name = argv[++i];
+        else if(strcmp(argv[i], "--wav") == 0 && i + 1 < argc)   null_opts.wav_path = argv[++i];
+        else if(strcmp(argv[i], "--full-redraw") == 0)           full_redraw = true;
+        else if(strcmp(argv[i], "--threads") == 0 && i + 1 < argc) threads = atoi(argv[++i]);
+        else if(strcmp(argv[i], "--fps") == 0 && i + 1 < argc)   fps = atoi(argv[++i]);
+        else if(strcmp(argv[i], "--particles") == 0 && i + 1 < argc) max_particles = atoi(argv[++i]);
+        else if(strcmp(argv[i], "--size") == 0 && i + 1 < argc){
+            if(sscanf(argv[++i], "%dx%d", &width, &height) != 2 || width <= 0 || height <= 0){
+                fprintf(stderr, "Bad --size '%s' (want WxH)\n", argv[i]);
+                return 1;
+            }
+        }
+        else seed = strtoull(argv[i], NULL, 0);
     }
 
+    const audio_backend_t *ab = audio_backend_find(audio_name);
+    if(!ab){
+        fprintf(stderr, "Unknown audio backend '%s'\n", audio_name);
+        return 1;
+    }
+    audio_null_configure(&null_opts);
+
     generator_init(&g_generator, seed);
-    terrain_init(seed);
-    particles_init();
-    shapes_init();
 
-    /* init CRT effects */
-    crt_fx_t crt_fx;
-    crt_fx_init(&crt_fx, seed, 800, 600);
+    /* scene: terrain, particles, shapes and CRT effects */
+    static vis_scene_t scene;
+    if(vis_scene_init(&scene, seed, width, height, !full_redraw) != 0
+       || vis_scene_set_threads(&scene, threads) != 0
+       || particles_set_capacity(max_particles) != 0){
+        fprintf(stderr, "Scene init failed\n");
+        return 1;
+    }
+    const crt_fx_t *crt_fx = &scene.fx;
 
-    if(audio_init(SR, 512, audio_render_callback, NULL) != 0){
+    vis_queue_init(&g_vis);
+    if(render_thread_start(&g_render, &g_generator, &g_vis, AUDIO_BLOCK, BLOCKS_AHEAD) != 0){
+        fprintf(stderr, "Render thread start failed\n");
+        return 1;
+    }
+    if(ab->init(SR, AUDIO_BLOCK, audio_render_callback, NULL) != 0){
         fprintf(stderr, "Audio init failed\n");
         return 1;
     }
 
-    printf("Playing with seed 0x%llx. Close the window to quit.\n", (unsigned long long)seed);
+    printf("Playing with seed 0x%llx via %s audio. Close the window to quit.\n",
+           (unsigned long long)seed, ab->name);
+    printf("Video: %dx%d @ %d fps, %d render thread%s, %s\n", width, height, fps,
+           scene.threads, scene.threads == 1 ? "" : "s", full_redraw ? "full redraw" : "dirty tiles");
 
     /* show CRT effect levels */
     printf("CRT FX: persist=%.2f, scan=%d, chroma=%d, noise=%d\n",
-           crt_fx.persistence, crt_fx.scanline_alpha, crt_fx.chroma_shift, crt_fx.noise_pixels);
+           crt_fx->persistence, crt_fx->scanline_alpha, crt_fx->chroma_shift, crt_fx->noise_pixels);
     printf("        jitter=%.1f, drops=%.2f, bleed=%.2f\n",
-           crt_fx.jitter_amount, crt_fx.frame_drop_chance, crt_fx.color_bleed);
+           crt_fx->jitter_amount, crt_fx->frame_drop_chance, crt_fx->color_bleed);
 
     /* --- Start audio & video --- */
-    audio_start();
-    if(video_init(800, 600, 30, true) != 0){
+    ab->start();
+    if(video_init(width, height, fps, true) != 0){
         fprintf(stderr, "Video init failed\n");
         return 1;
     }
 
     bool running = true;
     uint32_t *fb = video_get_framebuffer();
-    int vw = video_get_width();
-    int vh = video_get_height();
-    float base_hue = 0.0f;
-    float angle=0.0f;
-    int frame=0;
+    float level = 0.0f; /* block RMS 0..1, from VIS_RMS events */
     while(running){
         running = video_frame_begin();
-        /* clear */
-        raster_clear(fb, vw, vh, 0x000000FF); /* black, alpha 255 */
-
-        /* orbiting circle driven by RMS */
-        float level = g_block_rms; /* 0..1 */
-        int radius = 30 + (int)(80.0f * level);
-        int cx = vw/2 + (int)(cosf(angle)* (vw/4));
-        int cy = vh/2 + (int)(sinf(angle)* (vh/4));
-        /* filled circle background */
-        raster_fill_circle(fb, vw, vh, cx, cy, radius, 0x005500FF);
-        /* outlined ring */
-        raster_circle(fb, vw, vh, cx, cy, radius+10, 0x00FF00FF, 4);
-
-        /* draw scrolling floor */
-        terrain_draw(fb, vw, vh, frame);
-
-        /* bass hit shapes (behind floor) */
-        shapes_update_and_draw(fb, vw, vh);
-
-        /* spawn particles on saw hits */
-        if(g_generator.saw_hit){
-            float cx = vw * 0.3f + (rand() % (int)(vw * 0.4f));
-            float cy = vh * 0.2f + (rand() % (int)(vh * 0.3f));
-            /* color with slight hue variation from base */
-            float hue = (float)(rand() % 360) / 360.0f;
-            uint8_t r = (uint8_t)(127 + 127 * cosf(hue * 2 * M_PI));
-            uint8_t g = (uint8_t)(127 + 127 * cosf((hue + 0.33f) * 2 * M_PI));
-            uint8_t b = (uint8_t)(127 + 127 * cosf((hue + 0.66f) * 2 * M_PI));
-            uint32_t color = (r << 24) | (g << 16) | (b << 8) | 0xFF;
-            particles_spawn_burst(cx, cy, 20, color);
-        }
-
-        /* spawn bass shapes on bass hits */
-        if(g_generator.bass_hit){
-            shape_type_t types[] = {SHAPE_TRIANGLE, SHAPE_DIAMOND, SHAPE_HEXAGON, SHAPE_STAR, SHAPE_SQUARE};
-            shape_type_t type = types[rand() % 5];
-            /* color variation */
-            float hue = (float)(rand() % 360) / 360.0f;
-            uint8_t r = (uint8_t)(200 + 55 * cosf(hue * 2 * M_PI));
-            uint8_t g = (uint8_t)(200 + 55 * cosf((hue + 0.33f) * 2 * M_PI));
-            uint8_t b = (uint8_t)(200 + 55 * cosf((hue + 0.66f) * 2 * M_PI));
-            uint32_t color = (r << 24) | (g << 16) | (b << 8) | 0xFF;
-            shapes_spawn(type, color);
-        }
 
-        particles_update_and_draw(fb, vw, vh);
-
-        /* apply CRT post-processing effects */
-        crt_fx_apply(&crt_fx, fb, vw, vh, frame);
-
-        /* jitter effect (screen shake) */
-        if(crt_fx.jitter_amount > 0.01f && (rand() % 100) < 30){
-            int jx = (int)(-crt_fx.jitter_amount + (rand() % (int)(crt_fx.jitter_amount * 2)));
-            int jy = (int)(-crt_fx.jitter_amount + (rand() % (int)(crt_fx.jitter_amount * 2)));
-            /* shift framebuffer content */
-            uint32_t *temp = (uint32_t*)malloc(vw * vh * sizeof(uint32_t));
-            memcpy(temp, fb, vw * vh * sizeof(uint32_t));
-            raster_clear(fb, vw, vh, 0x000000FF);
-            for(int y = 0; y < vh; y++){
-                for(int x = 0; x < vw; x++){
-                    int src_x = x - jx;
-                    int src_y = y - jy;
-                    if(src_x >= 0 && src_x < vw && src_y >= 0 && src_y < vh){
-                        fb[y * vw + x] = temp[src_y * vw + src_x];
-                    }
-                }
+        /* collect every visual event whose audio has been played by now */
+        int saw_hits = 0, bass_hits = 0;
+        vis_event_t ev;
+        while(vis_queue_pop(&g_vis, render_thread_played(&g_render), &ev)){
+            switch(ev.type){
+                case VIS_SAW_HIT:  saw_hits++; break;
+                case VIS_BASS_HIT: bass_hits++; break;
+                case VIS_RMS:      level = ev.value; break;
             }
-            free(temp);
         }
 
-        angle += 0.02f;
+        vis_scene_render(&scene, fb, level, saw_hits, bass_hits);
 
         /* frame drop effect (skip presenting occasionally) */
-        if(crt_fx.frame_drop_chance < 0.01f || (rand() % 1000) > (int)(crt_fx.frame_drop_chance * 1000)){
-            video_frame_end();
+        if(crt_fx->frame_drop_chance < 0.01f || (rand() % 1000) > (int)(crt_fx->frame_drop_chance * 1000)){
+            if(scene.track_damage){
+                raster_damage_build(&scene.present);
+                video_frame_end_damage(&scene.present, scene.jitter_x, scene.jitter_y);
+            } else {
+                video_frame_end_damage(NULL, scene.jitter_x, scene.jitter_y);
+            }
+            vis_scene_presented(&scene);
         }
-
-        frame++;
     }
 
     video_shutdown();
-    crt_fx_cleanup(&crt_fx);
-    audio_stop();
+    vis_scene_free(&scene);
+    ab->stop();
+    render_thread_stop(&g_render);
+    if(atomic_load(&g_render.underruns))
+        printf("render thread: %llu underruns\n", (unsigned long long)atomic_load(&g_render.underruns));
+    if(ab->get_stats){
+        audio_stats_t st;
+        ab->get_stats(&st);
+        audio_stats_print(stdout, &st);
+    }
+#ifdef TRACE_ENABLED
+    trace_dump("realtime.trace");
+#endif
     return 0;
 } 
\ No newline at end of file
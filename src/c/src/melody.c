@@ -1,10 +1,19 @@
 #include "melody.h"
 #include <math.h>
 #include "env.h"
+#include "osc_bl.h"
 
 #define TAU 6.2831853071795864769f
 #define MELODY_DECAY_RATE 5.0f
 #define MELODY_MAX_SEC 2.0f
+#define MELODY_TILE 256u
+#define MELODY_LANES 8u
+
+#ifdef NO_MID_FM
+#define MELODY_GAIN 0.15f
+#else
+#define MELODY_GAIN 0.25f
+#endif
 
 void melody_init(melody_t *m, float32_t sr)
 {
@@ -24,7 +33,49 @@ void melody_trigger(melody_t *m, float32_t freq, float32_t dur_sec)
     m->pos = 0;
 }
 
+/* Band-limited melody: PolyBLEP saw on the fixed-point phase, and the
+ * envelope as a multiplicative recurrence (one expf per call to anchor it,
+ * MELODY_LANES interleaved chains so the tile loop vectorizes) instead of
+ * an expf and a divide per sample.  Same drive / soft clip and gain. */
+void melody_process_bl(melody_t *m, float32_t *L, float32_t *R, uint32_t n)
+{
+    if (m->pos >= m->len) return;
+    uint32_t todo = m->len - m->pos < n ? m->len - m->pos : n;
+    const uint32_t inc = osc_bl_inc(m->freq, m->sr);
+    const float32_t k = expf(-MELODY_DECAY_RATE / m->sr);
+
+    float32_t lane[MELODY_LANES], k_lanes = 1.0f;
+    lane[0] = env_exp_decay((float32_t)m->pos / m->sr, MELODY_DECAY_RATE) * MELODY_GAIN;
+    for(uint32_t j = 1; j < MELODY_LANES; j++) lane[j] = lane[j-1] * k;
+    for(uint32_t j = 0; j < MELODY_LANES; j++) k_lanes *= k;
+
+    float32_t saw[MELODY_TILE], env[MELODY_TILE];
+    for(uint32_t off = 0; off < todo; off += MELODY_TILE){
+        uint32_t c = todo - off < MELODY_TILE ? todo - off : MELODY_TILE;
+        osc_bl_saw(&m->osc.acc, saw, c, inc);
+        for(uint32_t i = 0; i < c; i += MELODY_LANES){
+            for(uint32_t j = 0; j < MELODY_LANES; j++){
+                env[i+j] = lane[j];
+                lane[j] *= k_lanes;
+            }
+        }
+        for(uint32_t i = 0; i < c; i++){
+            float32_t driven = 1.2f * saw[i];
+            float32_t s = (1.5f * driven - 0.5f * driven * driven * driven) * env[i];
+            L[off+i] += s;
+            R[off+i] += s;
+        }
+    }
+    m->pos += todo;
+}
+
 #ifndef MELODY_ASM
+#ifdef OSC_BANDLIMITED
+void melody_process(melody_t *m, float32_t *L, float32_t *R, uint32_t n)
+{
+    melody_process_bl(m, L, R, n);
+}
+#else
 void melody_process(melody_t *m, float32_t *L, float32_t *R, uint32_t n)
 {
     if (m->pos >= m->len) return;
@@ -41,11 +92,7 @@ void melody_process(melody_t *m, float32_t *L, float32_t *R, uint32_t n)
         float32_t saw = soft;
         float32_t t = (float32_t)m->pos / m->sr;
         float32_t env = env_exp_decay(t, MELODY_DECAY_RATE);
-#ifdef NO_MID_FM
-        float32_t sample = saw * env * 0.15f;
-#else
-        float32_t sample = saw * env * 0.25f; // scale down
-#endif
+        float32_t sample = saw * env * MELODY_GAIN; // scale down
         L[i]+=sample;
         R[i]+=sample;
         phase += phase_inc;
@@ -54,4 +101,5 @@ void melody_process(melody_t *m, float32_t *L, float32_t *R, uint32_t n)
     }
     m->osc.phase = phase;
 }
+#endif /* OSC_BANDLIMITED */
 #endif // MELODY_ASM 
\ No newline at end of file
@@ -2,9 +2,11 @@
 
 void noise_block(rng_t *rng, float *out, uint32_t n)
 {
+    uint64_t z = rng->state;
     for (uint32_t i = 0; i < n; ++i) {
-        // rng_next_float returns [0,1). Map to [-1,1)
-        float v = rng_next_float(rng) * 2.0f - 1.0f;
-        out[i] = v;
+        z += RNG_GAMMA;
+        // same mapping as rng_float_mono: 24-bit [0,1) -> [-1,1)
+        out[i] = ((uint32_t)rng_mix64(z) >> 8) * (1.0f / 16777216.0f) * 2.0f - 1.0f;
     }
-} 
\ No newline at end of file
+    rng->state = z;
+}
@@ -1,4 +1,5 @@
 #include "osc.h"
+#include "osc_bl.h"
 #include <math.h>
 
 #define TAU 6.28318530717958647692f
@@ -18,6 +19,12 @@ void osc_sine_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float3
 #endif
 
 #ifndef OSC_SHAPES_ASM
+#ifdef OSC_BANDLIMITED
+void osc_saw_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float32_t sr)
+{
+    osc_bl_saw_block(o, out, n, freq, sr);
+}
+#else
 void osc_saw_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float32_t sr)
 {
     const float32_t phase_inc = TAU * freq / sr;
@@ -30,7 +37,10 @@ void osc_saw_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float32
     }
     o->phase = ph;
 }
+#endif /* OSC_BANDLIMITED */
 
+/* Stays naive under OSC_BANDLIMITED: osc_bl_square_block is cleaner but
+ * slower (two residuals per sample, see bench_osc). */
 void osc_square_block(osc_t *o, float32_t *out, uint32_t n, float32_t freq, float32_t sr)
 {
     const float32_t phase_inc = TAU * freq / sr;
@@ -1,3 +1,4 @@
+#define _DEFAULT_SOURCE   /* M_PI from <math.h> under -std=c11 on glibc */
 #include "particles.h"
 #include "raster.h"
 #include <stdlib.h>
@@ -58,36 +59,115 @@ static const uint8_t FONT_5X7[][7] = {
 
 static const char GLYPH_SET[] = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*+-=?";
 
-static void draw_glyph(uint32_t *fb,int w,int h,int x,int y,uint8_t glyph_idx,uint32_t color)
+#define NUM_GLYPHS ((int)(sizeof(FONT_5X7)/sizeof(FONT_5X7[0])))
+#define GLYPH_W 5
+#define GLYPH_H 7
+
+/* Glyph atlas: each bitmap row expanded once into its horizontal runs
+ * (a 5-bit row has at most three), so drawing a glyph is a few fills. */
+typedef struct {
+    uint8_t nruns;
+    uint8_t x0[3], x1[3];   /* run covers x0 <= col < x1 */
+} glyph_row_t;
+
+static glyph_row_t g_atlas[NUM_GLYPHS][GLYPH_H];
+static bool g_atlas_ready = false;
+
+static void build_atlas(void)
 {
-    if(glyph_idx >= sizeof(FONT_5X7)/sizeof(FONT_5X7[0])) return;
-    const uint8_t *bitmap = FONT_5X7[glyph_idx];
-    for(int row=0;row<7;row++){
-        uint8_t bits = bitmap[row];
-        for(int col=0;col<5;col++){
-            if(bits & (1<<(4-col))){
-                int px = x + col;
-                int py = y + row;
-                if((unsigned)px < (unsigned)w && (unsigned)py < (unsigned)h){
-                    fb[py*w + px] = color;
-                }
+    for(int gi=0;gi<NUM_GLYPHS;gi++){
+        for(int row=0;row<GLYPH_H;row++){
+            glyph_row_t *r = &g_atlas[gi][row];
+            uint8_t bits = FONT_5X7[gi][row];
+            r->nruns = 0;
+            for(int col=0;col<GLYPH_W;){
+                if(!(bits & (1<<(4-col)))){ col++; continue; }
+                int end = col;
+                while(end < GLYPH_W && (bits & (1<<(4-end)))) end++;
+                r->x0[r->nruns] = (uint8_t)col;
+                r->x1[r->nruns] = (uint8_t)end;
+                r->nruns++;
+                col = end;
             }
         }
     }
+    g_atlas_ready = true;
+}
+
+/* Clip the 5x7 cell once, then fill the atlas runs inside it. */
+static void draw_glyph(uint32_t *fb,int w,int lo,int hi,int x,int y,uint8_t glyph_idx,uint32_t color)
+{
+    if(glyph_idx >= NUM_GLYPHS) return;
+    int r0 = lo - y > 0 ? lo - y : 0;
+    int r1 = hi - y < GLYPH_H ? hi - y : GLYPH_H;
+    int c0 = -x > 0 ? -x : 0;
+    int c1 = w - x < GLYPH_W ? w - x : GLYPH_W;
+    if(r0 >= r1 || c0 >= c1) return;
+    raster_damage(x, y, x + GLYPH_W - 1, y + GLYPH_H - 1);
+    const glyph_row_t *rows = g_atlas[glyph_idx];
+    for(int row=r0;row<r1;row++){
+        const glyph_row_t *r = &rows[row];
+        uint32_t *dst = fb + (size_t)(y + row)*w + x;
+        for(int k=0;k<r->nruns;k++){
+            int a = r->x0[k] > c0 ? r->x0[k] : c0;
+            int b = r->x1[k] < c1 ? r->x1[k] : c1;
+            for(int col=a;col<b;col++) dst[col] = color;
+        }
+    }
 }
 
-static particle_t g_particles[MAX_PARTICLES];
+static particle_t *g_particles = NULL;
+static int g_capacity = PARTICLES_DEFAULT_CAPACITY;
 static int g_count=0;
 
-void particles_init(void){ g_count=0; }
+void particles_init(void)
+{
+    if(!g_atlas_ready) build_atlas();
+    if(!g_particles) g_particles = (particle_t*)malloc((size_t)g_capacity * sizeof(particle_t));
+    g_count=0;
+}
+
+int particles_set_capacity(int capacity)
+{
+    if(capacity < 1) return 1;
+    particle_t *p = (particle_t*)realloc(g_particles, (size_t)capacity * sizeof(particle_t));
+    if(!p) return 1;
+    g_particles = p;
+    g_capacity = capacity;
+    if(g_count > capacity) g_count = capacity;
+    return 0;
+}
+
+int particles_capacity(void){ return g_capacity; }
+int particles_count(void){ return g_count; }
+
+void particles_free(void)
+{
+    free(g_particles);
+    g_particles = NULL;
+    g_count = 0;
+}
+
+/* Faded colour for the particle's remaining life */
+static uint32_t fade(const particle_t *p)
+{
+    float alpha = (float)p->life / (float)p->max_life;
+    uint32_t r = (p->color >> 24) & 0xFF;
+    uint32_t g = (p->color >> 16) & 0xFF;
+    uint32_t b = (p->color >> 8) & 0xFF;
+    r = (uint32_t)(r * alpha);
+    g = (uint32_t)(g * alpha);
+    b = (uint32_t)(b * alpha);
+    return (r<<24)|(g<<16)|(b<<8)|0xFF;
+}
 
 void particles_spawn_burst(float x,float y,int count,uint32_t color)
 {
-    if(count<1) return;
-    if(count>MAX_PARTICLES) count = MAX_PARTICLES;
+    if(count<1 || !g_particles) return;
+    if(count>g_capacity) count = g_capacity;
     float angle_step = 2.0f * (float)M_PI / (float)count;
     for(int i=0;i<count;i++){
-        if(g_count>=MAX_PARTICLES) break;
+        if(g_count>=g_capacity) break;
         float ang = i * angle_step;
         particle_t *p = &g_particles[g_count++];
         p->x = x; p->y=y;
@@ -98,14 +178,16 @@ void particles_spawn_burst(float x,float y,int count,uint32_t color)
         p->max_life = p->life;
         p->color = color;
         p->glyph = (uint8_t)(rand() % strlen(GLYPH_SET));
+        p->shade = fade(p);
+        p->sx = (int)p->x - 2;
+        p->sy = (int)p->y - 3;
     }
 }
 
-void particles_update_and_draw(uint32_t *fb,int w,int h)
+void particles_update(int w,int h)
 {
     for(int i=0;i<g_count;){
         particle_t *p = &g_particles[i];
-        /* update */
         p->x += p->vx;
         p->y += p->vy;
         p->vy += 0.1f; /* gravity */
@@ -115,18 +197,28 @@ void particles_update_and_draw(uint32_t *fb,int w,int h)
             g_particles[i] = g_particles[--g_count];
             continue;
         }
-        /* fade alpha based on life */
-        float alpha = (float)p->life / (float)p->max_life;
-        uint32_t r = (p->color >> 24) & 0xFF;
-        uint32_t g = (p->color >> 16) & 0xFF;
-        uint32_t b = (p->color >> 8) & 0xFF;
-        r = (uint32_t)(r * alpha);
-        g = (uint32_t)(g * alpha);
-        b = (uint32_t)(b * alpha);
-        uint32_t faded_color = (r<<24)|(g<<16)|(b<<8)|0xFF;
-        
-        /* draw glyph */
-        draw_glyph(fb,w,h,(int)p->x-2,(int)p->y-3,p->glyph,faded_color);
+        /* fade and sprite position once per frame, not once per band */
+        p->shade = fade(p);
+        p->sx = (int)p->x - 2;
+        p->sy = (int)p->y - 3;
         ++i;
     }
-} 
\ No newline at end of file
+}
+
+/* Draw only: safe to call from several threads with different raster rows */
+void particles_draw(uint32_t *fb,int w,int h)
+{
+    int lo, hi;
+    raster_clip_rows(h, &lo, &hi);
+    for(int i=0;i<g_count;i++){
+        const particle_t *p = &g_particles[i];
+        if(p->sy + GLYPH_H <= lo || p->sy >= hi) continue;
+        draw_glyph(fb,w,lo,hi,p->sx,p->sy,p->glyph,p->shade);
+    }
+}
+
+void particles_update_and_draw(uint32_t *fb,int w,int h)
+{
+    particles_update(w,h);
+    particles_draw(fb,w,h);
+}
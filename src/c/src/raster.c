@@ -1,41 +1,246 @@
 #include "raster.h"
+#include <limits.h>
 #include <math.h>
 #include <stdlib.h>
 #include <string.h>
 
+/* ---- Damage tracking ---- */
+
+static raster_damage_t *g_damage; /* where primitives report, NULL = off */
+
+/* Row window of the calling thread: primitives only touch rows in it */
+static _Thread_local int g_row0 = 0, g_row1 = INT_MAX;
+
+static inline void rows(int h, int *lo, int *hi)
+{
+    *lo = g_row0 > 0 ? g_row0 : 0;
+    *hi = g_row1 < h ? g_row1 : h;
+}
+
+int raster_damage_init(raster_damage_t *d, int w, int h)
+{
+    memset(d, 0, sizeof(*d));
+    d->w = w; d->h = h;
+    d->tw = (w + RASTER_TILE - 1) >> RASTER_TILE_SHIFT;
+    d->th = (h + RASTER_TILE - 1) >> RASTER_TILE_SHIFT;
+    d->tiles = (uint8_t*)calloc((size_t)d->tw * d->th, 1);
+    d->rects = (raster_rect_t*)malloc((size_t)d->tw * d->th * sizeof(raster_rect_t));
+    d->open = (int*)malloc((size_t)d->tw * sizeof(int));
+    if(!d->tiles || !d->rects || !d->open){ raster_damage_free(d); return 1; }
+    return 0;
+}
+
+void raster_damage_free(raster_damage_t *d)
+{
+    free(d->tiles);
+    free(d->rects);
+    free(d->open);
+    d->tiles = NULL; d->rects = NULL; d->open = NULL; d->nrects = 0;
+}
+
+void raster_damage_reset(raster_damage_t *d)
+{
+    memset(d->tiles, 0, (size_t)d->tw * d->th);
+    d->nrects = 0;
+}
+
+void raster_damage_all(raster_damage_t *d)
+{
+    memset(d->tiles, 1, (size_t)d->tw * d->th);
+}
+
+void raster_damage_rect(raster_damage_t *d, int x0, int y0, int x1, int y1)
+{
+    if(x0 < 0) x0 = 0;
+    if(y0 < 0) y0 = 0;
+    if(x1 >= d->w) x1 = d->w - 1;
+    if(y1 >= d->h) y1 = d->h - 1;
+    if(x0 > x1 || y0 > y1) return;
+    int tx0 = x0 >> RASTER_TILE_SHIFT, tx1 = x1 >> RASTER_TILE_SHIFT;
+    for(int ty = y0 >> RASTER_TILE_SHIFT; ty <= (y1 >> RASTER_TILE_SHIFT); ty++)
+        memset(d->tiles + ty * d->tw + tx0, 1, (size_t)(tx1 - tx0 + 1));
+}
+
+void raster_damage_union(raster_damage_t *d, const raster_damage_t *src)
+{
+    for(int i = 0; i < d->tw * d->th; i++) d->tiles[i] |= src->tiles[i];
+}
+
+void raster_damage_expand_rows(raster_damage_t *d, int tiles, int ty0, int ty1)
+{
+    /* grown tiles are marked 2 so they do not grow again */
+    for(int ty = ty0; ty < ty1; ty++){
+        uint8_t *row = d->tiles + ty * d->tw;
+        for(int tx = 0; tx < d->tw; tx++){
+            if(row[tx] != 1) continue;
+            int lo = tx - tiles < 0 ? 0 : tx - tiles;
+            int hi = tx + tiles >= d->tw ? d->tw - 1 : tx + tiles;
+            for(int j = lo; j <= hi; j++) if(!row[j]) row[j] = 2;
+        }
+        for(int tx = 0; tx < d->tw; tx++) row[tx] = row[tx] != 0;
+    }
+}
+
+void raster_damage_expand_x(raster_damage_t *d, int tiles)
+{
+    raster_damage_expand_rows(d, tiles, 0, d->th);
+}
+
+int raster_damage_build(raster_damage_t *d)
+{
+    d->nrects = 0;
+    for(int tx = 0; tx < d->tw; tx++) d->open[tx] = -1;
+    for(int ty = 0; ty < d->th; ty++){
+        const uint8_t *row = d->tiles + ty * d->tw;
+        int y = ty << RASTER_TILE_SHIFT;
+        int rh = d->h - y < RASTER_TILE ? d->h - y : RASTER_TILE;
+        for(int tx = 0; tx < d->tw; ){
+            if(!row[tx]){ tx++; continue; }
+            int a = tx;
+            while(tx < d->tw && row[tx]) tx++;
+            int x = a << RASTER_TILE_SHIFT;
+            int rw = (tx << RASTER_TILE_SHIFT) > d->w ? d->w - x : (tx - a) << RASTER_TILE_SHIFT;
+            /* open[a]: last rect whose run started at tile a */
+            if(d->open[a] >= 0){
+                raster_rect_t *up = &d->rects[d->open[a]];
+                if(up->w == rw && up->y + up->h == y){ up->h += rh; continue; }
+            }
+            d->open[a] = d->nrects;
+            d->rects[d->nrects++] = (raster_rect_t){ x, y, rw, rh };
+        }
+    }
+    return d->nrects;
+}
+
+float raster_damage_coverage(const raster_damage_t *d)
+{
+    long px = 0;
+    for(int i = 0; i < d->nrects; i++) px += (long)d->rects[i].w * d->rects[i].h;
+    return (float)px / ((float)d->w * (float)d->h);
+}
+
+void raster_set_damage(raster_damage_t *d){ g_damage = d; }
+
+void raster_damage(int x0, int y0, int x1, int y1)
+{
+    if(!g_damage) return;
+    if(y0 < g_row0) y0 = g_row0;
+    if(y1 >= g_row1) y1 = g_row1 - 1;
+    raster_damage_rect(g_damage, x0, y0, x1, y1);
+}
+
+void raster_set_rows(int y0, int y1){ g_row0 = y0; g_row1 = y1; }
+
+void raster_clip_rows(int h, int *y0, int *y1){ rows(h, y0, y1); }
+
+/* ---- Primitives ---- */
+
 void raster_clear(uint32_t *fb, int w, int h, uint32_t color)
 {
-    for(int i=0;i<w*h;i++) fb[i]=color;
+    int lo, hi; rows(h, &lo, &hi);
+    for(int i=lo*w;i<hi*w;i++) fb[i]=color;
+}
+
+void raster_clear_damage(uint32_t *fb, int w, int h, uint32_t color, const raster_damage_t *d)
+{
+    int lo, hi; rows(h, &lo, &hi);
+    for(int i = 0; i < d->nrects; i++){
+        const raster_rect_t *r = &d->rects[i];
+        int y0 = r->y > lo ? r->y : lo;
+        int y1 = r->y + r->h < hi ? r->y + r->h : hi;
+        for(int y = y0; y < y1; y++){
+            uint32_t *row = fb + y * w + r->x;
+            for(int x = 0; x < r->w; x++) row[x] = color;
+        }
+    }
+}
+
+static inline void plot(uint32_t *fb,int w,int lo,int hi,int x,int y,uint32_t col){
+    if((unsigned)x<(unsigned)w && y>=lo && y<hi){
+        fb[y*w+x]=col;
+        if(g_damage) g_damage->tiles[(y >> RASTER_TILE_SHIFT) * g_damage->tw + (x >> RASTER_TILE_SHIFT)] = 1;
+    }
+}
+
+/* Fill [x0, x1] on row y (rows [lo, hi) visible): clipped once, reported once. */
+static inline void span(uint32_t *fb,int w,int lo,int hi,int y,int x0,int x1,uint32_t col){
+    if(y < lo || y >= hi) return;
+    if(x0 < 0) x0 = 0;
+    if(x1 >= w) x1 = w-1;
+    if(x0 > x1) return;
+    if(g_damage) raster_damage_rect(g_damage, x0, y, x1, y);
+    uint32_t *row = fb + y*w;
+    for(int x = x0; x <= x1; ++x) row[x] = col;
 }
 
-static inline void plot(uint32_t *fb,int w,int h,int x,int y,uint32_t col){
-    if((unsigned)x<(unsigned)w && (unsigned)y<(unsigned)h) fb[y*w+x]=col;
+/* Largest x >= 0 with x*x <= n (n >= 0). */
+static inline int isqrt(int n){
+    int x = (int)sqrtf((float)n);
+    while(x*x > n) x--;
+    while((x+1)*(x+1) <= n) x++;
+    return x;
 }
 
+/* Ring r_in^2 <= x^2 + y^2 <= r^2, one or two spans per row */
 void raster_circle(uint32_t *fb,int w,int h,int cx,int cy,int r,uint32_t col,int thickness)
 {
     if(thickness<=0) thickness=1;
+    if(r < 0) return;
     int r_out=r;
     int r_in=r-thickness;
     int r_out2=r_out*r_out;
     int r_in2=r_in*r_in;
-    for(int y=-r_out;y<=r_out;y++){
-        int yy=y+cy;
+    int lo, hi; rows(h, &lo, &hi);
+    int y0 = -r_out < lo-cy ? lo-cy : -r_out;
+    int y1 = r_out > hi-1-cy ? hi-1-cy : r_out;
+    for(int y=y0;y<=y1;y++){
         int y2=y*y;
-        for(int x=-r_out;x<=r_out;x++){
-            int xx=x+cx;
-            int dist2 = x*x + y2;
-            if(dist2<=r_out2 && dist2>=r_in2){ plot(fb,w,h,xx,yy,col);}        }
+        int xo = isqrt(r_out2 - y2);
+        /* smallest |x| with x^2 >= r_in2 - y2 */
+        int xi = 0;
+        if(r_in2 > y2){ xi = isqrt(r_in2 - y2 - 1) + 1; }
+        if(xi > xo) continue;
+        if(xi == 0){ span(fb,w,lo,hi,cy+y,cx-xo,cx+xo,col); continue; }
+        span(fb,w,lo,hi,cy+y,cx-xo,cx-xi,col);
+        span(fb,w,lo,hi,cy+y,cx+xi,cx+xo,col);
+    }
+}
+
+/* Bresenham walk from (x0,y0) to (x1,y1); each row's pixels are contiguous,
+ * so they go out as one span, widened by `pad` on both sides (pad > 0: a
+ * thin line is cheaper plotted). */
+static void line_spans(uint32_t *fb,int w,int h,int x0,int y0,int x1,int y1,uint32_t col,int pad)
+{
+    int dx =  abs(x1 - x0), sx = x0 < x1 ? 1 : -1;
+    int dy = -abs(y1 - y0), sy = y0 < y1 ? 1 : -1;
+    int err = dx + dy, e2; /* error value e_xy */
+    int row = y0, left = x0, right = x0;
+    int lo, hi; rows(h, &lo, &hi);
+
+    while(true){
+        if(y0 != row){
+            span(fb, w, lo, hi, row, left - pad, right + pad, col);
+            row = y0; left = right = x0;
+        }
+        if(x0 < left) left = x0;
+        if(x0 > right) right = x0;
+        if(x0 == x1 && y0 == y1) break;
+        e2 = 2*err;
+        if(e2 >= dy){ err += dy; x0 += sx; }
+        if(e2 <= dx){ err += dx; y0 += sy; }
     }
+    span(fb, w, lo, hi, row, left - pad, right + pad, col);
 }
 
 /* Filled circle using simple scanline fill */
 void raster_fill_circle(uint32_t *fb,int w,int h,int cx,int cy,int r,uint32_t col)
 {
     int r2 = r*r;
+    int lo, hi; rows(h, &lo, &hi);
+    raster_damage(cx - r, cy - r, cx + r, cy + r);
     for(int y=-r; y<=r; ++y){
         int yy = cy + y;
-        if((unsigned)yy >= (unsigned)h) continue;
+        if(yy < lo || yy >= hi) continue;
         int x_extent = (int)sqrtf((float)(r2 - y*y));
         int x_min = cx - x_extent;
         int x_max = cx + x_extent;
@@ -53,9 +258,10 @@ void raster_line(uint32_t *fb,int w,int h,int x0,int y0,int x1,int y1,uint32_t c
     int dx =  abs(x1 - x0), sx = x0 < x1 ? 1 : -1;
     int dy = -abs(y1 - y0), sy = y0 < y1 ? 1 : -1;
     int err = dx + dy, e2; /* error value e_xy */
+    int lo, hi; rows(h, &lo, &hi);
 
     while(true){
-        plot(fb, w, h, x0, y0, col);
+        plot(fb, w, lo, hi, x0, y0, col);
         if(x0 == x1 && y0 == y1) break;
         e2 = 2*err;
         if(e2 >= dy){ err += dy; x0 += sx; }
@@ -63,20 +269,17 @@ void raster_line(uint32_t *fb,int w,int h,int x0,int y0,int x1,int y1,uint32_t c
     }
 }
 
-/* Simple polygon: if fill==true, use scanline fill; otherwise draw outline with raster_line */
+/* Simple polygon: if fill==true, use scanline fill; otherwise draw the outline.
+ * A thick edge is the edge's Bresenham line shifted by -(t-1)..t-1 in x,
+ * which per row is the line's own run widened by t-1: one span per row. */
 void raster_poly(uint32_t *fb,int w,int h,const int *vx,const int *vy,int n,uint32_t col,bool fill,int thickness)
 {
     if(n < 2) return;
     if(!fill){
         for(int i=0;i<n;i++){
             int j = (i+1)%n;
-            raster_line(fb,w,h,vx[i],vy[i],vx[j],vy[j],col);
-            if(thickness>1){ /* naive thickness by drawing parallel lines */
-                for(int t=1;t<thickness;t++){
-                    raster_line(fb,w,h,vx[i]+t,vy[i],vx[j]+t,vy[j],col);
-                    raster_line(fb,w,h,vx[i]-t,vy[i],vx[j]-t,vy[j],col);
-                }
-            }
+            if(thickness>1) line_spans(fb,w,h,vx[i],vy[i],vx[j],vy[j],col,thickness-1);
+            else raster_line(fb,w,h,vx[i],vy[i],vx[j],vy[j],col);
         }
         return;
     }
@@ -88,8 +291,9 @@ void raster_poly(uint32_t *fb,int w,int h,const int *vx,const int *vy,int n,uint
         if(vy[i] < y_min) y_min = vy[i];
         if(vy[i] > y_max) y_max = vy[i];
     }
-    if(y_min < 0) y_min = 0;
-    if(y_max >= h) y_max = h-1;
+    int lo, hi; rows(h, &lo, &hi);
+    if(y_min < lo) y_min = lo;
+    if(y_max >= hi) y_max = hi-1;
 
     for(int y=y_min; y<=y_max; ++y){
         /* Build list of x intersections with edges */
@@ -114,6 +318,7 @@ void raster_poly(uint32_t *fb,int w,int h,const int *vx,const int *vy,int n,uint
             int x_end   = inter[i+1];
             if(x_start < 0) x_start = 0;
             if(x_end >= w) x_end = w-1;
+            raster_damage(x_start, y, x_end, y);
             for(int x=x_start; x<=x_end; ++x){
                 fb[y*w + x] = col;
             }
@@ -124,9 +329,11 @@ void raster_poly(uint32_t *fb,int w,int h,const int *vx,const int *vy,int n,uint
 /* Blit helper: copy src_w*src_h pixels at (dx,dy) into dst, no alpha */
 void raster_blit_rgba(const uint32_t *src,int src_w,int src_h,uint32_t *dst,int dst_w,int dst_h,int dx,int dy)
 {
+    raster_damage(dx, dy, dx + src_w - 1, dy + src_h - 1);
+    int lo, hi; rows(dst_h, &lo, &hi);
     for(int y=0;y<src_h;y++){
         int dst_y = dy + y;
-        if((unsigned)dst_y >= (unsigned)dst_h) continue;
+        if(dst_y < lo || dst_y >= hi) continue;
         const uint32_t *srow = src + y*src_w;
         uint32_t *drow = dst + dst_y*dst_w;
         int copy_w = src_w;
@@ -140,9 +347,11 @@ void raster_blit_rgba(const uint32_t *src,int src_w,int src_h,uint32_t *dst,int
 
 void raster_blit_rgba_alpha(const uint32_t *src,int src_w,int src_h,uint32_t *dst,int dst_w,int dst_h,int dx,int dy)
 {
+    raster_damage(dx, dy, dx + src_w - 1, dy + src_h - 1);
+    int lo, hi; rows(dst_h, &lo, &hi);
     for(int y=0;y<src_h;y++){
         int dst_y = dy + y;
-        if((unsigned)dst_y >= (unsigned)dst_h) continue;
+        if(dst_y < lo || dst_y >= hi) continue;
         const uint32_t *srow = src + y*src_w;
         uint32_t *drow = dst + dst_y*dst_w;
         for(int x=0; x<src_w; ++x){
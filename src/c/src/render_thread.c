@@ -0,0 +1,133 @@
+#define _POSIX_C_SOURCE 200809L
+#include "render_thread.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+static uint32_t next_pow2(uint32_t v)
+{
+    uint32_t p = 1;
+    while(p < v) p <<= 1;
+    return p;
+}
+
+/* Render one block into the ring and publish its visual events. */
+static void render_block(render_thread_t *rt)
+{
+    const uint32_t n = rt->block;
+    float *L = rt->scratch;
+    float *R = L + n;
+    float *inter = R + n;
+
+    uint64_t base = rt->g->frames_done;
+    generator_process(rt->g, L, R, n);
+    for(uint32_t i = 0; i < n; ++i){
+        inter[i*2]   = L[i];
+        inter[i*2+1] = R[i];
+    }
+
+    uint64_t t = rt->frames_rendered;
+    if(rt->vis){
+        /* RMS first: the queue is popped in order, and the hits land later in the block */
+        vis_queue_push(rt->vis, t, VIS_RMS, g_block_rms);
+#ifdef GENERATOR_ASM
+        /* generator.s publishes no note events: one hit per flagged block */
+        (void)base;
+        if(rt->g->saw_hit)  vis_queue_push(rt->vis, t, VIS_SAW_HIT, 0.0f);
+        if(rt->g->bass_hit) vis_queue_push(rt->vis, t, VIS_BASS_HIT, 0.0f);
+#else
+        gen_event_t ev[32];
+        uint32_t got;
+        while((got = gen_event_read(rt->events, &rt->reader, ev, 32)) > 0){
+            for(uint32_t i = 0; i < got; i++){
+                uint64_t at = t + (ev[i].time - base);
+                if(ev[i].type == EVT_MELODY)       vis_queue_push(rt->vis, at, VIS_SAW_HIT, ev[i].freq);
+                else if(ev[i].type == EVT_FM_BASS) vis_queue_push(rt->vis, at, VIS_BASS_HIT, ev[i].freq);
+            }
+        }
+#endif
+    }
+
+    spsc_ring_write(&rt->ring, inter, n * 2);
+    rt->frames_rendered += n;
+}
+
+static void *render_main(void *arg)
+{
+    render_thread_t *rt = (render_thread_t *)arg;
+    /* Poll at a quarter of a block so a freed block is refilled well before
+     * the callback needs it. */
+    long nap_ns = (long)(1e9 * (double)rt->block / (double)SR / 4.0);
+    const struct timespec nap = { 0, nap_ns };
+
+    while(atomic_load_explicit(&rt->running, memory_order_relaxed)){
+        if(spsc_ring_writable(&rt->ring) >= rt->block * 2) render_block(rt);
+        else nanosleep(&nap, NULL);
+    }
+    return NULL;
+}
+
+int render_thread_start(render_thread_t *rt, generator_t *g, vis_queue_t *vis,
+                        uint32_t block, uint32_t blocks_ahead)
+{
+    memset(rt, 0, sizeof(*rt));
+    rt->g = g;
+    rt->vis = vis;
+    rt->block = block;
+
+    uint32_t cap = next_pow2(block * 2 * (blocks_ahead ? blocks_ahead : 1));
+    rt->ring_buf = calloc(cap, sizeof(float));
+    rt->scratch = calloc((size_t)block * 4, sizeof(float));
+    if(vis) rt->events = malloc(sizeof(gen_event_ring_t));
+    if(!rt->ring_buf || !rt->scratch || (vis && !rt->events)){
+        fprintf(stderr, "render_thread: out of memory\n");
+        free(rt->ring_buf);
+        free(rt->scratch);
+        free(rt->events);
+        rt->events = NULL;
+        return 1;
+    }
+    if(vis){
+        gen_event_ring_init(rt->events);
+        gen_event_reader_init(&rt->reader, rt->events);
+        generator_set_event_ring(g, rt->events);
+    }
+    spsc_ring_init(&rt->ring, rt->ring_buf, cap);
+    atomic_init(&rt->frames_played, 0u);
+    atomic_init(&rt->underruns, 0u);
+
+    /* Pre-fill so the first callbacks never see an empty ring */
+    while(spsc_ring_writable(&rt->ring) >= block * 2) render_block(rt);
+
+    atomic_store(&rt->running, true);
+    if(pthread_create(&rt->thread, NULL, render_main, rt) != 0){
+        fprintf(stderr, "render_thread: pthread_create failed\n");
+        atomic_store(&rt->running, false);
+        return 1;
+    }
+    return 0;
+}
+
+void render_thread_stop(render_thread_t *rt)
+{
+    if(atomic_exchange(&rt->running, false)) pthread_join(rt->thread, NULL);
+    if(rt->events && rt->g->events == rt->events) generator_set_event_ring(rt->g, NULL);
+    free(rt->ring_buf);
+    free(rt->scratch);
+    free(rt->events);
+    rt->ring_buf = NULL;
+    rt->scratch = NULL;
+    rt->events = NULL;
+}
+
+void render_thread_pull(render_thread_t *rt, float *buffer, uint32_t num_frames)
+{
+    uint32_t want = num_frames * 2;
+    uint32_t got = spsc_ring_read(&rt->ring, buffer, want);
+    if(got < want){
+        memset(buffer + got, 0, (want - got) * sizeof(float));
+        atomic_fetch_add_explicit(&rt->underruns, 1u, memory_order_relaxed);
+    }
+    atomic_fetch_add_explicit(&rt->frames_played, num_frames, memory_order_release);
+}
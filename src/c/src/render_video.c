@@ -0,0 +1,257 @@
+/* render_video – headless, audio-synchronous visualiser render.
+ *
+ * The real-time player paces frames with SDL_Delay and picks up whatever
+ * visual events the audio has played by then, so no two runs draw the same
+ * frames.  Here the clock is the audio itself: video frame k covers stream
+ * frames [k*SR/fps, (k+1)*SR/fps) (rounded down, so the split never drifts),
+ * the generator renders exactly those samples in AUDIO_BLOCK chunks and the
+ * scene is drawn from the saw / bass notes its event stream (gen_event.h)
+ * reports in them.  Nothing waits on a clock, so the render runs as fast as
+ * the CPU allows and is identical on every run and at any --threads.
+ *
+ * Frames go out as one raw RGBA stream (--rgba, '-' for stdout) and/or a
+ * numbered PPM sequence (--images DIR); the audio as a WAV (--wav); every
+ * note event as JSON or .npy (--events, by extension) for renderers that
+ * schedule their own visuals.  Screen shake and frame drops are applied the
+ * way the player presents them.  Without --rgba / --images no frames are
+ * drawn at all.
+ *
+ *   ffmpeg -f rawvideo -pix_fmt rgba -s 800x600 -r 30 -i render.rgba \
+ *          -i render.wav -c:v libx264 -pix_fmt yuv420p -shortest render.mp4
+ *
+ * Usage: bin/render_video [seed] [--seconds S | --frames N] [--fps F]
+ *                         [--size WxH] [--threads T] [--rgba file|-]
+ *                         [--images DIR] [--wav file] [--format s16|s24|f32]
+ *                         [--particles N] [--events file.json|file.npy]
+ *
+ * The default length is one segment, as bin/segment renders it.
+ */
+#define _POSIX_C_SOURCE 200809L
+#include "generator.h"
+#include "particles.h"
+#include "vis_scene.h"
+#include "wav_writer.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define AUDIO_BLOCK 512u   /* same chunking as the real-time render thread */
+#define BACKGROUND  0x000000FFu
+
+static generator_t g;
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static void usage(const char *argv0)
+{
+    fprintf(stderr, "usage: %s [seed] [--seconds S | --frames N] [--fps F] [--size WxH] [--threads T]\n"
+                    "       [--rgba file|-] [--images DIR] [--wav file] [--format s16|s24|f32]\n"
+                    "       [--particles N] [--events file.json|file.npy]\n", argv0);
+}
+
+/* What the player would show: fb moved by (dx, dy) over the clear colour. */
+static void present(uint32_t *dst, const uint32_t *fb, int w, int h, int dx, int dy)
+{
+    for(int y = 0; y < h; y++){
+        uint32_t *row = dst + (size_t)y * w;
+        int sy = y - dy;
+        if(sy < 0 || sy >= h){
+            for(int x = 0; x < w; x++) row[x] = BACKGROUND;
+            continue;
+        }
+        const uint32_t *src = fb + (size_t)sy * w;
+        int x0 = dx > 0 ? dx : 0, x1 = dx < 0 ? w + dx : w;
+        if(x0 > w) x0 = w;
+        if(x1 < x0) x1 = x0;
+        for(int x = 0; x < x0; x++) row[x] = BACKGROUND;
+        if(x1 > x0) memcpy(row + x0, src + x0 - dx, (size_t)(x1 - x0) * sizeof(uint32_t));
+        for(int x = x1; x < w; x++) row[x] = BACKGROUND;
+    }
+}
+
+/* 0xRRGGBBAA pixels to R, G, B[, A] bytes. */
+static void pack_bytes(uint8_t *out, const uint32_t *px, size_t n, int alpha)
+{
+    for(size_t i = 0; i < n; i++){
+        uint32_t p = px[i];
+        *out++ = (uint8_t)(p >> 24);
+        *out++ = (uint8_t)(p >> 16);
+        *out++ = (uint8_t)(p >> 8);
+        if(alpha) *out++ = (uint8_t)p;
+    }
+}
+
+int main(int argc, char **argv)
+{
+    uint64_t seed = 0xCAFEBABEULL;
+    double seconds = 0.0;          /* > 0: overrides the one-segment default */
+    uint64_t nframes = 0;          /* > 0: overrides --seconds */
+    int fps = 30, width = 800, height = 600, threads = 1;
+    int max_particles = PARTICLES_DEFAULT_CAPACITY;
+    const char *rgba_path = NULL, *image_dir = NULL, *wav_path = NULL, *events_path = NULL;
+    wav_format_t format = WAV_PCM16;
+
+    for(int i = 1; i < argc; i++){
+        const char *a = argv[i];
+        const char *v = (i + 1 < argc) ? argv[i + 1] : NULL;
+        if(a[0] != '-'){ seed = strtoull(a, NULL, 0); continue; }
+        if(!v){ usage(argv[0]); return 2; }
+        if     (strcmp(a, "--seconds") == 0) seconds = strtod(v, NULL);
+        else if(strcmp(a, "--frames") == 0)  nframes = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--fps") == 0)     fps = atoi(v);
+        else if(strcmp(a, "--threads") == 0) threads = atoi(v);
+        else if(strcmp(a, "--particles") == 0) max_particles = atoi(v);
+        else if(strcmp(a, "--rgba") == 0)    rgba_path = v;
+        else if(strcmp(a, "--images") == 0) image_dir = v;
+        else if(strcmp(a, "--wav") == 0)    wav_path = v;
+        else if(strcmp(a, "--events") == 0) events_path = v;
+        else if(strcmp(a, "--size") == 0){
+            if(sscanf(v, "%dx%d", &width, &height) != 2){ usage(argv[0]); return 2; }
+        }
+        else if(strcmp(a, "--format") == 0){
+            if     (strcmp(v, "s16") == 0) format = WAV_PCM16;
+            else if(strcmp(v, "s24") == 0) format = WAV_PCM24;
+            else if(strcmp(v, "f32") == 0) format = WAV_FLOAT32;
+            else { usage(argv[0]); return 2; }
+        }
+        else { usage(argv[0]); return 2; }
+        i++;
+    }
+    if(fps <= 0 || width <= 0 || height <= 0 || seconds < 0.0 || max_particles <= 0){
+        usage(argv[0]);
+        return 2;
+    }
+    if(!rgba_path && !image_dir && !wav_path && !events_path) wav_path = "render.wav";
+    const int draw = rgba_path || image_dir;
+
+    /* With frames on stdout, status lines go to stderr */
+    FILE *rgba = NULL;
+    int to_stdout = rgba_path && strcmp(rgba_path, "-") == 0;
+    FILE *msg = to_stdout ? stderr : stdout;
+
+    generator_init(&g, seed);
+    static gen_event_ring_t events;
+    gen_event_reader_t reader;
+    gen_event_ring_init(&events);
+    gen_event_reader_init(&reader, &events);
+    generator_set_event_ring(&g, &events);
+    gen_event_t *log = NULL;        /* --events: everything, in order */
+    uint64_t nlog = 0, log_cap = 0;
+
+    if(!nframes){
+        uint64_t audio = seconds > 0.0 ? (uint64_t)(seconds * SR + 0.5) : g.mt.seg_frames;
+        nframes = (audio * (uint64_t)fps + SR - 1) / SR;
+    }
+
+    /* the player never seeds rand(): start from the same sequence */
+    srand(1);
+    static vis_scene_t scene;
+    if(vis_scene_init(&scene, seed, width, height, true) != 0
+       || vis_scene_set_threads(&scene, threads) != 0
+       || particles_set_capacity(max_particles) != 0){
+        fprintf(stderr, "render_video: scene init failed\n");
+        return 1;
+    }
+    const crt_fx_t *fx = &scene.fx;
+
+    const size_t npx = (size_t)width * height;
+    uint32_t *fb = malloc(npx * sizeof(uint32_t));
+    uint32_t *shown = malloc(npx * sizeof(uint32_t));
+    uint8_t *bytes = malloc(npx * 4);
+    float *L = malloc(AUDIO_BLOCK * sizeof(float)), *R = malloc(AUDIO_BLOCK * sizeof(float));
+    if(!fb || !shown || !bytes || !L || !R){
+        fprintf(stderr, "render_video: out of memory\n");
+        return 1;
+    }
+    for(size_t i = 0; i < npx; i++) shown[i] = BACKGROUND;
+
+    if(to_stdout) rgba = stdout;
+    else if(rgba_path){
+        rgba = fopen(rgba_path, "wb");
+        if(!rgba){ perror(rgba_path); return 1; }
+    }
+    static wav_stream_t wav;
+    if(wav_path && wav_stream_open(&wav, wav_path, 2, SR, format) != 0) return 1;
+
+    fprintf(msg, "render_video: seed 0x%llx, %llu frames at %dx%d @ %d fps, %d thread%s\n",
+           (unsigned long long)seed, (unsigned long long)nframes, width, height, fps,
+           scene.threads, scene.threads == 1 ? "" : "s");
+
+    double t0 = now_sec();
+    float level = 0.0f;
+    uint64_t audio_pos = 0;
+    for(uint64_t k = 0; k < nframes; k++){
+        /* audio for this frame, in render-thread-sized chunks */
+        uint64_t end = (k + 1) * SR / (uint64_t)fps;
+        int saw_hits = 0, bass_hits = 0;
+        while(audio_pos < end){
+            uint32_t n = end - audio_pos < AUDIO_BLOCK ? (uint32_t)(end - audio_pos) : AUDIO_BLOCK;
+            generator_process(&g, L, R, n);
+            level = g_block_rms;
+            if(wav_path) wav_stream_append_stereo(&wav, L, R, n);
+            audio_pos += n;
+
+            gen_event_t ev[64];
+            uint32_t got;
+            while((got = gen_event_read(&events, &reader, ev, 64)) > 0){
+                for(uint32_t i = 0; i < got; i++){
+                    saw_hits += ev[i].type == EVT_MELODY;
+                    bass_hits += ev[i].type == EVT_FM_BASS;
+                }
+                if(!events_path) continue;
+                if(nlog + got > log_cap){
+                    log_cap = log_cap ? log_cap * 2 : 1024;
+                    gen_event_t *grown = realloc(log, log_cap * sizeof(*log));
+                    if(!grown){ fprintf(stderr, "render_video: out of memory\n"); return 1; }
+                    log = grown;
+                }
+                memcpy(log + nlog, ev, got * sizeof(*ev));
+                nlog += got;
+            }
+        }
+        if(!draw) continue;
+
+        vis_scene_render(&scene, fb, level, saw_hits, bass_hits);
+
+        /* frame drop effect: a dropped frame leaves the last one on screen */
+        if(fx->frame_drop_chance < 0.01f || (rand() % 1000) > (int)(fx->frame_drop_chance * 1000)){
+            present(shown, fb, width, height, scene.jitter_x, scene.jitter_y);
+            vis_scene_presented(&scene);
+        }
+
+        if(rgba){
+            pack_bytes(bytes, shown, npx, 1);
+            if(fwrite(bytes, 4, npx, rgba) != npx){ perror(rgba_path); return 1; }
+        }
+        if(image_dir){
+            char path[4096];
+            snprintf(path, sizeof(path), "%s/frame_%06llu.ppm", image_dir, (unsigned long long)k);
+            FILE *f = fopen(path, "wb");
+            if(!f){ perror(path); return 1; }
+            pack_bytes(bytes, shown, npx, 0);
+            fprintf(f, "P6\n%d %d\n255\n", width, height);
+            size_t ok = fwrite(bytes, 3, npx, f);
+            if(fclose(f) != 0 || ok != npx){ perror(path); return 1; }
+        }
+    }
+    double dt = now_sec() - t0;
+
+    if(rgba && fclose(rgba) != 0){ perror(rgba_path); return 1; }
+    if(wav_path && wav_stream_close(&wav) != 0) return 1;
+    if(events_path && gen_event_save(events_path, log, nlog, seed) != 0) return 1;
+    vis_scene_free(&scene);
+    free(fb); free(shown); free(bytes); free(L); free(R); free(log);
+
+    double length = (double)audio_pos / SR;
+    fprintf(msg, "Rendered %llu frames, %llu audio frames (%.2f s) in %.2f s (%.1f fps, %.1fx real time)\n",
+           (unsigned long long)nframes, (unsigned long long)audio_pos, length, dt,
+           (double)nframes / dt, length / dt);
+    if(events_path) fprintf(msg, "Wrote %llu note events to %s\n", (unsigned long long)nlog, events_path);
+    return 0;
+}
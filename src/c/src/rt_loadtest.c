@@ -0,0 +1,136 @@
+/* rt_loadtest – run the real-time audio path headless through the null sink.
+ *
+ * Renders `seed` through generator_process from the null backend's timer
+ * thread at the device period (no window, no sound card), then prints the
+ * deadline statistics.  Exits non-zero when more deadlines were missed
+ * than --max-misses allows, so CI can gate on it.
+ *
+ * With --ahead N the generator moves to a render thread that keeps N blocks
+ * queued in the SPSC ring (as bin/realtime does) and the callback only
+ * copies; visual events are drained from the vis queue like the video loop.
+ *
+ * Usage: bin/rt_loadtest [seed] [--seconds S] [--period FRAMES] [--speed X]
+ *                        [--ahead N] [--wav out.wav] [--max-misses N]
+ */
+#define _POSIX_C_SOURCE 200809L
+#include "audio_backend.h"
+#include "generator.h"
+#include "render_thread.h"
+#include "trace.h"
+#include <stdatomic.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+static generator_t g_generator;
+static atomic_uint_fast64_t g_frames_rendered;
+static render_thread_t g_render;
+static vis_queue_t g_vis;
+
+static void render_callback(float *buffer, uint32_t num_frames, void *user_data)
+{
+    (void)user_data;
+    float L[num_frames], R[num_frames];
+    generator_process(&g_generator, L, R, num_frames);
+    for(uint32_t i = 0; i < num_frames; ++i){
+        buffer[i*2]   = L[i];
+        buffer[i*2+1] = R[i];
+    }
+    atomic_fetch_add_explicit(&g_frames_rendered, num_frames, memory_order_relaxed);
+}
+
+static void pull_callback(float *buffer, uint32_t num_frames, void *user_data)
+{
+    (void)user_data;
+    render_thread_pull(&g_render, buffer, num_frames);
+    atomic_fetch_add_explicit(&g_frames_rendered, num_frames, memory_order_relaxed);
+}
+
+static void usage(const char *argv0)
+{
+    fprintf(stderr, "usage: %s [seed] [--seconds S] [--period FRAMES] [--speed X] "
+                    "[--ahead N] [--wav out.wav] [--max-misses N]\n", argv0);
+}
+
+int main(int argc, char **argv)
+{
+    uint64_t seed = 0xCAFEBABEULL;
+    float seconds = 10.0f;
+    uint32_t period = 512;
+    long max_misses = -1;
+    uint32_t ahead = 0;
+    audio_null_opts_t opts = { NULL, 1.0f };
+
+    for(int i = 1; i < argc; i++){
+        const char *a = argv[i];
+        const char *v = (i + 1 < argc) ? argv[i + 1] : NULL;
+        if(a[0] != '-'){ seed = strtoull(a, NULL, 0); continue; }
+        if(!v){ usage(argv[0]); return 2; }
+        if     (strcmp(a, "--seconds") == 0)    seconds = strtof(v, NULL);
+        else if(strcmp(a, "--period") == 0)     period = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--speed") == 0)      opts.speed = strtof(v, NULL);
+        else if(strcmp(a, "--ahead") == 0)      ahead = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--wav") == 0)        opts.wav_path = v;
+        else if(strcmp(a, "--max-misses") == 0) max_misses = strtol(v, NULL, 0);
+        else { usage(argv[0]); return 2; }
+        i++;
+    }
+    if(period == 0 || seconds <= 0.0f){
+        usage(argv[0]);
+        return 2;
+    }
+
+    generator_init(&g_generator, seed);
+
+    const audio_backend_t *ab = &audio_backend_null;
+    audio_null_configure(&opts);
+    if(ahead){
+        vis_queue_init(&g_vis);
+        if(render_thread_start(&g_render, &g_generator, &g_vis, period, ahead) != 0) return 1;
+    }
+    if(ab->init(SR, period, ahead ? pull_callback : render_callback, NULL) != 0){
+        fprintf(stderr, "Audio init failed\n");
+        return 1;
+    }
+
+    uint64_t target = (uint64_t)(seconds * (float)SR);
+    printf("rt_loadtest: seed 0x%llx, %.1f s, period %u frames, speed %.2f, %s%s%s\n",
+           (unsigned long long)seed, seconds, period, opts.speed,
+           ahead ? "render thread" : "render in callback",
+           opts.wav_path ? ", wav " : "", opts.wav_path ? opts.wav_path : "");
+
+    uint64_t vis_counts[3] = { 0, 0, 0 };
+    ab->start();
+    const struct timespec poll = { 0, 5 * 1000 * 1000 };
+    while(atomic_load_explicit(&g_frames_rendered, memory_order_relaxed) < target){
+        nanosleep(&poll, NULL);
+        vis_event_t ev;
+        while(ahead && vis_queue_pop(&g_vis, render_thread_played(&g_render), &ev))
+            vis_counts[ev.type]++;
+    }
+    ab->stop();
+
+    audio_stats_t st;
+    ab->get_stats(&st);
+    audio_stats_print(stdout, &st);
+    if(ahead){
+        render_thread_stop(&g_render);
+        printf("render thread: %u blocks ahead, %llu underruns; vis events: %llu saw, %llu bass, "
+               "%llu rms, %u dropped\n", ahead,
+               (unsigned long long)atomic_load(&g_render.underruns),
+               (unsigned long long)vis_counts[VIS_SAW_HIT], (unsigned long long)vis_counts[VIS_BASS_HIT],
+               (unsigned long long)vis_counts[VIS_RMS], (unsigned)atomic_load(&g_vis.dropped));
+    }
+
+#ifdef TRACE_ENABLED
+    trace_dump("rt_loadtest.trace");
+#endif
+
+    if(max_misses >= 0 && st.misses > (uint64_t)max_misses){
+        fprintf(stderr, "rt_loadtest: %llu missed deadlines (allowed %ld)\n",
+                (unsigned long long)st.misses, max_misses);
+        return 1;
+    }
+    return 0;
+}
@@ -0,0 +1,185 @@
+/* seed_scan – describe a range of seeds into a columnar .npy file.
+ *
+ * Runs describe_seed (parameters + event counts, no audio) over
+ * start, start+stride, ... and writes one packed record per seed as a
+ * NumPy structured array, so np.load("seeds.npy") gives named columns
+ * (tools/seed_space.py reads it with or without numpy).  The range is
+ * split across threads in fixed chunks and streamed to disk, so memory
+ * does not grow with --count.
+ *
+ * Usage: bin/seed_scan [--start S] [--count N] [--stride K]
+ *                      [--threads T] [--out seeds.npy]
+ */
+#define _POSIX_C_SOURCE 199309L
+#include "generator.h"
+#include <pthread.h>
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define SCAN_CHUNK       65536u
+#define SCAN_MAX_THREADS 64u
+
+/* Column order of the .npy records: name, dtype, where it lives in seed_desc_t.
+ * Records are packed (no padding) and little-endian. */
+typedef struct {
+    const char *name;
+    const char *dtype;
+    size_t offset;
+    size_t size;
+} column_t;
+
+#define COL(f, t) { #f, t, offsetof(seed_desc_t, f), sizeof(((seed_desc_t *)0)->f) }
+static const column_t columns[] = {
+    COL(seed, "<u8"),
+    COL(bpm, "<f4"),
+    COL(step_samples, "<u4"),
+    COL(seg_frames, "<u4"),
+    COL(root_freq, "<f4"),
+    COL(delay_factor, "<f4"),
+    COL(delay_samples, "<u4"),
+    COL(scale, "|u1"),
+    COL(kick_hits, "|u1"),
+    COL(snare_hits, "|u1"),
+    COL(hat_hits, "|u1"),
+    COL(preset_offset, "|u1"),
+    COL(rotation, "|u1"),
+    COL(kick_mask, "<u2"),
+    COL(snare_mask, "<u2"),
+    COL(hat_mask, "<u2"),
+    COL(events, "<u2"),
+    COL(events_dropped, "<u2"),
+    COL(n_kick, "<u2"),
+    COL(n_snare, "<u2"),
+    COL(n_hat, "<u2"),
+    COL(n_melody, "<u2"),
+    COL(n_mid_simple, "<u2"),
+    COL(n_mid_fm, "<u2"),
+    COL(n_bass, "<u2"),
+};
+#define NUM_COLUMNS (sizeof(columns) / sizeof(columns[0]))
+
+typedef struct {
+    uint64_t first, stride;
+    uint32_t count;
+    uint8_t *out;
+} scan_job_t;
+
+static size_t record_size(void)
+{
+    size_t n = 0;
+    for(size_t c = 0; c < NUM_COLUMNS; c++) n += columns[c].size;
+    return n;
+}
+
+static void *scan_worker(void *arg)
+{
+    const scan_job_t *job = arg;
+    uint8_t *p = job->out;
+    for(uint32_t i = 0; i < job->count; i++){
+        seed_desc_t d;
+        describe_seed(job->first + (uint64_t)i * job->stride, &d);
+        for(size_t c = 0; c < NUM_COLUMNS; c++){
+            memcpy(p, (const uint8_t *)&d + columns[c].offset, columns[c].size);
+            p += columns[c].size;
+        }
+    }
+    return NULL;
+}
+
+/* NPY v1.0 header for a 1-D structured array of `count` records. */
+static int write_npy_header(FILE *f, uint64_t count)
+{
+    char dict[2048];
+    int len = snprintf(dict, sizeof(dict), "{'descr': [");
+    for(size_t c = 0; c < NUM_COLUMNS; c++)
+        len += snprintf(dict + len, sizeof(dict) - (size_t)len, "%s('%s', '%s')",
+                        c ? ", " : "", columns[c].name, columns[c].dtype);
+    len += snprintf(dict + len, sizeof(dict) - (size_t)len,
+                    "], 'fortran_order': False, 'shape': (%llu,), }", (unsigned long long)count);
+
+    /* magic(6) + version(2) + header_len(2) + dict + padding + '\n' is a multiple of 64 */
+    size_t total = 10 + (size_t)len + 1;
+    size_t pad = (64 - total % 64) % 64;
+    uint16_t hlen = (uint16_t)(len + pad + 1);
+    uint8_t pre[10] = { 0x93, 'N', 'U', 'M', 'P', 'Y', 1, 0, (uint8_t)(hlen & 0xFF), (uint8_t)(hlen >> 8) };
+    if(fwrite(pre, 1, sizeof(pre), f) != sizeof(pre)) return -1;
+    if(fwrite(dict, 1, (size_t)len, f) != (size_t)len) return -1;
+    for(size_t i = 0; i < pad; i++) fputc(' ', f);
+    fputc('\n', f);
+    return ferror(f) ? -1 : 0;
+}
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static void usage(const char *argv0)
+{
+    fprintf(stderr, "usage: %s [--start S] [--count N] [--stride K] [--threads T] [--out seeds.npy]\n", argv0);
+}
+
+int main(int argc, char **argv)
+{
+    uint64_t start = 0, stride = 1, count = 1000000;
+    uint32_t threads = 4;
+    const char *out = "seeds.npy";
+
+    for(int i = 1; i < argc; i++){
+        const char *a = argv[i];
+        const char *v = (i + 1 < argc) ? argv[i + 1] : NULL;
+        if(!v){ usage(argv[0]); return 2; }
+        if     (strcmp(a, "--start") == 0)   start = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--count") == 0)   count = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--stride") == 0)  stride = strtoull(v, NULL, 0);
+        else if(strcmp(a, "--threads") == 0) threads = (uint32_t)strtoul(v, NULL, 0);
+        else if(strcmp(a, "--out") == 0)     out = v;
+        else { usage(argv[0]); return 2; }
+        i++;
+    }
+    if(count == 0 || threads == 0 || threads > SCAN_MAX_THREADS){
+        usage(argv[0]);
+        return 2;
+    }
+
+    FILE *f = fopen(out, "wb");
+    if(!f){ perror(out); return 1; }
+    if(write_npy_header(f, count) != 0){ perror(out); fclose(f); return 1; }
+
+    const size_t rec = record_size();
+    uint8_t *buf = malloc(rec * SCAN_CHUNK);
+    if(!buf){ fprintf(stderr, "seed_scan: out of memory\n"); fclose(f); return 1; }
+
+    double t0 = now_sec();
+    pthread_t tid[SCAN_MAX_THREADS];
+    scan_job_t job[SCAN_MAX_THREADS];
+    int spawned[SCAN_MAX_THREADS];
+    for(uint64_t done = 0; done < count; ){
+        uint32_t n = count - done < SCAN_CHUNK ? (uint32_t)(count - done) : SCAN_CHUNK;
+        uint32_t per = (n + threads - 1) / threads, used = 0;
+        for(uint32_t t = 0; t < threads && t * per < n; t++, used++){
+            uint32_t lo = t * per;
+            job[t] = (scan_job_t){ start + (done + lo) * stride, stride,
+                                   n - lo < per ? n - lo : per, buf + (size_t)lo * rec };
+            spawned[t] = pthread_create(&tid[t], NULL, scan_worker, &job[t]) == 0;
+            if(!spawned[t]) scan_worker(&job[t]);
+        }
+        for(uint32_t t = 0; t < used; t++)
+            if(spawned[t]) pthread_join(tid[t], NULL);
+        if(fwrite(buf, rec, n, f) != n){ perror(out); free(buf); fclose(f); return 1; }
+        done += n;
+    }
+    double dt = now_sec() - t0;
+    free(buf);
+    if(fclose(f) != 0){ perror(out); return 1; }
+
+    printf("Wrote %s (%llu seeds from 0x%llx, stride %llu, %zu-byte records, %.2f Mseeds/s)\n",
+           out, (unsigned long long)count, (unsigned long long)start, (unsigned long long)stride,
+           rec, (double)count / dt * 1e-6);
+    return 0;
+}
@@ -1,5 +1,7 @@
 #include "wav_writer.h"
 #include "generator.h"
+#include "trace.h"
+#include "gen_profile.h"
 #include <stdio.h>
 #include <stdlib.h>
 #include <math.h>
@@ -7,9 +9,9 @@
 /* extern counter defined in generator_step.c */
 extern int g_mid_trigger_count;
 
-#define MAX_SEG_FRAMES 424000 
-static float L[MAX_SEG_FRAMES], R[MAX_SEG_FRAMES];
-static int16_t pcm[MAX_SEG_FRAMES * 2];
+/* Rendered and written in fixed blocks, so memory does not grow with the
+ * segment length. */
+#define SEG_BLOCK 512u
 
 /* Fallback scalar RMS when assembly version not linked */
 #ifndef GENERATOR_RMS_ASM_PRESENT
@@ -36,25 +38,49 @@ int main(int argc, char **argv)
     generator_init(&g, seed);
 
     uint32_t total_frames = g.mt.seg_frames;
-    if(total_frames > MAX_SEG_FRAMES) total_frames = MAX_SEG_FRAMES;
+
+    char wavname[64];
+    sprintf(wavname, "seed_0x%llx.wav", (unsigned long long)seed);
+    wav_stream_t wav;
+    if(wav_stream_open(&wav, wavname, 2, SR, WAV_PCM16) != 0) return 1;
 
     printf("C-DBG before gen_process: step_samples=%u addr=%p\n", g.mt.step_samples, &g.mt.step_samples);
-    generator_process(&g, L, R, total_frames);
-    
-    /* RMS diagnostic to verify audio energy */
-    float rms = generator_compute_rms_asm(L, R, total_frames);
-    printf("C-POST rms=%f\n", rms);
-    printf("DEBUG: MID triggers fired = %d\n", g_mid_trigger_count);
+    float L[SEG_BLOCK], R[SEG_BLOCK];
+    double sum_sq = 0.0;
+    for(uint32_t done = 0; done < total_frames; ){
+        uint32_t n = total_frames - done;
+        if(n > SEG_BLOCK) n = SEG_BLOCK;
+        generator_process(&g, L, R, n);
 
-    for(uint32_t i=0;i<total_frames;i++){
-        pcm[2*i]   = (int16_t)(L[i]*32767);
-        pcm[2*i+1] = (int16_t)(R[i]*32767);
+        /* RMS diagnostic to verify audio energy, accumulated per block */
+        float block_rms = generator_compute_rms_asm(L, R, n);
+        sum_sq += (double)block_rms * block_rms * (double)(2 * n);
+
+        wav_stream_append_stereo(&wav, L, R, n);
+        done += n;
     }
+    if(wav_stream_close(&wav) != 0) return 1;
 
-    char wavname[64];
-    sprintf(wavname, "seed_0x%llx.wav", (unsigned long long)seed);
-    write_wav(wavname, pcm, total_frames, 2, SR);
+    float rms = (float)sqrt(sum_sq / (double)(2 * total_frames));
+    printf("C-POST rms=%f\n", rms);
+    printf("DEBUG: MID triggers fired = %d\n", g_mid_trigger_count);
+    if(g.events_dropped)
+        printf("WARNING: %u events dropped (event queue full)\n", g.events_dropped);
     printf("Wrote %s (%u frames, %.2f bpm, root %.2f Hz)\n", wavname, total_frames, g.mt.bpm, g.music.root_freq);
 
+#ifdef GEN_PROFILE_ENABLED
+    char profname[64];
+    sprintf(profname, "seed_0x%llx.profile.json", (unsigned long long)seed);
+    if(gen_profile_dump_json(profname) == 0)
+        printf("Wrote %s\n", profname);
+#endif
+
+#ifdef TRACE_ENABLED
+    char tracename[64];
+    sprintf(tracename, "seed_0x%llx.trace", (unsigned long long)seed);
+    if(trace_dump(tracename) == 0)
+        printf("Wrote %s (%llu records)\n", tracename, (unsigned long long)trace_count());
+#endif
+
     return 0;
 } 
\ No newline at end of file
@@ -1,3 +1,4 @@
+#define _DEFAULT_SOURCE   /* M_PI from <math.h> under -std=c11 on glibc */
 #include "shapes.h"
 #include "raster.h"
 #include <math.h>
@@ -30,16 +31,10 @@ static void rotate_point(float *x, float *y, float cx, float cy, float angle)
     *y = cy + ry;
 }
 
-void shapes_update_and_draw(uint32_t *fb, int w, int h)
+void shapes_update(void)
 {
-    int cx = w/2;
-    int cy = h/2;
-    float max_size = fminf(w,h) * 0.6f;
-    
     for(int i=0; i<g_count;){
         bass_shape_t *s = &g_shapes[i];
-        
-        /* update */
         if(s->scale < 1.0f) s->scale += 0.15f; /* fast growth */
         s->alpha -= 8;
         if(s->alpha < 0) s->alpha = 0;
@@ -50,6 +45,25 @@ void shapes_update_and_draw(uint32_t *fb, int w, int h)
             g_shapes[i] = g_shapes[--g_count];
             continue;
         }
+        ++i;
+    }
+}
+
+void shapes_update_and_draw(uint32_t *fb, int w, int h)
+{
+    shapes_update();
+    shapes_draw(fb, w, h);
+}
+
+/* Draw only: safe to call from several threads with different raster rows */
+void shapes_draw(uint32_t *fb, int w, int h)
+{
+    int cx = w/2;
+    int cy = h/2;
+    float max_size = fminf(w,h) * 0.6f;
+    
+    for(int i=0; i<g_count; i++){
+        const bass_shape_t *s = &g_shapes[i];
         
         /* draw with alpha blend simulation */
         float size = max_size * fminf(s->scale, 1.0f);
@@ -126,7 +140,5 @@ void shapes_update_and_draw(uint32_t *fb, int w, int h)
         
         /* draw outline only (thickness 3) */
         raster_poly(fb, w, h, vx, vy, n, col, false, 3);
-        
-        ++i;
     }
 } 
\ No newline at end of file
@@ -1,4 +1,5 @@
 #include "snare.h"
+#include "noise.h"
 #include <math.h>
 
 #define TAU 6.28318530717958647692f
@@ -25,20 +26,34 @@ void snare_trigger(snare_t *s)
 }
 
 #ifndef SNARE_ASM
+/* Noise comes from a precomputed NOISE_FILL block; the stream is rewound to
+ * the samples actually used when the envelope cuts the hit short.  With
+ * the default noise_block the output matches the per-sample
+ * rng_float_mono() loop exactly. */
 void snare_process(snare_t *s, float32_t *L, float32_t *R, uint32_t n)
 {
-    if (s->pos >= s->len) return;
-    for (uint32_t i = 0; i < n; ++i) {
-        if (s->pos >= s->len) break;
-        /* Envelope recurrence */
-        s->env *= s->env_coef;
-        float32_t noise = rng_float_mono(&s->rng);
-        float32_t sample = s->env * noise * SNARE_AMP;
-        L[i] += sample;
-        R[i] += sample;
-        if (s->env < 1e-4f) {
-            s->pos = s->len; break; }
-        s->pos++;
+    float32_t noise[NOISE_CHUNK];
+    uint32_t i = 0;
+    while (i < n && s->pos < s->len) {
+        uint32_t m = n - i;
+        if (m > s->len - s->pos) m = s->len - s->pos;
+        if (m > NOISE_CHUNK) m = NOISE_CHUNK;
+        rng_t start = s->rng;
+        NOISE_FILL(&s->rng, noise, m);
+
+        float32_t env = s->env, coef = s->env_coef;
+        uint32_t k = 0;
+        for (; k < m; ++k) {
+            env *= coef;
+            float32_t sample = env * noise[k] * SNARE_AMP;
+            L[i + k] += sample;
+            R[i + k] += sample;
+            if (env < 1e-4f) { ++k; s->pos = s->len; break; }
+        }
+        s->env = env;
+        if (s->pos < s->len) s->pos += k;
+        if (k < m) { s->rng = start; rng_skip(&s->rng, k); }
+        i += k;
     }
 }
 #endif // SNARE_ASM 
\ No newline at end of file
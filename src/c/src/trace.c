@@ -0,0 +1,61 @@
+#define _POSIX_C_SOURCE 199309L
+#include "trace.h"
+#include <stdio.h>
+#include <time.h>
+
+#if (TRACE_CAPACITY & (TRACE_CAPACITY - 1)) != 0
+#error "TRACE_CAPACITY must be a power of two"
+#endif
+
+static trace_record_t g_ring[TRACE_CAPACITY];
+static uint64_t g_head = 0; /* total records written */
+
+static inline uint64_t now_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ull + (uint64_t)ts.tv_nsec;
+}
+
+void trace_emit(uint16_t event, uint16_t voice, uint32_t aux,
+                float p0, float p1, float p2, float p3)
+{
+    trace_record_t *r = &g_ring[g_head & (TRACE_CAPACITY - 1)];
+    r->t_ns  = now_ns();
+    r->event = event;
+    r->voice = voice;
+    r->aux   = aux;
+    r->p[0] = p0; r->p[1] = p1; r->p[2] = p2; r->p[3] = p3;
+    g_head++;
+}
+
+void trace_reset(void) { g_head = 0; }
+
+uint64_t trace_count(void) { return g_head; }
+
+int trace_dump(const char *path)
+{
+    FILE *f = fopen(path, "wb");
+    if(!f){
+        perror("trace_dump: fopen");
+        return 1;
+    }
+
+    uint64_t total = g_head;
+    uint32_t stored = (total < TRACE_CAPACITY) ? (uint32_t)total : TRACE_CAPACITY;
+    uint64_t first = total - stored;
+
+    /* header: magic, version, record size, stored count, total emitted */
+    uint32_t hdr[4] = {TRACE_FILE_MAGIC, TRACE_FILE_VERSION,
+                       (uint32_t)sizeof(trace_record_t), stored};
+    fwrite(hdr, sizeof(uint32_t), 4, f);
+    fwrite(&total, sizeof(uint64_t), 1, f);
+
+    /* unwrap the ring so records come out oldest first */
+    for(uint64_t i = first; i < total; i++){
+        fwrite(&g_ring[i & (TRACE_CAPACITY - 1)], sizeof(trace_record_t), 1, f);
+    }
+
+    fclose(f);
+    return 0;
+}
@@ -72,10 +72,24 @@ bool video_frame_begin(void)
 
 void video_frame_end(void)
 {
-    /* upload framebuffer to texture & present */
-    SDL_UpdateTexture(g.tex, NULL, g.fb, g.width * sizeof(uint32_t));
+    video_frame_end_damage(NULL, 0, 0);
+}
+
+void video_frame_end_damage(const raster_damage_t *d, int dx, int dy)
+{
+    /* upload framebuffer (or its dirty rectangles) to texture & present */
+    if(!d){
+        SDL_UpdateTexture(g.tex, NULL, g.fb, g.width * sizeof(uint32_t));
+    } else {
+        for(int i = 0; i < d->nrects; i++){
+            const raster_rect_t *r = &d->rects[i];
+            SDL_Rect sr = { r->x, r->y, r->w, r->h };
+            SDL_UpdateTexture(g.tex, &sr, g.fb + r->y * g.width + r->x, g.width * sizeof(uint32_t));
+        }
+    }
+    SDL_Rect dst = { dx, dy, g.width, g.height };
     SDL_RenderClear(g.ren);
-    SDL_RenderCopy(g.ren, g.tex, NULL, NULL);
+    SDL_RenderCopy(g.ren, g.tex, NULL, &dst);
     SDL_RenderPresent(g.ren);
 }
 
@@ -0,0 +1,183 @@
+#define _DEFAULT_SOURCE   /* M_PI from <math.h> under -std=c11 on glibc */
+#include "vis_scene.h"
+#include "terrain.h"
+#include "particles.h"
+#include "shapes.h"
+#include <limits.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+
+#define BACKGROUND 0x000000FF /* black, alpha 255 */
+
+int vis_scene_init(vis_scene_t *s, uint64_t seed, int w, int h, bool track_damage)
+{
+    memset(s, 0, sizeof(*s));
+    s->w = w; s->h = h;
+    s->track_damage = track_damage;
+
+    terrain_init(seed);
+    particles_init();
+    shapes_init();
+    crt_fx_init(&s->fx, seed, w, h);
+    if(!s->fx.prev_frame || !s->fx.row_tmp || !s->fx.tile_stamp || !s->fx.noise) return 1;
+    s->threads = 1;
+    s->row_tmp = (uint32_t*)malloc((size_t)w * sizeof(uint32_t));
+    if(!s->row_tmp) return 1;
+
+    if(track_damage){
+        if(raster_damage_init(&s->drawn, w, h) || raster_damage_init(&s->out, w, h)
+           || raster_damage_init(&s->present, w, h)) return 1;
+        /* the framebuffer starts undefined: clear and upload all of it once */
+        raster_damage_all(&s->out);
+        raster_damage_build(&s->out);
+        raster_damage_all(&s->present);
+    }
+    return 0;
+}
+
+int vis_scene_set_threads(vis_scene_t *s, int threads)
+{
+    if(threads > BAND_POOL_MAX_THREADS) threads = BAND_POOL_MAX_THREADS;
+    if(s->threads > 1) band_pool_free(&s->pool);
+    s->threads = 1;
+    if(threads > 1){
+        if(band_pool_init(&s->pool, threads) != 0) return 1;
+        s->threads = s->pool.threads;
+    }
+    uint32_t *tmp = (uint32_t*)realloc(s->row_tmp, (size_t)s->threads * s->w * sizeof(uint32_t));
+    if(!tmp) return 1;
+    s->row_tmp = tmp;
+    return 0;
+}
+
+void vis_scene_free(vis_scene_t *s)
+{
+    if(s->threads > 1) band_pool_free(&s->pool);
+    free(s->row_tmp);
+    particles_free();
+    crt_fx_cleanup(&s->fx);
+    if(s->track_damage){
+        raster_damage_free(&s->drawn);
+        raster_damage_free(&s->out);
+        raster_damage_free(&s->present);
+    }
+}
+
+void vis_scene_presented(vis_scene_t *s)
+{
+    if(s->track_damage) raster_damage_reset(&s->present);
+}
+
+static void spawn_particles(int vw, int vh, int saw_hits)
+{
+    /* spawn particles on saw hits */
+    for(int h = 0; h < saw_hits; h++){
+        float cx = vw * 0.3f + (rand() % (int)(vw * 0.4f));
+        float cy = vh * 0.2f + (rand() % (int)(vh * 0.3f));
+        /* color with slight hue variation from base */
+        float hue = (float)(rand() % 360) / 360.0f;
+        uint8_t r = (uint8_t)(127 + 127 * cosf(hue * 2 * M_PI));
+        uint8_t g = (uint8_t)(127 + 127 * cosf((hue + 0.33f) * 2 * M_PI));
+        uint8_t b = (uint8_t)(127 + 127 * cosf((hue + 0.66f) * 2 * M_PI));
+        uint32_t color = (r << 24) | (g << 16) | (b << 8) | 0xFF;
+        particles_spawn_burst(cx, cy, 20, color);
+    }
+}
+
+static void spawn_shapes(int bass_hits)
+{
+    /* spawn bass shapes on bass hits */
+    for(int h = 0; h < bass_hits; h++){
+        shape_type_t types[] = {SHAPE_TRIANGLE, SHAPE_DIAMOND, SHAPE_HEXAGON, SHAPE_STAR, SHAPE_SQUARE};
+        shape_type_t type = types[rand() % 5];
+        /* color variation */
+        float hue = (float)(rand() % 360) / 360.0f;
+        uint8_t r = (uint8_t)(200 + 55 * cosf(hue * 2 * M_PI));
+        uint8_t g = (uint8_t)(200 + 55 * cosf((hue + 0.33f) * 2 * M_PI));
+        uint8_t b = (uint8_t)(200 + 55 * cosf((hue + 0.66f) * 2 * M_PI));
+        uint32_t color = (r << 24) | (g << 16) | (b << 8) | 0xFF;
+        shapes_spawn(type, color);
+    }
+}
+
+/* Everything that touches pixels, for rows y0 <= y < y1 only */
+static void render_band(void *ctx, int y0, int y1, int worker)
+{
+    vis_scene_t *s = (vis_scene_t *)ctx;
+    uint32_t *fb = s->fb;
+    const int vw = s->w, vh = s->h;
+    raster_set_rows(y0, y1);
+
+    /* clear: everything, or only what the last frame left non-background */
+    if(s->track_damage) raster_clear_damage(fb, vw, vh, BACKGROUND, &s->out);
+    else raster_clear(fb, vw, vh, BACKGROUND);
+
+    /* filled circle background */
+    raster_fill_circle(fb, vw, vh, s->cx, s->cy, s->radius, 0x005500FF);
+    /* outlined ring */
+    raster_circle(fb, vw, vh, s->cx, s->cy, s->radius+10, 0x00FF00FF, 4);
+
+    /* draw scrolling floor */
+    terrain_draw(fb, vw, vh, s->frame);
+
+    /* bass hit shapes (behind floor) */
+    shapes_draw(fb, vw, vh);
+    particles_draw(fb, vw, vh);
+
+    /* apply CRT post-processing effects */
+    crt_fx_apply_rows(&s->fx, fb, vw, vh, s->frame, y0, y1,
+                      s->track_damage ? &s->drawn : NULL, &s->out, s->row_tmp + (size_t)worker * vw);
+
+    raster_set_rows(0, INT_MAX);
+}
+
+void vis_scene_render(vis_scene_t *s, uint32_t *fb, float level, int saw_hits, int bass_hits)
+{
+    const int vw = s->w, vh = s->h;
+    s->fb = fb;
+
+    if(s->track_damage){
+        /* last frame's tiles are about to be cleared */
+        raster_damage_union(&s->present, &s->out);
+        raster_damage_reset(&s->drawn);
+        raster_set_damage(&s->drawn);
+    }
+
+    /* orbiting circle driven by RMS */
+    s->radius = 30 + (int)(80.0f * level);
+    s->cx = vw/2 + (int)(cosf(s->angle)* (vw/4));
+    s->cy = vh/2 + (int)(sinf(s->angle)* (vh/4));
+
+    /* State first, on this thread: shapes age before they are drawn, the
+     * new bursts move with the older particles, and shapes spawned on bass
+     * hits first appear next frame - the order the single pass had. */
+    shapes_update();
+    spawn_particles(vw, vh, saw_hits);
+    particles_update(vw, vh);
+    crt_fx_begin(&s->fx, vw, vh, s->track_damage);
+
+    if(s->threads > 1) band_pool_run(&s->pool, render_band, s, vh, VIS_BAND_ROWS);
+    else render_band(s, 0, vh, 0);
+
+    spawn_shapes(bass_hits);
+
+    if(s->track_damage){
+        raster_set_damage(NULL);
+        raster_damage_build(&s->out);
+        raster_damage_union(&s->present, &s->out);
+    }
+    /* jitter effect (screen shake): an offset for the presenter rather
+     * than a shifted copy of the framebuffer */
+    s->jitter_x = s->jitter_y = 0;
+    if(s->fx.jitter_amount > 0.01f && (rand() % 100) < 30){
+        int span = (int)(s->fx.jitter_amount * 2);
+        if(span > 0){ /* below 0.5 px the shake rounds to nothing */
+            s->jitter_x = (int)(-s->fx.jitter_amount + (rand() % span));
+            s->jitter_y = (int)(-s->fx.jitter_amount + (rand() % span));
+        }
+    }
+
+    s->angle += 0.02f;
+    s->frame++;
+}
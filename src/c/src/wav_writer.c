@@ -1,6 +1,7 @@
 #include "wav_writer.h"
 #include <stdio.h>
 #include <string.h>
+#include <math.h>
 
 static void write_le32(FILE *f, uint32_t v) { fwrite(&v, 4, 1, f); }
 static void write_le16(FILE *f, uint16_t v) { fwrite(&v, 2, 1, f); }
@@ -44,4 +45,178 @@ void write_wav(const char *path,
     fwrite(samples, block_align, frames, f);
 
     fclose(f);
-} 
\ No newline at end of file
+} 
+/* ---- streaming writer ---- */
+
+#define WAV_FORMAT_PCM   1
+#define WAV_FORMAT_FLOAT 3
+#define WAV_CONVERT_CHUNK 1024u  /* samples converted per pass */
+
+static uint32_t bytes_per_sample(wav_format_t fmt)
+{
+    return fmt == WAV_PCM24 ? 3u : fmt == WAV_FLOAT32 ? 4u : 2u;
+}
+
+/* Header with the given data size.  Float files carry the cbSize field and
+ * a fact chunk, as the spec requires for non-PCM formats. */
+static void write_stream_header(wav_stream_t *w, uint32_t data_bytes)
+{
+    FILE *f = w->f;
+    uint16_t bps = (uint16_t)bytes_per_sample(w->format);
+    uint16_t block_align = w->num_channels * bps;
+    int is_float = w->format == WAV_FLOAT32;
+    uint32_t fmt_size = is_float ? 18 : 16;
+    uint32_t header = 12 + 8 + fmt_size + (is_float ? 12 : 0) + 8;
+
+    fwrite("RIFF", 1, 4, f);
+    write_le32(f, header - 8 + data_bytes);
+    fwrite("WAVE", 1, 4, f);
+    fwrite("fmt ", 1, 4, f);
+    write_le32(f, fmt_size);
+    write_le16(f, is_float ? WAV_FORMAT_FLOAT : WAV_FORMAT_PCM);
+    write_le16(f, w->num_channels);
+    write_le32(f, w->sample_rate);
+    write_le32(f, w->sample_rate * block_align);
+    write_le16(f, block_align);
+    write_le16(f, bps * 8);
+    if(is_float){
+        write_le16(f, 0);                       /* cbSize */
+        fwrite("fact", 1, 4, f);
+        write_le32(f, 4);
+        write_le32(f, block_align ? data_bytes / block_align : 0); /* frames */
+    }
+    fwrite("data", 1, 4, f);
+    w->data_size_pos = header - 4;
+    write_le32(f, data_bytes);
+}
+
+static void stream_flush(wav_stream_t *w)
+{
+    if(w->buf_used){
+        fwrite(w->buf, 1, w->buf_used, w->f);
+        w->buf_used = 0;
+    }
+}
+
+/* Room for `bytes` more in the output buffer, flushing if needed. */
+static uint8_t *stream_reserve(wav_stream_t *w, uint32_t bytes)
+{
+    if(w->buf_used + bytes > WAV_STREAM_BUF_BYTES) stream_flush(w);
+    uint8_t *p = w->buf + w->buf_used;
+    w->buf_used += bytes;
+    return p;
+}
+
+/* The converters are branch-free (clamp via fminf/fmaxf, truncating cast)
+ * so the compiler vectorizes them.  16-bit keeps the renderer's historical
+ * scale of 32767 and truncation, so in-range samples are bit-identical. */
+void wav_convert_s16(const float *restrict in, int16_t *restrict out, uint32_t n)
+{
+    for(uint32_t i = 0; i < n; i++)
+        out[i] = (int16_t)(fmaxf(-1.0f, fminf(1.0f, in[i])) * 32767.0f);
+}
+
+static void convert_s24(const float *restrict in, uint8_t *restrict out, uint32_t n)
+{
+    int32_t tmp[WAV_CONVERT_CHUNK];
+    for(uint32_t i = 0; i < n; i++)
+        tmp[i] = (int32_t)(fmaxf(-1.0f, fminf(1.0f, in[i])) * 8388607.0f);
+    for(uint32_t i = 0; i < n; i++){
+        out[3*i]   = (uint8_t)tmp[i];
+        out[3*i+1] = (uint8_t)(tmp[i] >> 8);
+        out[3*i+2] = (uint8_t)(tmp[i] >> 16);
+    }
+}
+
+static void convert_f32(const float *restrict in, float *restrict out, uint32_t n)
+{
+    for(uint32_t i = 0; i < n; i++)
+        out[i] = fmaxf(-1.0f, fminf(1.0f, in[i]));
+}
+
+/* Convert n interleaved samples (n <= WAV_CONVERT_CHUNK) into the buffer. */
+static void stream_put(wav_stream_t *w, const float *in, uint32_t n)
+{
+    uint8_t *dst = stream_reserve(w, n * bytes_per_sample(w->format));
+    switch(w->format){
+    case WAV_PCM16:   wav_convert_s16(in, (int16_t *)dst, n); break;
+    case WAV_PCM24:   convert_s24(in, dst, n); break;
+    case WAV_FLOAT32: convert_f32(in, (float *)dst, n); break;
+    }
+}
+
+int wav_stream_open(wav_stream_t *w, const char *path, uint16_t num_channels,
+                    uint32_t sample_rate, wav_format_t format)
+{
+    w->f = fopen(path, "wb");
+    if(!w->f){
+        perror("wav_stream_open: fopen");
+        return 1;
+    }
+    w->frames = 0;
+    w->num_channels = num_channels;
+    w->sample_rate = sample_rate;
+    w->format = format;
+    w->buf_used = 0;
+    write_stream_header(w, 0); /* sizes patched on close */
+    return 0;
+}
+
+void wav_stream_append(wav_stream_t *w, const int16_t *samples, uint32_t frames)
+{
+    if(!w->f || w->format != WAV_PCM16) return;
+    stream_flush(w);
+    fwrite(samples, (size_t)w->num_channels * 2, frames, w->f);
+    w->frames += frames;
+}
+
+void wav_stream_append_float(wav_stream_t *w, const float *samples, uint32_t frames)
+{
+    if(!w->f) return;
+    uint32_t n = frames * w->num_channels;
+    for(uint32_t done = 0; done < n; ){
+        uint32_t c = n - done < WAV_CONVERT_CHUNK ? n - done : WAV_CONVERT_CHUNK;
+        stream_put(w, samples + done, c);
+        done += c;
+    }
+    w->frames += frames;
+}
+
+void wav_stream_append_stereo(wav_stream_t *w, const float *L, const float *R, uint32_t frames)
+{
+    if(!w->f) return;
+    if(w->num_channels == 1 || !R){
+        wav_stream_append_float(w, L, frames);
+        return;
+    }
+    float inter[WAV_CONVERT_CHUNK];
+    const uint32_t chunk = WAV_CONVERT_CHUNK / 2;
+    for(uint32_t done = 0; done < frames; ){
+        uint32_t c = frames - done < chunk ? frames - done : chunk;
+        for(uint32_t i = 0; i < c; i++){
+            inter[2*i]   = L[done + i];
+            inter[2*i+1] = R[done + i];
+        }
+        stream_put(w, inter, c * 2);
+        done += c;
+    }
+    w->frames += frames;
+}
+
+int wav_stream_close(wav_stream_t *w)
+{
+    if(!w->f) return 1;
+    stream_flush(w);
+    uint64_t data_bytes = w->frames * w->num_channels * bytes_per_sample(w->format);
+    if(data_bytes > 0xFFFFFFFFull - w->data_size_pos - 4){
+        fprintf(stderr, "wav_stream_close: %llu bytes exceed the 4 GiB RIFF limit; header sizes clamped\n",
+                (unsigned long long)data_bytes);
+        data_bytes = 0xFFFFFFFFull - w->data_size_pos - 4;
+    }
+    rewind(w->f);
+    write_stream_header(w, (uint32_t)data_bytes);
+    int err = ferror(w->f);
+    err |= fclose(w->f);
+    w->f = NULL;
+    return err != 0;
+}
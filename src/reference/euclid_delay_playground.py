@@ -1,11 +1,16 @@
 import math
 import argparse
 import colorsys
+import sys
 import threading
+from pathlib import Path
 import numpy as np
 import pygame
 import random
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools'))
+from euclid_table import euclid_mask  # noqa: E402
+
 """
 euclid_delay_playground.py  – Sparse Euclidean grooves + stereo delay
 
@@ -80,19 +85,8 @@ print(f"Delay {delay_factor:g} beats ({delay_ms} ms), feedback {feedback:.2f}")
 delay_samples = int(SR*delay_ms/1000)
 
 # ---------- EUCLIDEAN RHYTHMS ----------
-
-def euclidean(pulses:int, steps:int):
-    """Return list of 0/1 per step using the Bjorklund algorithm (bucket method)."""
-    pattern=[]
-    bucket=0
-    for _ in range(steps):
-        bucket+=pulses
-        if bucket>=steps:
-            bucket-=steps
-            pattern.append(1)
-        else:
-            pattern.append(0)
-    return pattern
+# Bucket patterns come from the shared table (tools/euclid_table.py, the
+# same one the C engine compiles in) as bitmasks, bit i = step i.
 
 step_count_bar = 4*STEPS_PER_BEAT  # 16 steps
 
@@ -100,15 +94,11 @@ kick_pulses  = int(grng.integers(1,4))  # 1-3 hits per bar
 snare_pulses = int(grng.integers(0,3))  # maybe 0-2 hits
 hat_pulses   = int(grng.integers(2,5))  # 2-4 ticks
 
-kick_pattern  = euclidean(kick_pulses, step_count_bar)
-snare_pattern = euclidean(snare_pulses, step_count_bar)
-hat_pattern   = euclidean(hat_pulses, step_count_bar)
-
-# Rotate patterns randomly
+# Rotate patterns randomly (a bit rotation of the table entry)
 rot = int(grng.integers(0,step_count_bar))
-kick_pattern  = kick_pattern[rot:]+kick_pattern[:rot]
-snare_pattern = snare_pattern[rot:]+snare_pattern[:rot]
-hat_pattern   = hat_pattern[rot:]+hat_pattern[:rot]
+kick_mask  = euclid_mask(kick_pulses, step_count_bar, rot)
+snare_mask = euclid_mask(snare_pulses, step_count_bar, rot)
+hat_mask   = euclid_mask(hat_pulses, step_count_bar, rot)
 
 # ---------- AUDIO SEGMENT ----------
 
@@ -135,15 +125,15 @@ def make_segment(sr:int, lfsr_state:int):
 
         bar_pos = step % step_count_bar
         # ----- drums -----
-        if kick_pattern[bar_pos]==1:
+        if kick_mask >> bar_pos & 1:
             env = np.exp(-20*np.linspace(0,step_sec,n))
             tone = np.sin(2*math.pi*50*np.linspace(0,step_sec,n))
             sl += 0.8*env[:,None]*tone[:,None]
-        if snare_pattern[bar_pos]==1:
+        if snare_mask >> bar_pos & 1:
             env=np.exp(-35*np.linspace(0,step_sec,n))
             noise=grng.uniform(-1,1,n)[:,None]
             sl += 0.4*env[:,None]*noise
-        if hat_pattern[bar_pos]==1:
+        if hat_mask >> bar_pos & 1:
             env=np.exp(-120*np.linspace(0,step_sec,n))
             noise=grng.uniform(-1,1,n)[:,None]
             sl += 0.15*env[:,None]*noise
@@ -0,0 +1,34 @@
+"""Build the C tree with opt-in Makefile flags in a scratch copy.
+
+The Makefile keeps every object in src/*.o and does not track CFLAGS, so
+building FM_FAST=1 (say) in place would leave fast objects behind for the
+next test's default build.  build_variant() copies the sources to a
+scratch directory and runs make there instead.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+
+def build_variant(dest: Path, *targets: str, **flags: str) -> Path:
+    """Copy src/c (sources only) and src/asm under *dest*, run ``make <targets> FLAG=value ...``.
+
+    Returns the copied C directory; run targets write their WAVs there.
+    """
+
+    cdir = dest / "src" / "c"
+    (cdir / "src").mkdir(parents=True)
+    shutil.copy2(SRC / "c" / "Makefile", cdir)
+    shutil.copytree(SRC / "c" / "include", cdir / "include")
+    for c in (SRC / "c" / "src").glob("*.c"):
+        shutil.copy2(c, cdir / "src")
+    shutil.copytree(SRC / "asm", dest / "src" / "asm", ignore=shutil.ignore_patterns("*.o"))
+    subprocess.run(["make", "-C", str(cdir), *targets, *(f"{k}={v}" for k, v in flags.items())],
+                   check=True, stdout=subprocess.DEVNULL)
+    return cdir
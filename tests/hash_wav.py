@@ -7,6 +7,8 @@ Two modes are available:
 
 The *coarse* mode lets us keep unit tests green when a new NEON / ASM
 implementation changes results only at the sub-LSB level (< ≈0.1 dB).
+A sample that rounds across one of the dropped bits still flips it, though;
+tests/wav_compare.py compares block-wise against tolerances instead.
 """
 
 from __future__ import annotations
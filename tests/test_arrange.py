@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import struct
+import subprocess
+import wave
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / 'C-version'
+SEG_WAV = CVER / 'seed_0xcafebabe.wav'
+
+
+def test_single_segment_matches_segment_render():
+    """One streamed segment is byte-identical to bin/segment's output."""
+    subprocess.run(['make', '-C', str(CVER), 'clean', 'segment', 'arrange', 'NO_RUN=1'], check=True)
+    subprocess.run([str(CVER / 'bin' / 'segment')], cwd=CVER, check=True)
+    subprocess.run([str(CVER / 'bin' / 'arrange'), '--segments', '1', '--block', '333',
+                    '--out', 'arrange_one.wav'], cwd=CVER, check=True)
+    assert (CVER / 'arrange_one.wav').read_bytes() == SEG_WAV.read_bytes()
+
+
+def test_seconds_sets_exact_length():
+    subprocess.run(['make', '-C', str(CVER), 'arrange', 'NO_RUN=1'], check=True)
+    subprocess.run([str(CVER / 'bin' / 'arrange'), '--seconds', '30', '--out', 'arrange_30s.wav'],
+                   cwd=CVER, check=True)
+    with wave.open(str(CVER / 'arrange_30s.wav'), 'rb') as wf:
+        assert wf.getnframes() == 30 * 44100
+
+
+def test_lookahead_limiter_never_clips():
+    """With look-ahead the limiter holds every sample under its -0.1 dBFS threshold."""
+    subprocess.run(['make', '-C', str(CVER), 'arrange', 'NO_RUN=1'], check=True)
+    subprocess.run([str(CVER / 'bin' / 'arrange'), '--segments', '6', '--lookahead', '1.5',
+                    '--out', 'arrange_lookahead.wav'], cwd=CVER, check=True)
+    with wave.open(str(CVER / 'arrange_lookahead.wav'), 'rb') as wf:
+        raw = wf.readframes(wf.getnframes())
+    peak = max(abs(s) for s in struct.unpack(f'<{len(raw) // 2}h', raw))
+    assert peak <= int(32767 * 10 ** (-0.1 / 20)) + 1
@@ -2,7 +2,7 @@ import subprocess
 from pathlib import Path
 import pytest
 
-from tests.hash_wav import hash_wav
+from tests.wav_compare import check_baseline
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -19,9 +19,8 @@ def test_bass_hash():
     # Build and render the bass-only WAV
     subprocess.run(["make", "-C", str(CVER), "clean", "bass"], check=True)
     assert WAV.exists(), "bass_only.wav missing after build"
-    h = hash_wav(WAV, mode="coarse")
-    expected = BASE.read_text().strip()
-    assert h == expected, f"bass_only.wav hash mismatch: got {h}, expected {expected}"
+    res = check_baseline(WAV, BASE)
+    assert res, f"bass_only.wav: {res}"
 
 @pytest.mark.parametrize("make_target, wav_name, baseline_file", PRESETS)
 def test_bass_hash_parametrized(make_target, wav_name, baseline_file):
@@ -29,7 +28,5 @@ def test_bass_hash_parametrized(make_target, wav_name, baseline_file):
     subprocess.run(["make", "-C", str(CVER), "clean", make_target], check=True)
     wav_path = CVER / wav_name
     assert wav_path.exists(), f"{wav_name} missing after build"
-    h = hash_wav(wav_path, mode="coarse")
-    baseline_path = ROOT / "tests" / "baseline" / f"{baseline_file}"
-    expected = baseline_path.read_text().strip()
-    assert h == expected, f"{wav_name} hash mismatch: got {h}, expected {expected}" 
\ No newline at end of file
+    res = check_baseline(wav_path, ROOT / "tests" / "baseline" / f"{baseline_file}")
+    assert res, f"{wav_name}: {res}" 
\ No newline at end of file
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import re
+import subprocess
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / 'C-version'
+
+
+def test_fixed_point_effects_track_float_reference():
+    """The fused 8-bit pass stays within a few levels of the float per-effect original."""
+    subprocess.run(['make', '-C', str(CVER), 'bin/bench_crt'], check=True)
+    for seed in ('0x2', '0x5', '0xcafebabe'):
+        r = subprocess.run([str(CVER / 'bin' / 'bench_crt'), '60', '320', '240', seed],
+                           cwd=CVER, capture_output=True, text=True, check=True)
+        m = re.search(r'max (\d+), mean ([\d.]+)', r.stdout)
+        assert m, r.stdout
+        assert int(m.group(1)) <= 4 and float(m.group(2)) < 0.25, r.stdout
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'tools'))
+
+import euclid_table  # noqa: E402
+
+
+def test_masks_match_bucket_walk_and_list_rotation():
+    """Every table entry, rotated, equals the bucket pattern rotated by slicing."""
+    for steps in range(1, euclid_table.EUCLID_MAX_STEPS + 1):
+        for pulses in range(steps + 1):
+            base, bucket = [], 0
+            for _ in range(steps):
+                bucket += pulses
+                base.append(int(bucket >= steps))
+                bucket -= steps if bucket >= steps else 0
+            for rot in (0, 1, steps // 2, steps - 1):
+                assert euclid_table.pattern(pulses, steps, rot) == base[rot:] + base[:rot]
+
+
+def test_c_header_is_up_to_date(tmp_path):
+    out = tmp_path / 'euclid_table.h'
+    euclid_table.emit_c(out)
+    assert out.read_text() == (ROOT / 'src' / 'c' / 'include' / 'euclid_table.h').read_text()
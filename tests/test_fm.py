@@ -1,7 +1,8 @@
 import subprocess
 from pathlib import Path
 
-from tests.hash_wav import hash_wav
+from tests.build_variant import build_variant
+from tests.wav_compare import check_baseline, compare_wav
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -11,6 +12,25 @@ BASE = ROOT / "tests" / "baseline" / "fm_c_hash.txt"
 def test_fm_hash():
     subprocess.run(["make", "-C", str(CVER), "clean", "fm"], check=True)
     assert WAV.exists(), "fm.wav missing"
-    h = hash_wav(WAV, mode="coarse")
-    expected = BASE.read_text().strip()
-    assert h == expected, f"fm.wav hash mismatch: got {h}, expected {expected}" 
\ No newline at end of file
+    res = check_baseline(WAV, BASE)
+    assert res, f"fm.wav: {res}"
+
+def test_fm_pool_overlap_and_steal():
+    """Overlapping notes both sound and a full pool steals the oldest slot, matching per-slot voices exactly."""
+    res = subprocess.run(["make", "-C", str(CVER), "fm_pool_check"], capture_output=True, text=True)
+    assert res.returncode == 0, res.stdout + res.stderr
+    assert "overlap: 2 notes, up to 2 at once: ok" in res.stdout
+    assert "steal: " in res.stdout and res.stdout.count(": ok") == 2
+
+
+def test_fm_fast_matches_reference_kernel(tmp_path):
+    """FM_FAST=1 renders within a tight tolerance of the reference kernel (but not bit-identical)."""
+    ref = build_variant(tmp_path / "ref", "segment", NO_RUN="1")
+    fast = build_variant(tmp_path / "fast", "segment", NO_RUN="1", FM_FAST="1")
+    for seed in ("0x3", "0xcafebabe"):
+        for cdir in (ref, fast):
+            subprocess.run([str(cdir / "bin" / "segment"), seed], cwd=cdir, check=True, stdout=subprocess.DEVNULL)
+        wav = f"seed_{seed}.wav"
+        res = compare_wav(ref / wav, fast / wav, rms_db=-55.0, peak=0.01)
+        assert res, f"{wav}: {res}"
+        assert res.worst_peak > 0.0, f"{wav}: FM_FAST build rendered bit-identical audio"
@@ -2,7 +2,7 @@ import subprocess
 from pathlib import Path
 import pytest
 
-from tests.hash_wav import hash_wav
+from tests.wav_compare import check_baseline
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -20,6 +20,5 @@ def test_fm_preset_hash(make_target: str, wav_name: str, baseline_file: str):
     subprocess.run(["make", "-C", str(CVER), "clean", make_target], check=True)
     wav_path = CVER / wav_name
     assert wav_path.exists(), f"{wav_name} missing after build"
-    h = hash_wav(wav_path, mode="coarse")
-    expected = (ROOT / "tests" / "baseline" / baseline_file).read_text().strip()
-    assert h == expected, f"{wav_name} hash mismatch: got {h}, expected {expected}" 
\ No newline at end of file
+    res = check_baseline(wav_path, ROOT / "tests" / "baseline" / baseline_file)
+    assert res, f"{wav_name}: {res}" 
\ No newline at end of file
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / 'C-version'
+sys.path.insert(0, str(ROOT / 'tools'))
+from seed_space import describe_seed, load_table  # noqa: E402
+
+VOICE_COUNT = {'kick': 'n_kick', 'snare': 'n_snare', 'hat': 'n_hat', 'melody': 'n_melody',
+               'mid_simple': 'n_mid_simple', 'mid_fm': 'n_mid_fm', 'bass_fm': 'n_bass'}
+
+
+def _export(seed: str, out: str) -> None:
+    subprocess.run([str(CVER / 'bin' / 'render_video'), seed, '--events', out],
+                   cwd=CVER, check=True, capture_output=True)
+
+
+def test_event_stream_matches_the_schedule():
+    """One pass of the pattern publishes every queued note once, in time order, with its voice."""
+    subprocess.run(['make', '-C', str(CVER), 'render_video', 'NO_RUN=1'], check=True)
+    for seed in (0x3, 0xcafebabe, 0x1234):
+        _export(hex(seed), 'events.json')
+        doc = json.loads((CVER / 'events.json').read_text())
+        d = describe_seed(seed)
+        loop = 32 * d['step_samples']   # TOTAL_STEPS: the queue repeats after this
+        events = [e for e in doc['events'] if e['time'] < loop]
+        assert doc['sample_rate'] == 44100
+        assert [e['time'] for e in events] == sorted(e['time'] for e in events)
+        assert len(events) == d['events']
+        for voice, col in VOICE_COUNT.items():
+            assert sum(e['voice'] == voice for e in events) == d[col], (hex(seed), voice)
+        assert all(e['freq'] > 0 for e in events if e['type'] in ('melody', 'mid', 'fm_bass'))
+
+
+@pytest.mark.parametrize('numpy', ['numpy', 'no-numpy'])
+def test_npy_export_matches_json(numpy, monkeypatch):
+    """The .npy export loads (structured array or list of dicts) with the JSON export's times and freqs."""
+    if numpy == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)   # import numpy raises ImportError
+    subprocess.run(['make', '-C', str(CVER), 'render_video', 'NO_RUN=1'], check=True)
+    _export('0xcafebabe', 'events.json')
+    _export('0xcafebabe', 'events.npy')
+    table = load_table(CVER / 'events.npy')
+    if isinstance(table, list):
+        times, freqs = [r['time'] for r in table], [r['freq'] for r in table]
+    else:
+        times, freqs = table['time'].tolist(), table['freq'].tolist()
+    events = json.loads((CVER / 'events.json').read_text())['events']
+    assert len(times) == len(events) > 0
+    for t, f, e in zip(times, freqs, events):
+        assert int(t) == e['time']
+        assert abs(float(f) - e['freq']) < 1e-3
+
+
+def test_ring_readers_on_other_threads():
+    """Readers draining the ring on other threads never see a torn record and account for every event."""
+    subprocess.run(['make', '-C', str(CVER), 'event_ring_stress', 'NO_RUN=1'], check=True)
+    res = subprocess.run([str(CVER / 'bin' / 'event_ring_stress'), '--events', '1000000', '--readers', '3'],
+                         capture_output=True, text=True, timeout=120)
+    assert res.returncode == 0, res.stdout
+    assert res.stdout.rstrip().endswith(': ok')
+
+
+def test_events_fire_on_their_exact_sample():
+    """Off-grid and sub-block event times trigger on their own sample at block sizes 1 .. 1537."""
+    res = subprocess.run(['make', '-C', str(CVER), 'event_timing_check'], capture_output=True, text=True)
+    assert res.returncode == 0, res.stdout + res.stderr
+    for block in (1, 2, 7, 63, 509, 1537):
+        assert f'block {block:4d}: ok' in res.stdout
+    assert 'event_timing_check: 9 events, 9 block sizes: ok' in res.stdout
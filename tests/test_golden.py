@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+import subprocess
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / 'C-version'
+sys.path.insert(0, str(ROOT / 'tools'))
+
+import golden  # noqa: E402
+
+
+def _golden(*args):
+    return subprocess.run([sys.executable, str(ROOT / 'tools' / 'golden.py'), *args],
+                          capture_output=True, text=True)
+
+
+def test_verify_reports_first_drifting_second(tmp_path):
+    """A fresh database verifies clean; a corrupted per-second digest is located."""
+    db = tmp_path / 'golden.tsv'
+    assert _golden('build', '--start', '0xcafebabe', '--count', '6', '--threads', '3', '--db', str(db)).returncode == 0
+    sources, _, records = golden.load(db)
+    assert len(records) == 6 and sources
+    for r in records.values():
+        assert len(r['seconds']) == -(-r['frames'] // golden.SR)
+
+    res = _golden('verify', '--db', str(db), '--all', '--threads', '2')
+    assert res.returncode == 0, res.stdout
+    assert 're-rendering 6 of 6 seeds' in res.stdout
+
+    lines = db.read_text().splitlines()
+    i = next(k for k, line in enumerate(lines) if line.startswith('0x00000000cafebabf'))
+    fields = lines[i].split('\t')
+    fields[4 + 2] = '0' * 16
+    lines[i] = '\t'.join(fields)
+    db.write_text('\n'.join(lines) + '\n')
+    res = _golden('verify', '--db', str(db), '--all')
+    assert res.returncode == 1
+    assert '0x00000000cafebabf: drift at second 2 ' in res.stdout
+    assert '1 of 6 re-rendered seeds drifted' in res.stdout
+
+
+def test_incremental_selection():
+    """Only the seeds whose paths a changed file touches are re-rendered."""
+    records = {
+        1: {'paths': golden.KICK | golden.MID_FM | 1 << 8},
+        2: {'paths': golden.HAT | golden.BASS_FM | 1 << 14},
+        3: {'paths': golden.MID_SIMPLE},
+    }
+    old = {'src/c/src/kick.c': 'a', 'src/c/src/fm_presets.c:FM_BASS_PLUCKY': 'b',
+           'src/c/src/vis_scene.c': 'c', 'src/c/src/generator.c': 'd'}
+
+    def pick(name=None):
+        new = {**old, name: 'x'} if name else old
+        return golden.select(records, golden.changed_paths(old, new)[0])
+
+    assert pick() == []
+    assert pick('src/c/src/vis_scene.c') == []
+    assert pick('src/c/src/kick.c') == [1]
+    assert pick('src/c/src/fm_presets.c:FM_BASS_PLUCKY') == [2]
+    assert pick('src/c/src/generator.c') == [1, 2, 3]
+    assert golden.affected_paths('src/c/src/gen_event.c') == golden.ALL
+    assert golden.affected_paths('src/c/src/wav_writer.c') == golden.ALL
+    assert golden.affected_paths('src/c/src/gen_bells.c') == 0
+
+
+def test_wav_digest_matches_segment(tmp_path):
+    """The digests of bin/segment's WAV equal bin/golden's for the same seed."""
+    db = tmp_path / 'golden.tsv'
+    assert _golden('build', '--start', '0xcafebabe', '--count', '1', '--db', str(db)).returncode == 0
+    _, _, records = golden.load(db)
+    subprocess.run(['make', '-C', str(CVER), 'segment', 'NO_RUN=1'], check=True)
+    subprocess.run([str(CVER / 'bin' / 'segment'), '0xcafebabe'], cwd=CVER, check=True, stdout=subprocess.DEVNULL)
+    frames, coarse, seconds = golden.wav_digests(CVER / 'seed_0xcafebabe.wav')
+    r = records[0xcafebabe]
+    assert (frames, coarse, seconds) == (r['frames'], r['coarse'], r['seconds'])
@@ -1,7 +1,7 @@
 import subprocess
 from pathlib import Path
 
-from tests.hash_wav import hash_wav
+from tests.wav_compare import check_baseline
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -11,6 +11,5 @@ BASE = ROOT / "tests" / "baseline" / "hat_hash.txt"
 def test_hat_hash():
     subprocess.run(["make", "-C", str(CVER), "clean", "hat"], check=True)
     assert WAV.exists(), "hat.wav missing after build"
-    h = hash_wav(WAV, mode="coarse")
-    expected = BASE.read_text().strip()
-    assert h == expected, f"hat.wav hash mismatch: got {h}, expected {expected}" 
\ No newline at end of file
+    res = check_baseline(WAV, BASE)
+    assert res, f"hat.wav: {res}"
\ No newline at end of file
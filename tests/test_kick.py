@@ -1,7 +1,7 @@
 import subprocess
 from pathlib import Path
 
-from tests.hash_wav import hash_wav
+from tests.wav_compare import check_baseline
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -11,6 +11,5 @@ BASE = ROOT / "tests" / "baseline" / "kick_hash.txt"
 def test_kick_hash():
     subprocess.run(["make", "-C", str(CVER), "clean", "kick"], check=True)
     assert WAV.exists()
-    h = hash_wav(WAV, mode="coarse")
-    expected = BASE.read_text().strip()
-    assert h == expected 
\ No newline at end of file
+    res = check_baseline(WAV, BASE)
+    assert res, f"kick.wav: {res}"
\ No newline at end of file
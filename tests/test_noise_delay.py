@@ -1,7 +1,7 @@
 import subprocess
 from pathlib import Path
 
-from tests.hash_wav import hash_wav
+from tests.wav_compare import check_baseline
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -13,6 +13,5 @@ def test_delay_hash():
     # Build delay.wav via make target (includes asm delay + noise)
     subprocess.run(["make", "-C", str(CVER), "clean", "delay"], check=True)
     assert WAV.exists(), "delay build did not create wav"
-    h = hash_wav(WAV, mode="coarse")
-    expected = BASE.read_text().strip()
-    assert h == expected, f"WAV hash mismatch: got {h}, expected {expected}" 
\ No newline at end of file
+    res = check_baseline(WAV, BASE)
+    assert res, f"delay.wav: {res}"
\ No newline at end of file
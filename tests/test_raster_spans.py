@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / 'C-version'
+
+
+def test_span_rasterizers_match_per_pixel_originals():
+    """Rings and thick outlines drawn as spans hit exactly the pixels the old kernels did."""
+    subprocess.run(['make', '-C', str(CVER), 'bin/bench_raster'], check=True)
+    r = subprocess.run([str(CVER / 'bin' / 'bench_raster'), '1'], cwd=CVER, capture_output=True, text=True)
+    assert r.returncode == 0, r.stdout + r.stderr
+    assert ' 0 mismatched cases' in r.stdout
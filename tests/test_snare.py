@@ -1,7 +1,12 @@
+import math
+import re
 import subprocess
+import wave
+from array import array
 from pathlib import Path
 
-from tests.hash_wav import hash_wav
+from tests.build_variant import build_variant
+from tests.wav_compare import check_baseline, compare_wav
 
 ROOT = Path(__file__).resolve().parent.parent
 CVER = ROOT / "C-version"
@@ -11,6 +16,27 @@ BASE = ROOT / "tests" / "baseline" / "snare_hash.txt"
 def test_snare_hash():
     subprocess.run(["make", "-C", str(CVER), "clean", "snare"], check=True)
     assert WAV.exists(), "snare.wav missing after build"
-    h = hash_wav(WAV, mode="coarse")
-    expected = BASE.read_text().strip()
-    assert h == expected, f"snare.wav hash mismatch: got {h}, expected {expected}" 
\ No newline at end of file
+    res = check_baseline(WAV, BASE)
+    assert res, f"snare.wav: {res}"
+
+
+def _level_db(path: Path) -> float:
+    with wave.open(str(path), "rb") as wf:
+        x = array("h", wf.readframes(wf.getnframes()))
+    return 10.0 * math.log10(sum(v * v for v in x) / len(x) / 32768.0 ** 2)
+
+
+def test_noise_fast_matches_reference_noise(tmp_path):
+    """NOISE_FAST=1 is a different noise stream with the same level, spectrum and statistics."""
+    ref = build_variant(tmp_path / "ref", "snare", "hat")
+    fast = build_variant(tmp_path / "fast", "snare", "hat", "bin/bench_noise", NOISE_FAST="1")
+    for wav in ("snare.wav", "hat.wav"):
+        # Sample differences are meaningless between two noise streams: compare per-block spectra
+        res = compare_wav(ref / wav, fast / wav, rms_db=0.0, peak=2.0, spec_db=6.0)
+        assert res, f"{wav}: {res}"
+        assert res.worst_peak > 0.01, f"{wav}: NOISE_FAST build rendered the reference noise"
+        assert abs(_level_db(ref / wav) - _level_db(fast / wav)) < 0.5, wav
+
+    out = subprocess.run([str(fast / "bin" / "bench_noise"), "5"], capture_output=True, text=True, check=True).stdout
+    mean, var = map(float, re.search(r"mean ([-+.\d]+)\s+var ([.\d]+)", out).groups())
+    assert abs(mean) < 0.002 and abs(var - 1.0 / 3.0) < 0.002, out
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+import subprocess
+import wave
+from array import array
+from pathlib import Path
+
+from tests.hash_wav import hash_wav
+from tests.wav_compare import BLOCK, check_baseline, compare_wav, fingerprint, fingerprints_match
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / 'C-version'
+
+
+def _render(tmp_path: Path):
+    """Three seconds of a real mix as int16 samples, plus the WAV parameters."""
+    subprocess.run(['make', '-C', str(CVER), 'segment', 'NO_RUN=1'], check=True)
+    subprocess.run([str(CVER / 'bin' / 'segment'), '0xcafebabe'], cwd=tmp_path, check=True,
+                   stdout=subprocess.DEVNULL)
+    with wave.open(str(tmp_path / 'seed_0xcafebabe.wav'), 'rb') as wf:
+        return wf.getparams(), array('h', wf.readframes(3 * wf.getframerate()))
+
+
+def _write(path: Path, params, samples: array) -> Path:
+    with wave.open(str(path), 'wb') as wf:
+        wf.setparams(params)
+        wf.writeframes(samples.tobytes())
+    return path
+
+
+def test_sub_lsb_drift_passes_where_the_coarse_hash_flips(tmp_path):
+    params, ref = _render(tmp_path)
+    rng = random.Random(1)
+    drift = array('h', (max(-32768, min(32767, s + rng.choice((-1, 0, 1)))) for s in ref))
+    a = _write(tmp_path / 'a.wav', params, ref)
+    b = _write(tmp_path / 'b.wav', params, drift)
+
+    assert hash_wav(a, mode='coarse') != hash_wav(b, mode='coarse')
+    res = compare_wav(a, b)
+    assert res, str(res)
+    assert res.blocks == -(-len(ref) // 2 // BLOCK)
+    assert fingerprints_match(fingerprint(a), fingerprint(b))
+
+
+def test_audible_change_fails_at_its_block(tmp_path):
+    params, ref = _render(tmp_path)
+    rate = params.framerate
+    quieter = array('h', ref)   # -1 dB over 4096 frames starting at 1 s
+    for i in range(2 * rate, 2 * (rate + 4096)):
+        quieter[i] = int(quieter[i] * 0.89)
+    a = _write(tmp_path / 'a.wav', params, ref)
+    c = _write(tmp_path / 'c.wav', params, quieter)
+
+    res = compare_wav(a, c)
+    assert not res and res.first_bad_block == rate // BLOCK
+    fp = fingerprints_match(fingerprint(a), fingerprint(c))
+    assert not fp and fp.first_bad_block == rate // BLOCK
+
+    short = _write(tmp_path / 'short.wav', params, ref[:-2 * BLOCK])
+    assert 'format differs' in compare_wav(a, short).reason
+
+
+def test_check_baseline_prefers_the_fingerprint(tmp_path):
+    params, ref = _render(tmp_path)
+    wav = _write(tmp_path / 'x.wav', params, ref)
+    base = tmp_path / 'x_hash.txt'
+    base.write_text(hash_wav(wav, mode='coarse') + '\n')
+    assert check_baseline(wav, base)
+
+    base.write_text('0' * 64 + '\n')
+    assert not check_baseline(wav, base)
+    (tmp_path / 'x_fp.txt').write_text(fingerprint(wav) + '\n')
+    assert check_baseline(wav, base)
+
+
+def _arrange(tmp_path: Path, fmt: str) -> Path:
+    out = tmp_path / f'{fmt}.wav'
+    subprocess.run([str(CVER / 'bin' / 'arrange'), '0x3', '--seconds', '2', '--format', fmt, '--out', str(out)],
+                   cwd=tmp_path, check=True, stdout=subprocess.DEVNULL)
+    return out
+
+
+def test_reads_float32_and_24_bit(tmp_path):
+    """The f32 and s24 renders of arrange compare equal to the s16 one, and to each other to 24-bit precision."""
+    subprocess.run(['make', '-C', str(CVER), 'arrange', 'NO_RUN=1'], check=True)
+    s16, s24, f32 = (_arrange(tmp_path, fmt) for fmt in ('s16', 's24', 'f32'))
+    for wav in (s24, f32):
+        res = compare_wav(s16, wav)
+        assert res and res.blocks == -(-2 * 44100 // BLOCK), f'{wav.name}: {res}'
+        assert fingerprints_match(fingerprint(s16), fingerprint(wav)), wav.name
+    res = compare_wav(f32, s24, rms_db=-99.0, peak=2.0 ** -22)
+    assert res, str(res)
+
+    # A -1 dB dip over 4096 frames from 1 s in the float file is found in its block
+    raw = bytearray(f32.read_bytes())
+    data = raw.index(b'data') + 8
+    samples = array('f', raw[data:])
+    for i in range(2 * 44100, 2 * (44100 + 4096)):
+        samples[i] *= 0.89
+    dip = tmp_path / 'dip.wav'
+    dip.write_bytes(bytes(raw[:data]) + samples.tobytes())
+    res = compare_wav(f32, dip)
+    assert not res and res.first_bad_block == 44100 // BLOCK
@@ -0,0 +1,423 @@
+"""Block-wise perceptual comparison of WAV files.
+
+hash_wav(mode="coarse") drops 4 LSBs and hashes: one sample that lands on
+the other side of a quantization step flips the whole digest.  This module
+streams two files in blocks of BLOCK frames instead and, per block, checks
+
+    rms   – RMS of the sample difference, dBFS
+    peak  – largest absolute sample difference (full scale = 1.0)
+    spec  – largest band-level difference in dB between the two spectra
+            (mid signal, Hann window, roughly octave BANDS), counted over the
+            bands within SPEC_RANGE_DB of the block's loudest band and
+            above SPEC_FLOOR_DB
+
+against thresholds that sub-LSB drift stays far below and an audible
+change does not.  compare_wav() returns the verdict and where it failed.
+
+fingerprint() condenses a file into a short text – per block the channel
+RMS and the band levels in whole dB – and fingerprints_match() compares two
+with a one-step tolerance, so a baseline can be kept as text and checked
+without the reference WAV.
+
+FFTs go through numpy, a chunk of blocks per rfft call, when it is
+installed, and a radix-2 FFT in pure Python otherwise.
+"""
+
+from __future__ import annotations
+
+import base64
+import cmath
+import math
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised where numpy is missing
+    np = None
+
+BLOCK = 2048                        # frames per block (power of two)
+CHUNK = 64                          # blocks per numpy batch
+BANDS = (0, 100, 200, 400, 800, 1600, 3200, 6400, 12800)   # band lower edges, Hz
+FLOOR_DB = -100.0                   # levels are clamped here
+SPEC_RANGE_DB = 60.0                # bands quieter than the loudest by more are not compared,
+SPEC_FLOOR_DB = -70.0               # nor bands (or fingerprint levels) below this
+
+RMS_DB = -70.0                      # default thresholds
+PEAK = 32 / 32768
+SPEC_DB = 1.0
+
+FP_MAGIC = "wfp1"
+
+
+@dataclass
+class WavComparison:
+    passed: bool
+    reason: str = ""                # why it failed ("" when it passed)
+    blocks: int = 0
+    first_bad_block: int | None = None
+    worst_rms_db: float = FLOOR_DB
+    worst_peak: float = 0.0
+    worst_spec_db: float = 0.0
+
+    def __bool__(self) -> bool:
+        return self.passed
+
+    def __str__(self) -> str:
+        stats = (f"{self.blocks} blocks, worst rms {self.worst_rms_db:.1f} dBFS, "
+                 f"peak {self.worst_peak:.2e}, spectrum {self.worst_spec_db:.2f} dB")
+        if self.passed:
+            return f"PASS ({stats})"
+        return f"FAIL: {self.reason} ({stats})"
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+
+# (format tag, bits per sample) -> array typecode of the decoded words
+_FORMATS = {(1, 16): "h", (1, 24): "i", (3, 32): "f"}
+_NP_TYPES = {"h": "<i2", "i": "<i4", "f": "<f4"}
+_EXTENSIBLE = 0xFFFE
+
+
+class _Reader:
+    """Stream a 16/24-bit PCM or float32 WAV as per-channel float lists in [-1, 1].
+
+    The RIFF chunks are parsed here rather than with the wave module, which
+    only reads integer PCM and rejects format 3 (IEEE float) outright.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.f = open(path, "rb")
+        try:
+            self._parse(str(path))
+        except BaseException:
+            self.f.close()
+            raise
+
+    def _parse(self, path: str) -> None:
+        head = self.f.read(12)
+        if len(head) < 12 or head[:4] != b"RIFF" or head[8:] != b"WAVE":
+            raise RuntimeError(f"{path}: not a RIFF/WAVE file")
+        fmt = None
+        while True:
+            hdr = self.f.read(8)
+            if len(hdr) < 8:
+                raise RuntimeError(f"{path}: no data chunk")
+            cid, size = hdr[:4], struct.unpack("<I", hdr[4:])[0]
+            if cid == b"fmt ":
+                body = self.f.read(size + (size & 1))
+                tag, self.channels, self.rate = struct.unpack("<HHI", body[:8])
+                align, bits = struct.unpack("<HH", body[12:16])
+                if tag == _EXTENSIBLE and size >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]   # first two bytes of the SubFormat GUID
+                fmt = (tag, bits)
+            elif cid == b"data":
+                break
+            else:
+                self.f.seek(size + (size & 1), 1)
+        if fmt not in _FORMATS:
+            raise RuntimeError(f"{path}: unsupported WAV format: tag {fmt and fmt[0]}, {fmt and fmt[1]} bits")
+        self.code = _FORMATS[fmt]
+        self.width = fmt[1] // 8
+        self.align = align
+        # A streaming writer that was never closed leaves the size at 0: use what is there
+        here = self.f.tell()
+        avail = self.f.seek(0, 2) - here
+        self.f.seek(here)
+        self.frames = (min(size, avail) if size else avail) // align
+        self.left = self.frames
+
+    def _raw(self, frames: int) -> bytes:
+        n = min(frames, self.left)
+        self.left -= n
+        raw = self.f.read(n * self.align)
+        if self.width == 3:
+            # 24-bit words into the top of 32-bit ones: i32 / 2**31 == s24 / 2**23
+            wide = bytearray(len(raw) // 3 * 4)
+            wide[1::4], wide[2::4], wide[3::4] = raw[0::3], raw[1::3], raw[2::3]
+            raw = bytes(wide)
+        return raw
+
+    def read(self, frames: int) -> list:
+        data = array(self.code, self._raw(frames))
+        if sys.byteorder == "big":
+            data.byteswap()
+        if self.code == "h":
+            data = [s / 32768.0 for s in data]
+        elif self.code == "i":
+            data = [s / 2147483648.0 for s in data]
+        return [data[c::self.channels] for c in range(self.channels)]
+
+    def read_np(self, frames: int):
+        data = np.frombuffer(self._raw(frames), dtype=_NP_TYPES[self.code])
+        data = data.astype(np.float64)
+        if self.code == "h":
+            data /= 32768.0
+        elif self.code == "i":
+            data /= 2147483648.0
+        return data.reshape(-1, self.channels).T
+
+    def close(self) -> None:
+        self.f.close()
+
+
+# ---------------------------------------------------------------------------
+# Spectra
+# ---------------------------------------------------------------------------
+
+
+_HANN = [0.5 - 0.5 * math.cos(2.0 * math.pi * n / BLOCK) for n in range(BLOCK)]
+_HANN_POWER = sum(w * w for w in _HANN)
+_BITREV = [int(f"{i:0{BLOCK.bit_length() - 1}b}"[::-1], 2) for i in range(BLOCK)]
+_TWIDDLE = [cmath.exp(-2j * math.pi * k / BLOCK) for k in range(BLOCK // 2)]
+
+
+def _band_bins(rate: int) -> list[tuple[int, int]]:
+    """rfft bin range [lo, hi) of each band; the DC bin is left out."""
+    edges = [max(1, int(round(f * BLOCK / rate))) for f in BANDS] + [BLOCK // 2 + 1]
+    return list(zip(edges, edges[1:]))
+
+
+def _level_db(power: float) -> float:
+    """Band power (sum of |X|^2 over its bins) to dB relative to a full-scale sine."""
+    ms = 4.0 * power / (BLOCK * _HANN_POWER)
+    return max(FLOOR_DB, 10.0 * math.log10(ms + 1e-30))
+
+
+def _fft(x: list) -> list:
+    """Iterative radix-2 FFT of BLOCK real or complex values."""
+    x = [x[i] for i in _BITREV]
+    size = 2
+    while size <= BLOCK:
+        half = size // 2
+        tw = _TWIDDLE[::BLOCK // size]
+        for start in range(0, BLOCK, size):
+            for k in range(half):
+                a = x[start + k]
+                b = x[start + k + half] * tw[k]
+                x[start + k] = a + b
+                x[start + k + half] = a - b
+        size *= 2
+    return x
+
+
+def _bands_py(mid: list, bins: list[tuple[int, int]]) -> list[float]:
+    spec = _fft([mid[n] * _HANN[n] if n < len(mid) else 0.0 for n in range(BLOCK)])
+    return [_level_db(sum(abs(spec[k]) ** 2 for k in range(lo, hi))) for lo, hi in bins]
+
+
+def _bands_np(mid, bins: list[tuple[int, int]]):
+    """Band levels of each row of `mid` (blocks x BLOCK), as a blocks x bands array."""
+    power = np.abs(np.fft.rfft(mid * np.asarray(_HANN), axis=1)) ** 2
+    sums = np.stack([power[:, lo:hi].sum(axis=1) for lo, hi in bins], axis=1)
+    return np.maximum(FLOOR_DB, 10.0 * np.log10(4.0 * sums / (BLOCK * _HANN_POWER) + 1e-30))
+
+
+def _spec_diff(a: list[float], b: list[float]) -> float:
+    floor = max(max(a) - SPEC_RANGE_DB, max(b) - SPEC_RANGE_DB, SPEC_FLOOR_DB)
+    diffs = [abs(x - y) for x, y in zip(a, b) if max(x, y) > floor]
+    return max(diffs, default=0.0)
+
+
+def _rms_db(ms: float) -> float:
+    return max(FLOOR_DB, 10.0 * math.log10(ms + 1e-30))
+
+
+# ---------------------------------------------------------------------------
+# Block streams
+# ---------------------------------------------------------------------------
+
+
+def _mid(chans: list) -> list:
+    if len(chans) == 1:
+        return list(chans[0])
+    return [sum(s) / len(chans) for s in zip(*chans)]
+
+
+def _pad_np(x, frames: int):
+    """Zero-pad the channels x frames array `x` to whole blocks; returns channels x blocks x BLOCK."""
+    nb = -(-frames // BLOCK)
+    out = np.zeros((x.shape[0], nb * BLOCK))
+    out[:, :frames] = x
+    return out.reshape(x.shape[0], nb, BLOCK)
+
+
+def _compare_blocks(ra: _Reader, rb: _Reader):
+    """Yield (rms_db, peak, spec_db) per block of two open readers."""
+    bins = _band_bins(ra.rate)
+    left = ra.frames
+    if np is not None:
+        while left > 0:
+            n = min(left, BLOCK * CHUNK)
+            a, b = _pad_np(ra.read_np(n), n), _pad_np(rb.read_np(n), n)
+            d = a - b
+            ms = (d * d).mean(axis=(0, 2))
+            peak = np.abs(d).max(axis=(0, 2))
+            la, lb = _bands_np(a.mean(axis=0), bins), _bands_np(b.mean(axis=0), bins)
+            for i in range(len(ms)):
+                yield _rms_db(float(ms[i])), float(peak[i]), _spec_diff(la[i].tolist(), lb[i].tolist())
+            left -= n
+        return
+    while left > 0:
+        n = min(left, BLOCK)
+        a, b = ra.read(n), rb.read(n)
+        diffs = [x - y for ca, cb in zip(a, b) for x, y in zip(ca, cb)]
+        ms = sum(d * d for d in diffs) / (BLOCK * ra.channels)
+        peak = max(abs(d) for d in diffs)
+        yield _rms_db(ms), peak, _spec_diff(_bands_py(_mid(a), bins), _bands_py(_mid(b), bins))
+        left -= n
+
+
+def _fingerprint_blocks(r: _Reader):
+    """Yield per block the channel RMS levels followed by the mid band levels, in dB."""
+    bins = _band_bins(r.rate)
+    left = r.frames
+    if np is not None:
+        while left > 0:
+            n = min(left, BLOCK * CHUNK)
+            x = _pad_np(r.read_np(n), n)
+            rms = np.maximum(FLOOR_DB, 10.0 * np.log10((x * x).mean(axis=2) + 1e-30))
+            bands = _bands_np(x.mean(axis=0), bins)
+            for i in range(bands.shape[0]):
+                yield rms[:, i].tolist() + bands[i].tolist()
+            left -= n
+        return
+    while left > 0:
+        n = min(left, BLOCK)
+        x = r.read(n)
+        rms = [_rms_db(sum(s * s for s in c) / BLOCK) for c in x]
+        yield rms + _bands_py(_mid(x), bins)
+        left -= n
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def compare_wav(reference: str | Path, candidate: str | Path, *, rms_db: float = RMS_DB,
+                peak: float = PEAK, spec_db: float = SPEC_DB) -> WavComparison:
+    """Compare *candidate* with *reference* block by block.
+
+    Fails on a format or length mismatch, or on the first block whose
+    difference exceeds any threshold; the statistics cover the blocks read
+    up to that point.
+    """
+
+    ra, rb = _Reader(reference), _Reader(candidate)
+    try:
+        fmt_a = (ra.channels, ra.rate, ra.frames)
+        fmt_b = (rb.channels, rb.rate, rb.frames)
+        if fmt_a != fmt_b:
+            return WavComparison(False, f"format differs: (channels, rate, frames) {fmt_a} vs {fmt_b}")
+        res = WavComparison(True)
+        for i, (r, p, s) in enumerate(_compare_blocks(ra, rb)):
+            res.blocks += 1
+            res.worst_rms_db = max(res.worst_rms_db, r)
+            res.worst_peak = max(res.worst_peak, p)
+            res.worst_spec_db = max(res.worst_spec_db, s)
+            bad = [name for name, over in (("rms", r > rms_db), ("peak", p > peak), ("spectrum", s > spec_db)) if over]
+            if bad:
+                res.passed = False
+                res.first_bad_block = i
+                res.reason = f"block {i} (at {i * BLOCK / ra.rate:.2f} s): {', '.join(bad)} over threshold"
+                break
+        return res
+    finally:
+        ra.close()
+        rb.close()
+
+
+def fingerprint(path: str | Path) -> str:
+    """Compact, drift-tolerant fingerprint of a WAV file (see fingerprints_match)."""
+
+    r = _Reader(path)
+    try:
+        levels = bytearray()
+        for values in _fingerprint_blocks(r):
+            levels.extend(max(0, min(255, int(round(-v)))) for v in values)
+        payload = base64.b64encode(zlib.compress(bytes(levels), 9)).decode("ascii")
+        return f"{FP_MAGIC}:{r.channels}:{r.rate}:{r.frames}:{BLOCK}:{payload}"
+    finally:
+        r.close()
+
+
+def _parse_fingerprint(fp: str) -> tuple[tuple[int, ...], bytes]:
+    magic, channels, rate, frames, block, payload = fp.strip().split(":")
+    if magic != FP_MAGIC:
+        raise ValueError(f"not a {FP_MAGIC} fingerprint")
+    return (int(channels), int(rate), int(frames), int(block)), zlib.decompress(base64.b64decode(payload))
+
+
+def fingerprints_match(expected: str, actual: str, *, tol_db: int = 1) -> WavComparison:
+    """Compare two fingerprints level by level.
+
+    Levels are stored in whole dB, so a tolerance of 1 step accepts any
+    drift under 0.5 dB and rejects anything over 2 dB.  Levels below
+    SPEC_FLOOR_DB are compared as SPEC_FLOOR_DB.
+    """
+
+    head_a, la = _parse_fingerprint(expected)
+    head_b, lb = _parse_fingerprint(actual)
+    if head_a != head_b:
+        return WavComparison(False, f"format differs: (channels, rate, frames, block) {head_a} vs {head_b}")
+    per_block = head_a[0] + len(BANDS)
+    res = WavComparison(True, blocks=len(la) // per_block)
+    quiet = int(-SPEC_FLOOR_DB)
+    diffs = [abs(min(x, quiet) - min(y, quiet)) for x, y in zip(la, lb)]
+    res.worst_spec_db = float(max(diffs, default=0))
+    bad = next((k for k, d in enumerate(diffs) if d > tol_db), None)
+    if bad is not None:
+        i = bad // per_block
+        res.passed = False
+        res.first_bad_block = i
+        res.reason = f"block {i} (at {i * head_a[3] / head_a[1]:.2f} s): level off by {diffs[bad]} dB"
+    return res
+
+
+def fingerprint_path(baseline_hash: str | Path) -> Path:
+    """tests/baseline/<name>_fp.txt for tests/baseline/<name>_hash.txt."""
+    p = Path(baseline_hash)
+    return p.with_name(p.name.replace("_hash.txt", "_fp.txt"))
+
+
+def check_baseline(wav: str | Path, baseline_hash: str | Path) -> WavComparison:
+    """Check a rendered WAV against its tests/baseline entry.
+
+    Uses the recorded fingerprint when there is one (tools/update_baselines.py
+    writes it next to the hash) and the coarse hash otherwise.
+    """
+
+    fp = fingerprint_path(baseline_hash)
+    if fp.exists():
+        return fingerprints_match(fp.read_text(), fingerprint(wav))
+    from tests.hash_wav import hash_wav
+
+    h = hash_wav(wav, mode="coarse")
+    expected = Path(baseline_hash).read_text().strip()
+    return WavComparison(h == expected, "" if h == expected else f"coarse hash {h}, expected {expected}")
+
+
+# ---------------------------------------------------------------------------
+# CLI helper
+# ---------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        print(fingerprint(sys.argv[1]))
+        sys.exit(0)
+    if len(sys.argv) != 3:
+        print("Usage: python -m tests.wav_compare <reference.wav> <candidate.wav>\n"
+              "       python -m tests.wav_compare <file.wav>      (print its fingerprint)", file=sys.stderr)
+        sys.exit(1)
+    result = compare_wav(sys.argv[1], sys.argv[2])
+    print(result)
+    sys.exit(0 if result else 1)
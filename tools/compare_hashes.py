@@ -5,6 +5,7 @@ Compare current WAV file hashes with baseline hashes to show differences.
 
 from pathlib import Path
 from tests.hash_wav import hash_wav
+from tests.wav_compare import fingerprint, fingerprint_path, fingerprints_match
 
 # Mapping of audit WAV files to their baseline hash files
 COMPARISONS = [
@@ -24,10 +25,11 @@ COMPARISONS = [
     ("current_calm-c.wav", "calm_c_hash.txt", "Calm"),
     ("current_quantum-c.wav", "quantum_c_hash.txt", "Quantum"),
     ("current_pluck-c.wav", "pluck_c_hash.txt", "Pluck"),
+    ("current_seed_0xcafebabe.wav", "segment_hash.txt", "Segment"),
 ]
 
 def main():
-    root = Path(__file__).parent
+    root = Path(__file__).resolve().parent.parent
     audit_dir = root / "audit_wavs"
     baseline_dir = root / "tests" / "baseline"
     
@@ -40,7 +42,19 @@ def main():
         wav_path = audit_dir / wav_file
         baseline_path = baseline_dir / baseline_file
         
-        if wav_path.exists() and baseline_path.exists():
+        fp_path = fingerprint_path(baseline_path)
+        if wav_path.exists() and fp_path.exists():
+            # Tolerant check against the recorded fingerprint
+            result = fingerprints_match(fp_path.read_text(), fingerprint(wav_path))
+            if result:
+                print(f"✅ {name:<15} MATCH")
+                matches += 1
+            else:
+                print(f"❌ {name:<15} DIFFERENT")
+                print(f"   {result.reason}")
+            total += 1
+
+        elif wav_path.exists() and baseline_path.exists():
             # Calculate current hash
             current_hash = hash_wav(wav_path, mode="coarse")
             baseline_hash = baseline_path.read_text().strip()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Euclidean rhythms as precomputed bitmasks.
+
+Every (pulses, steps) bucket pattern for steps <= 64 is built once, at
+import, as an integer whose bit i is step i – the same table the C engine
+compiles in (include/euclid_table.h, generated from here).  A rotation is
+a bit rotation of the table entry, so `euclid_mask()` is O(1) and pattern
+questions become bit operations:
+
+    >>> m = euclid_mask(3, 16, rot=2)
+    >>> bin(m).count("1"), bool(m >> 4 & 1)
+
+Regenerate the C header after changing anything here:
+
+    python tools/euclid_table.py --emit-c src/c/include/euclid_table.h
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+EUCLID_MAX_STEPS = 64
+
+
+def _offset(steps: int) -> int:
+    """Index of (0, steps): rows for 1..steps-1 hold 2..steps entries."""
+    return (steps - 1) * (steps + 2) // 2
+
+
+def _build(pulses: int, steps: int) -> int:
+    # Same bucket walk as euclid_pattern() in euclid.c
+    mask, bucket = 0, 0
+    for i in range(steps):
+        bucket += pulses
+        if bucket >= steps:
+            bucket -= steps
+            mask |= 1 << i
+    return mask
+
+
+TABLE = [_build(p, s) for s in range(1, EUCLID_MAX_STEPS + 1) for p in range(s + 1)]
+
+
+def rotate(mask: int, steps: int, rot: int) -> int:
+    """Rotate as generator_rotate_pattern_c did: new[i] = old[(i + rot) % steps]."""
+    rot %= steps
+    if rot == 0:
+        return mask
+    full = (1 << steps) - 1
+    return ((mask >> rot) | (mask << (steps - rot))) & full
+
+
+def euclid_mask(pulses: int, steps: int, rot: int = 0) -> int:
+    if not 1 <= steps <= EUCLID_MAX_STEPS or not 0 <= pulses <= steps:
+        raise ValueError(f"need 0 <= pulses <= steps <= {EUCLID_MAX_STEPS}, got {pulses}/{steps}")
+    return rotate(TABLE[_offset(steps) + pulses], steps, rot)
+
+
+def pattern(pulses: int, steps: int, rot: int = 0) -> list[int]:
+    """The 0/1 list form, for code that still wants one."""
+    m = euclid_mask(pulses, steps, rot)
+    return [(m >> i) & 1 for i in range(steps)]
+
+
+def emit_c(path: Path) -> None:
+    lines = [
+        "/* Generated by tools/euclid_table.py – do not edit. */",
+        "#ifndef EUCLID_TABLE_H",
+        "#define EUCLID_TABLE_H",
+        "",
+        "#include <stdint.h>",
+        "",
+        f"#define EUCLID_TABLE_SIZE {len(TABLE)}u",
+        "",
+        "/* Bucket pattern of (pulses, steps), bit i = step i, at",
+        " * [(steps - 1) * (steps + 2) / 2 + pulses] for 1 <= steps <= 64. */",
+        "static const uint64_t euclid_table[EUCLID_TABLE_SIZE] = {",
+    ]
+    for s in range(1, EUCLID_MAX_STEPS + 1):
+        row = TABLE[_offset(s):_offset(s) + s + 1]
+        lines.append(f"    /* {s} */")
+        for i in range(0, len(row), 4):
+            lines.append("    " + " ".join(f"0x{v:016x}ull," for v in row[i:i + 4]))
+    lines += ["};", "", "#endif /* EUCLID_TABLE_H */", ""]
+    path.write_text("\n".join(lines))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Euclidean rhythm bitmask table")
+    ap.add_argument("--emit-c", type=Path, metavar="HEADER", help="write the C table header")
+    args = ap.parse_args()
+    if args.emit_c:
+        emit_c(args.emit_c)
+        print(f"Wrote {args.emit_c} ({len(TABLE)} patterns)")
+    else:
+        for s in (8, 12, 16):
+            for p in range(1, s):
+                print(f"E({p},{s}) " + "".join("x" if b else "." for b in pattern(p, s)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Golden render digests per seed: build a database, verify against it.
+
+Usage:
+    python tools/golden.py build [--start S] [--count N] [--stride K] [--threads T] [--db golden.tsv]
+    python tools/golden.py verify [--db golden.tsv] [--all] [--threads T] [--update]
+    python tools/golden.py wav FILE.wav [...]
+
+`build` runs the C digester (bin/golden, built on demand), which renders
+each seed's segment and records a coarse digest of the whole render plus
+one per second (int16 samples with the 4 LSBs dropped, as
+tests/hash_wav.py's coarse mode, FNV-1a 64 over the words) and the set of
+voices / FM presets the seed played.  The database also records a SHA-1
+of every source file the audio depends on.
+
+`verify` re-renders and compares.  By default only the seeds a source
+change can affect are re-rendered: a change to kick.c re-checks the seeds
+that played a kick, one to the FM_BASS_PLUCKY preset the seeds whose bass
+used it, and so on (PATH_BITS, PRESET_BITS); a change to a file the whole
+mix goes through (generator.c, delay, limiter, wav_writer's int16
+conversion, the Makefile, ...) or to
+the build options re-checks everything, and files only the visuals and
+tools use are ignored.  Each drifting seed is reported with the first second that
+differs.  Exit status 1 on drift; --update rewrites the database instead.
+
+`wav` prints the same digests for a rendered WAV (e.g. bin/segment's
+output), to check a file against a database line by hand.
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import wave
+from array import array
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / "src" / "c"
+BIN = CVER / "bin" / "golden"
+
+SR = 44100
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+MASK64 = (1 << 64) - 1
+
+# `paths` bits written by bin/golden (gen_event_voice_t, then FM presets)
+KICK, SNARE, HAT, MELODY, MID_FM, BASS_FM, MID_SIMPLE = (1 << i for i in range(7))
+FM = MID_FM | BASS_FM
+MID_PRESETS = 0xF << 8
+BASS_PRESETS = 0x7 << 12
+
+# Source files whose changes only matter to the seeds with these paths
+PATH_BITS = {
+    "kick.*": KICK,
+    "snare.*": SNARE,
+    "hat.*": HAT,
+    "noise.*": SNARE | HAT,
+    "melody.*": MELODY,
+    "osc_bl.h": MELODY,
+    "osc.*": MELODY | FM | MID_SIMPLE,
+    "osc_s*.s": MELODY | FM | MID_SIMPLE,
+    "env.h": KICK | MELODY | FM | MID_SIMPLE,
+    "fm_*": FM,
+    "fast_math*.h": FM,
+    "simple_voice.*": MID_SIMPLE,
+}
+
+# Source files bin/golden does not link against
+IGNORED = (
+    "arrange.c", "audio_*", "band_pool.*", "bench_*.c", "coreaudio.*", "crt_fx.*", "main.c",
+    "main_realtime.c", "*kick_test.c", "test_kick_isolation.c", "particles.*", "raster.*",
+    "render_thread.*", "render_video.c", "rt_loadtest.c", "seed_scan.c", "segment.c", "shapes.*",
+    "spsc_ring.h", "terrain.*", "video.*", "vis_*",
+    "gen_[!ep]*.c", "gen_pluck.c",   # the single-voice generators, not gen_event.c / gen_profile.c
+)
+
+# fm_presets.c is fingerprinted per preset: editing one re-checks only its seeds
+PRESETS_FILE = "fm_presets.c"
+PRESET_BITS = {
+    "FM_PRESET_BELLS": 1 << 8, "FM_PRESET_CALM": 1 << 9, "FM_PRESET_QUANTUM": 1 << 10, "FM_PRESET_PLUCK": 1 << 11,
+    "FM_BASS_DEFAULT": 1 << 12, "FM_BASS_QUANTUM": 1 << 13, "FM_BASS_PLUCKY": 1 << 14,
+}
+PRESET_DEF = re.compile(r"^\s*const\s+fm_params_t\s+(\w+)\s*=")
+
+ALL = -1
+
+
+def source_files() -> list[Path]:
+    files = [CVER / "Makefile"]
+    files += sorted((CVER / "src").glob("*.c"))
+    files += sorted((CVER / "include").glob("*.h"))
+    files += sorted((ROOT / "src" / "asm" / "active").glob("*.s"))
+    return files
+
+
+def fingerprints() -> dict[str, str]:
+    """SHA-1 per source file, plus one per preset definition of fm_presets.c
+    (keyed "<file>:<preset>", and left out of the file's own digest)."""
+    out = {}
+    for f in source_files():
+        name = f.relative_to(ROOT).as_posix()
+        data = f.read_bytes()
+        if f.name == PRESETS_FILE:
+            rest = []
+            for line in data.decode().splitlines(keepends=True):
+                m = PRESET_DEF.match(line)
+                if m and m.group(1) in PRESET_BITS:
+                    out[f"{name}:{m.group(1)}"] = hashlib.sha1(line.encode()).hexdigest()
+                else:
+                    rest.append(line)
+            data = "".join(rest).encode()
+        out[name] = hashlib.sha1(data).hexdigest()
+    return out
+
+
+def affected_paths(name: str) -> int:
+    """Path bits a change to source file `name` can affect (ALL = every seed, 0 = none)."""
+    base = name.rsplit("/", 1)[-1]
+    if ":" in base:
+        return PRESET_BITS.get(base.split(":", 1)[1], ALL)
+    if any(fnmatch.fnmatch(base, pat) for pat in IGNORED):
+        return 0
+    for pat, bits in PATH_BITS.items():
+        if fnmatch.fnmatch(base, pat):
+            return bits
+    return ALL
+
+
+def changed_paths(old: dict[str, str], new: dict[str, str]) -> tuple[int, list[str]]:
+    """OR of affected_paths over the files that differ between two fingerprint sets."""
+    changed = sorted(k for k in old.keys() | new.keys() if old.get(k) != new.get(k))
+    bits = 0
+    for name in changed:
+        b = affected_paths(name)
+        if b == ALL:
+            return ALL, changed
+        bits |= b
+    return bits, changed
+
+
+def select(records: dict, bits: int) -> list[int]:
+    """Seeds whose recorded paths intersect `bits` (voice bits imply all their presets)."""
+    if bits == ALL:
+        return list(records)
+    if bits & MID_FM:
+        bits |= MID_PRESETS
+    if bits & BASS_FM:
+        bits |= BASS_PRESETS
+    return [s for s, r in records.items() if r["paths"] & bits]
+
+
+# ---------------------------------------------------------------- database
+
+def parse_line(line: str) -> dict:
+    f = line.rstrip("\n").split("\t")
+    return {"seed": int(f[0], 16), "paths": int(f[1], 16), "frames": int(f[2]),
+            "coarse": f[3], "seconds": f[4:]}
+
+
+def format_line(r: dict) -> str:
+    return "\t".join([f"0x{r['seed']:016x}", f"0x{r['paths']:04x}", str(r["frames"]), r["coarse"], *r["seconds"]])
+
+
+def load(path: Path) -> tuple[dict[str, str], str, dict[int, dict]]:
+    """(source fingerprints, config line, records by seed) of a database or bin/golden output."""
+    sources, config, records = {}, "", {}
+    for line in path.read_text().splitlines():
+        if line.startswith("# source "):
+            _, _, name, digest = line.split(" ")
+            sources[name] = digest
+        elif line.startswith("# config"):
+            config = line
+        elif line and not line.startswith("#"):
+            r = parse_line(line)
+            records[r["seed"]] = r
+    return sources, config, records
+
+
+def save(path: Path, sources: dict[str, str], config: str, records: dict[int, dict]) -> None:
+    with open(path, "w") as f:
+        for name, digest in sorted(sources.items()):
+            f.write(f"# source {name} {digest}\n")
+        f.write(config + "\n")
+        f.write("# seed\tpaths\tframes\tcoarse\tper-second...\n")
+        for r in records.values():
+            f.write(format_line(r) + "\n")
+
+
+def first_drift(old: dict, new: dict) -> str | None:
+    """None when the renders match, else where they first differ."""
+    if old["frames"] != new["frames"]:
+        return f"length {old['frames']} -> {new['frames']} frames"
+    if old["coarse"] == new["coarse"] and old["seconds"] == new["seconds"]:
+        return None
+    for i, (a, b) in enumerate(zip(old["seconds"], new["seconds"])):
+        if a != b:
+            return f"second {i} ({a} -> {b})"
+    return f"coarse {old['coarse']} -> {new['coarse']}"
+
+
+# ---------------------------------------------------------------- rendering
+
+def build_bin() -> None:
+    jobs = str(max(1, os.cpu_count() or 1))
+    subprocess.run(["make", "-C", str(CVER), "golden", "NO_RUN=1", f"-j{jobs}"],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def render(args: list[str], seeds: list[int] | None = None, quiet: bool = False) -> tuple[str, dict[int, dict]]:
+    """Run bin/golden; returns its config line and records."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "golden.tsv"
+        cmd = [str(BIN), *args, "--out", str(out)]
+        stdin = None
+        if seeds is not None:
+            cmd += ["--seeds", "-"]
+            stdin = "".join(f"0x{s:x}\n" for s in seeds)
+        # the generator prints debug lines on stdout
+        subprocess.run(cmd, input=stdin, text=True, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL if quiet else None)
+        _, config, records = load(out)
+    return config, records
+
+
+def wav_digests(path: Path) -> tuple[int, str, list[str]]:
+    """(frames, coarse, per-second digests) of a 16-bit stereo WAV, as bin/golden computes them."""
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2 or wf.getnchannels() != 2:
+            raise SystemExit(f"{path}: need 16-bit stereo")
+        frames = wf.getnframes()
+        words = array("h", wf.readframes(frames))
+    if sys.byteorder == "big":
+        words.byteswap()
+    coarse, sec, seconds = FNV_OFFSET, FNV_OFFSET, []
+    for i, s in enumerate(words):
+        w = s & 0xFFF0
+        coarse = ((coarse ^ w) * FNV_PRIME) & MASK64
+        sec = ((sec ^ w) * FNV_PRIME) & MASK64
+        if (i + 1) % (2 * SR) == 0:
+            seconds.append(f"{sec:016x}")
+            sec = FNV_OFFSET
+    if frames % SR:
+        seconds.append(f"{sec:016x}")
+    return frames, f"{coarse:016x}", seconds
+
+
+# ---------------------------------------------------------------- CLI
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("build", help="digest a seed range into a database")
+    p.add_argument("--start", default="0")
+    p.add_argument("--count", type=int, default=1000)
+    p.add_argument("--stride", default="1")
+    p.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--db", type=Path, default=Path("golden.tsv"))
+
+    p = sub.add_parser("verify", help="re-render the affected seeds and compare")
+    p.add_argument("--db", type=Path, default=Path("golden.tsv"))
+    p.add_argument("--all", action="store_true", help="re-render every seed, whatever changed")
+    p.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--update", action="store_true", help="store the new digests instead of failing")
+
+    p = sub.add_parser("wav", help="print a WAV file's digests")
+    p.add_argument("files", nargs="+", type=Path)
+
+    args = ap.parse_args(argv)
+
+    if args.cmd == "wav":
+        for path in args.files:
+            frames, coarse, seconds = wav_digests(path)
+            print("\t".join([str(path), str(frames), coarse, *seconds]))
+        return 0
+
+    build_bin()
+    threads = ["--threads", str(min(max(args.threads, 1), 64))]
+
+    if args.cmd == "build":
+        config, records = render(["--start", args.start, "--count", str(args.count),
+                                  "--stride", args.stride, *threads])
+        save(args.db, fingerprints(), config, records)
+        print(f"golden: {len(records)} seeds -> {args.db}")
+        return 0
+
+    old_sources, old_config, records = load(args.db)
+    new_sources = fingerprints()
+    config, _ = render(["--count", "0"], quiet=True)
+    if args.all or not old_sources:
+        bits, changed = ALL, []
+    else:
+        bits, changed = changed_paths(old_sources, new_sources)
+    if config != old_config:
+        print(f"build options changed: {old_config!r} -> {config!r}")
+        bits = ALL
+    for name in changed:
+        print(f"changed: {name}")
+    seeds = select(records, bits)
+    print(f"golden: re-rendering {len(seeds)} of {len(records)} seeds")
+
+    _, fresh = render(threads, seeds) if seeds else (config, {})
+    drifted = 0
+    for seed in seeds:
+        where = first_drift(records[seed], fresh[seed])
+        if where:
+            drifted += 1
+            print(f"0x{seed:016x}: drift at {where}")
+        records[seed] = fresh[seed]
+    print(f"golden: {drifted} of {len(seeds)} re-rendered seeds drifted")
+
+    if args.update:
+        save(args.db, new_sources, config, records)
+        return 0
+    return 1 if drifted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Aggregate per-voice generator profiles across many seeds.
+
+Usage:
+    python tools/profile_seeds.py [--seeds 0x1,0x2,...] [--count N] [--json out.json]
+
+The script will:
+  1. Build `segment` with PROFILE_VOICES=1, in a scratch copy of the C
+     sources, so generator_process accumulates per-voice nanoseconds,
+     frames rendered and call counts.  src/c itself is left untouched.
+  2. Render each seed; segment writes seed_0x<seed>.profile.json.
+  3. Sum the counters and print a flame-style table, widest bar first, so
+     it is obvious which voices deserve an assembly port.
+
+The `postmix` stage is generator_postmix, which mixes, limits and measures
+RMS in one tiled pass; those three are not timed separately.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+CVER = SRC / "c"
+
+BAR_WIDTH = 40
+
+
+def build(dest: Path) -> Path:
+    """Build `segment` with the profiling hooks compiled in, in a copy under *dest*.
+
+    The Makefile does not track CFLAGS, so building in src/c would leave
+    instrumented objects behind for the next default build.  Returns the
+    copied C directory.
+    """
+    print("[profile] building segment (PROFILE_VOICES=1) …", flush=True)
+    cdir = dest / "src" / "c"
+    (cdir / "src").mkdir(parents=True)
+    shutil.copy2(CVER / "Makefile", cdir)
+    shutil.copytree(CVER / "include", cdir / "include")
+    for c in (CVER / "src").glob("*.c"):
+        shutil.copy2(c, cdir / "src")
+    shutil.copytree(SRC / "asm", dest / "src" / "asm", ignore=shutil.ignore_patterns("*.o"))
+    jobs = str(max(1, os.cpu_count() or 1))
+    subprocess.run(["make", "-C", str(cdir), "segment", "NO_RUN=1", "PROFILE_VOICES=1", f"-j{jobs}"],
+                   check=True, stdout=subprocess.DEVNULL)
+    return cdir
+
+
+def profile_seed(cdir: Path, seed: int) -> dict:
+    """Render one seed with cdir's `segment` and return its parsed profile JSON."""
+    subprocess.run([str(cdir / "bin" / "segment"), hex(seed)], cwd=cdir, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    prof = cdir / f"seed_{hex(seed)}.profile.json"
+    data = json.loads(prof.read_text())
+    prof.unlink()
+    (cdir / f"seed_{hex(seed)}.wav").unlink(missing_ok=True)
+    return data
+
+
+def aggregate(profiles: list[dict]) -> dict:
+    """Sum stage counters and trigger counts over all profiles."""
+    total: dict = {"blocks": 0, "block_frames": 0, "stages": {}, "triggers": {}}
+    for p in profiles:
+        total["blocks"] += p["blocks"]
+        total["block_frames"] += p["block_frames"]
+        for name, c in p["stages"].items():
+            acc = total["stages"].setdefault(name, {"ns": 0, "frames": 0, "calls": 0})
+            for k in acc:
+                acc[k] += c[k]
+        for name, n in p["triggers"].items():
+            total["triggers"][name] = total["triggers"].get(name, 0) + n
+    return total
+
+
+def print_table(total: dict, n_seeds: int) -> None:
+    stages = sorted(total["stages"].items(), key=lambda kv: kv[1]["ns"], reverse=True)
+    all_ns = sum(c["ns"] for _, c in stages) or 1
+    widest = stages[0][1]["ns"] if stages else 1
+
+    print(f"\n{n_seeds} seed(s), {total['block_frames']} frames, {all_ns / 1e6:.2f} ms total\n")
+    print(f"{'stage':<11} {'ms':>9} {'%':>6} {'ns/frame':>9} {'active%':>8}  profile")
+    for name, c in stages:
+        pct = 100.0 * c["ns"] / all_ns
+        # Voices report frames only while sounding; post stages see every frame.
+        per_frame = c["ns"] / c["frames"] if c["frames"] else 0.0
+        active = 100.0 * c["frames"] / total["block_frames"] if total["block_frames"] else 0.0
+        bar = "█" * max(0, round(BAR_WIDTH * c["ns"] / widest)) if widest else ""
+        print(f"{name:<11} {c['ns'] / 1e6:9.2f} {pct:6.1f} {per_frame:9.1f} {active:8.1f}  {bar}")
+
+    print("\ntriggers: " + ", ".join(f"{k}={v}" for k, v in total["triggers"].items()))
+
+
+def main(argv: list[str]) -> None:
+    ap = argparse.ArgumentParser(description="Per-voice generator profile across seeds")
+    ap.add_argument("--seeds", type=str, default="",
+                    help="comma-separated seed list (hex or decimal)")
+    ap.add_argument("--count", type=int, default=16,
+                    help="number of consecutive seeds starting at --start when --seeds is empty")
+    ap.add_argument("--start", type=lambda s: int(s, 0), default=0xCAFEBABE)
+    ap.add_argument("--json", type=Path, help="also write the aggregate as JSON")
+    ap.add_argument("--no-build", action="store_true", help="reuse src/c's bin/segment (built with PROFILE_VOICES=1)")
+    args = ap.parse_args(argv[1:])
+
+    if args.seeds:
+        seeds = [int(s, 0) for s in args.seeds.split(",") if s]
+    else:
+        seeds = [args.start + i for i in range(args.count)]
+
+    profiles = []
+    with tempfile.TemporaryDirectory(prefix="profile_seeds_") as tmp:
+        cdir = CVER if args.no_build else build(Path(tmp))
+        for i, seed in enumerate(seeds):
+            print(f"  [{i + 1:3}/{len(seeds)}] {hex(seed)}", flush=True)
+            profiles.append(profile_seed(cdir, seed))
+
+    total = aggregate(profiles)
+    print_table(total, len(seeds))
+
+    if args.json:
+        args.json.write_text(json.dumps(total, indent=2) + "\n")
+        print(f"\n[profile] wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
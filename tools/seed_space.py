@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Explore the seed space without rendering audio.
+
+Usage:
+    python tools/seed_space.py describe 0xcafebabe [0x1 ...] [--json]
+    python tools/seed_space.py scan [--start S] [--count N] [--stride K] [--out seeds.npy]
+    python tools/seed_space.py query seeds.npy [--where 'bpm>100'] [--where 'kick_mask&0x11']
+                                               [--sort bpm [--desc]] [--limit 20] [--histogram scale]
+
+`describe` derives a seed's musical parameters and per-voice event counts in
+pure Python, draw for draw the same way generator_init does (SplitMix64,
+float32 arithmetic).  `scan` runs the C scanner (bin/seed_scan, built on
+demand), which does the same through describe_seed at around a million seeds
+per second per thread, into a NumPy structured .npy table.  `query` filters
+and summarizes such a table – vectorized when numpy is installed, row by row
+otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import operator
+import os
+import re
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from euclid_table import euclid_mask  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+CVER = ROOT / "src" / "c"
+BIN = CVER / "bin" / "seed_scan"
+
+# Keep in sync with music_time.h / generator.h / music_defs.h
+SR = 44100
+STEPS_PER_BEAT = 4
+STEPS_PER_BAR = 16
+TOTAL_STEPS = 32
+MAX_EVENTS = 512
+MAX_DELAY_SAMPLES = 106000
+ROOT_CHOICES = (220.0, 233.08, 246.94, 261.63, 293.66)
+DELAY_FACTORS = (2.0, 1.0, 0.5, 0.25)
+SCALE_NAMES = ("major_pent", "minor_pent")
+
+# Column order of seed_scan's records (seed_desc_t, see src/seed_scan.c)
+FIELDS = (
+    "seed", "bpm", "step_samples", "seg_frames", "root_freq", "delay_factor", "delay_samples",
+    "scale", "kick_hits", "snare_hits", "hat_hits", "preset_offset", "rotation",
+    "kick_mask", "snare_mask", "hat_mask",
+    "events", "events_dropped", "n_kick", "n_snare", "n_hat", "n_melody",
+    "n_mid_simple", "n_mid_fm", "n_bass",
+)
+
+MASK64 = (1 << 64) - 1
+GAMMA = 0x9E3779B97F4A7C15
+_F32 = struct.Struct("<f")
+
+
+def f32(x: float) -> float:
+    """Round a Python float to float32, as each C float operation does."""
+    return _F32.unpack(_F32.pack(x))[0]
+
+
+class Rng:
+    """SplitMix64, identical to rand.h."""
+
+    def __init__(self, seed: int) -> None:
+        self.state = (seed + GAMMA) & MASK64
+
+    def u32(self) -> int:
+        self.state = (self.state + GAMMA) & MASK64
+        z = self.state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return (z ^ (z >> 31)) & 0xFFFFFFFF
+
+    def float(self) -> float:
+        return f32((self.u32() >> 8) * (1.0 / 16777216.0))
+
+
+def describe_seed(seed: int) -> dict:
+    """Python twin of describe_seed(): the same fields, the same values."""
+    rng = Rng(seed)
+    d = {"seed": seed & MASK64}
+    d["kick_hits"] = 2 + rng.u32() % 3
+    d["snare_hits"] = 1 + rng.u32() % 3
+    d["hat_hits"] = 4 + rng.u32() % 5
+    d["preset_offset"] = rng.u32() % 4
+
+    bpm = f32(50.0 + f32(rng.float() * 70.0))
+    beat_sec = f32(60.0 / bpm)
+    step_sec = f32(beat_sec / STEPS_PER_BEAT)
+    d["bpm"] = bpm
+    d["step_samples"] = int(f32(f32(step_sec * SR) + 0.5))
+    d["seg_frames"] = int(f32(f32(f32(step_sec * TOTAL_STEPS) * SR) + 0.5))
+    d["root_freq"] = f32(ROOT_CHOICES[rng.u32() % 5])
+    d["scale"] = 0 if rng.u32() % 2 else 1          # SCALE_MAJOR_PENT : SCALE_MINOR_PENT
+
+    rot = rng.u32() % STEPS_PER_BAR
+    d["rotation"] = rot
+    for name in ("kick", "snare", "hat"):
+        d[f"{name}_mask"] = euclid_mask(d[f"{name}_hits"], STEPS_PER_BAR, rot)
+
+    counts = dict.fromkeys(("n_kick", "n_snare", "n_hat", "n_melody", "n_mid_simple", "n_mid_fm", "n_bass"), 0)
+    for step in range(TOTAL_STEPS):
+        bar_step = step % STEPS_PER_BAR
+        for name in ("kick", "snare", "hat"):
+            counts[f"n_{name}"] += (d[f"{name}_mask"] >> bar_step) & 1
+        if bar_step in (0, 8):
+            counts["n_melody"] += 1
+        q = bar_step % 4
+        if q == 2 or (q in (1, 3) and rng.float() < f32(0.1)):
+            counts["n_mid_simple" if rng.u32() % 7 < 3 else "n_mid_fm"] += 1
+        if bar_step == 0:
+            counts["n_bass"] += 1
+    total = sum(counts.values())
+    d["events"] = min(total, MAX_EVENTS)
+    d["events_dropped"] = total - d["events"]
+    d.update(counts)
+
+    d["delay_factor"] = DELAY_FACTORS[rng.u32() % 4]
+    d["delay_samples"] = min(int(f32(f32(beat_sec * d["delay_factor"]) * SR)), MAX_DELAY_SAMPLES)
+    return {k: d[k] for k in FIELDS}
+
+
+# ---------------------------------------------------------------- .npy I/O
+
+_NPY_CODES = {"u1": "B", "u2": "H", "u4": "I", "u8": "Q", "i1": "b", "i2": "h",
+              "i4": "i", "i8": "q", "f4": "f", "f8": "d"}
+
+
+def _npy_header(f) -> tuple[list, int]:
+    if f.read(6) != b"\x93NUMPY":
+        raise ValueError("not a .npy file")
+    major = f.read(2)[0]
+    hlen = struct.unpack("<H" if major == 1 else "<I", f.read(2 if major == 1 else 4))[0]
+    header = ast.literal_eval(f.read(hlen).decode("latin1"))
+    return header["descr"], header["shape"][0]
+
+
+def load_table(path: Path):
+    """Return the table as a numpy structured array, or a list of dicts without numpy."""
+    try:
+        import numpy as np
+        return np.load(path)
+    except ImportError:
+        pass
+    with open(path, "rb") as f:
+        descr, count = _npy_header(f)
+        names = [name for name, _ in descr]
+        rec = struct.Struct("<" + "".join(_NPY_CODES[t[1:]] for _, t in descr))
+        data = f.read(rec.size * count)
+    return [dict(zip(names, row)) for row in rec.iter_unpack(data)]
+
+
+# ---------------------------------------------------------------- query
+
+def _has_bits(col, bits):
+    """`col & bits`: every bit of `bits` is set, e.g. a kick on steps 0 and 4."""
+    return (col & bits) == bits
+
+
+_OPS = {"<=": operator.le, ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+        "<": operator.lt, ">": operator.gt, "&": _has_bits}
+_WHERE = re.compile(r"^\s*(\w+)\s*(<=|>=|==|!=|<|>|&)\s*([-+0-9a-fA-FxX.]+)\s*$")
+
+
+def parse_where(expr: str) -> tuple[str, object, int | float]:
+    m = _WHERE.match(expr)
+    if not m or m.group(1) not in FIELDS:
+        raise SystemExit(f"bad --where {expr!r}: expected <column><op><number>, columns: {', '.join(FIELDS)}")
+    try:
+        value: int | float = int(m.group(3), 0)    # exact for 64-bit seeds
+    except ValueError:
+        value = float(m.group(3))
+    return m.group(1), _OPS[m.group(2)], value
+
+
+def query(table, wheres: list, sort: str | None, desc: bool, limit: int) -> tuple[int, list[dict]]:
+    """Apply the filters; return the match count and the first `limit` rows."""
+    if isinstance(table, list):
+        rows = [r for r in table if all(op(r[col], v) for col, op, v in wheres)]
+        if sort:
+            rows.sort(key=lambda r: r[sort], reverse=desc)
+        return len(rows), rows[:limit]
+
+    import numpy as np
+    mask = np.ones(len(table), dtype=bool)
+    for col, op, v in wheres:
+        mask &= op(table[col], v)
+    hits = table[mask]
+    if sort:
+        order = np.argsort(hits[sort], kind="stable")
+        hits = hits[order[::-1] if desc else order]
+    head = hits[:limit]
+    return len(hits), [{k: head[k][i].item() for k in head.dtype.names} for i in range(len(head))]
+
+
+def histogram(table, col: str) -> dict:
+    if isinstance(table, list):
+        out: dict = {}
+        for r in table:
+            out[r[col]] = out.get(r[col], 0) + 1
+        return dict(sorted(out.items()))
+    import numpy as np
+    values, counts = np.unique(table[col], return_counts=True)
+    return {v.item(): int(c) for v, c in zip(values, counts)}
+
+
+def format_row(d: dict) -> str:
+    return (f"0x{d['seed']:x}: {d['bpm']:.2f} bpm, root {d['root_freq']:.2f} Hz "
+            f"{SCALE_NAMES[d['scale']]}, euclid {d['kick_hits']}/{d['snare_hits']}/{d['hat_hits']} "
+            f"rot {d['rotation']}, delay x{d['delay_factor']:g}, events {d['events']} "
+            f"(kick {d['n_kick']}, snare {d['n_snare']}, hat {d['n_hat']}, mel {d['n_melody']}, "
+            f"mid {d['n_mid_simple']}+{d['n_mid_fm']} fm, bass {d['n_bass']})")
+
+
+# ---------------------------------------------------------------- CLI
+
+def build() -> None:
+    jobs = str(max(1, os.cpu_count() or 1))
+    subprocess.run(["make", "-C", str(CVER), "seed_scan", "NO_RUN=1", f"-j{jobs}"],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("describe", help="print the parameters of some seeds")
+    p.add_argument("seeds", nargs="+", type=lambda s: int(s, 0))
+    p.add_argument("--json", action="store_true")
+
+    p = sub.add_parser("scan", help="describe a seed range into a .npy table (C scanner)")
+    p.add_argument("--start", default="0")
+    p.add_argument("--count", type=int, default=1_000_000)
+    p.add_argument("--stride", default="1")
+    p.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--out", type=Path, default=Path("seeds.npy"))
+
+    p = sub.add_parser("query", help="filter / summarize a .npy table")
+    p.add_argument("table", type=Path)
+    p.add_argument("--where", action="append", default=[], help="e.g. 'bpm>100', 'kick_mask&0x11' (all bits set); repeat to AND")
+    p.add_argument("--sort", help="column to sort the matches by")
+    p.add_argument("--desc", action="store_true", help="sort descending")
+    p.add_argument("--limit", type=int, default=20)
+    p.add_argument("--histogram", help="print value counts of a column")
+    p.add_argument("--json", action="store_true")
+
+    args = ap.parse_args(argv)
+
+    if args.cmd == "describe":
+        descs = [describe_seed(s) for s in args.seeds]
+        if args.json:
+            json.dump(descs, sys.stdout, indent=2)
+            print()
+        else:
+            for d in descs:
+                print(format_row(d))
+        return 0
+
+    if args.cmd == "scan":
+        build()
+        subprocess.run([str(BIN), "--start", args.start, "--count", str(args.count), "--stride", args.stride,
+                        "--threads", str(min(max(args.threads, 1), 64)), "--out", str(args.out.resolve())],
+                       check=True)
+        return 0
+
+    table = load_table(args.table)
+    if args.histogram:
+        if args.histogram not in FIELDS:
+            raise SystemExit(f"unknown column {args.histogram!r}")
+        for value, n in histogram(table, args.histogram).items():
+            print(f"{value!s:>12}  {n}")
+        return 0
+    if args.sort and args.sort not in FIELDS:
+        raise SystemExit(f"unknown column {args.sort!r}")
+    n, rows = query(table, [parse_where(w) for w in args.where], args.sort, args.desc, args.limit)
+    if args.json:
+        json.dump({"matches": n, "rows": rows}, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{n} of {len(table)} seeds match")
+        for r in rows:
+            print(format_row(r))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Decode binary trace dumps written by the C engine (src/c/src/trace.c).
+
+Build with tracing enabled, render, then decode:
+
+    make -C src/c clean segment TRACE=1
+    python tools/trace_decode.py src/c/seed_0xcafebabe.trace
+    python tools/trace_decode.py src/c/seed_0xcafebabe.trace --json > trace.json
+
+Each record is printed with its timestamp relative to the first record, so
+the output reads like the old printf debug log but costs nothing on the
+audio thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import struct
+import sys
+from pathlib import Path
+
+MAGIC = 0x5442444E  # "NDBT"
+VERSION = 1
+
+HEADER = struct.Struct("<4IQ")       # magic, version, record size, stored, total
+RECORD = struct.Struct("<QHHI4f")    # t_ns, event, voice, aux, p[4]
+
+# Keep in sync with trace_event_t / trace_voice_t in include/trace.h
+EVENT_NAMES = [
+    "FM_TRIGGER",
+    "FM_PROCESS_FIRST",
+    "EVENT",
+    "MID_TRIGGER",
+    "STEP_END",
+    "DELAY_BLOCK",
+]
+
+VOICE_NAMES = [
+    "-",
+    "kick",
+    "snare",
+    "hat",
+    "melody",
+    "fm",
+    "mid_fm",
+    "bass_fm",
+    "mid_simple",
+    "delay",
+]
+
+EVT_TYPES = ["KICK", "SNARE", "HAT", "MELODY", "MID", "FM_BASS"]
+
+
+def _name(table: list[str], idx: int) -> str:
+    return table[idx] if 0 <= idx < len(table) else f"#{idx}"
+
+
+def read_trace(path: Path) -> tuple[int, list[dict]]:
+    """Return (total_emitted, records) from a trace dump."""
+    data = path.read_bytes()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: truncated header")
+
+    magic, version, rec_size, stored, total = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a trace file (magic 0x{magic:08x})")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported trace version {version}")
+    if rec_size != RECORD.size:
+        raise ValueError(f"{path}: record size {rec_size}, expected {RECORD.size}")
+
+    records = []
+    off = HEADER.size
+    for _ in range(stored):
+        t_ns, event, voice, aux, p0, p1, p2, p3 = RECORD.unpack_from(data, off)
+        off += RECORD.size
+        records.append({
+            "t_ns": t_ns,
+            "event": _name(EVENT_NAMES, event),
+            "voice": _name(VOICE_NAMES, voice),
+            "aux": aux,
+            "p": [p0, p1, p2, p3],
+        })
+    return total, records
+
+
+def format_record(r: dict, t0: int) -> str:
+    """Render one record in the style of the old printf log lines."""
+    dt_us = (r["t_ns"] - t0) / 1000.0
+    ev, aux, p = r["event"], r["aux"], r["p"]
+    if ev == "FM_TRIGGER":
+        body = f"cf={p[0]:.2f} ratio={p[1]:.2f} idx={p[2]:.2f} amp={p[3]:.2f} len={aux}"
+    elif ev == "FM_PROCESS_FIRST":
+        body = f"n={aux} len={int(p[0])}"
+    elif ev == "EVENT":
+        body = (f"type={_name(EVT_TYPES, int(p[0]))} aux={int(p[1])} "
+                f"step={int(p[2])} pos={int(p[3])} event_idx={aux}")
+    elif ev == "MID_TRIGGER":
+        body = f"step={int(p[0])} aux={int(p[1])} pos={int(p[2])} count={aux}"
+    elif ev == "STEP_END":
+        body = f"event_idx={aux} step={int(p[0])} pos={int(p[1])}"
+    elif ev == "DELAY_BLOCK":
+        body = f"size={int(p[0])} idx={int(p[1])} n={aux}"
+    else:
+        body = f"aux={aux} p={p}"
+    return f"{dt_us:12.1f} us  {ev:<16} {r['voice']:<10} {body}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("trace", type=Path, help="trace dump (*.trace)")
+    ap.add_argument("--json", action="store_true", help="emit JSON instead of text")
+    ap.add_argument("--event", action="append", default=[],
+                    help="only show this event name (repeatable)")
+    args = ap.parse_args(argv)
+
+    total, records = read_trace(args.trace)
+    if args.event:
+        wanted = {e.upper() for e in args.event}
+        records = [r for r in records if r["event"] in wanted]
+
+    if args.json:
+        json.dump({"total": total, "records": records}, sys.stdout, indent=1)
+        print()
+        return 0
+
+    dropped = total - len(records) if not args.event else 0
+    print(f"# {len(records)} record(s), {total} emitted"
+          + (f", {dropped} overwritten" if dropped > 0 else ""))
+    t0 = records[0]["t_ns"] if records else 0
+    for r in records:
+        print(format_record(r, t0))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ Run this after you've listened to the WAV files in audit_wavs/ and confirmed the
 import subprocess
 from pathlib import Path
 from tests.hash_wav import hash_wav
+from tests.wav_compare import fingerprint, fingerprint_path
 
 # Mapping of audit WAV files to their baseline hash files
 BASELINE_MAPPINGS = [
@@ -26,10 +27,11 @@ BASELINE_MAPPINGS = [
     ("current_calm-c.wav", "calm_c_hash.txt"),
     ("current_quantum-c.wav", "quantum_c_hash.txt"),
     ("current_pluck-c.wav", "pluck_c_hash.txt"),
+    ("current_seed_0xcafebabe.wav", "segment_hash.txt"),
 ]
 
 def main():
-    root = Path(__file__).parent
+    root = Path(__file__).resolve().parent.parent
     audit_dir = root / "audit_wavs"
     baseline_dir = root / "tests" / "baseline"
     
@@ -49,8 +51,9 @@ def main():
             if baseline_path.exists():
                 old_hash = baseline_path.read_text().strip()
             
-            # Update the baseline
+            # Update the baseline, plus the fingerprint the tests prefer over the hash
             baseline_path.write_text(new_hash + "\n")
+            fingerprint_path(baseline_path).write_text(fingerprint(wav_path) + "\n")
             
             print(f"✅ {baseline_file}")
             print(f"   Old: {old_hash[:16]}...")